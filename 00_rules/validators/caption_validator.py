@@ -25,12 +25,21 @@ from typing import Dict, List, Any, Optional
 
 PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "04_pipeline"))
+
+from caption_rules import get_caption_rules
+from caption_audit_runner import DEFAULT_CACHE_PATH, AuditCache, cache_key, checker_fingerprint
+
+# 시트 캡션 검증 결과 캐시 (텍스트 해시 + 안전도 + 규칙 버전, 바뀐 캡션만 재검증)
+SHEET_CACHE_PATH = DEFAULT_CACHE_PATH.with_name("sheet_results.json")
 
 
 def validate_instagram_caption(caption: str, safety_level: str) -> Dict[str, Any]:
     """
     Instagram 캡션 검증 (파스타 규칙 8단계)
 
+    규칙 정의: 02_config/caption_rules.json IG1~IG8 (caption_rules 엔진 1회 스캔)
+
     Args:
         caption: Instagram 캡션 텍스트
         safety_level: 안전도 (SAFE/CAUTION/DANGER/FORBIDDEN)
@@ -38,86 +47,25 @@ def validate_instagram_caption(caption: str, safety_level: str) -> Dict[str, Any
     Returns:
         {"valid": bool, "errors": list, "score": str, "details": dict}
     """
-    errors = []
-    details = {}
-    score = 0
-
-    # 1. 안전도 이모지 (필수)
-    safety_emojis = {
-        'SAFE': ('✅', '🟢'),
-        'CAUTION': ('⚠️', '🟡'),
-        'DANGER': ('🚨', '🔴'),
-        'FORBIDDEN': ('⛔', '🔴')
+    rules = get_caption_rules()
+    safety = safety_level.upper()
+    scan = rules.scan(caption)
+    findings = [f for f in rules.evaluate(caption, "instagram", safety) if f.rule.startswith("IG")]
+    errors = [f.message for f in findings]
+    score = 8 - len(findings)
+
+    details = {
+        'safety_emoji': safety in rules.safety_emoji and scan.has(f"safety_emoji:{safety}"),
+        'bullet_count': scan.count('bullet'),
+        # 3. 절대 금지 항목은 CAUTION 이상만 (SAFE는 면제)
+        'has_forbidden': scan.has('forbidden_marker')
+        if safety in ['CAUTION', 'DANGER', 'FORBIDDEN'] else 'N/A (SAFE)',
+        'has_size_info': scan.has('size_info'),
+        'has_key_message': scan.has('key_message'),
+        'has_cta': scan.has('cta'),
+        'has_ai_notice': scan.has('ai_mark') and scan.has('ai_generated'),
+        'hashtag_count': scan.count('hashtag'),
     }
-    expected = safety_emojis.get(safety_level.upper(), ())
-    has_safety_emoji = any(e in caption for e in expected)
-    details['safety_emoji'] = has_safety_emoji
-    if has_safety_emoji:
-        score += 1
-    else:
-        errors.append(f"1. 안전도 이모지 누락 (필요: {expected})")
-
-    # 2. 주의사항 리스트 (필수, 최소 3개)
-    bullet_count = caption.count('•')
-    details['bullet_count'] = bullet_count
-    if bullet_count >= 3:
-        score += 1
-    else:
-        errors.append(f"2. 주의사항 리스트 부족 ({bullet_count}/3)")
-
-    # 3. 절대 금지 항목 (CAUTION 이상 필수)
-    if safety_level.upper() in ['CAUTION', 'DANGER', 'FORBIDDEN']:
-        has_forbidden = '금지' in caption or '🚫' in caption or '절대' in caption
-        details['has_forbidden'] = has_forbidden
-        if has_forbidden:
-            score += 1
-        else:
-            errors.append("3. 절대 금지 항목 누락")
-    else:
-        score += 1  # SAFE는 면제
-        details['has_forbidden'] = 'N/A (SAFE)'
-
-    # 4. 급여량 정보 (필수)
-    size_keywords = ['소형견', '중형견', '대형견', '소형', '중형', '대형']
-    has_size_info = any(kw in caption for kw in size_keywords)
-    details['has_size_info'] = has_size_info
-    if has_size_info:
-        score += 1
-    else:
-        errors.append("4. 급여량 정보 누락 (소/중/대형견)")
-
-    # 5. 핵심 메시지 (💡 또는 명확한 요약)
-    has_key_message = '💡' in caption or '"' in caption or '📌' in caption
-    details['has_key_message'] = has_key_message
-    if has_key_message:
-        score += 1
-    else:
-        errors.append("5. 핵심 메시지 누락 (💡 또는 인용)")
-
-    # 6. CTA (필수)
-    cta_keywords = ['저장', '공유', '💾', '📲', '북마크']
-    has_cta = any(kw in caption for kw in cta_keywords)
-    details['has_cta'] = has_cta
-    if has_cta:
-        score += 1
-    else:
-        errors.append("6. CTA 누락 (저장/공유)")
-
-    # 7. AI 고지 (필수)
-    has_ai_notice = 'AI' in caption and ('생성' in caption or 'generated' in caption.lower())
-    details['has_ai_notice'] = has_ai_notice
-    if has_ai_notice:
-        score += 1
-    else:
-        errors.append("7. AI 고지 누락")
-
-    # 8. 해시태그 (12~16개)
-    hashtag_count = caption.count('#')
-    details['hashtag_count'] = hashtag_count
-    if 12 <= hashtag_count <= 16:
-        score += 1
-    else:
-        errors.append(f"8. 해시태그 {hashtag_count}개 (필요: 12~16개)")
 
     return {
         "valid": len(errors) == 0,
@@ -132,37 +80,25 @@ def validate_threads_caption(caption: str) -> Dict[str, Any]:
     """
     Threads 캡션 검증
 
+    규칙 정의: 02_config/caption_rules.json TH1~TH3
+
     Args:
         caption: Threads 캡션 텍스트
 
     Returns:
         {"valid": bool, "errors": list, "details": dict}
     """
-    errors = []
-    details = {}
-
-    # 1. 길이 제한 (500자)
-    char_count = len(caption)
-    details['char_count'] = char_count
-    if char_count > 500:
-        errors.append(f"글자 수 초과 ({char_count}/500)")
-
-    # 2. 해시태그 없어야 함 (권장, 3개 이하)
-    hashtag_count = caption.count('#')
-    details['hashtag_count'] = hashtag_count
-    if hashtag_count > 3:
-        errors.append(f"해시태그 과다 ({hashtag_count}개, 권장: 3개 이하)")
-
-    # 3. AI 고지
-    has_ai = 'AI' in caption
-    details['has_ai_notice'] = has_ai
-    if not has_ai:
-        errors.append("AI 고지 누락")
-
-    # 4. 인스타 유도 (선택)
-    has_insta_ref = '@sunshinedogfood' in caption or 'instagram' in caption.lower()
-    details['has_insta_ref'] = has_insta_ref
-    # 선택 사항이므로 에러로 추가하지 않음
+    rules = get_caption_rules()
+    scan = rules.scan(caption)
+    errors = [f.message for f in rules.evaluate(caption, "threads") if f.rule.startswith("TH")]
+
+    details = {
+        'char_count': len(caption),
+        'hashtag_count': scan.count('hashtag'),
+        'has_ai_notice': scan.has('ai_mark'),
+        # 인스타 유도는 선택 사항이므로 에러로 추가하지 않음
+        'has_insta_ref': scan.has('insta_ref'),
+    }
 
     return {
         "valid": len(errors) == 0,
@@ -292,6 +228,9 @@ def scan_all_captions(fix: bool = False) -> Dict[str, Any]:
     # 스캔 대상: approved, body_ready
     target_statuses = ['approved', 'body_ready']
 
+    cache = AuditCache(SHEET_CACHE_PATH)
+    fingerprint = checker_fingerprint(validate_instagram_caption)
+
     for item in data:
         if item['status'].lower() not in target_statuses:
             results['skipped'] += 1
@@ -307,7 +246,11 @@ def scan_all_captions(fix: bool = False) -> Dict[str, Any]:
             results['skipped'] += 1
             continue
 
-        p_result = validate_instagram_caption(p_caption, safety)
+        key = cache_key(p_caption, safety, fingerprint)
+        p_result = cache.get(f"sheet:{item['num']}:P", key)
+        if p_result is None:
+            p_result = validate_instagram_caption(p_caption, safety)
+            cache.put(f"sheet:{item['num']}:P", key, p_result)
 
         print(f"\n[{item['num']}] {item['eng_name']} ({item['status']})")
         print(f"   안전도: {safety}")
@@ -330,6 +273,8 @@ def scan_all_captions(fix: bool = False) -> Dict[str, Any]:
                 'score': p_result['score']
             })
 
+    cache.save()
+
     # 요약
     print("\n" + "=" * 70)
     print("📊 스캔 결과 요약")
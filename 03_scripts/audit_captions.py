@@ -4,13 +4,16 @@ audit_captions.py - WO-FREEZE-001 조사 C
 캡션 미생성 원인 분석
 """
 
-import json
 import re
+import sys
 from pathlib import Path
 
 PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "04_pipeline"))
+from food_data_store import default_food_data_path, get_food_store
+
 CONTENTS_DIR = PROJECT_ROOT / "01_contents"
-FOOD_DATA_PATH = PROJECT_ROOT / "config" / "food_data.json"
+FOOD_DATA_PATH = default_food_data_path()
 # 2026-02-13: 플랫 구조 - STATUS_DIRS 제거
 # STATUS_DIRS = ["1_cover_only", "2_body_ready", "3_approved", "4_posted"]
 
@@ -21,8 +24,7 @@ def main():
     print("━" * 60)
 
     # food_data 로드
-    with open(FOOD_DATA_PATH, "r", encoding="utf-8") as f:
-        food_data = json.load(f)
+    food_data = get_food_store(FOOD_DATA_PATH).require()
 
     food_data_keys = set(food_data.keys())
 
@@ -4,13 +4,15 @@ audit_number_system.py - WO-FREEZE-001 조사 A
 번호 체계 정합성 검사
 """
 
-import json
+import sys
 import re
 from pathlib import Path
 
 PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "04_pipeline"))
+from food_data_store import default_food_data_path, get_food_store
 CONTENTS_DIR = PROJECT_ROOT / "01_contents"
-FOOD_DATA_PATH = PROJECT_ROOT / "config" / "food_data.json"
+FOOD_DATA_PATH = default_food_data_path()
 # 2026-02-13: 플랫 구조 - STATUS_DIRS 제거
 # STATUS_DIRS = ["1_cover_only", "2_body_ready", "3_approved", "4_posted"]
 
@@ -21,8 +23,7 @@ def main():
     print("━" * 60)
 
     # 1. food_data.json 로드
-    with open(FOOD_DATA_PATH, "r", encoding="utf-8") as f:
-        food_data = json.load(f)
+    food_data = get_food_store(FOOD_DATA_PATH).require()
 
     food_data_nums = {}
     for key, value in food_data.items():
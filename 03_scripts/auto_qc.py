@@ -49,16 +49,17 @@ except ImportError:
 
 # 경로 설정
 PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "04_pipeline"))
+from food_data_store import default_food_data_path, get_food_store
 CONTENTS_DIR = PROJECT_ROOT / "01_contents"
-FOOD_DATA_PATH = PROJECT_ROOT / "config" / "food_data.json"
+FOOD_DATA_PATH = default_food_data_path()
 OUTPUT_PATH = PROJECT_ROOT / "qc_result.json"
 
 
 def load_food_data():
     """food_data.json 로드"""
     try:
-        with open(FOOD_DATA_PATH, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return get_food_store(FOOD_DATA_PATH).require()
     except:
         return {}
 
@@ -7,11 +7,11 @@ batch_blog_slides.py - 블로그 슬라이드 3-7 일괄 생성
 
 import os
 import sys
-import json
 from pathlib import Path
 
 PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT / "scripts"))
+sys.path.insert(0, str(PROJECT_ROOT / "04_pipeline"))
 
 from infographic_generator import (
     generate_nutrition_info,
@@ -20,6 +20,7 @@ from infographic_generator import (
     generate_precautions,
     generate_cooking_method
 )
+from food_data_store import get_food_store
 
 # 콘텐츠 폴더 매핑
 CONTENT_FOLDERS = {
@@ -33,10 +34,7 @@ CONTENT_FOLDERS = {
 
 def load_food_data(food_id: int) -> dict:
     """food_data.json에서 특정 음식 데이터 로드"""
-    json_path = PROJECT_ROOT / "config" / "food_data.json"
-    with open(json_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
-    return data.get(str(food_id), {})
+    return get_food_store().require().get(str(food_id), {})
 
 
 def generate_slides_for_food(food_id: int, food_data: dict, output_dir: Path):
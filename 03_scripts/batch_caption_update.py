@@ -9,13 +9,15 @@ batch_caption_update.py - 전체 캡션 일괄 업데이트
 - 쓰레드: CAPTION_RULE.md §3 쓰레드 규칙 준수
 """
 
-import json
+import sys
 import os
 from pathlib import Path
 
 PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "04_pipeline"))
+from food_data_store import default_food_data_path, get_food_store
 CONTENTS_DIR = PROJECT_ROOT / "01_contents"
-FOOD_DATA_PATH = PROJECT_ROOT / "config" / "food_data.json"
+FOOD_DATA_PATH = default_food_data_path()
 
 # 게시 완료 항목 (제외)
 POSTED_ITEMS = ["033"]  # 바게트
@@ -238,8 +240,7 @@ def generate_threads_caption(food_id, food_data):
 def update_captions():
     """전체 캡션 업데이트"""
     # food_data.json 로드
-    with open(FOOD_DATA_PATH, "r", encoding="utf-8") as f:
-        food_data = json.load(f)
+    food_data = get_food_store(FOOD_DATA_PATH).require()
 
     updated = 0
     skipped = 0
@@ -8,7 +8,6 @@ R7 Phase 2: 블로그 본문 인포그래픽 (3~7장) 일괄 생성
 
 import os
 import sys
-import json
 import argparse
 from pathlib import Path
 from typing import Dict, List, Optional
@@ -16,6 +15,7 @@ from typing import Dict, List, Optional
 # 프로젝트 루트
 PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(PROJECT_ROOT / "04_pipeline"))
 
 from scripts.infographic_generator import (
     generate_nutrition_info,
@@ -24,6 +24,7 @@ from scripts.infographic_generator import (
     generate_precautions,
     generate_cooking_method,
 )
+from food_data_store import default_food_data_path, get_food_store
 
 # 콘텐츠 폴더
 CONTENTS_DIR = PROJECT_ROOT / "01_contents"
@@ -31,7 +32,7 @@ CONTENTS_DIR = PROJECT_ROOT / "01_contents"
 # 이제 contents/ 직접 스캔
 
 # 콘텐츠 데이터 파일
-FOOD_DATA_FILE = PROJECT_ROOT / "config" / "food_data.json"
+FOOD_DATA_FILE = default_food_data_path()
 
 
 def load_food_data() -> Dict:
@@ -41,8 +42,7 @@ def load_food_data() -> Dict:
         print("   기본 템플릿으로 진행합니다.")
         return {}
 
-    with open(FOOD_DATA_FILE, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    return get_food_store(FOOD_DATA_FILE).data
 
 
 def get_default_data(food_name: str, safety: str = "SAFE") -> Dict:
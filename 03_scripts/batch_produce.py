@@ -16,7 +16,6 @@ PD님 담당 (SKIP):
 
 import os
 import sys
-import json
 import re
 import shutil
 import subprocess
@@ -25,9 +24,11 @@ from datetime import datetime
 
 PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(PROJECT_ROOT / "04_pipeline"))
+from food_data_store import default_food_data_path, get_food_store
 
 CONTENTS_DIR = PROJECT_ROOT / "01_contents"
-FOOD_DATA_PATH = PROJECT_ROOT / "config" / "food_data.json"
+FOOD_DATA_PATH = default_food_data_path()
 CTA_SOURCE_DIR = PROJECT_ROOT / "01_contents" / "sunshine photos" / "00_Best" / "crop"
 COVER_SCRIPT = PROJECT_ROOT / "services" / "scripts" / "blog_cover_v2.py"
 
@@ -50,8 +51,7 @@ results = {
 def load_food_data():
     """food_data.json 로드"""
     if FOOD_DATA_PATH.exists():
-        with open(FOOD_DATA_PATH, "r", encoding="utf-8") as f:
-            return json.load(f)
+        return get_food_store(FOOD_DATA_PATH).require()
     return {}
 
 
@@ -26,9 +26,10 @@ if os.environ.get("PIPELINE_AUTHORIZED") != "true":
 # ═══════════════════════════════════════════════════════════════
 
 import os
-import json
 import re
 import shutil
+import argparse
+import threading
 import subprocess
 from pathlib import Path
 from datetime import datetime
@@ -45,10 +46,16 @@ from scripts.infographic_generator import (
     generate_cooking_method
 )
 
+sys.path.insert(0, str(PROJECT_ROOT / "04_pipeline"))
+from render_cache import get_render_cache, format_stats
+from food_data_store import default_food_data_path, get_food_store
+from batch_executor import BatchExecutor, default_workers, format_eta
+
 CONTENTS_DIR = PROJECT_ROOT / "01_contents"
-FOOD_DATA_PATH = PROJECT_ROOT / "config" / "food_data.json"
+FOOD_DATA_PATH = default_food_data_path()
 CTA_SOURCE_DIR = PROJECT_ROOT / "01_contents" / "sunshine photos" / "00_Best" / "crop"
 COVER_SCRIPT = PROJECT_ROOT / "services" / "scripts" / "blog_cover_v2.py"
+JOURNAL_FILE = PROJECT_ROOT / "logs" / "batch_produce_v2" / "journal.jsonl"
 
 # 2026-02-13: 플랫 구조로 변경 - STATUS_DIRS 제거
 # 이제 contents/ 직접 스캔
@@ -77,14 +84,19 @@ results = {
         "food_data": []
     }
 }
+# 폴더는 워커 스레드에서 동시 처리 - stats 카운터 증가만 잠금 (list.append 는 원자적)
+_stats_lock = threading.Lock()
+
+
+def count_stat(name: str):
+    """노드별 제작 건수 +1"""
+    with _stats_lock:
+        results["stats"][name] += 1
 
 
 def load_food_data():
-    """food_data.json 로드"""
-    if FOOD_DATA_PATH.exists():
-        with open(FOOD_DATA_PATH, "r", encoding="utf-8") as f:
-            return json.load(f)
-    return {}
+    """food_data.json 로드 (공용 캐시, 파일 없으면 빈 dict)"""
+    return get_food_store(FOOD_DATA_PATH).data
 
 
 def get_cta_images():
@@ -326,7 +338,7 @@ def process_folder(folder, food_data, cta_images):
             with open(insta_caption_file, "w", encoding="utf-8") as f:
                 f.write(caption)
             print(f"  ├─ 인스타캡션 ✅ (신규 생성)")
-            results["stats"]["caption_insta"] += 1
+            count_stat("caption_insta")
             produced.append("insta_caption")
         except Exception as e:
             print(f"  ├─ 인스타캡션 ❌ ({e})")
@@ -342,7 +354,7 @@ def process_folder(folder, food_data, cta_images):
             with open(threads_caption_file, "w", encoding="utf-8") as f:
                 f.write(caption)
             print(f"  ├─ 쓰레드캡션 ✅ (신규 생성)")
-            results["stats"]["caption_thread"] += 1
+            count_stat("caption_thread")
             produced.append("threads_caption")
         except Exception as e:
             print(f"  ├─ 쓰레드캡션 ❌ ({e})")
@@ -358,7 +370,7 @@ def process_folder(folder, food_data, cta_images):
             with open(blog_caption_file, "w", encoding="utf-8") as f:
                 f.write(caption)
             print(f"  ├─ 블로그캡션 ✅ (신규 생성)")
-            results["stats"]["caption_blog"] += 1
+            count_stat("caption_blog")
             produced.append("blog_caption")
         except Exception as e:
             print(f"  ├─ 블로그캡션 ❌ ({e})")
@@ -379,7 +391,7 @@ def process_folder(folder, food_data, cta_images):
                 )
                 if result.returncode == 0:
                     print(f"  ├─ 표지 ✅ (blog_cover_v2.py)")
-                    results["stats"]["cover"] += 1
+                    count_stat("cover")
                     produced.append("cover")
                 else:
                     print(f"  ├─ 표지 ❌ (생성 실패)")
@@ -401,7 +413,7 @@ def process_folder(folder, food_data, cta_images):
             cta_src = cta_images[cta_idx]
             shutil.copy(cta_src, cta_file)
             print(f"  ├─ CTA ✅ (크롭폴더 선정)")
-            results["stats"]["cta"] += 1
+            count_stat("cta")
             produced.append("cta")
         else:
             print(f"  ├─ CTA ❌ (소스 없음)")
@@ -421,7 +433,7 @@ def process_folder(folder, food_data, cta_images):
         try:
             generate_nutrition_info(food_ko, nutrients, safety, "", slide_03)
             print(f"  ├─ 슬라이드03 ✅ (infographic_generator)")
-            results["stats"]["slide_03"] += 1
+            count_stat("slide_03")
             produced.append("slide_03")
         except Exception as e:
             print(f"  ├─ 슬라이드03 ❌ ({e})")
@@ -435,7 +447,7 @@ def process_folder(folder, food_data, cta_images):
         try:
             generate_do_dont(food_ko, do_items, dont_items, safety, slide_04)
             print(f"  ├─ 슬라이드04 ✅ (infographic_generator)")
-            results["stats"]["slide_04"] += 1
+            count_stat("slide_04")
             produced.append("slide_04")
         except Exception as e:
             print(f"  ├─ 슬라이드04 ❌ ({e})")
@@ -449,7 +461,7 @@ def process_folder(folder, food_data, cta_images):
         try:
             generate_dosage_table(dosages, None, "", safety, slide_05)
             print(f"  ├─ 슬라이드05 ✅ (infographic_generator)")
-            results["stats"]["slide_05"] += 1
+            count_stat("slide_05")
             produced.append("slide_05")
         except Exception as e:
             print(f"  ├─ 슬라이드05 ❌ ({e})")
@@ -464,7 +476,7 @@ def process_folder(folder, food_data, cta_images):
             # precautions는 List[Dict] 형태로 직접 전달 (WO-SCHEMA-001 버그 수정)
             generate_precautions(food_ko, precautions, "", safety, slide_06)
             print(f"  ├─ 슬라이드06 ✅ (infographic_generator)")
-            results["stats"]["slide_06"] += 1
+            count_stat("slide_06")
             produced.append("slide_06")
         except Exception as e:
             print(f"  ├─ 슬라이드06 ❌ ({e})")
@@ -485,7 +497,7 @@ def process_folder(folder, food_data, cta_images):
             ]
             generate_cooking_method(food_ko, steps, "처음 급여 시 소량으로 시작하세요", safety, slide_07)
             print(f"  └─ 슬라이드07 ✅ (infographic_generator)")
-            results["stats"]["slide_07"] += 1
+            count_stat("slide_07")
             produced.append("slide_07")
         except Exception as e:
             print(f"  └─ 슬라이드07 ❌ ({e})")
@@ -549,6 +561,7 @@ def print_report():
     print(f"  완료: {len(results['processed'])}건")
     print(f"  스킵: {len(results['skipped'])}건")
     print(f"  에러: {len(results['errors'])}건")
+    print(f"  {format_stats(get_render_cache().stats())}")
 
     print(f"\n[2. 노드별 제작 건수]")
     print(f"  캡션 3종:")
@@ -599,6 +612,13 @@ def print_report():
 
 
 def main():
+    parser = argparse.ArgumentParser(description="WO-BATCH-003-B AI팀 담당 어셋 일괄 제작")
+    parser.add_argument("--resume", action="store_true", help="저널 기준 완료 폴더 건너뛰고 이어서 실행")
+    parser.add_argument("--workers", type=int, default=None,
+                        help=f"동시 처리 수 (기본: {default_workers()})")
+    parser.add_argument("--retries", type=int, default=1, help="폴더별 재시도 횟수")
+    args = parser.parse_args()
+
     print("="*60)
     print("WO-BATCH-003-B: AI팀 담당 어셋 일괄 제작 (보완)")
     print("="*60)
@@ -612,13 +632,21 @@ def main():
     folders = get_all_folders()
     print(f"콘텐츠 폴더: {len(folders)}개")
 
-    # 전체 처리
-    for i, folder in enumerate(folders):
-        process_folder(folder, food_data, cta_images)
-
+    # 전체 처리 (폴더별 저널 기록, 기존재 파일은 process_folder 가 SKIP → 재시도 안전)
+    def on_progress(progress):
         # 10개마다 진행률 표시
-        if (i + 1) % 10 == 0:
-            print(f"\n>>> 진행률: {i+1}/{len(folders)} ({(i+1)*100//len(folders)}%)")
+        if progress.current % 10 == 0 or progress.current == progress.total:
+            print(f"\n>>> 진행률: {progress.current}/{progress.total} ({progress.current*100//progress.total}%)"
+                  f" · {progress.throughput:.1f}건/분 · 남은 시간 {format_eta(progress.eta)}")
+
+    executor = BatchExecutor(JOURNAL_FILE, workers=args.workers, retries=args.retries)
+    report = executor.run(folders, key=lambda f: f"{f['num']:03d}_{f['food_en']}",
+                          func=lambda f: process_folder(f, food_data, cta_images),
+                          resume=args.resume, on_progress=on_progress)
+    for name, error in report.failed.items():
+        results["errors"].append(f"#{name}: {error[:60]}")
+    if report.skipped:
+        print(f"\n⏭️ 재개: 완료 폴더 {len(report.skipped)}건 건너뜀")
 
     # 노션 동기화
     run_notion_sync()
@@ -3,13 +3,14 @@
 batch_runner.py - 플랫폼별 배치 처리 실행기
 WO-038 v2: 레드2 R4 리스크 차단 + 플랫폼별 콘텐츠 차이 반영
 
-사용법: python3 batch_runner.py [플랫폼] [작업] [대상]
+사용법: python3 batch_runner.py [플랫폼] [작업] [대상] [--resume] [--workers N]
 예시: python3 batch_runner.py insta cover 060-070
 """
 
 import sys
 import os
 import re
+import argparse
 from pathlib import Path
 from typing import List, Tuple, Optional
 from datetime import datetime
@@ -19,6 +20,9 @@ PROJECT_ROOT = Path(__file__).parent.parent
 CONTENTS_DIR = PROJECT_ROOT / "01_contents"
 LOG_DIR = PROJECT_ROOT / "config" / "logs" / "batch"
 
+sys.path.insert(0, str(PROJECT_ROOT / "04_pipeline"))
+from batch_executor import BatchExecutor, format_eta
+
 # 플랫폼 설정
 PLATFORMS = ["insta", "threads", "blog"]
 
@@ -59,7 +63,7 @@ def print_error(msg: str):
 def print_usage():
     """사용법 출력"""
     print("""
-사용법: /batch [플랫폼] [작업] [대상]
+사용법: /batch [플랫폼] [작업] [대상] [--resume] [--workers N]
 
 플랫폼:
   insta     인스타그램
@@ -80,6 +84,11 @@ def print_usage():
   3_approved  폴더 지정
   all         전체
 
+옵션:
+  --resume      같은 플랫폼/작업의 완료 콘텐츠 건너뛰고 이어서 실행
+  --workers N   동시 처리 수 (기본: CPU 수)
+  --retries N   콘텐츠별 재시도 횟수 (기본: 1)
+
 예시:
   /batch insta cover 060-070
   /batch threads caption 3_approved
@@ -200,7 +209,8 @@ def execute_action(platform: str, action: str, content_num: str) -> Tuple[bool,
     return True, "성공"
 
 
-def run_batch(platform: str, action: str, target: str):
+def run_batch(platform: str, action: str, target: str, resume: bool = False,
+              workers: Optional[int] = None, retries: int = 1):
     """배치 작업 실행"""
 
     # 1. 플랫폼-작업 검증
@@ -231,16 +241,29 @@ def run_batch(platform: str, action: str, target: str):
     print(f"대상: {len(contents)}개")
     print("")
 
-    # 5. 순차 실행
+    # 5. 병렬 실행 (플랫폼/작업별 저널 → --resume 시 완료 콘텐츠 건너뜀)
     results = {"success": [], "fail": [], "skip": []}
+    fail_messages = {}
 
-    for content_num in contents:
-        success, msg = execute_action(platform, action, content_num)
-        if success:
-            results["success"].append(content_num)
-        else:
-            results["fail"].append((content_num, msg))
-            print(f"    ❌ {content_num}: {msg}")
+    def on_result(content_num: str, outcome):
+        if outcome is not None and not outcome[0]:
+            fail_messages[content_num] = outcome[1]
+            print(f"    ❌ {content_num}: {outcome[1]}")
+
+    def on_progress(progress):
+        if progress.current % 10 == 0 or progress.current == progress.total:
+            print(f"  >>> {progress.current}/{progress.total} · {progress.throughput:.1f}건/분"
+                  f" · 남은 시간 {format_eta(progress.eta)}")
+
+    executor = BatchExecutor(LOG_DIR / f"journal_{platform}_{action}.jsonl", workers=workers, retries=retries)
+    report = executor.run(contents, key=str,
+                          func=lambda content_num: execute_action(platform, action, content_num),
+                          resume=resume, succeeded=lambda outcome: outcome[0],
+                          on_result=on_result, on_progress=on_progress)
+
+    results["success"] = sorted(report.done)
+    results["skip"] = report.skipped
+    results["fail"] = [(num, fail_messages.get(num, error)) for num, error in sorted(report.failed.items())]
 
     # 6. 요약 보고
     print("")
@@ -251,6 +274,8 @@ def run_batch(platform: str, action: str, target: str):
     print("")
     print(f"✅ 성공: {len(results['success'])}개")
     print(f"❌ 실패: {len(results['fail'])}개")
+    if results["skip"]:
+        print(f"⏭️ 건너뜀 (이전 완료): {len(results['skip'])}개")
 
     if results["fail"]:
         print("")
@@ -269,6 +294,7 @@ def run_batch(platform: str, action: str, target: str):
         f.write(f"Target: {target}\n")
         f.write(f"Success: {results['success']}\n")
         f.write(f"Fail: {results['fail']}\n")
+        f.write(f"Skip: {results['skip']}\n")
 
 
 def main():
@@ -276,11 +302,17 @@ def main():
         print_usage()
         sys.exit(1)
 
-    platform = sys.argv[1].lower()
-    action = sys.argv[2].lower()
-    target = sys.argv[3]
-
-    run_batch(platform, action, target)
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("platform")
+    parser.add_argument("action")
+    parser.add_argument("target")
+    parser.add_argument("--resume", action="store_true")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--retries", type=int, default=1)
+    args = parser.parse_args()
+
+    run_batch(args.platform.lower(), args.action.lower(), args.target,
+              resume=args.resume, workers=args.workers, retries=args.retries)
 
 
 if __name__ == "__main__":
@@ -15,13 +15,15 @@ v1.1 규칙:
    - FORBIDDEN: 경고, 절대 금지 강조
 """
 
-import json
+import sys
 import os
 from pathlib import Path
 
 BASE_DIR = Path("/Users/al02399300/Desktop/Jun_AI/Dog_Contents/project_sunshine")
+sys.path.insert(0, str(Path(__file__).parent.parent / "04_pipeline"))
+from food_data_store import default_food_data_path, get_food_store
 CONTENTS_DIR = BASE_DIR / "01_contents"
-FOOD_DATA_PATH = BASE_DIR / "config" / "food_data.json"
+FOOD_DATA_PATH = default_food_data_path()
 
 # 한국어 -> 영어 번역 매핑
 BENEFIT_TRANSLATIONS = {
@@ -137,8 +139,7 @@ def translate_benefit(korean: str) -> str:
 
 def load_food_data():
     """food_data.json 로드"""
-    with open(FOOD_DATA_PATH, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    return get_food_store(FOOD_DATA_PATH).require()
 
 def get_english_food_name(english_name: str) -> str:
     """영문 이름 정규화 (언더스코어/한글 제거)"""
@@ -4,20 +4,21 @@
 초과: FAQ 줄이기, 부족: 내용 추가
 """
 
-import json
+import sys
 import re
 from pathlib import Path
 
 PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "04_pipeline"))
+from food_data_store import default_food_data_path, get_food_store
 CONTENTS_DIR = PROJECT_ROOT / "01_contents"
-FOOD_DATA_PATH = PROJECT_ROOT / "config" / "food_data.json"
+FOOD_DATA_PATH = default_food_data_path()
 
 TARGET_MIN = 1620
 TARGET_MAX = 1980
 
 def load_food_data():
-    with open(FOOD_DATA_PATH, "r", encoding="utf-8") as f:
-        return json.load(f)
+    return get_food_store(FOOD_DATA_PATH).require()
 
 def get_folder(num: int) -> Path:
     pattern = f"{num:03d}_*"
@@ -6,11 +6,16 @@ BLOG_RULE.md 기준 검수
 
 import json
 import re
+import sys
 from pathlib import Path
 
 PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "04_pipeline"))
+from caption_audit_runner import CaptionAuditRunner, format_summary
+from food_data_store import default_food_data_path, get_food_store
+
 CONTENTS_DIR = PROJECT_ROOT / "01_contents"
-FOOD_DATA_PATH = PROJECT_ROOT / "config" / "food_data.json"
+FOOD_DATA_PATH = default_food_data_path()
 
 # 안전도별 후킹 문구
 HOOKING_PATTERNS = {
@@ -29,23 +34,7 @@ SAFETY_EMOJIS = {
 }
 
 def load_food_data():
-    with open(FOOD_DATA_PATH, "r", encoding="utf-8") as f:
-        return json.load(f)
-
-def find_blog_caption(folder: Path):
-    """블로그 캡션 파일 찾기"""
-    # 새 경로
-    new_path = folder / "blog" / "caption.txt"
-    if new_path.exists():
-        return new_path
-
-    # OLD 경로
-    old_blog_dir = folder / "02_Blog"
-    if old_blog_dir.exists():
-        for f in old_blog_dir.glob("*_Blog_Caption.txt"):
-            return f
-
-    return None
+    return get_food_store(FOOD_DATA_PATH).require()
 
 def audit_blog_caption(content: str, safety: str, food_name: str):
     """블로그 캡션 검수"""
@@ -101,6 +90,10 @@ def audit_blog_caption(content: str, safety: str, food_name: str):
 
     return issues
 
+def audit_check(text: str, platform: str, food: dict) -> dict:
+    """caption_audit_runner 검사 함수 (프로세스 풀 워커에서 실행)"""
+    return {"failed": audit_blog_caption(text, food["safety"], food["name"])}
+
 def main():
     food_data = load_food_data()
 
@@ -112,39 +105,30 @@ def main():
     passes = []
     skipped = []
 
-    for folder in sorted(CONTENTS_DIR.iterdir()):
-        if not folder.is_dir():
-            continue
+    # 콘텐츠 트리 1회 순회 + 바뀐 캡션만 검사 (caption_audit_runner 결과 캐시)
+    runner = CaptionAuditRunner(food_data, checker=audit_check, contents_dir=CONTENTS_DIR)
+    report = runner.run(platforms=["blog"], num_range=(8, 998), skip_unknown=False)
+    records = {r.folder: r for r in report.by_platform("blog")}
 
-        match = re.match(r'^(\d{3})_', folder.name)
-        if not match:
-            continue
+    for folder in report.folders:
+        num = folder.num
+        food_info = runner.food_info(num, folder.name)
+        safety, food_name = food_info["safety"], food_info["name"]
 
-        num = int(match.group(1))
-        if num < 8 or num == 0 or num == 999:
-            continue
-
-        # food_data에서 안전도 가져오기
-        food_info = food_data.get(str(num), {})
-        safety = food_info.get("safety", "UNKNOWN")
-        food_name = food_info.get("name", folder.name.split("_", 1)[1] if "_" in folder.name else folder.name)
-
-        # 블로그 캡션 찾기
-        caption_path = find_blog_caption(folder)
-        if not caption_path:
+        record = records.get(folder.name)
+        if record is None:
             skipped.append((num, food_name, "캡션 파일 없음"))
             continue
 
-        with open(caption_path, "r", encoding="utf-8") as f:
-            content = f.read()
-
-        issues = audit_blog_caption(content, safety, food_name)
-
+        issues = record.failed or ([record.error] if record.error else [])
         if issues:
-            fails.append((num, food_name, safety, issues, caption_path))
+            fails.append((num, food_name, safety, issues, Path(record.path)))
         else:
             passes.append((num, food_name, safety))
 
+    print(f"\n{format_summary(report.summary)}")
+    runner.write_report(report, name="blog_caption_audit")
+
     # 결과 출력
     print(f"\n✅ PASS: {len(passes)}건")
     print(f"❌ FAIL: {len(fails)}건")
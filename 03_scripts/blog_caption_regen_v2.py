@@ -4,13 +4,15 @@
 글자수 1,620~1,980 범위 맞춤
 """
 
-import json
+import sys
 import re
 from pathlib import Path
 
 PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "04_pipeline"))
+from food_data_store import default_food_data_path, get_food_store
 CONTENTS_DIR = PROJECT_ROOT / "01_contents"
-FOOD_DATA_PATH = PROJECT_ROOT / "config" / "food_data.json"
+FOOD_DATA_PATH = default_food_data_path()
 
 HOOKING = {
     "SAFE": '"이거 줘도 되나?" 검색해본 적 있다면, 당신은 좋은 보호자예요.',
@@ -22,8 +24,7 @@ HOOKING = {
 EMOJI = {"SAFE": "🟢", "CAUTION": "🟡", "DANGER": "🟠", "FORBIDDEN": "⛔"}
 
 def load_food_data():
-    with open(FOOD_DATA_PATH, "r", encoding="utf-8") as f:
-        return json.load(f)
+    return get_food_store(FOOD_DATA_PATH).require()
 
 def get_folder(num: int) -> Path:
     pattern = f"{num:03d}_*"
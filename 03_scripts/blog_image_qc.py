@@ -13,7 +13,6 @@ blog_image_qc.py - 블로그 이미지 3~7번 전체 재검수
 
 import os
 import sys
-import json
 import re
 from pathlib import Path
 from PIL import Image
@@ -22,6 +21,9 @@ from typing import Dict, List, Any, Optional
 
 PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(PROJECT_ROOT / "04_pipeline"))
+
+from food_data_store import get_food_store
 
 CONTENTS_DIR = PROJECT_ROOT / "01_contents"
 # 2026-02-13: 플랫 구조 - STATUS_DIRS 제거
@@ -69,11 +71,7 @@ def get_all_content_folders() -> List[Dict]:
 
 def load_food_data() -> Dict:
     """food_data.json 로드"""
-    food_data_path = PROJECT_ROOT / "config" / "food_data.json"
-    if food_data_path.exists():
-        with open(food_data_path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    return {}
+    return get_food_store().data
 
 
 def check_image_resolution(image_path: Path) -> tuple:
@@ -13,15 +13,19 @@ blog_infographic_generator.py - 블로그 인포그래픽 자동 생성
 중앙정렬 검증: §15 이미지-캡션 일치 검증 준수
 """
 
-import json
+import sys
 from pathlib import Path
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageDraw
 
 # 중앙정렬 검증 로그 활성화
 ALIGNMENT_LOG = True
 
 PROJECT_ROOT = Path(__file__).parent.parent
-FOOD_DATA_PATH = PROJECT_ROOT / "config" / "food_data.json"
+sys.path.insert(0, str(PROJECT_ROOT / "04_pipeline"))
+from food_data_store import default_food_data_path, get_food_store
+
+from infographic_toolkit import load_font, paste_gradient
+FOOD_DATA_PATH = default_food_data_path()
 CONTENTS_DIR = PROJECT_ROOT / "01_contents"
 # 2026-02-13: 플랫 구조로 변경 - STATUS_DIRS 제거
 # 이제 contents/ 직접 스캔
@@ -72,29 +76,15 @@ FONT_PATH = "/System/Library/Fonts/AppleSDGothicNeo.ttc"
 
 # 실제 사용할 폰트 찾기
 def get_font(style: str, size: int):
-    """폰트 로드 - AppleSDGothicNeo 사용"""
-    try:
-        # AppleSDGothicNeo.ttc는 여러 weight 포함
-        # index 0: Regular, 5: Bold, 6: ExtraBold
-        if style == "bold":
-            return ImageFont.truetype(FONT_PATH, size, index=5)
-        else:
-            return ImageFont.truetype(FONT_PATH, size, index=0)
-    except Exception as e:
-        print(f"폰트 로드 실패: {e}")
-        return ImageFont.load_default()
-
-
-def draw_gradient(draw, bbox, color_start, color_end, direction="vertical"):
-    """그라데이션 그리기"""
-    x1, y1, x2, y2 = bbox
-    if direction == "vertical":
-        for y in range(y1, y2):
-            ratio = (y - y1) / (y2 - y1) if y2 > y1 else 0
-            r = int(color_start[0] + (color_end[0] - color_start[0]) * ratio)
-            g = int(color_start[1] + (color_end[1] - color_start[1]) * ratio)
-            b = int(color_start[2] + (color_end[2] - color_start[2]) * ratio)
-            draw.line([(x1, y), (x2, y)], fill=(r, g, b))
+    """폰트 로드 - AppleSDGothicNeo 사용 (핸들 캐시 재사용)"""
+    # AppleSDGothicNeo.ttc는 여러 weight 포함
+    # index 0: Regular, 5: Bold, 6: ExtraBold
+    return load_font(FONT_PATH, size, index=5 if style == "bold" else 0)
+
+
+def draw_gradient(img, bbox, color_start, color_end, direction="vertical"):
+    """그라데이션 그리기 (캐시된 그라데이션 붙이기)"""
+    paste_gradient(img, bbox, color_start, color_end, direction)
 
 
 def draw_rounded_rect(draw, bbox, radius, fill):
@@ -217,7 +207,7 @@ def generate_nutrition_card(data: dict, output_path: Path):
     draw = ImageDraw.Draw(img)
 
     # 헤더 그라데이션
-    draw_gradient(draw, (0, 0, 1080, 150), COLORS["mint_start"], COLORS["mint_end"])
+    draw_gradient(img, (0, 0, 1080, 150), COLORS["mint_start"], COLORS["mint_end"])
 
     # 제목 (수평 중앙)
     font_title = get_font("bold", 56)
@@ -303,7 +293,7 @@ def generate_dosage_card(data: dict, output_path: Path):
     draw = ImageDraw.Draw(img)
 
     # 헤더 그라데이션
-    draw_gradient(draw, (0, 0, 1080, 150), COLORS["mint_start"], COLORS["mint_end"])
+    draw_gradient(img, (0, 0, 1080, 150), COLORS["mint_start"], COLORS["mint_end"])
 
     # 제목 (수평 중앙)
     font_title = get_font("bold", 56)
@@ -397,7 +387,7 @@ def generate_do_dont_card(data: dict, output_path: Path):
     draw = ImageDraw.Draw(img)
 
     # 헤더 그라데이션
-    draw_gradient(draw, (0, 0, 1080, 150), COLORS["mint_start"], COLORS["mint_end"])
+    draw_gradient(img, (0, 0, 1080, 150), COLORS["mint_start"], COLORS["mint_end"])
 
     # SAFE 뱃지 (사각형 내부 중앙정렬)
     safety = data.get("safety", "SAFE")
@@ -476,7 +466,7 @@ def generate_caution_card(data: dict, output_path: Path):
     draw = ImageDraw.Draw(img)
 
     # 헤더 그라데이션 (주황)
-    draw_gradient(draw, (0, 0, 1080, 150), COLORS["coral_start"], COLORS["coral_end"])
+    draw_gradient(img, (0, 0, 1080, 150), COLORS["coral_start"], COLORS["coral_end"])
 
     # 제목 (도형 뱃지 + 텍스트)
     # 주의 뱃지 (사각형 내부 중앙정렬)
@@ -542,7 +532,7 @@ def generate_cooking_card(data: dict, output_path: Path):
     draw = ImageDraw.Draw(img)
 
     # 헤더 그라데이션
-    draw_gradient(draw, (0, 0, 1080, 150), COLORS["mint_start"], COLORS["mint_end"])
+    draw_gradient(img, (0, 0, 1080, 150), COLORS["mint_start"], COLORS["mint_end"])
 
     # 제목 (수평 중앙)
     font_title = get_font("bold", 56)
@@ -611,7 +601,7 @@ def generate_toxicity_card(data, output_path):
     draw = ImageDraw.Draw(img)
 
     # 헤더 그라데이션 (빨강 계열)
-    draw_gradient(draw, (0, 0, 1080, 130), COLORS["forbidden_start"], COLORS["forbidden_end"])
+    draw_gradient(img, (0, 0, 1080, 130), COLORS["forbidden_start"], COLORS["forbidden_end"])
 
     font_title = get_font("bold", 48)
     font_subtitle = get_font("regular", 22)
@@ -678,7 +668,7 @@ def generate_symptoms_card(data, output_path):
     draw = ImageDraw.Draw(img)
 
     # 헤더 그라데이션
-    draw_gradient(draw, (0, 0, 1080, 130), COLORS["forbidden_start"], COLORS["forbidden_end"])
+    draw_gradient(img, (0, 0, 1080, 130), COLORS["forbidden_start"], COLORS["forbidden_end"])
 
     font_title = get_font("bold", 48)
     font_subtitle = get_font("regular", 22)
@@ -741,7 +731,7 @@ def generate_emergency_card(data, output_path):
     draw = ImageDraw.Draw(img)
 
     # 헤더 그라데이션
-    draw_gradient(draw, (0, 0, 1080, 130), COLORS["forbidden_start"], COLORS["forbidden_end"])
+    draw_gradient(img, (0, 0, 1080, 130), COLORS["forbidden_start"], COLORS["forbidden_end"])
 
     font_title = get_font("bold", 48)
     font_subtitle = get_font("regular", 22)
@@ -803,7 +793,7 @@ def generate_alternative_card(data, output_path):
     draw = ImageDraw.Draw(img)
 
     # 헤더 그라데이션 (초록 계열 - 긍정적 대안)
-    draw_gradient(draw, (0, 0, 1080, 130), COLORS["mint_start"], COLORS["mint_end"])
+    draw_gradient(img, (0, 0, 1080, 130), COLORS["mint_start"], COLORS["mint_end"])
 
     font_title = get_font("bold", 48)
     font_subtitle = get_font("regular", 22)
@@ -865,7 +855,7 @@ def generate_warning_card(data, output_path):
     draw = ImageDraw.Draw(img)
 
     # 헤더 그라데이션 (빨강)
-    draw_gradient(draw, (0, 0, 1080, 130), COLORS["forbidden_start"], COLORS["forbidden_end"])
+    draw_gradient(img, (0, 0, 1080, 130), COLORS["forbidden_start"], COLORS["forbidden_end"])
 
     font_title = get_font("bold", 48)
     font_subtitle = get_font("regular", 22)
@@ -936,8 +926,7 @@ def generate_warning_card(data, output_path):
 
 def generate_all_infographics(num: int, dry_run: bool = False):
     """모든 인포그래픽 생성 (3~7번)"""
-    with open(FOOD_DATA_PATH, "r", encoding="utf-8") as f:
-        food_data = json.load(f)
+    food_data = get_food_store(FOOD_DATA_PATH).require()
 
     num_str = f"{num:03d}"  # 폴더 찾기용 (예: "011")
     data_key = str(num)      # food_data.json 키용 (예: "11")
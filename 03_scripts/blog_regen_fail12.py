@@ -4,12 +4,14 @@
 BLOG_RULE v3.0 형식 적용
 """
 
-import json
+import sys
 from pathlib import Path
 
 BASE_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(BASE_DIR / "04_pipeline"))
+from food_data_store import default_food_data_path, get_food_store
 CONTENTS_DIR = BASE_DIR / "01_contents"
-FOOD_DATA_PATH = BASE_DIR / "config" / "food_data.json"
+FOOD_DATA_PATH = default_food_data_path()
 
 FAIL_TARGETS = [90, 138, 144, 157, 161, 162, 163, 164, 165, 168, 169, 171]
 
@@ -24,8 +26,7 @@ CONCLUSION_EMOJI = {"SAFE": "✅", "CAUTION": "⚠️", "DANGER": "🚨", "FORBI
 CONCLUSION_TEXT = {"SAFE": "급여 가능!", "CAUTION": "조건부 급여 가능!", "DANGER": "급여 비권장!", "FORBIDDEN": "절대 급여 금지!"}
 
 def load_food_data():
-    with open(FOOD_DATA_PATH, "r", encoding="utf-8") as f:
-        return json.load(f)
+    return get_food_store(FOOD_DATA_PATH).require()
 
 def find_folder(num: int) -> Path:
     """01_contents/ 바로 아래에서 숫자로 시작하는 폴더 찾기"""
@@ -12,20 +12,22 @@
 
 import os
 import json
+import sys
 import re
 from pathlib import Path
 from datetime import datetime
 
 # 경로 설정
 PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "04_pipeline"))
+from food_data_store import default_food_data_path, get_food_store
 CONTENTS_DIR = PROJECT_ROOT / "01_contents"
-FOOD_DATA_PATH = PROJECT_ROOT / "config" / "food_data.json"
+FOOD_DATA_PATH = default_food_data_path()
 OUTPUT_PATH = PROJECT_ROOT / "caption_audit_result.json"
 
 def load_food_data():
     """food_data.json 로드"""
-    with open(FOOD_DATA_PATH, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    return get_food_store(FOOD_DATA_PATH).require()
 
 def get_safety_from_filename(filename):
     """파일명에서 안전도 추출"""
@@ -8,13 +8,14 @@ WO-2026-0216-CAPTION-REGEN
 
 import os
 import sys
-import json
 import re
 from pathlib import Path
 
 PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "04_pipeline"))
+from food_data_store import default_food_data_path, get_food_store
 CONTENTS_DIR = PROJECT_ROOT / "01_contents"
-FOOD_DATA_PATH = PROJECT_ROOT / "config" / "food_data.json"
+FOOD_DATA_PATH = default_food_data_path()
 
 # ============================================================
 # 후킹 패턴 (B안)
@@ -52,8 +53,7 @@ THREADS_HOOK = {
 
 
 def load_food_data():
-    with open(FOOD_DATA_PATH, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    return get_food_store(FOOD_DATA_PATH).require()
 
 
 def find_content_folder(num: int) -> Path:
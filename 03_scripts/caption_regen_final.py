@@ -10,12 +10,14 @@
 - OLD 경로와 NEW 경로 모두에 저장
 """
 
-import json
+import sys
 from pathlib import Path
 
 BASE_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(BASE_DIR / "04_pipeline"))
+from food_data_store import default_food_data_path, get_food_store
 CONTENTS_DIR = BASE_DIR / "01_contents"
-FOOD_DATA_PATH = BASE_DIR / "config" / "food_data.json"
+FOOD_DATA_PATH = default_food_data_path()
 
 # B안 감성 후킹 패턴 (한영 병행)
 HOOKING_PATTERNS = {
@@ -42,8 +44,7 @@ CONCLUSION_TEXT_KO = {"SAFE": "급여 가능!", "CAUTION": "조건부 급여 가
 CONCLUSION_TEXT_EN = {"SAFE": "Safe to feed!", "CAUTION": "Conditional feeding OK!", "DANGER": "Not recommended!", "FORBIDDEN": "Never feed!"}
 
 def load_food_data():
-    with open(FOOD_DATA_PATH, "r", encoding="utf-8") as f:
-        return json.load(f)
+    return get_food_store(FOOD_DATA_PATH).require()
 
 def find_folder(num: int) -> Path:
     for folder in CONTENTS_DIR.iterdir():
@@ -10,7 +10,6 @@ v3.1: ENUM 단일 판정, 금지 키워드 차단, 이미지-캡션 일치 검
 
 import os
 import sys
-import json
 import argparse
 from pathlib import Path
 from datetime import datetime
@@ -19,8 +18,10 @@ from typing import Dict, List, Optional, Tuple
 
 PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(PROJECT_ROOT / "04_pipeline"))
+from food_data_store import default_food_data_path, get_food_store
 
-FOOD_DATA_PATH = PROJECT_ROOT / "config" / "food_data.json"
+FOOD_DATA_PATH = default_food_data_path()
 CONTENTS_DIR = PROJECT_ROOT / "01_contents"
 LOGS_DIR = PROJECT_ROOT / "logs" / "validation"
 # 2026-02-13: 플랫 구조 - STATUS_DIRS 제거
@@ -41,8 +42,7 @@ def get_safety_from_source(food_id: int) -> Safety:
     §22.11.1: 단일 source에서 1회만 판정
     food_data.json이 유일한 source
     """
-    with open(FOOD_DATA_PATH, "r", encoding="utf-8") as f:
-        food_data = json.load(f)
+    food_data = get_food_store(FOOD_DATA_PATH).require()
 
     data = food_data.get(str(food_id), {})
     safety_str = data.get("safety", "SAFE").upper()
@@ -400,8 +400,7 @@ def scan_all(start: int = 1, end: int = 999, verbose: bool = True):
         "by_safety": {"SAFE": 0, "CAUTION": 0, "FORBIDDEN": 0}
     }
 
-    with open(FOOD_DATA_PATH, "r", encoding="utf-8") as f:
-        food_data = json.load(f)
+    food_data = get_food_store(FOOD_DATA_PATH).require()
 
     for food_id in range(start, end + 1):
         if str(food_id) not in food_data:
@@ -28,6 +28,9 @@ from pathlib import Path
 from datetime import datetime
 
 PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "04_pipeline"))
+from food_data_store import get_food_store
+
 PD_FOLDER = PROJECT_ROOT / "박PD_확인용"
 
 # 원본 파일 경로
@@ -213,7 +216,7 @@ def create_review_samples(baseline_hashes: dict):
     random.seed(seed)
 
     # 37개 FORBIDDEN 음식에서 8건 추출
-    food_data = json.load(open(PROJECT_ROOT / "config" / "food_data.json"))
+    food_data = get_food_store().require()
     toxicity = json.load(open(PROJECT_ROOT / "config" / "toxicity_mapping.json"))
 
     forbidden_ids = []
@@ -1,12 +1,20 @@
 #!/usr/bin/env python3
 """
 crop 폴더 유사/중복 이미지 삭제 스크립트
-수동 검토 후 확정된 삭제 목록
+- 기본: 수동 검토 후 확정된 삭제 목록
+- --auto: 지각 해시 인덱스로 유사 그룹 검출 (그룹 내 첫 번호 보관)
+  --apply 없으면 삭제 예정 목록만 출력
 """
 
 import os
+import sys
+import argparse
 from pathlib import Path
 
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "04_pipeline"))
+from image_hash_index import ImageHashIndex, NEAR_DUPLICATE_RADIUS
+
 CROP_DIR = Path("/Users/al02399300/Desktop/Jun_AI/Dog_Contents/project_sunshine/contents/sunshine photos/00_Best/crop")
 
 # 삭제 대상 파일 목록 (수동 검토 완료)
@@ -64,29 +72,60 @@ DELETE_LIST = [
     "haetsali_happy_sit_indoor_0207.png",
 ]
 
+def find_similar_groups(radius: int = NEAR_DUPLICATE_RADIUS) -> list:
+    """지각 해시 유사 그룹 -> [(보관 파일명, [삭제 파일명, ...]), ...]"""
+    index = ImageHashIndex.for_pool("crop", [CROP_DIR], extensions=(".png",))
+    index.update()
+
+    groups = []
+    for group in index.duplicate_groups(radius):
+        names = sorted(Path(p).name for p in group)
+        groups.append((names[0], names[1:]))
+    return groups
+
+
 def main():
+    parser = argparse.ArgumentParser(description="crop 폴더 유사/중복 이미지 삭제")
+    parser.add_argument("--auto", action="store_true", help="수동 목록 대신 지각 해시 유사 그룹 사용")
+    parser.add_argument("--radius", type=int, default=NEAR_DUPLICATE_RADIUS, help="유사 판정 해밍 반경")
+    parser.add_argument("--apply", action="store_true", help="--auto 결과 실제 삭제")
+    args = parser.parse_args()
+
     print("=" * 60)
     print("유사/중복 이미지 삭제")
     print("=" * 60)
 
+    delete_list = DELETE_LIST
+    dry_run = False
+    if args.auto:
+        delete_list = []
+        for keep, similar in find_similar_groups(args.radius):
+            print(f"📁 {keep} 보관 ← {', '.join(similar)}")
+            delete_list.extend(similar)
+        dry_run = not args.apply
+        print()
+
     deleted = 0
     not_found = 0
     total_size = 0
 
-    for filename in DELETE_LIST:
+    for filename in delete_list:
         filepath = CROP_DIR / filename
         if filepath.exists():
             size = filepath.stat().st_size
             total_size += size
-            filepath.unlink()
-            print(f"✅ 삭제: {filename}")
+            if dry_run:
+                print(f"[삭제예정] {filename}")
+            else:
+                filepath.unlink()
+                print(f"✅ 삭제: {filename}")
             deleted += 1
         else:
             print(f"⚠️ 없음: {filename}")
             not_found += 1
 
     print("\n" + "=" * 60)
-    print(f"삭제 완료: {deleted}개")
+    print(f"{'삭제 예정' if dry_run else '삭제 완료'}: {deleted}개")
     print(f"없는 파일: {not_found}개")
     print(f"확보 용량: {total_size / 1024 / 1024:.1f} MB")
     print("=" * 60)
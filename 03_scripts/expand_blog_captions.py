@@ -4,14 +4,15 @@ expand_blog_captions.py - 블로그 캡션 글자수 확충
 목표: 1,620~1,980자
 """
 
-import json
 import re
 import sys
 from pathlib import Path
 
 PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "04_pipeline"))
+from food_data_store import default_food_data_path, get_food_store
 CONTENTS_DIR = PROJECT_ROOT / "01_contents"
-FOOD_DATA_PATH = PROJECT_ROOT / "config" / "food_data.json"
+FOOD_DATA_PATH = default_food_data_path()
 
 # 햇살이 경험담 추가 문구 (안전도별)
 HAESSARI_ADDITIONS = {
@@ -427,8 +428,7 @@ def main():
         start_id = int(sys.argv[1])
         end_id = int(sys.argv[2])
 
-    with open(FOOD_DATA_PATH, "r", encoding="utf-8") as f:
-        food_data = json.load(f)
+    food_data = get_food_store(FOOD_DATA_PATH).require()
 
     print("=" * 60)
     print(f"블로그 캡션 글자수 확충 ({start_id:03d}~{end_id:03d})")
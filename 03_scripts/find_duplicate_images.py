@@ -1,104 +1,99 @@
 #!/usr/bin/env python3
 """
 이미지 해시 기반 중복 검출 스크립트
-- 파일 크기 + 이미지 해시로 중복 감지
+- 파일 크기 + 파일 해시로 완전 동일 파일 감지
+- 지각 해시(pHash) 인덱스 + 해밍 반경으로 유사 이미지 감지
+  (리사이즈/재압축/소폭 크롭 포함, 변경된 파일만 재해시)
 - 중복 이미지 자동 삭제 (원본 1개만 유지)
 """
 
 import os
+import sys
 import hashlib
+import argparse
 from pathlib import Path
-from PIL import Image
 from collections import defaultdict
 
-BEST_FOLDER = Path("/Users/al02399300/Desktop/Jun_AI/Dog_Contents/project_sunshine/contents/sunshine photos/00_Best")
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "04_pipeline"))
+from image_hash_index import ImageHashIndex, NEAR_DUPLICATE_RADIUS
 
-def get_image_hash(img_path: Path) -> str:
-    """이미지 콘텐츠 해시 생성 (리사이즈 후 비교)"""
-    try:
-        img = Image.open(img_path).convert('RGB')
-        # 작은 크기로 리사이즈하여 비교 (빠른 처리)
-        img_small = img.resize((64, 64), Image.Resampling.LANCZOS)
-        
-        # 픽셀 데이터로 해시 생성
-        pixels = list(img_small.getdata())
-        pixel_str = str(pixels)
-        return hashlib.md5(pixel_str.encode()).hexdigest()
-    except Exception as e:
-        return None
+BEST_FOLDER = Path("/Users/al02399300/Desktop/Jun_AI/Dog_Contents/project_sunshine/contents/sunshine photos/00_Best")
 
 
 def get_file_hash(file_path: Path) -> str:
-    """파일 바이너리 해시 (완전 동일 파일)"""
+    """파일 바이너리 해시 (완전 동일 파일, 청크 단위 읽기)"""
     try:
+        hash_md5 = hashlib.md5()
         with open(file_path, 'rb') as f:
-            return hashlib.md5(f.read()).hexdigest()
-    except:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                hash_md5.update(chunk)
+        return hash_md5.hexdigest()
+    except OSError:
         return None
 
 
-def find_duplicates():
+def find_duplicates(folder: Path = BEST_FOLDER, radius: int = NEAR_DUPLICATE_RADIUS):
     """중복 이미지 검출"""
     print("=" * 60)
     print("이미지 중복 검출 (해시 기반)")
     print("=" * 60)
     print()
-    
+
     # 1단계: 파일 크기로 그룹화
     print("[1/3] 파일 크기로 그룹화...")
     size_groups = defaultdict(list)
-    
-    for img_path in BEST_FOLDER.glob("*.jpg"):
+
+    for img_path in folder.glob("*.jpg"):
         size = img_path.stat().st_size
         size_groups[size].append(img_path)
-    
+
     # 같은 크기 그룹만 추출
     same_size_groups = {k: v for k, v in size_groups.items() if len(v) > 1}
     print(f"     동일 크기 그룹: {len(same_size_groups)}개")
-    
+
     # 2단계: 파일 해시로 완전 동일 파일 검출
     print("\n[2/3] 파일 해시로 완전 동일 검출...")
     exact_duplicates = []
-    
+
     for size, files in same_size_groups.items():
         hash_groups = defaultdict(list)
         for f in files:
             h = get_file_hash(f)
             if h:
                 hash_groups[h].append(f)
-        
+
         for h, group in hash_groups.items():
             if len(group) > 1:
                 # 첫 번째 파일 유지, 나머지 삭제 대상
-                exact_duplicates.extend(group[1:])
-    
+                exact_duplicates.extend(sorted(group)[1:])
+
     print(f"     완전 동일 파일: {len(exact_duplicates)}개")
-    
-    # 3단계: 이미지 해시로 유사 이미지 검출
-    print("\n[3/3] 이미지 해시로 유사 검출...")
-    
-    all_images = list(BEST_FOLDER.glob("*.jpg"))
+
+    # 3단계: 지각 해시로 유사 이미지 검출
+    print(f"\n[3/3] 지각 해시로 유사 검출 (해밍 반경 {radius})...")
+
+    index = ImageHashIndex.for_pool("best_photos", [folder], extensions=(".jpg",))
+    stats = index.update()
+    print(f"     인덱스 {len(index)}건 (신규 {stats['added']}, 갱신 {stats['updated']}, "
+          f"유지 {stats['unchanged']})")
+
     # 이미 삭제 대상인 파일 제외
-    remaining = [f for f in all_images if f not in exact_duplicates]
-    
-    image_hash_groups = defaultdict(list)
-    for img_path in remaining:
-        h = get_image_hash(img_path)
-        if h:
-            image_hash_groups[h].append(img_path)
-    
+    excluded = {str(f.resolve()) for f in exact_duplicates}
+
     similar_duplicates = []
-    for h, group in image_hash_groups.items():
+    for group in index.duplicate_groups(radius):
+        group = [Path(p) for p in group if p not in excluded]
         if len(group) > 1:
             # 가장 큰 파일 유지, 나머지 삭제
             group_sorted = sorted(group, key=lambda x: x.stat().st_size, reverse=True)
             similar_duplicates.extend(group_sorted[1:])
-    
+
     print(f"     유사 이미지: {len(similar_duplicates)}개")
-    
+
     # 결과 합산
-    all_duplicates = list(set(exact_duplicates + similar_duplicates))
-    
+    all_duplicates = list({f.resolve() for f in exact_duplicates + similar_duplicates})
+
     return all_duplicates
 
 
@@ -128,8 +123,13 @@ def delete_duplicates(duplicates: list, dry_run: bool = True):
 
 
 def main():
+    parser = argparse.ArgumentParser(description="이미지 중복 검출")
+    parser.add_argument("--folder", type=Path, default=BEST_FOLDER, help="검사 폴더")
+    parser.add_argument("--radius", type=int, default=NEAR_DUPLICATE_RADIUS, help="유사 판정 해밍 반경 (0~64)")
+    args = parser.parse_args()
+
     # 중복 검출
-    duplicates = find_duplicates()
+    duplicates = find_duplicates(args.folder, args.radius)
     
     print()
     print("=" * 60)
@@ -153,7 +153,7 @@ def main():
         print("\n✅ 중복 파일 없음!")
     
     # 최종 상태
-    remaining = len(list(BEST_FOLDER.glob("*.jpg")))
+    remaining = len(list(args.folder.glob("*.jpg")))
     print(f"\n📁 남은 파일: {remaining}개")
 
 
@@ -16,7 +16,6 @@ WO-PHASE2-SUPPLEMENT B-1
 
 import os
 import sys
-import json
 import argparse
 import re
 from pathlib import Path
@@ -25,9 +24,11 @@ from typing import Dict, List, Tuple, Optional
 
 PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(PROJECT_ROOT / "04_pipeline"))
+from food_data_store import default_food_data_path, get_food_store
 
 CONTENTS_DIR = PROJECT_ROOT / "01_contents"
-FOOD_DATA_PATH = PROJECT_ROOT / "config" / "food_data.json"
+FOOD_DATA_PATH = default_food_data_path()
 LOGS_DIR = PROJECT_ROOT / "logs" / "fix_captions"
 # 2026-02-13: 플랫 구조 - STATUS_DIRS 제거
 # STATUS_DIRS = ["1_cover_only", "2_body_ready", "3_approved", "4_posted"]
@@ -107,8 +108,7 @@ def find_caption_files(content_folder: Path) -> List[Path]:
 
 def get_forbidden_ids() -> List[int]:
     """FORBIDDEN 음식 ID 목록 조회"""
-    with open(FOOD_DATA_PATH, "r", encoding="utf-8") as f:
-        food_data = json.load(f)
+    food_data = get_food_store(FOOD_DATA_PATH).require()
 
     forbidden_ids = []
     for food_id, data in food_data.items():
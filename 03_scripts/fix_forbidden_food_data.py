@@ -25,8 +25,10 @@ from copy import deepcopy
 
 PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(PROJECT_ROOT / "04_pipeline"))
+from food_data_store import default_food_data_path, get_food_store
 
-FOOD_DATA_PATH = PROJECT_ROOT / "config" / "food_data.json"
+FOOD_DATA_PATH = default_food_data_path()
 TOXICITY_MAPPING_PATH = PROJECT_ROOT / "config" / "toxicity_mapping.json"
 LOGS_DIR = PROJECT_ROOT / "logs" / "fix_food_data"
 
@@ -272,8 +274,8 @@ def run_fix(
     print(f"FORBIDDEN 음식 데이터 수정 {'(DRY-RUN)' if dry_run else '(EXECUTE)'}")
     print("=" * 60)
 
-    # 데이터 로드
-    food_data = load_json(FOOD_DATA_PATH)
+    # 데이터 로드 (공용 캐시는 읽기 전용 -> 수정용 사본)
+    food_data = deepcopy(get_food_store(FOOD_DATA_PATH).require())
     toxicity_mapping = load_json(TOXICITY_MAPPING_PATH)
 
     # 대상 결정
@@ -328,7 +330,7 @@ def run_fix(
     if not dry_run:
         # 백업 생성
         backup_path = FOOD_DATA_PATH.with_suffix(".json.bak")
-        original_data = load_json(FOOD_DATA_PATH)
+        original_data = get_food_store(FOOD_DATA_PATH).require()
         save_json(backup_path, original_data)
         print(f"\n백업 생성: {backup_path}")
 
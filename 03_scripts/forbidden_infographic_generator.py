@@ -11,13 +11,14 @@ FORBIDDEN 이미지 구조:
 - 7번: 수의사 상담 (not 조리 방법)
 """
 
-import json
 import sys
 from pathlib import Path
 from PIL import Image, ImageDraw, ImageFont
 
 PROJECT_ROOT = Path(__file__).parent.parent
-FOOD_DATA_PATH = PROJECT_ROOT / "config" / "food_data.json"
+sys.path.insert(0, str(PROJECT_ROOT / "04_pipeline"))
+from food_data_store import default_food_data_path, get_food_store
+FOOD_DATA_PATH = default_food_data_path()
 CONTENTS_DIR = PROJECT_ROOT / "01_contents"
 # 2026-02-13: 플랫 구조 - STATUS_DIRS 제거
 # STATUS_DIRS = ["4_posted", "3_approved", "2_body_ready", "1_cover_only"]
@@ -388,15 +389,14 @@ def generate_vet_consult(data: dict, output_path: Path):
 
 def generate_forbidden_infographics(num: int):
     """FORBIDDEN 음식 인포그래픽 생성 (3~7번)"""
-    with open(FOOD_DATA_PATH, "r", encoding="utf-8") as f:
-        food_data = json.load(f)
+    food_data = get_food_store(FOOD_DATA_PATH).require()
 
     num_str = str(num)
     if num_str not in food_data:
         print(f"  {num}: 데이터 없음")
         return None
 
-    data = food_data[num_str]
+    data = dict(food_data[num_str])  # 공용 캐시 항목은 읽기 전용
 
     if data.get("safety") != "FORBIDDEN":
         print(f"  {num}. {data.get('name', '')}: FORBIDDEN 아님 (스킵)")
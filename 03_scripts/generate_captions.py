@@ -4,11 +4,13 @@ generate_captions.py - 인스타/블로그 캡션 배치 생성
 RULES.md §2.7, §2.8 템플릿 준수
 """
 
-import json
+import sys
 from pathlib import Path
 
 PROJECT_ROOT = Path(__file__).parent.parent
-FOOD_DATA_PATH = PROJECT_ROOT / "config" / "food_data.json"
+sys.path.insert(0, str(PROJECT_ROOT / "04_pipeline"))
+from food_data_store import default_food_data_path, get_food_store
+FOOD_DATA_PATH = default_food_data_path()
 CONTENTS_DIR = PROJECT_ROOT / "01_contents"
 # 2026-02-13: 플랫 구조로 변경 - STATUS_DIRS 제거
 # 이제 contents/ 직접 스캔
@@ -16,8 +18,7 @@ CONTENTS_DIR = PROJECT_ROOT / "01_contents"
 
 def load_food_data():
     """음식 데이터 로드"""
-    with open(FOOD_DATA_PATH, "r", encoding="utf-8") as f:
-        return json.load(f)
+    return get_food_store(FOOD_DATA_PATH).require()
 
 
 def find_content_folder(num: int) -> Path:
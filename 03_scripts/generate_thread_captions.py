@@ -6,10 +6,11 @@ Thread Caption Generator v1.1
 
 import os
 import sys
-import json
 from pathlib import Path
 
 BASE_PATH = "/Users/al02399300/Desktop/Jun_AI/Dog_Contents/project_sunshine"
+sys.path.insert(0, str(Path(__file__).parent.parent / "04_pipeline"))
+from food_data_store import get_food_store
 
 # 음식별 이모지 매핑 (확장)
 FOOD_EMOJI = {
@@ -177,8 +178,7 @@ def main():
     print()
 
     # food_data.json 로드
-    with open(os.path.join(BASE_PATH, "config", "food_data.json"), 'r', encoding='utf-8') as f:
-        food_data = json.load(f)
+    food_data = get_food_store().require()
 
     generated = 0
     skipped = 0
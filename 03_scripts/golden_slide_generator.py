@@ -10,11 +10,15 @@ v1.0 - 2026-02-14
 """
 
 import json
+import sys
 from pathlib import Path
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageDraw
 
 # 경로 설정
 PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "04_pipeline"))
+
+from infographic_toolkit import load_font, paste_gradient
 GOLDEN_DIR = PROJECT_ROOT / "00_rules" / "02_Image_rules" / "Blog_04-07"
 
 # 해상도: 1080 x 1350px (4:5 세로)
@@ -113,31 +117,18 @@ BADGE_WIDTHS = {
 }
 
 
+# AppleSDGothicNeo.ttc index: 0 Regular, 5 SemiBold, 6 Bold, 7 Heavy
+FONT_INDEX = {"extrabold": 7, "bold": 6, "semibold": 5, "regular": 0}
+
+
 def get_font(style: str, size: int):
-    """폰트 로드 - AppleSDGothicNeo (SAFE 기준 통일)"""
-    try:
-        if style == "extrabold":
-            return ImageFont.truetype(FONT_PATH, size, index=7)  # Heavy
-        elif style == "bold":
-            return ImageFont.truetype(FONT_PATH, size, index=6)  # Bold
-        elif style == "semibold":
-            return ImageFont.truetype(FONT_PATH, size, index=5)  # SemiBold
-        else:  # regular
-            return ImageFont.truetype(FONT_PATH, size, index=0)  # Regular
-    except Exception as e:
-        print(f"폰트 로드 실패: {e}")
-        return ImageFont.load_default()
-
-
-def draw_gradient(draw, bbox, color_start, color_end):
-    """수직 그라데이션"""
-    x1, y1, x2, y2 = bbox
-    for y in range(y1, y2):
-        ratio = (y - y1) / (y2 - y1) if y2 > y1 else 0
-        r = int(color_start[0] + (color_end[0] - color_start[0]) * ratio)
-        g = int(color_start[1] + (color_end[1] - color_start[1]) * ratio)
-        b = int(color_start[2] + (color_end[2] - color_start[2]) * ratio)
-        draw.line([(x1, y), (x2, y)], fill=(r, g, b))
+    """폰트 로드 - AppleSDGothicNeo (SAFE 기준 통일, 핸들 캐시 재사용)"""
+    return load_font(FONT_PATH, size, index=FONT_INDEX.get(style, 0))
+
+
+def draw_gradient(img, bbox, color_start, color_end):
+    """수직 그라데이션 (캐시된 그라데이션 붙이기)"""
+    paste_gradient(img, bbox, color_start, color_end)
 
 
 def draw_rounded_rect(draw, bbox, radius, fill):
@@ -188,7 +179,7 @@ def generate_03_nutrition(safety: str, food_data: dict, output_path: Path):
     draw = ImageDraw.Draw(img)
 
     # 헤더 그라데이션 (120px)
-    draw_gradient(draw, (0, 0, WIDTH, 120), colors["header_start"], colors["header_end"])
+    draw_gradient(img, (0, 0, WIDTH, 120), colors["header_start"], colors["header_end"])
 
     # 제목 (SAFE 기준 통일)
     font_title = get_font("extrabold", FONT_SIZES["header_title"])
@@ -279,7 +270,7 @@ def generate_04_feeding(safety: str, food_data: dict, output_path: Path):
     draw = ImageDraw.Draw(img)
 
     # 헤더 그라데이션
-    draw_gradient(draw, (0, 0, WIDTH, 120), colors["header_start"], colors["header_end"])
+    draw_gradient(img, (0, 0, WIDTH, 120), colors["header_start"], colors["header_end"])
 
     # 안전도 배지 (상단 중앙) - 동적 너비
     badge_width_04 = BADGE_WIDTHS.get(safety, 100) + 20  # 04번은 좀 더 넓게
@@ -398,7 +389,7 @@ def generate_05_amount(safety: str, food_data: dict, output_path: Path):
     draw = ImageDraw.Draw(img)
 
     # 헤더 그라데이션
-    draw_gradient(draw, (0, 0, WIDTH, 120), colors["header_start"], colors["header_end"])
+    draw_gradient(img, (0, 0, WIDTH, 120), colors["header_start"], colors["header_end"])
 
     # 제목 (SAFE 기준 통일)
     font_title = get_font("extrabold", FONT_SIZES["header_title"])
@@ -527,7 +518,7 @@ def generate_06_caution(safety: str, food_data: dict, output_path: Path):
     # 헤더 그라데이션 (주황/코랄 계열)
     coral_start = (247, 168, 139) if safety == "SAFE" else colors["header_start"]
     coral_end = (251, 196, 174) if safety == "SAFE" else colors["header_end"]
-    draw_gradient(draw, (0, 0, WIDTH, 120), coral_start, coral_end)
+    draw_gradient(img, (0, 0, WIDTH, 120), coral_start, coral_end)
 
     # 제목 뱃지 + 텍스트
     if safety in ["SAFE", "CAUTION"]:
@@ -631,7 +622,7 @@ def generate_07_cooking(safety: str, food_data: dict, output_path: Path):
     draw = ImageDraw.Draw(img)
 
     # 헤더 그라데이션
-    draw_gradient(draw, (0, 0, WIDTH, 120), colors["header_start"], colors["header_end"])
+    draw_gradient(img, (0, 0, WIDTH, 120), colors["header_start"], colors["header_end"])
 
     # 제목 (SAFE 기준 통일)
     font_title = get_font("extrabold", FONT_SIZES["header_title"])
@@ -17,6 +17,13 @@ from PIL import Image, ImageDraw, ImageFont
 
 PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(PROJECT_ROOT / "04_pipeline"))
+
+import infographic_toolkit
+from infographic_toolkit import (
+    circle_badge, load_font as load_font_file, paste_component, paste_gradient, rounded_badge,
+)
+from render_cache import cached_render, design_fingerprint
 
 
 # =============================================================================
@@ -126,13 +133,10 @@ STEP_COLORS = ["#8BC34A", "#A5D6A7", "#FFEB3B", "#90CAF9", "#FFC107"]
 # 공통 유틸리티 함수
 # =============================================================================
 def load_font(font_type: str, size: int) -> ImageFont.FreeTypeFont:
-    """폰트 로드"""
-    try:
-        path = FONT_PATHS.get(font_type, FONT_PATHS["regular"])
-        index = 6 if font_type == "bold" else 2
-        return ImageFont.truetype(path, size, index=index)
-    except Exception:
-        return ImageFont.load_default()
+    """폰트 로드 (핸들 캐시 재사용)"""
+    path = FONT_PATHS.get(font_type, FONT_PATHS["regular"])
+    index = 6 if font_type == "bold" else 2
+    return load_font_file(path, size, index=index)
 
 
 def hex_to_rgb(hex_color: str) -> Tuple[int, int, int]:
@@ -143,35 +147,25 @@ def hex_to_rgb(hex_color: str) -> Tuple[int, int, int]:
 
 def draw_gradient_header(draw: ImageDraw.Draw, img: Image.Image,
                          colors: List[Tuple[int, int, int]], height: int = 130):
-    """그라데이션 헤더"""
-    for y in range(height):
-        ratio = y / height
-        r = int(colors[0][0] + (colors[1][0] - colors[0][0]) * ratio)
-        g = int(colors[0][1] + (colors[1][1] - colors[0][1]) * ratio)
-        b = int(colors[0][2] + (colors[1][2] - colors[0][2]) * ratio)
-        for x in range(CANVAS_SIZE[0]):
-            img.putpixel((x, y), (r, g, b))
+    """그라데이션 헤더 (캐시된 그라데이션 붙이기)"""
+    paste_gradient(img, (0, 0, CANVAS_SIZE[0], height), colors[0], colors[1])
 
 
-def draw_rounded_badge(draw: ImageDraw.Draw, text: str, position: Tuple[int, int],
+def draw_rounded_badge(img: Image.Image, text: str, position: Tuple[int, int],
                        bg_color: str, text_color: str, font: ImageFont.FreeTypeFont,
                        padding_x: int = 20, padding_y: int = 8, radius: int = 15):
     """둥근 배지 그리기"""
     bbox = font.getbbox(text)
     text_width = bbox[2] - bbox[0]
     text_height = bbox[3] - bbox[1]
-    x, y = position
 
-    draw.rounded_rectangle(
-        [x, y, x + text_width + padding_x * 2, y + text_height + padding_y * 2],
-        radius=radius,
-        fill=bg_color
-    )
-    draw.text((x + padding_x, y + padding_y), text, fill=text_color, font=font)
+    badge = rounded_badge((text_width + padding_x * 2, text_height + padding_y * 2), radius, bg_color,
+                          text, font, text_color, (padding_x, padding_y))
+    paste_component(img, badge, position)
     return text_width + padding_x * 2
 
 
-def draw_right_aligned_badge(draw: ImageDraw.Draw, text: str, y: int,
+def draw_right_aligned_badge(img: Image.Image, text: str, y: int,
                               bg_color: str, text_color: str, font: ImageFont.FreeTypeFont,
                               right_margin: int = 40, padding_x: int = 20, padding_y: int = 8,
                               radius: int = 15):
@@ -184,54 +178,40 @@ def draw_right_aligned_badge(draw: ImageDraw.Draw, text: str, y: int,
     # 우측 마진을 고려하여 x 위치 계산
     x = CANVAS_SIZE[0] - badge_width - right_margin
 
-    draw.rounded_rectangle(
-        [x, y, x + badge_width, y + text_height + padding_y * 2],
-        radius=radius,
-        fill=bg_color
-    )
-    draw.text((x + padding_x, y + padding_y), text, fill=text_color, font=font)
+    badge = rounded_badge((badge_width, text_height + padding_y * 2), radius, bg_color,
+                          text, font, text_color, (padding_x, padding_y))
+    paste_component(img, badge, (x, y))
     return badge_width
 
 
-def draw_check_circle(draw: ImageDraw.Draw, position: Tuple[int, int],
+def draw_check_circle(img: Image.Image, position: Tuple[int, int],
                       font: ImageFont.FreeTypeFont, is_do: bool = True):
     """§15.10 준수: 원형 V/X 마크"""
-    x, y = position
-    radius = 14
     color = SAFE_PALETTE["badge"] if is_do else "#F44336"
-
-    draw.ellipse([x - radius, y - radius, x + radius, y + radius], fill=color)
     text = "V" if is_do else "X"
-    draw.text((x - 6, y - 10), text, fill=COMMON_COLORS["white"], font=font)
+    paste_component(img, circle_badge(14, color, text, font, COMMON_COLORS["white"], (-6, -10)),
+                    position)
 
 
-def draw_number_badge(draw: ImageDraw.Draw, number: int, position: Tuple[int, int],
+def draw_number_badge(img: Image.Image, number: int, position: Tuple[int, int],
                       font: ImageFont.FreeTypeFont, color: str = None):
     """원형 번호 뱃지"""
-    x, y = position
-    radius = 25
     bg_color = color or BADGE_COLORS[(number - 1) % len(BADGE_COLORS)]
+    paste_component(img, circle_badge(25, bg_color, str(number), font, COMMON_COLORS["white"], (-8, -15)),
+                    position)
 
-    draw.ellipse([x - radius, y - radius, x + radius, y + radius], fill=bg_color)
-    draw.text((x - 8, y - 15), str(number), fill=COMMON_COLORS["white"], font=font)
 
-
-def draw_step_badge(draw: ImageDraw.Draw, step_num: int, position: Tuple[int, int],
+def draw_step_badge(img: Image.Image, step_num: int, position: Tuple[int, int],
                     font: ImageFont.FreeTypeFont):
     """STEP N 둥근 배지"""
-    x, y = position
     text = f"STEP {step_num}"
     color = STEP_COLORS[(step_num - 1) % len(STEP_COLORS)]
 
     bbox = font.getbbox(text)
     text_width = bbox[2] - bbox[0]
 
-    draw.rounded_rectangle(
-        [x, y, x + text_width + 20, y + 32],
-        radius=16,
-        fill=color
-    )
-    draw.text((x + 10, y + 5), text, fill=COMMON_COLORS["white"], font=font)
+    badge = rounded_badge((text_width + 20, 32), 16, color, text, font, COMMON_COLORS["white"], (10, 5))
+    paste_component(img, badge, position)
     return text_width + 20
 
 
@@ -305,7 +285,7 @@ def generate_safe_nutrition_info(
 
     # 안전도 배지 (우측 정렬, 잘림 방지)
     badge_text = safety.value
-    draw_right_aligned_badge(draw, badge_text, 40,
+    draw_right_aligned_badge(img, badge_text, 40,
                               palette["badge_bg"], COMMON_COLORS["white"], fonts["badge"])
 
     # 영양소 카드
@@ -318,7 +298,7 @@ def generate_safe_nutrition_info(
             [margin, y_pos, CANVAS_SIZE[0] - margin, y_pos + card_height],
             radius=10, fill=COMMON_COLORS["box_blue"]
         )
-        draw_number_badge(draw, i, (margin + 50, y_pos + card_height // 2), fonts["badge"])
+        draw_number_badge(img, i, (margin + 50, y_pos + card_height // 2), fonts["badge"])
         draw.text((margin + 95, y_pos + 20), nutrient["name"],
                   fill=COMMON_COLORS["text_dark"], font=fonts["card_title"])
         draw.text((margin + 95, y_pos + 58), nutrient.get("benefit", ""),
@@ -408,7 +388,7 @@ def generate_safe_do_dont(
 
     y_pos = do_box_y + 30
     for item in do_items[:3]:
-        draw_check_circle(draw, (margin + 35, y_pos + 12), fonts["check"], is_do=True)
+        draw_check_circle(img, (margin + 35, y_pos + 12), fonts["check"], is_do=True)
         draw.text((margin + 60, y_pos), item, fill=COMMON_COLORS["text_dark"], font=fonts["item"])
         y_pos += item_spacing
 
@@ -426,7 +406,7 @@ def generate_safe_do_dont(
 
     y_pos = dont_box_y + 30
     for item in dont_items[:3]:
-        draw_check_circle(draw, (margin + 35, y_pos + 12), fonts["check"], is_do=False)
+        draw_check_circle(img, (margin + 35, y_pos + 12), fonts["check"], is_do=False)
         draw.text((margin + 60, y_pos), item, fill=COMMON_COLORS["text_dark"], font=fonts["item"])
         y_pos += item_spacing
 
@@ -597,7 +577,7 @@ def generate_safe_precautions(
             [margin, y_pos, CANVAS_SIZE[0] - margin, y_pos + card_height],
             radius=12, fill=COMMON_COLORS["box_blue"]
         )
-        draw_number_badge(draw, i, (margin + 50, y_pos + card_height // 2), fonts["number"])
+        draw_number_badge(img, i, (margin + 50, y_pos + card_height // 2), fonts["number"])
         draw.text((margin + 95, y_pos + 18), item["title"],
                   fill=COMMON_COLORS["text_dark"], font=fonts["card_title"])
         draw.text((margin + 95, y_pos + 55), item.get("desc", ""),
@@ -675,7 +655,7 @@ def generate_safe_cooking_method(
             [margin, y_pos, CANVAS_SIZE[0] - margin, y_pos + card_height],
             radius=12, fill=COMMON_COLORS["box_blue"]
         )
-        badge_width = draw_step_badge(draw, i, (margin + 15, y_pos + 15), fonts["step_badge"])
+        badge_width = draw_step_badge(img, i, (margin + 15, y_pos + 15), fonts["step_badge"])
         draw.text((margin + badge_width + 30, y_pos + 15), step["title"],
                   fill=COMMON_COLORS["text_dark"], font=fonts["step_title"])
         draw.text((margin + 20, y_pos + 55), step.get("desc", ""),
@@ -753,7 +733,7 @@ def generate_forbidden_danger_info(
               fill=COMMON_COLORS["subtitle"], font=fonts["subtitle"])
 
     # FORBIDDEN 배지 (우측 정렬, 잘림 방지)
-    draw_right_aligned_badge(draw, "FORBIDDEN", 40,
+    draw_right_aligned_badge(img, "FORBIDDEN", 40,
                               palette["badge_bg"], COMMON_COLORS["white"], fonts["badge"])
 
     # 위험 성분 카드
@@ -1137,9 +1117,26 @@ def generate_forbidden_vet_consult(
     return img
 
 
+# =============================================================================
+# 렌더 캐시 지문 (팔레트/캔버스/폰트/템플릿 코드가 바뀌면 무효화)
+# =============================================================================
+INFOGRAPHIC_FINGERPRINT = design_fingerprint(
+    {
+        "palettes": [SAFE_PALETTE, CAUTION_PALETTE, DANGER_PALETTE, FORBIDDEN_PALETTE],
+        "common": COMMON_COLORS,
+        "canvas": CANVAS_SIZE,
+        "fonts": FONT_PATHS,
+        "badge_colors": BADGE_COLORS,
+        "step_colors": STEP_COLORS,
+    },
+    files=[Path(__file__), Path(infographic_toolkit.__file__), *FONT_PATHS.values()],
+)
+
+
 # =============================================================================
 # §22.8 통합 생성 함수 (안전도별 분기)
 # =============================================================================
+@cached_render("infographic.nutrition_info", INFOGRAPHIC_FINGERPRINT, output_arg="output_path")
 def generate_nutrition_info(food_name, nutrients, safety_str, footnote="", output_path=None):
     """3번 영양정보 - 안전도별 분기"""
     safety = safety_validate(safety_str)
@@ -1155,6 +1152,7 @@ def generate_nutrition_info(food_name, nutrients, safety_str, footnote="", outpu
         return generate_safe_nutrition_info(food_name, nutrients, safety, footnote, output_path)
 
 
+@cached_render("infographic.do_dont", INFOGRAPHIC_FINGERPRINT, output_arg="output_path")
 def generate_do_dont(food_name, do_items, dont_items, safety_str, output_path=None):
     """4번 급여 DO/DON'T - 안전도별 분기"""
     safety = safety_validate(safety_str)
@@ -1166,6 +1164,7 @@ def generate_do_dont(food_name, do_items, dont_items, safety_str, output_path=No
         return generate_safe_do_dont(food_name, do_items, dont_items, safety, output_path)
 
 
+@cached_render("infographic.dosage_table", INFOGRAPHIC_FINGERPRINT, output_arg="output_path")
 def generate_dosage_table(dosages, warning_text=None, footnote="", safety_str="SAFE", output_path=None):
     """5번 급여량표 - 안전도별 분기"""
     safety = safety_validate(safety_str)
@@ -1177,6 +1176,7 @@ def generate_dosage_table(dosages, warning_text=None, footnote="", safety_str="S
         return generate_safe_dosage_table(dosages, warning_text, footnote, safety, output_path)
 
 
+@cached_render("infographic.precautions", INFOGRAPHIC_FINGERPRINT, output_arg="output_path")
 def generate_precautions(food_name, items, emergency_note="", safety_str="SAFE", output_path=None):
     """6번 주의사항 - 안전도별 분기"""
     safety = safety_validate(safety_str)
@@ -1189,6 +1189,7 @@ def generate_precautions(food_name, items, emergency_note="", safety_str="SAFE",
         return generate_safe_precautions(food_name, items, emergency_note, safety, output_path)
 
 
+@cached_render("infographic.cooking_method", INFOGRAPHIC_FINGERPRINT, output_arg="output_path")
 def generate_cooking_method(food_name, steps, tip="", safety_str="SAFE", output_path=None):
     """7번 조리방법 - 안전도별 분기"""
     safety = safety_validate(safety_str)
@@ -1,20 +1,20 @@
 #!/usr/bin/env python3
 """037 콜리플라워 검수"""
 import json
+import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent.parent / "04_pipeline"))
+from food_data_store import get_food_store
+
 FOLDER = Path("01_contents/037_Cauliflower")
-FOOD_DATA = Path("config/food_data.json")
 
 print("=" * 60)
 print("037 콜리플라워 검수 보고서")
 print("=" * 60)
 
 # 1. food_data.json 확인
-with open(FOOD_DATA, "r") as f:
-    food_data = json.load(f)
-
-food_37 = food_data.get("37", {})
+food_37 = get_food_store().require().get("37", {})
 name = food_37.get("name", "Unknown")
 safety = food_37.get("safety", "Unknown")
 
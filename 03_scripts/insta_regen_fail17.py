@@ -4,12 +4,14 @@
 INSTAGRAM_RULE v1.1 형식 적용
 """
 
-import json
+import sys
 from pathlib import Path
 
 BASE_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(BASE_DIR / "04_pipeline"))
+from food_data_store import default_food_data_path, get_food_store
 CONTENTS_DIR = BASE_DIR / "01_contents"
-FOOD_DATA_PATH = BASE_DIR / "config" / "food_data.json"
+FOOD_DATA_PATH = default_food_data_path()
 
 # FAIL 대상 목록
 FAIL_TARGETS = [
@@ -33,8 +35,7 @@ CONCLUSIONS = {
 }
 
 def load_food_data():
-    with open(FOOD_DATA_PATH, "r", encoding="utf-8") as f:
-        return json.load(f)
+    return get_food_store(FOOD_DATA_PATH).require()
 
 def find_folder(num: int) -> Path:
     """01_contents/ 바로 아래에서 숫자로 시작하는 폴더 찾기"""
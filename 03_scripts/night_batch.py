@@ -7,12 +7,13 @@ night_batch.py - WO-NIGHT-001 야간 배치 처리
   python3 scripts/night_batch.py --test         # 1개 테스트
   python3 scripts/night_batch.py --start 0 --end 10  # 범위 지정
   python3 scripts/night_batch.py --all          # 전체 실행
+  python3 scripts/night_batch.py --all --resume # 중단된 배치 이어서 (완료 항목 건너뜀)
+  python3 scripts/night_batch.py --all --workers 4   # 동시 처리 수 지정 (기본: CPU 수)
 """
 
 import os
 import sys
 import json
-import time
 import argparse
 from pathlib import Path
 from datetime import datetime
@@ -38,6 +39,16 @@ except ImportError:
     INFOGRAPHIC_AVAILABLE = False
     print("⚠️ infographic_generator 임포트 실패")
 
+# 렌더 캐시 (적중/미스 보고용)
+sys.path.insert(0, str(PROJECT_ROOT / "04_pipeline"))
+try:
+    from render_cache import get_render_cache, format_stats
+    RENDER_CACHE_AVAILABLE = True
+except ImportError:
+    RENDER_CACHE_AVAILABLE = False
+from food_data_store import default_food_data_path, get_food_store
+from batch_executor import FAILED_RESULT, BatchExecutor, BatchProgress, default_workers, format_eta
+
 # 터미널 색상
 class Colors:
     GREEN = "\033[92m"
@@ -51,9 +62,10 @@ class Colors:
 
 # 경로
 CONTENTS_DIR = PROJECT_ROOT / "01_contents"
-FOOD_DATA_FILE = PROJECT_ROOT / "config" / "food_data.json"
+FOOD_DATA_FILE = default_food_data_path()
 TARGETS_FILE = PROJECT_ROOT / "config" / "night_batch_targets.json"
 LOG_DIR = PROJECT_ROOT / "logs" / "night_batch"
+JOURNAL_FILE = LOG_DIR / "journal.jsonl"
 
 # 안전도 설정
 SAFETY_CONFIG = {
@@ -75,15 +87,22 @@ class BatchResult:
         self.cover_success = 0
         self.cover_fail = 0
         self.errors = []
+        self.skipped = 0
+        self.passed = False
         self.start_time = datetime.now()
 
+    def merge(self, other: "BatchResult"):
+        """항목별 결과 합치기 (워커 스레드 결과 → 메인 스레드 집계)"""
+        for name in ("caption_success", "caption_fail", "caption_retry",
+                     "image_success", "image_fail", "image_retry",
+                     "cover_success", "cover_fail"):
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+        self.errors.extend(other.errors)
+
 
 def load_food_data() -> Dict:
-    """음식 데이터 로드"""
-    if not FOOD_DATA_FILE.exists():
-        return {}
-    with open(FOOD_DATA_FILE, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    """음식 데이터 로드 (공용 캐시, 파일 없으면 빈 dict)"""
+    return get_food_store(FOOD_DATA_FILE).data
 
 
 def load_targets() -> List[Dict]:
@@ -414,8 +433,8 @@ def validate_content(content_path: Path, food_info: Dict, safety: str) -> Tuple[
 
 
 def print_status(current: int, total: int, content_name: str, status: str,
-                 results: BatchResult):
-    """터미널 상태 표시"""
+                 results: BatchResult, progress: Optional[BatchProgress] = None):
+    """터미널 상태 표시 (progress 있으면 처리량 / ETA 포함)"""
     print("\033[2J\033[H")  # 화면 클리어
 
     print("━" * 60)
@@ -424,9 +443,12 @@ def print_status(current: int, total: int, content_name: str, status: str,
     print()
 
     # 진행바
-    progress = int((current / total) * 40)
-    bar = "█" * progress + "░" * (40 - progress)
+    filled = int((current / total) * 40)
+    bar = "█" * filled + "░" * (40 - filled)
     print(f"[{bar}] {current}/{total}")
+    if progress is not None:
+        print(f"⚡ 처리량: {progress.throughput:.1f}건/분 · 남은 시간: {format_eta(progress.eta)}"
+              + (f" · 건너뜀 {progress.skipped}건" if progress.skipped else ""))
     print()
 
     # 현재 작업
@@ -578,6 +600,7 @@ def save_report(results: BatchResult, output_path: Path):
     """완료 보고서 저장"""
     elapsed = datetime.now() - results.start_time
     hours = elapsed.total_seconds() / 3600
+    cache_line = format_stats(get_render_cache().stats()) if RENDER_CACHE_AVAILABLE else "렌더 캐시: 사용 불가"
 
     report = f"""[WO-NIGHT-001 완료 보고]
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -590,6 +613,8 @@ def save_report(results: BatchResult, output_path: Path):
 | CTA 이미지 | 0건 | 0건 | 0건 |
 
 총 소요 시간: {hours:.1f}시간
+재개 건너뜀: {results.skipped}건
+{cache_line}
 생성 시각: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 
 """
@@ -613,6 +638,10 @@ def main():
     parser.add_argument("--end", type=int, default=None, help="종료 인덱스")
     parser.add_argument("--all", action="store_true", help="전체 실행")
     parser.add_argument("--dry-run", action="store_true", help="실제 생성 없이 확인만")
+    parser.add_argument("--resume", action="store_true", help="저널 기준 완료 항목 건너뛰고 이어서 실행")
+    parser.add_argument("--workers", type=int, default=None,
+                        help=f"동시 처리 수 (기본: {default_workers()})")
+    parser.add_argument("--retries", type=int, default=1, help="항목별 재시도 횟수")
     args = parser.parse_args()
 
     # 로그 디렉토리 생성
@@ -648,19 +677,33 @@ def main():
     # 음식 데이터 로드
     food_data = load_food_data()
 
-    # 배치 처리
+    # 배치 처리 (항목별 결과는 워커에서 따로 모아 메인 스레드에서 합침)
     results = BatchResult()
     total = len(targets)
 
-    for i, target in enumerate(targets):
-        print_status(i + 1, total, target['name'], "처리 중...", results)
-
-        success = process_content(target, food_data, results)
-
-        status = "✅ 완료" if success else "❌ 실패"
-        print_status(i + 1, total, target['name'], status, results)
-
-        time.sleep(0.5)  # 속도 조절
+    def run_target(target: Dict) -> BatchResult:
+        item = BatchResult()
+        item.passed = process_content(target, food_data, item)
+        return item
+
+    def on_result(target: Dict, item: Optional[BatchResult]):
+        if item is not None:
+            results.merge(item)
+
+    def on_progress(progress: BatchProgress):
+        status = "✅ 완료" if progress.status == "done" else "❌ 실패"
+        print_status(progress.current, total, progress.key, status, results, progress)
+
+    executor = BatchExecutor(JOURNAL_FILE, workers=args.workers, retries=args.retries)
+    print(f"⚙️ 워커 {executor.workers}개 · 재시도 {executor.retries}회 · 저널 {JOURNAL_FILE}")
+    report = executor.run(targets, key=lambda t: t['name'], func=run_target, resume=args.resume,
+                          succeeded=lambda item: item.passed,
+                          on_result=on_result, on_progress=on_progress)
+
+    results.skipped = len(report.skipped)
+    for name, error in report.failed.items():
+        if error != FAILED_RESULT:
+            results.errors.append(f"{name}: 예외 - {error}")
 
     # 보고서 저장
     report_path = LOG_DIR / f"report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
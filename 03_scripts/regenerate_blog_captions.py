@@ -4,13 +4,14 @@ regenerate_blog_captions.py - 블로그 캡션 재생성
 잘못된 음식명이 포함된 캡션을 올바른 데이터로 재생성합니다.
 """
 
-import json
 import sys
 from pathlib import Path
 
 PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "04_pipeline"))
+from food_data_store import default_food_data_path, get_food_store
 CONTENTS_DIR = PROJECT_ROOT / "01_contents"
-FOOD_DATA_PATH = PROJECT_ROOT / "config" / "food_data.json"
+FOOD_DATA_PATH = default_food_data_path()
 
 
 # 안전도별 아이콘
@@ -633,8 +634,7 @@ def main():
 
     food_ids = [int(x) for x in sys.argv[1:]]
 
-    with open(FOOD_DATA_PATH, "r", encoding="utf-8") as f:
-        food_data = json.load(f)
+    food_data = get_food_store(FOOD_DATA_PATH).require()
 
     print("=" * 60)
     print(f"블로그 캡션 재생성")
@@ -15,24 +15,24 @@ sys.exit(1)
 # ═══════════════════════════════════════════════════════════════
 
 import os
-import json
 import re
 from pathlib import Path
 
 PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(PROJECT_ROOT / "04_pipeline"))
+from food_data_store import default_food_data_path, get_food_store
 
 from scripts.infographic_generator import generate_precautions
 
 CONTENTS_DIR = PROJECT_ROOT / "01_contents"
-FOOD_DATA_PATH = PROJECT_ROOT / "config" / "food_data.json"
+FOOD_DATA_PATH = default_food_data_path()
 # 2026-02-13: 플랫 구조 - STATUS_DIRS 제거
 # STATUS_DIRS = ["1_cover_only", "2_body_ready", "3_approved", "4_posted"]
 
 
 def load_food_data():
-    with open(FOOD_DATA_PATH, "r", encoding="utf-8") as f:
-        return json.load(f)
+    return get_food_store(FOOD_DATA_PATH).require()
 
 
 def get_all_folders():
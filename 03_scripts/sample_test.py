@@ -6,16 +6,17 @@ sample_test.py - WO-SCHEMA-001 STEP 3
 
 import os
 import sys
-import json
 import random
 from pathlib import Path
 
 PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(PROJECT_ROOT / "04_pipeline"))
+from food_data_store import default_food_data_path, get_food_store
 
 from scripts.infographic_generator import generate_precautions
 
-FOOD_DATA_PATH = PROJECT_ROOT / "config" / "food_data.json"
+FOOD_DATA_PATH = default_food_data_path()
 TEST_OUTPUT_DIR = PROJECT_ROOT / "debug" / "step3_sample_test"
 
 
@@ -26,8 +27,7 @@ def main():
 
     TEST_OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
-    with open(FOOD_DATA_PATH, "r", encoding="utf-8") as f:
-        food_data = json.load(f)
+    food_data = get_food_store(FOOD_DATA_PATH).require()
 
     # 랜덤 5건 선택
     keys = list(food_data.keys())
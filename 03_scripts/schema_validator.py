@@ -8,11 +8,13 @@ food_data.json 전체 스키마 검증
 - 타입 검증: precautions가 str이면 위반
 """
 
-import json
+import sys
 from pathlib import Path
 
 PROJECT_ROOT = Path(__file__).parent.parent
-FOOD_DATA_PATH = PROJECT_ROOT / "config" / "food_data.json"
+sys.path.insert(0, str(PROJECT_ROOT / "04_pipeline"))
+from food_data_store import default_food_data_path, get_food_store
+FOOD_DATA_PATH = default_food_data_path()
 
 def validate_schema():
     """food_data.json 스키마 검증"""
@@ -20,8 +22,7 @@ def validate_schema():
     print("STEP 1: 스키마 검증")
     print("━" * 50)
 
-    with open(FOOD_DATA_PATH, "r", encoding="utf-8") as f:
-        food_data = json.load(f)
+    food_data = get_food_store(FOOD_DATA_PATH).require()
 
     total = len(food_data)
     valid_count = 0
@@ -3,7 +3,7 @@
 Instagram 통계 자동 수집 데몬 v1.0
 
 기능:
-- instagram_stats_collector.py 래핑
+- instagram_stats_collector.py 래핑 (core.insights_collector 공용 수집기, Graph API batch)
 - launchd에서 24시간마다 실행
 - 수집 완료 시 텔레그램 알림 (선택)
 - 로그 파일 기록
@@ -112,7 +112,8 @@ class StatsCollectorDaemon:
 
     def _collect_stats(self) -> Dict[str, Any]:
         """실제 통계 수집 (기존 collector 활용)"""
-        from services.scripts.instagram_stats_collector import InstagramStatsCollector
+        sys.path.insert(0, str(Path(__file__).parent / "publishing"))
+        from instagram_stats_collector import InstagramStatsCollector
 
         collector = InstagramStatsCollector()
 
@@ -133,6 +134,11 @@ class StatsCollectorDaemon:
             total_likes += post_stats.get("likes", 0)
             total_comments += post_stats.get("comments", 0)
 
+        refresh = collector.last_refresh
+        if refresh:
+            logger.info(f"인사이트 갱신: {refresh['updated']}개 (캐시 유지 {refresh['skipped']}개, "
+                        f"요청 {refresh['requests']}건 / batch {refresh['batches']}회)")
+
         return {
             "success": True,
             "posts_collected": len(stats),
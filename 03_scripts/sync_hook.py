@@ -16,7 +16,6 @@ sync_hook.py - 파이프라인 v2.7 노션 동기화 훅
 import os
 import sys
 import re
-import json
 import requests
 from pathlib import Path
 from datetime import datetime
@@ -25,8 +24,10 @@ from typing import Optional, Dict, Any, List
 # 프로젝트 루트
 PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(PROJECT_ROOT / "04_pipeline"))
 
 from dotenv import load_dotenv
+from food_data_store import get_food_store
 load_dotenv(PROJECT_ROOT / ".env")
 
 # === 설정 ===
@@ -154,10 +155,9 @@ def log_sync(message: str, level: str = "INFO"):
 def find_content_by_name(content_name: str) -> Optional[tuple]:
     """콘텐츠 이름으로 폴더 및 번호 찾기"""
     # food_data.json에서 매핑 확인
-    food_data_path = PROJECT_ROOT / "config" / "food_data.json"
-    if food_data_path.exists():
-        with open(food_data_path, "r", encoding="utf-8") as f:
-            food_data = json.load(f)
+    store = get_food_store()
+    if store.exists():
+        food_data = store.data
 
         for food_id, data in food_data.items():
             if data.get("name_ko") == content_name or data.get("name_en") == content_name:
@@ -350,10 +350,9 @@ def calculate_progress(content_num: int) -> float:
 
     # Phase 1: 기획 (20%)
     # food_data.json에 데이터 있으면 완료
-    food_data_path = PROJECT_ROOT / "config" / "food_data.json"
-    if food_data_path.exists():
-        with open(food_data_path, "r", encoding="utf-8") as f:
-            food_data = json.load(f)
+    store = get_food_store()
+    if store.exists():
+        food_data = store.data
         if str(content_num) in food_data:
             progress += 20
 
@@ -631,10 +630,9 @@ def create_notion_page(folder: dict) -> Optional[str]:
     food_ko = food_en  # 기본값
     safety_level = "CAUTION"  # 기본값
 
-    food_data_path = PROJECT_ROOT / "config" / "food_data.json"
-    if food_data_path.exists():
-        with open(food_data_path, "r", encoding="utf-8") as f:
-            food_data = json.load(f)
+    store = get_food_store()
+    if store.exists():
+        food_data = store.data
 
         # 영문명으로 매핑 시도
         for food_id, data in food_data.items():
@@ -10,6 +10,7 @@ Instagram Graph API로 게시물 스캔 → 상태 불일치 자동 수정
 
 import os
 import re
+import sys
 import json
 import shutil
 import time
@@ -21,6 +22,9 @@ from dotenv import load_dotenv
 PROJECT_ROOT = Path(__file__).parent.parent
 load_dotenv(PROJECT_ROOT / ".env")
 
+sys.path.insert(0, str(PROJECT_ROOT / "04_pipeline"))
+from core.instagram_media_sync import MediaSync
+
 IG_ACCOUNT_ID = os.getenv("INSTAGRAM_BUSINESS_ACCOUNT_ID")
 IG_ACCESS_TOKEN = os.getenv("INSTAGRAM_ACCESS_TOKEN")
 NOTION_API_KEY = os.getenv("NOTION_API_KEY")
@@ -151,30 +155,15 @@ def extract_food_from_caption(caption: str, mapping: dict) -> int:
     return None
 
 
-def fetch_instagram_posts():
-    """Instagram Graph API로 모든 게시물 가져오기"""
-    posts = []
-    url = f"https://graph.facebook.com/v18.0/{IG_ACCOUNT_ID}/media"
-    params = {
-        "fields": "id,caption,permalink,media_type,media_url,thumbnail_url,timestamp,children{media_url,media_type}",
-        "access_token": IG_ACCESS_TOKEN,
-        "limit": 100
-    }
-
-    while url:
-        response = requests.get(url, params=params)
-        if response.status_code != 200:
-            print(f"❌ Instagram API 오류: {response.status_code}")
-            break
+def fetch_instagram_posts(media_sync: MediaSync):
+    """Instagram 게시물 목록 (로컬 미디어 인덱스 증분 동기화 후, 최신순)
 
-        data = response.json()
-        posts.extend(data.get("data", []))
-
-        paging = data.get("paging", {})
-        url = paging.get("next")
-        params = {}
-
-    return posts
+    media_url / children 은 만료되는 서명 URL 이라 인덱스에 저장하지 않음
+    → 이미지 다운로드가 필요한 게시물만 media_sync.fetch_media() 로 조회
+    """
+    if media_sync.sync_safe() is None and not media_sync.media_ids():
+        print("❌ Instagram 게시물 목록 없음 (API 오류 / 미설정)")
+    return media_sync.media()
 
 
 def download_image(url: str, save_path: Path) -> bool:
@@ -333,7 +322,8 @@ def sync_instagram_to_local(dry_run: bool = False):
 
     # 2. 인스타 게시물 가져오기
     print("\n📥 인스타그램 게시물 로드 중...")
-    posts = fetch_instagram_posts()
+    media_sync = MediaSync(access_token=IG_ACCESS_TOKEN, account_id=IG_ACCOUNT_ID)
+    posts = fetch_instagram_posts(media_sync)
     print(f"   {len(posts)}개 게시물")
 
     # 3. 게시물 매칭 및 처리
@@ -356,9 +346,6 @@ def sync_instagram_to_local(dry_run: bool = False):
     for post in posts:
         caption = post.get("caption", "")
         permalink = post.get("permalink", "")
-        media_url = post.get("media_url", "")
-        media_type = post.get("media_type", "")
-        children = post.get("children", {}).get("data", [])
 
         # 음식 번호 추출
         num = extract_food_from_caption(caption, mapping)
@@ -442,6 +429,10 @@ def sync_instagram_to_local(dry_run: bool = False):
         existing_images = list(insta_dir.glob("*.jpg")) + list(insta_dir.glob("*.png"))
 
         if not existing_images:
+            media = media_sync.fetch_media(post["id"]) or {}
+            media_type = media.get("media_type", post.get("media_type", ""))
+            media_url = media.get("media_url", "")
+            children = media.get("children", {}).get("data", [])
             if media_type == "CAROUSEL_ALBUM" and children:
                 for i, child in enumerate(children):
                     child_url = child.get("media_url", "")
@@ -25,6 +25,12 @@ sys.path.insert(0, str(PROJECT_ROOT))
 import gspread
 from google.oauth2.service_account import Credentials
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "04_pipeline"))
+from core.utils.sheet_gateway import SheetGateway
+
+# 감시 모드에서 동기화마다 인증 / 시트 열기 / 전체 읽기를 반복하지 않도록 재사용
+_gateway = None
+
 
 def get_sheet():
     """구글시트 연결"""
@@ -38,6 +44,14 @@ def get_sheet():
     return client.open("Sunshine").worksheet("게시콘텐츠")
 
 
+def get_gateway() -> SheetGateway:
+    """시트 게이트웨이 (스냅샷 캐시 + 일괄 쓰기, 프로세스당 1회 연결)"""
+    global _gateway
+    if _gateway is None:
+        _gateway = SheetGateway(get_sheet())
+    return _gateway
+
+
 def get_local_status():
     """로컬 폴더 상태 확인"""
     body_ready = PROJECT_ROOT / "contents" / "2_body_ready"
@@ -75,12 +89,12 @@ def sync_to_sheet(dry_run=False):
     print(f"[{datetime.now().strftime('%H:%M:%S')}] 동기화 시작...")
 
     local_status = get_local_status()
-    sheet = get_sheet()
-    all_data = sheet.get_all_values()
+    gateway = get_gateway()
+    snapshot = gateway.snapshot()
 
     updates = []
 
-    for idx, row in enumerate(all_data[1:], start=2):
+    for idx, row in enumerate(snapshot.rows, start=2):
         if len(row) == 0:
             continue
 
@@ -112,12 +126,11 @@ def sync_to_sheet(dry_run=False):
             print(f"  [{u['num']}] {u['field']}: '{u['old']}' → '{u['new']}'")
 
         if not dry_run:
-            # 배치 업데이트
-            cells = []
-            for u in updates:
-                cells.append(gspread.Cell(u['row'], u['col'], u['new']))
+            # 배치 업데이트 (batch_update 1회, 쿼터 초과 시 백오프 재시도, 실패 시 예약 버림)
+            with gateway.batch():
+                for u in updates:
+                    gateway.stage_update(u['row'], u['col'], u['new'])
 
-            sheet.update_cells(cells)
             print(f"\n✅ {len(updates)}건 업데이트 완료")
         else:
             print("\n(--dry-run 모드: 실제 업데이트 안함)")
@@ -30,6 +30,11 @@ from collections import Counter
 # 프로젝트 루트
 ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "04_pipeline"))
+
+from core.content_catalog import STATUS_LOCATIONS, ContentCatalog
+from core.instagram_media_sync import MediaSync, match_known_media
+from core.utils.sheet_gateway import SheetGateway
 
 # .env 로드
 try:
@@ -55,9 +60,18 @@ CONTENTS_DIR = ROOT / "01_contents"
 
 # FOLDER_STATUS = {v: k for k, v in STATUS_FOLDERS.items()}
 
+# 상태 폴더 매핑은 콘텐츠 카탈로그 기준 (이동/카운트는 카탈로그 조회)
+STATUS_FOLDERS = {status: folder for folder, status in STATUS_LOCATIONS.items()}
+FOLDER_STATUS = dict(STATUS_LOCATIONS)
+CATALOG = ContentCatalog(CONTENTS_DIR)
+
+# 게시콘텐츠 시트 (루프 전체에서 연결 1회 + 스냅샷 공유, get_sheet_gateway)
+_sheet_gateway = None
+
 # Instagram API
 INSTAGRAM_ACCESS_TOKEN = os.getenv("INSTAGRAM_ACCESS_TOKEN")
 INSTAGRAM_BUSINESS_ID = os.getenv("INSTAGRAM_BUSINESS_ACCOUNT_ID")
+MEDIA_SYNC = MediaSync(access_token=INSTAGRAM_ACCESS_TOKEN, account_id=INSTAGRAM_BUSINESS_ID)
 
 # Telegram
 TELEGRAM_BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN")
@@ -77,48 +91,30 @@ def get_instagram_posts() -> dict:
         print("  ⚠️ Instagram API 설정 없음")
         return {}
 
-    try:
-        url = f"https://graph.facebook.com/v21.0/{INSTAGRAM_BUSINESS_ID}/media"
-        params = {
-            "access_token": INSTAGRAM_ACCESS_TOKEN,
-            "fields": "id,caption,timestamp,media_type",
-            "limit": 100
-        }
-
-        response = requests.get(url, params=params, timeout=30)
+    # 로컬 미디어 인덱스 증분 동기화 (실패 시 기존 인덱스 사용)
+    MEDIA_SYNC.sync_safe()
 
-        if response.status_code != 200:
-            print(f"  ⚠️ Instagram API 오류: {response.status_code}")
-            return {}
-
-        data = response.json()
-        posts = {}
-
-        for media in data.get("data", []):
-            media_id = media.get("id")
-            caption = media.get("caption", "")
-
-            # 캡션에서 음식명 추출 시도
-            posts[media_id] = {
-                "caption": caption[:100],
-                "timestamp": media.get("timestamp")
-            }
+    posts = {}
+    for media in MEDIA_SYNC.media():
+        posts[media["id"]] = {
+            "caption": (media.get("caption") or "")[:100],
+            "timestamp": media.get("timestamp")
+        }
 
-        print(f"  📸 Instagram 게시물: {len(posts)}개")
-        return posts
-
-    except Exception as e:
-        print(f"  ⚠️ Instagram API 실패: {e}")
-        return {}
+    print(f"  📸 Instagram 게시물: {len(posts)}개")
+    return posts
 
 
 def get_posted_food_ids() -> set:
     """
     Instagram에 게시된 food_id 집합 반환
-    방법: publishing_history.csv 또는 metadata.json의 instagram_media_id
+    방법: publishing_history.csv, metadata.json의 instagram_media_id,
+          Instagram 미디어 인덱스 (로컬 기록과 media_id 가 일치하는 게시물만)
     """
     posted_ids = set()
 
+    known_media = {}  # 로컬에 기록된 media_id → food_id
+
     # 1. publishing_history.csv 확인
     history_path = ROOT / "config" / "data" / "publishing_history.csv"
     if history_path.exists():
@@ -130,39 +126,27 @@ def get_posted_food_ids() -> set:
                     food_id = parts[1].strip()
                     if food_id:
                         posted_ids.add(food_id.lower())
+                        if len(parts) >= 6 and parts[5].strip():  # Post ID
+                            known_media[parts[5].strip()] = food_id
         except Exception as e:
             print(f"  ⚠️ 히스토리 읽기 실패: {e}")
 
     # 2. 4_posted 폴더의 모든 콘텐츠
-    posted_dir = CONTENTS_DIR / "4_posted"
-    if posted_dir.exists():
-        for month_dir in posted_dir.iterdir():
-            if month_dir.is_dir() and not month_dir.name.startswith("."):
-                for folder in month_dir.iterdir():
-                    if folder.is_dir():
-                        food_id = extract_food_id(folder.name)
-                        posted_ids.add(food_id.lower())
+    for entry in CATALOG.entries(["4_posted"]):
+        posted_ids.add(extract_food_id(entry.name).lower())
 
     # 3. 모든 폴더에서 instagram_media_id 있는 것
-    for status_folder in ["1_cover_only", "2_body_ready", "3_approved"]:
-        status_dir = CONTENTS_DIR / status_folder
-        if not status_dir.exists():
-            continue
-
-        for folder in status_dir.iterdir():
-            if not folder.is_dir() or folder.name.startswith("."):
-                continue
-
-            meta_path = folder / "metadata.json"
-            if meta_path.exists():
-                try:
-                    with open(meta_path, 'r', encoding='utf-8') as f:
-                        meta = json.load(f)
-                    if meta.get("instagram_media_id"):
-                        food_id = meta.get("food_id") or extract_food_id(folder.name)
-                        posted_ids.add(food_id.lower())
-                except:
-                    pass
+    for entry in CATALOG.entries(["1_cover_only", "2_body_ready", "3_approved"]):
+        if entry.metadata.get("instagram_media_id"):
+            food_id = entry.metadata.get("food_id") or extract_food_id(entry.name)
+            posted_ids.add(food_id.lower())
+
+    # 4. Instagram 미디어 인덱스 (로컬에 기록된 media_id 와 일치하는 게시물만, 캡션 추정은 로그만)
+    for entry in CATALOG.entries():
+        media_id = entry.metadata.get("instagram_media_id") or entry.metadata.get("media_id")
+        if media_id:
+            known_media[str(media_id)] = entry.metadata.get("food_id") or extract_food_id(entry.name)
+    posted_ids |= match_known_media(MEDIA_SYNC.media(), known_media)
 
     return posted_ids
 
@@ -187,15 +171,8 @@ def determine_status(folder_path: Path, posted_food_ids: set) -> str:
     Instagram SSOT 기반 상태 판별
     우선순위: posted > approved > body_ready > cover_only
     """
-    meta_path = folder_path / "metadata.json"
-    meta = {}
-
-    if meta_path.exists():
-        try:
-            with open(meta_path, 'r', encoding='utf-8') as f:
-                meta = json.load(f)
-        except json.JSONDecodeError:
-            pass
+    entry = CATALOG.entry_for(folder_path)
+    meta = entry.metadata if entry else {}
 
     food_id = meta.get("food_id") or extract_food_id(folder_path.name)
 
@@ -213,7 +190,7 @@ def determine_status(folder_path: Path, posted_food_ids: set) -> str:
 
     # 3. body_ready = 이미지 4장 존재
     images = [f"{food_id}_{i:02d}.png" for i in range(4)]
-    if all((folder_path / img).exists() for img in images):
+    if entry and all(entry.has_image(img) for img in images):
         return "body_ready"
 
     # 4. 나머지 = cover_only
@@ -226,34 +203,11 @@ def determine_status(folder_path: Path, posted_food_ids: set) -> str:
 
 def get_all_content_folders() -> list:
     """모든 콘텐츠 폴더 수집 (위치 무관)"""
-    folders = []
-
-    # 상태 폴더들
-    for status_folder in ["1_cover_only", "2_body_ready", "3_approved"]:
-        status_dir = CONTENTS_DIR / status_folder
-        if not status_dir.exists():
-            continue
-
-        for folder in status_dir.iterdir():
-            if folder.is_dir() and not folder.name.startswith("."):
-                folders.append({
-                    "path": folder,
-                    "current_status": FOLDER_STATUS[status_folder]
-                })
-
-    # 4_posted는 월별 하위 구조
-    posted_dir = CONTENTS_DIR / "4_posted"
-    if posted_dir.exists():
-        for month_dir in posted_dir.iterdir():
-            if month_dir.is_dir() and not month_dir.name.startswith("."):
-                for folder in month_dir.iterdir():
-                    if folder.is_dir() and not folder.name.startswith("."):
-                        folders.append({
-                            "path": folder,
-                            "current_status": "posted"
-                        })
-
-    return folders
+    # 상태 폴더들 + 4_posted 월별 하위 구조
+    return [
+        {"path": entry.path, "current_status": entry.location_status}
+        for entry in CATALOG.entries(["1_cover_only", "2_body_ready", "3_approved", "4_posted"])
+    ]
 
 
 def move_to_status_folder(folder_path: Path, target_status: str) -> Path:
@@ -274,6 +228,8 @@ def move_to_status_folder(folder_path: Path, target_status: str) -> Path:
 
     try:
         shutil.move(str(folder_path), str(dest_path))
+        CATALOG.invalidate(folder_path)
+        CATALOG.invalidate(dest_path)
         return dest_path
     except Exception as e:
         print(f"  ❌ 이동 실패 {folder_path.name}: {e}")
@@ -295,6 +251,7 @@ def update_metadata_status(folder_path: Path, status: str):
 
     with open(meta_path, 'w', encoding='utf-8') as f:
         json.dump(meta, f, ensure_ascii=False, indent=2)
+    CATALOG.invalidate(meta_path)
 
 
 def scan_and_fix(posted_food_ids: set) -> list:
@@ -333,45 +290,45 @@ def count_local_folders() -> dict:
     """로컬 폴더 상태별 개수"""
     counts = {"cover_only": 0, "body_ready": 0, "approved": 0, "posted": 0}
 
-    for status, folder_name in STATUS_FOLDERS.items():
-        status_dir = CONTENTS_DIR / folder_name
-
-        if status == "posted":
-            # posted는 월별 하위 구조
-            if status_dir.exists():
-                for month_dir in status_dir.iterdir():
-                    if month_dir.is_dir() and not month_dir.name.startswith("."):
-                        counts[status] += sum(1 for f in month_dir.iterdir()
-                                              if f.is_dir() and not f.name.startswith("."))
-        else:
-            if status_dir.exists():
-                counts[status] = sum(1 for f in status_dir.iterdir()
-                                     if f.is_dir() and not f.name.startswith("."))
+    # posted는 월별 하위 구조 포함
+    for entry in CATALOG.entries(list(FOLDER_STATUS)):
+        counts[entry.location_status] += 1
 
     return counts
 
 
+def get_sheet_gateway():
+    """게시콘텐츠 시트 게이트웨이 (1회 연결, 스냅샷 캐시 + 일괄 쓰기 / 설정 없으면 None)"""
+    global _sheet_gateway
+    if _sheet_gateway is not None:
+        return _sheet_gateway
+
+    import gspread
+    from google.oauth2.service_account import Credentials
+
+    SCOPES = ['https://www.googleapis.com/auth/spreadsheets', 'https://www.googleapis.com/auth/drive']
+    creds_path = os.environ.get('GOOGLE_CREDENTIALS_PATH')
+    sheet_id = os.environ.get('GOOGLE_SHEET_ID')
+
+    if not creds_path or not sheet_id:
+        return None
+
+    creds = Credentials.from_service_account_file(creds_path, scopes=SCOPES)
+    client = gspread.authorize(creds)
+    _sheet_gateway = SheetGateway(client.open_by_key(sheet_id).worksheet('게시콘텐츠'))
+    return _sheet_gateway
+
+
 def count_sheet_status() -> dict:
     """시트 상태별 개수"""
     counts = {"cover_only": 0, "body_ready": 0, "approved": 0, "posted": 0}
 
     try:
-        import gspread
-        from google.oauth2.service_account import Credentials
-
-        SCOPES = ['https://www.googleapis.com/auth/spreadsheets', 'https://www.googleapis.com/auth/drive']
-        creds_path = os.environ.get('GOOGLE_CREDENTIALS_PATH')
-        sheet_id = os.environ.get('GOOGLE_SHEET_ID')
-
-        if not creds_path or not sheet_id:
+        gateway = get_sheet_gateway()
+        if gateway is None:
             return counts
 
-        creds = Credentials.from_service_account_file(creds_path, scopes=SCOPES)
-        client = gspread.authorize(creds)
-        worksheet = client.open_by_key(sheet_id).worksheet('게시콘텐츠')
-
-        f_column = worksheet.col_values(6)
-        for status in f_column[1:]:
+        for status in gateway.snapshot().column_values(6):  # F열
             if status in counts:
                 counts[status] += 1
 
@@ -391,24 +348,14 @@ def count_instagram_posts() -> int:
 # ==========================================
 
 def sync_sheet(posted_food_ids: set):
-    """로컬 폴더 기준으로 시트 F열 업데이트"""
+    """로컬 폴더 기준으로 시트 F열 업데이트 (변경분 batch_update 1회)"""
     try:
-        import gspread
-        from google.oauth2.service_account import Credentials
-
-        SCOPES = ['https://www.googleapis.com/auth/spreadsheets', 'https://www.googleapis.com/auth/drive']
-        creds_path = os.environ.get('GOOGLE_CREDENTIALS_PATH')
-        sheet_id = os.environ.get('GOOGLE_SHEET_ID')
-
-        if not creds_path or not sheet_id:
+        gateway = get_sheet_gateway()
+        if gateway is None:
             print("  ⚠️ Google Sheets 설정 없음 - 스킵")
             return
 
-        creds = Credentials.from_service_account_file(creds_path, scopes=SCOPES)
-        client = gspread.authorize(creds)
-        worksheet = client.open_by_key(sheet_id).worksheet('게시콘텐츠')
-
-        all_records = worksheet.get_all_records()
+        all_records = gateway.records()
 
         # 로컬 상태 맵 구축
         local_status_map = {}
@@ -420,30 +367,29 @@ def sync_sheet(posted_food_ids: set):
             local_status_map[food_id.lower()] = actual_status
 
         # 시트 업데이트
-        batch_updates = []
-
-        for idx, record in enumerate(all_records):
-            row_num = idx + 2
-            eng_name = record.get('영문명', '').lower()
-            current_status = record.get('게시상태', '')
-
-            # Instagram SSOT: posted_food_ids에 있으면 무조건 posted
-            if eng_name in posted_food_ids:
-                target_status = "posted"
-            elif eng_name in local_status_map:
-                target_status = local_status_map[eng_name]
-            else:
-                continue  # 로컬에 없으면 스킵
-
-            if current_status != target_status:
-                batch_updates.append({
-                    'range': f'F{row_num}',
-                    'values': [[target_status]]
-                })
-
-        if batch_updates:
-            worksheet.batch_update(batch_updates)
-            print(f"  📝 시트 업데이트: {len(batch_updates)}건")
+        updated = 0
+
+        # 변경분은 블록 끝에서 batch_update 1회 (실패 시 예약 버림 → 다음 동기화에서 시트 재조회)
+        with gateway.batch():
+            for idx, record in enumerate(all_records):
+                row_num = idx + 2
+                eng_name = record.get('영문명', '').lower()
+                current_status = record.get('게시상태', '')
+
+                # Instagram SSOT: posted_food_ids에 있으면 무조건 posted
+                if eng_name in posted_food_ids:
+                    target_status = "posted"
+                elif eng_name in local_status_map:
+                    target_status = local_status_map[eng_name]
+                else:
+                    continue  # 로컬에 없으면 스킵
+
+                if current_status != target_status:
+                    gateway.stage_update(row_num, 6, target_status)  # F열
+                    updated += 1
+
+        if updated:
+            print(f"  📝 시트 업데이트: {updated}건")
         else:
             print(f"  📝 시트 변경 없음")
 
@@ -481,21 +427,11 @@ def check_local_vs_sheet_items(posted_food_ids: set) -> list:
     mismatches = []
 
     try:
-        import gspread
-        from google.oauth2.service_account import Credentials
-
-        SCOPES = ['https://www.googleapis.com/auth/spreadsheets', 'https://www.googleapis.com/auth/drive']
-        creds_path = os.environ.get('GOOGLE_CREDENTIALS_PATH')
-        sheet_id = os.environ.get('GOOGLE_SHEET_ID')
-
-        if not creds_path or not sheet_id:
+        gateway = get_sheet_gateway()
+        if gateway is None:
             return mismatches
 
-        creds = Credentials.from_service_account_file(creds_path, scopes=SCOPES)
-        client = gspread.authorize(creds)
-        worksheet = client.open_by_key(sheet_id).worksheet('게시콘텐츠')
-
-        all_records = worksheet.get_all_records()
+        all_records = gateway.records()
 
         # 로컬 상태 맵
         local_status_map = {}
@@ -588,6 +524,7 @@ def run_sync_loop():
 
     # Instagram posted 목록 가져오기 (1회)
     print("\n[0] Instagram 게시 목록 조회")
+    get_instagram_posts()
     posted_food_ids = get_posted_food_ids()
     print(f"  → posted 대상: {len(posted_food_ids)}개")
 
@@ -6,10 +6,12 @@ Thread Caption Validator v1.0
 
 import os
 import re
-import json
+import sys
 from pathlib import Path
 
 BASE_PATH = "/Users/al02399300/Desktop/Jun_AI/Dog_Contents/project_sunshine"
+sys.path.insert(0, str(Path(__file__).parent.parent / "04_pipeline"))
+from food_data_store import get_food_store
 
 # 안전도별 톤 키워드
 TONE_KEYWORDS = {
@@ -244,11 +246,7 @@ def main():
     print("="*50)
 
     # food_data.json에서 안전도 로드
-    food_data_path = os.path.join(BASE_PATH, "config", "food_data.json")
-    food_data = {}
-    if os.path.exists(food_data_path):
-        with open(food_data_path, 'r', encoding='utf-8') as f:
-            food_data = json.load(f)
+    food_data = get_food_store().data
 
     # 테스트 캡션 (예시)
     test_captions = {
@@ -16,14 +16,17 @@ Validator 체크리스트:
 □ 해시태그 12~16개
 """
 
-import json
 import re
 import sys
 from pathlib import Path
 
 PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "04_pipeline"))
+from caption_audit_runner import CaptionAuditRunner
+from food_data_store import default_food_data_path, get_food_store
+
 CONTENTS_DIR = PROJECT_ROOT / "01_contents"
-FOOD_DATA_PATH = PROJECT_ROOT / "config" / "food_data.json"
+FOOD_DATA_PATH = default_food_data_path()
 
 
 def validate_blog_caption(content: str, safety: str, name: str) -> dict:
@@ -194,6 +197,13 @@ def validate_blog_caption(content: str, safety: str, name: str) -> dict:
     return result
 
 
+def audit_check(text: str, platform: str, food: dict) -> dict:
+    """caption_audit_runner 검사 함수 (프로세스 풀 워커에서 실행, 안전도 없으면 SAFE 기준)"""
+    safety = food["safety"] if food["safety"] != "UNKNOWN" else "SAFE"
+    result = validate_blog_caption(text, safety, food["name"])
+    return dict(result, failed=result["fails"])
+
+
 def main():
     # 범위 파싱
     start_id = 6
@@ -207,8 +217,7 @@ def main():
         end_id = int(sys.argv[1])
 
     # food_data.json 로드
-    with open(FOOD_DATA_PATH, "r", encoding="utf-8") as f:
-        food_data = json.load(f)
+    food_data = get_food_store(FOOD_DATA_PATH).require()
 
     print("=" * 70)
     print(f"블로그 캡션 검수 v2.0 ({start_id:03d}~{end_id:03d})")
@@ -219,6 +228,14 @@ def main():
     pass_count = 0
     fail_count = 0
 
+    # 콘텐츠 트리 1회 순회 + 바뀐 캡션만 검사 (caption_audit_runner 결과 캐시)
+    runner = CaptionAuditRunner(food_data, checker=audit_check, contents_dir=CONTENTS_DIR)
+    report = runner.run(platforms=["blog"], num_range=(start_id, end_id), skip_unknown=False)
+    folders = {}
+    for folder in report.folders:
+        folders.setdefault(folder.num, folder)
+    records = {r.folder: r for r in report.by_platform("blog")}
+
     for food_id in range(start_id, end_id + 1):
         food_id_str = str(food_id)
 
@@ -230,59 +247,48 @@ def main():
         safety = data.get("safety", "SAFE")
 
         # 폴더 찾기
-        folder_pattern = f"{food_id:03d}_*"
-        matches = list(CONTENTS_DIR.glob(folder_pattern))
-
-        if not matches:
+        content_folder = folders.get(food_id)
+        if content_folder is None:
             print(f"\n[{food_id:03d}] {name} - 폴더 없음")
             continue
 
-        content_folder = matches[0]
-        blog_folder = content_folder / "02_Blog"
-
-        if not blog_folder.exists():
-            print(f"\n[{food_id:03d}] {name} - 02_Blog 폴더 없음")
-            continue
-
         # 블로그 캡션 찾기
-        caption_files = list(blog_folder.glob("*_Blog_Caption.txt"))
-
-        if not caption_files:
+        record = records.get(content_folder.name)
+        if record is None:
             print(f"\n[{food_id:03d}] {name} - 캡션 파일 없음")
             continue
 
         total += 1
-        caption_file = caption_files[0]
 
-        try:
-            content = caption_file.read_text(encoding='utf-8')
-            result = validate_blog_caption(content, safety, name)
+        if record.status == "error":
+            fail_count += 1
+            print(f"\n[{food_id:03d}] {name} - 오류: {record.error}")
+            continue
 
-            has_fail = len(result["fails"]) > 0
+        result = record.result
+        has_fail = len(result["fails"]) > 0
 
-            if has_fail:
-                fail_count += 1
-                status = "❌ FAIL"
-            else:
-                pass_count += 1
-                status = "✅ PASS"
+        if has_fail:
+            fail_count += 1
+            status = "❌ FAIL"
+        else:
+            pass_count += 1
+            status = "✅ PASS"
 
-            stats = result["stats"]
-            print(f"\n[{food_id:03d}] {name} ({safety}) - {status}")
-            print(f"    글자수: {stats.get('글자수', 0)}자 | H2: {stats.get('H2', 0)}개 | 키워드: {stats.get('키워드', 0)}회 | 이미지: {stats.get('이미지태그', 0)}개")
-            print(f"    해시태그: {stats.get('해시태그', 0)}개 | 동질감: {stats.get('동질감요소', 0)}요소 | 팩트체크: {stats.get('팩트체크', 0)}/5")
+        stats = result["stats"]
+        print(f"\n[{food_id:03d}] {name} ({safety}) - {status}")
+        print(f"    글자수: {stats.get('글자수', 0)}자 | H2: {stats.get('H2', 0)}개 | 키워드: {stats.get('키워드', 0)}회 | 이미지: {stats.get('이미지태그', 0)}개")
+        print(f"    해시태그: {stats.get('해시태그', 0)}개 | 동질감: {stats.get('동질감요소', 0)}요소 | 팩트체크: {stats.get('팩트체크', 0)}/5")
 
-            if result["fails"]:
-                for f in result["fails"]:
-                    print(f"    ❌ {f}")
+        if result["fails"]:
+            for f in result["fails"]:
+                print(f"    ❌ {f}")
 
-            if result["warnings"]:
-                for w in result["warnings"]:
-                    print(f"    ⚠️ {w}")
+        if result["warnings"]:
+            for w in result["warnings"]:
+                print(f"    ⚠️ {w}")
 
-        except Exception as e:
-            fail_count += 1
-            print(f"\n[{food_id:03d}] {name} - 오류: {e}")
+    runner.write_report(report, name="validate_blog_captions")
 
     print("\n" + "=" * 70)
     print(f"검수 완료: {total}개")
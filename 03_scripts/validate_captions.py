@@ -4,13 +4,15 @@ validate_captions.py - 전체 캡션 검수
 CAPTION_RULE.md 기준 검증
 """
 
-import json
+import sys
 import re
 from pathlib import Path
 
 PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "04_pipeline"))
+from food_data_store import default_food_data_path, get_food_store
 CONTENTS_DIR = PROJECT_ROOT / "01_contents"
-FOOD_DATA_PATH = PROJECT_ROOT / "config" / "food_data.json"
+FOOD_DATA_PATH = default_food_data_path()
 
 # 게시 완료 항목 (제외)
 POSTED_ITEMS = ["033"]
@@ -124,8 +126,7 @@ def validate_threads_caption(content: str, safety: str, name: str) -> list:
 
 def main():
     # food_data.json 로드
-    with open(FOOD_DATA_PATH, "r", encoding="utf-8") as f:
-        food_data = json.load(f)
+    food_data = get_food_store(FOOD_DATA_PATH).require()
 
     total_checked = 0
     total_pass = 0
@@ -5,14 +5,17 @@ WO-RENAME-001: food_data.json 번호 체계 수정
 """
 
 import json
+import sys
 import re
 import shutil
 from pathlib import Path
 from datetime import datetime
 
 PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "04_pipeline"))
+from food_data_store import default_food_data_path, get_food_store
 CONTENTS_DIR = PROJECT_ROOT / "01_contents"
-FOOD_DATA_PATH = PROJECT_ROOT / "config" / "food_data.json"
+FOOD_DATA_PATH = default_food_data_path()
 # 2026-02-13: 플랫 구조 - STATUS_DIRS 제거
 # STATUS_DIRS = ["1_cover_only", "2_body_ready", "3_approved", "4_posted"]
 
@@ -56,8 +59,7 @@ def main():
     print(f"\n[백업 생성] {backup_path}")
 
     # 2. 기존 food_data 로드
-    with open(FOOD_DATA_PATH, "r", encoding="utf-8") as f:
-        old_food_data = json.load(f)
+    old_food_data = get_food_store(FOOD_DATA_PATH).require()
 
     # 음식 이름으로 인덱스 생성
     food_by_name = {}
@@ -173,8 +175,7 @@ def main():
     print("━" * 70)
 
     # 다시 로드해서 검증
-    with open(FOOD_DATA_PATH, "r", encoding="utf-8") as f:
-        verify_data = json.load(f)
+    verify_data = get_food_store(FOOD_DATA_PATH).require()
 
     verify_keys = set(int(k) for k in verify_data.keys())
     folder_nums = set(f["num"] for f in folder_foods)
@@ -4,13 +4,15 @@ WO-RENAME-001 STEP 2: Dry-run 테스트
 5개 폴더로 리네이밍 로직 검증 (실제 변경 없음)
 """
 
-import json
+import sys
 import re
 from pathlib import Path
 
 PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "04_pipeline"))
+from food_data_store import default_food_data_path, get_food_store
 CONTENTS_DIR = PROJECT_ROOT / "01_contents"
-FOOD_DATA_PATH = PROJECT_ROOT / "config" / "food_data.json"
+FOOD_DATA_PATH = default_food_data_path()
 
 
 def to_pascal_case(text):
@@ -76,8 +78,7 @@ def main():
     print("━" * 70)
 
     # food_data 로드
-    with open(FOOD_DATA_PATH, "r", encoding="utf-8") as f:
-        food_data = json.load(f)
+    food_data = get_food_store(FOOD_DATA_PATH).require()
 
     # 테스트 대상 선정: 4_posted에서 5개
     test_folders = []
@@ -6,15 +6,17 @@ WO-RENAME-001 STEP 5: PascalCase 리네이밍
 - 파일명: PascalCase 적용
 """
 
-import json
+import sys
 import re
 import shutil
 from pathlib import Path
 from datetime import datetime
 
 PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "04_pipeline"))
+from food_data_store import default_food_data_path, get_food_store
 CONTENTS_DIR = PROJECT_ROOT / "01_contents"
-FOOD_DATA_PATH = PROJECT_ROOT / "config" / "food_data.json"
+FOOD_DATA_PATH = default_food_data_path()
 
 
 def to_pascal_case(text):
@@ -63,8 +65,7 @@ def main():
     print("━" * 70)
 
     # food_data 로드
-    with open(FOOD_DATA_PATH, "r", encoding="utf-8") as f:
-        food_data = json.load(f)
+    food_data = get_food_store(FOOD_DATA_PATH).require()
 
     # 통계
     folders_renamed = 0
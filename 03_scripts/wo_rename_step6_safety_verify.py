@@ -7,12 +7,15 @@ WO-RENAME-001 STEP 6: Safety 검증
 """
 
 import json
+import sys
 import re
 from pathlib import Path
 
 PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "04_pipeline"))
+from food_data_store import default_food_data_path, get_food_store
 CONTENTS_DIR = PROJECT_ROOT / "01_contents"
-FOOD_DATA_PATH = PROJECT_ROOT / "config" / "food_data.json"
+FOOD_DATA_PATH = default_food_data_path()
 BACKUP_DIR = PROJECT_ROOT / "backups" / "wo_rename_001_20260213_171742"
 
 
@@ -22,8 +25,7 @@ def main():
     print("━" * 70)
 
     # food_data 로드
-    with open(FOOD_DATA_PATH, "r", encoding="utf-8") as f:
-        food_data = json.load(f)
+    food_data = get_food_store(FOOD_DATA_PATH).require()
 
     # 백업 스냅샷 로드
     snapshot_path = BACKUP_DIR / "folder_structure_snapshot.json"
@@ -4,15 +4,17 @@ WO-RESTRUCTURE-001 STEP 3: 구조 재구성 실행
 165개 폴더 순차 처리
 """
 
-import json
+import sys
 import re
 import shutil
 from pathlib import Path
 from datetime import datetime
 
 PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "04_pipeline"))
+from food_data_store import default_food_data_path, get_food_store
 CONTENTS_DIR = PROJECT_ROOT / "01_contents"
-FOOD_DATA_PATH = PROJECT_ROOT / "config" / "food_data.json"
+FOOD_DATA_PATH = default_food_data_path()
 
 
 def get_food_name(folder_name):
@@ -185,8 +187,7 @@ def main():
     print("━━━━━ STEP 3: 구조 재구성 ━━━━━")
 
     # food_data 로드
-    with open(FOOD_DATA_PATH, "r", encoding="utf-8") as f:
-        food_data = json.load(f)
+    food_data = get_food_store(FOOD_DATA_PATH).require()
 
     # 폴더 목록
     folders = sorted([f for f in CONTENTS_DIR.iterdir() if f.is_dir() and re.match(r'^\d{3}_', f.name)])
@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+"""
+batch_executor.py - 재개 가능한 병렬 배치 실행기
+
+night_batch / batch_produce_v2 / batch_runner 공용:
+- 서로 독립인 콘텐츠를 워커 풀에서 동시 처리 (기본: CPU 수, BATCH_WORKERS 로 조정)
+- 항목별 완료를 JSONL 저널에 기록 (한 줄 append + fsync, 중간에 죽어도 앞 기록 유지)
+  → --resume 시 완료(done) 항목은 건너뛰고 실패/미처리 항목만 다시 실행
+- 항목별 재시도: 예외 또는 실패 반환 시 retries 회까지 (배치 전체는 멈추지 않음)
+- 진행 콜백: 처리량(건/분) / ETA 포함 BatchProgress, 메인 스레드에서 호출
+
+사용법:
+    from batch_executor import BatchExecutor
+
+    executor = BatchExecutor(LOG_DIR / "journal.jsonl", workers=args.workers, retries=1)
+    report = executor.run(targets, key=lambda t: t["name"], func=process,
+                          resume=args.resume, on_progress=show)
+    report.done, report.failed, report.skipped
+
+주의: func 는 워커 스레드에서 실행 - 공유 상태는 반환값으로 넘겨 on_result 에서 합치기
+"""
+
+import os
+import json
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+DEFAULT_RETRIES = 1
+DEFAULT_RETRY_DELAY = 1.0
+MAX_WORKERS = 32
+FAILED_RESULT = "실패 반환"  # succeeded() 가 False 인 경우의 저널 error
+
+
+def default_workers() -> int:
+    """워커 수 (BATCH_WORKERS 환경 변수, 없으면 CPU 수)"""
+    try:
+        workers = int(os.getenv("BATCH_WORKERS", "0"))
+    except ValueError:
+        workers = 0
+    if workers <= 0:
+        workers = os.cpu_count() or 1
+    return max(1, min(workers, MAX_WORKERS))
+
+
+# ============================================
+# 저널
+# ============================================
+
+class BatchJournal:
+    """
+    항목별 처리 결과 JSONL 저널
+
+    - 한 줄: {"key", "status": "done"|"failed", "attempts", "seconds", "error", "at"}
+    - 같은 key 는 마지막 줄이 유효 (실패 후 재시도 성공 → done)
+    - 잘린 마지막 줄(쓰기 중 종료)은 무시
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    def load(self) -> Dict[str, Dict]:
+        """key → 마지막 기록"""
+        entries: Dict[str, Dict] = {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    if isinstance(entry, dict) and "key" in entry:
+                        entries[str(entry["key"])] = entry
+        except FileNotFoundError:
+            pass
+        return entries
+
+    def completed(self) -> set:
+        """done 으로 끝난 key"""
+        return {key for key, entry in self.load().items() if entry.get("status") == "done"}
+
+    def record(self, key: str, status: str, attempts: int = 1, seconds: float = 0.0,
+               error: Optional[str] = None):
+        """한 줄 append + fsync"""
+        entry = {"key": key, "status": status, "attempts": attempts, "seconds": round(seconds, 3),
+                 "error": error, "at": datetime.now().isoformat()}
+        line = json.dumps(entry, ensure_ascii=False) + "\n"
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+
+    def reset(self):
+        """새 배치 시작 (이전 저널은 .prev 로 보관)"""
+        with self._lock:
+            if self.path.exists():
+                os.replace(self.path, self.path.with_suffix(self.path.suffix + ".prev"))
+
+
+# ============================================
+# 진행 / 결과
+# ============================================
+
+@dataclass
+class BatchProgress:
+    """진행 현황 (on_progress 콜백 인자)"""
+    total: int
+    done: int = 0
+    failed: int = 0
+    skipped: int = 0
+    elapsed: float = 0.0
+    key: str = ""
+    status: str = ""
+
+    @property
+    def finished(self) -> int:
+        """이번 실행에서 끝난 항목 (성공 + 실패, 건너뛴 항목 제외)"""
+        return self.done + self.failed
+
+    @property
+    def current(self) -> int:
+        """진행바 위치 (건너뛴 항목 포함)"""
+        return self.skipped + self.finished
+
+    @property
+    def throughput(self) -> float:
+        """처리량 (건/분)"""
+        if self.elapsed <= 0:
+            return 0.0
+        return self.finished * 60.0 / self.elapsed
+
+    @property
+    def eta(self) -> Optional[float]:
+        """남은 예상 시간 (초, 첫 완료 전에는 None)"""
+        if self.finished == 0:
+            return None
+        return (self.total - self.current) * self.elapsed / self.finished
+
+
+@dataclass
+class BatchReport:
+    """배치 실행 결과"""
+    total: int
+    done: List[str] = field(default_factory=list)
+    failed: Dict[str, str] = field(default_factory=dict)
+    skipped: List[str] = field(default_factory=list)
+    retried: int = 0
+    elapsed: float = 0.0
+
+
+def format_eta(seconds: Optional[float]) -> str:
+    """ETA 표시 (예: 1시간 05분 / 3분 20초 / 계산 중)"""
+    if seconds is None:
+        return "계산 중"
+    seconds = int(round(seconds))
+    hours, rest = divmod(seconds, 3600)
+    minutes, secs = divmod(rest, 60)
+    if hours:
+        return f"{hours}시간 {minutes:02d}분"
+    if minutes:
+        return f"{minutes}분 {secs:02d}초"
+    return f"{secs}초"
+
+
+# ============================================
+# 실행기
+# ============================================
+
+class BatchExecutor:
+    """
+    항목 목록을 워커 풀에서 처리 + 저널 기록
+
+    Args:
+        journal_path: JSONL 저널 경로
+        workers: 동시 처리 수 (None: default_workers())
+        retries: 항목당 추가 시도 횟수
+        retry_delay: 재시도 전 대기 (초, 시도마다 2배)
+    """
+
+    def __init__(self, journal_path, workers: Optional[int] = None, retries: int = DEFAULT_RETRIES,
+                 retry_delay: float = DEFAULT_RETRY_DELAY, log: Callable[[str], None] = print):
+        self.journal = BatchJournal(journal_path)
+        self.workers = max(1, int(workers)) if workers else default_workers()
+        self.retries = max(0, int(retries))
+        self.retry_delay = retry_delay
+        self.log = log
+
+    def _attempt(self, func: Callable[[Any], Any], item: Any, key: str,
+                 succeeded: Callable[[Any], bool]) -> Dict:
+        """워커 스레드: 성공하거나 재시도를 다 쓸 때까지 실행 (result 는 마지막 시도 값)"""
+        started = time.monotonic()
+        delay = self.retry_delay
+        error = None
+        result = None
+        attempts = 0
+        for attempts in range(1, self.retries + 2):
+            try:
+                result = func(item)
+                error = None if succeeded(result) else FAILED_RESULT
+            except Exception as e:
+                result = None
+                error = f"{type(e).__name__}: {e}"
+            if error is None:
+                break
+            if attempts <= self.retries:
+                self.log(f"   ⚠️ [{key}] 시도 {attempts}/{self.retries + 1} 실패: {error[:80]} → 재시도")
+                time.sleep(delay)
+                delay *= 2
+        return {"result": result, "error": error, "attempts": attempts,
+                "seconds": time.monotonic() - started}
+
+    def _record(self, report: BatchReport, progress: BatchProgress, item_key: str,
+                outcome: Dict) -> str:
+        """끝난 항목 저널 기록 + 집계 (상태 반환)"""
+        status = "done" if outcome["error"] is None else "failed"
+        self.journal.record(item_key, status, outcome["attempts"], outcome["seconds"],
+                            outcome["error"])
+        report.retried += outcome["attempts"] - 1
+        if status == "done":
+            report.done.append(item_key)
+            progress.done += 1
+        else:
+            report.failed[item_key] = outcome["error"]
+            progress.failed += 1
+        return status
+
+    def run(self, items: Iterable[Any], key: Callable[[Any], str], func: Callable[[Any], Any],
+            resume: bool = False,
+            succeeded: Callable[[Any], bool] = lambda result: result is not False,
+            on_result: Optional[Callable[[Any, Any], None]] = None,
+            on_progress: Optional[Callable[[BatchProgress], None]] = None) -> BatchReport:
+        """
+        배치 실행
+
+        Args:
+            key: 항목 → 저널 key (배치 간 안정적인 값, 예: 폴더명)
+            func: 항목 처리 (워커 스레드, 예외 = 실패)
+            succeeded: 반환값 → 성공 여부 (기본: False 가 아니면 성공)
+            resume: True 면 저널의 done 항목 건너뜀, False 면 저널 새로 시작
+            on_result: (항목, 마지막 시도 반환값) - 메인 스레드, 성공/실패 모두 호출 (예외면 None)
+            on_progress: BatchProgress - 메인 스레드, 항목 완료마다 호출
+        """
+        items = list(items)
+        if resume:
+            completed = self.journal.completed()
+        else:
+            self.journal.reset()
+            completed = set()
+
+        report = BatchReport(total=len(items))
+        progress = BatchProgress(total=len(items))
+        pending = []
+        for item in items:
+            item_key = str(key(item))
+            if item_key in completed:
+                report.skipped.append(item_key)
+            else:
+                pending.append((item_key, item))
+        progress.skipped = len(report.skipped)
+        if report.skipped:
+            self.log(f"⏭️ 저널 기준 완료 {len(report.skipped)}건 건너뜀 (남은 {len(pending)}건)")
+
+        started = time.monotonic()
+        pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="batch")
+        futures = {pool.submit(self._attempt, func, item, item_key, succeeded): (item_key, item)
+                   for item_key, item in pending}
+        recorded = set()
+        try:
+            for future in as_completed(futures):
+                item_key, item = futures[future]
+                outcome = future.result()
+                recorded.add(future)
+                status = self._record(report, progress, item_key, outcome)
+
+                if on_result:
+                    on_result(item, outcome["result"])
+                if on_progress:
+                    progress.elapsed = time.monotonic() - started
+                    progress.key = item_key
+                    progress.status = status
+                    on_progress(progress)
+        except BaseException:
+            # 예외/Ctrl+C: 대기 항목은 실행하지 않고 취소, 이미 끝난 항목만 저널 기록 후 전달
+            pool.shutdown(wait=False, cancel_futures=True)
+            for future, (item_key, _) in futures.items():
+                if future in recorded or not future.done() or future.cancelled():
+                    continue
+                if future.exception() is None:
+                    self._record(report, progress, item_key, future.result())
+            raise
+        pool.shutdown()
+
+        report.elapsed = time.monotonic() - started
+        return report
@@ -14,7 +14,6 @@ v3.1: 6단계 순차 실행 구조 (pre → generate → post → gate)
     results = pipeline.run_batch(food_ids=[1, 2, 3, 127])
 """
 
-import json
 from typing import Dict, List, Optional, Union, Callable, Any
 from pathlib import Path
 from dataclasses import dataclass, field
@@ -24,6 +23,7 @@ from enum import Enum
 import sys
 PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(PROJECT_ROOT / "04_pipeline"))
 
 from pipeline.enums.safety import Safety, get_safety, SafetyError
 from pipeline.caption_generator import (
@@ -41,13 +41,14 @@ from pipeline.validators import (
     validate_after_generation,
     generate_structure_id,
 )
+from food_data_store import default_food_data_path, get_food_store
 
 
 # =============================================================================
 # 설정
 # =============================================================================
 
-FOOD_DATA_PATH = PROJECT_ROOT / "config" / "food_data.json"
+FOOD_DATA_PATH = default_food_data_path()
 CONTENTS_DIR = PROJECT_ROOT / "contents"
 LOGS_DIR = PROJECT_ROOT / "logs" / "pipeline"
 STATUS_DIRS = ["1_cover_only", "2_body_ready", "3_approved", "4_posted"]
@@ -131,20 +132,19 @@ class SafetyPipeline:
         self.caption_generator = caption_generator
         self.image_generator = image_generator
 
-        # 캐시
-        self._food_data_cache: Optional[Dict] = None
+        # 공용 저장소 (프로세스 단위 캐시)
+        self.food_store = get_food_store(FOOD_DATA_PATH)
 
     def load_food_data(self) -> Dict:
-        """food_data.json 로드 (캐시)"""
-        if self._food_data_cache is None:
-            with open(FOOD_DATA_PATH, "r", encoding="utf-8") as f:
-                self._food_data_cache = json.load(f)
-        return self._food_data_cache
+        """food_data.json 로드 (공용 캐시, 읽기 전용)"""
+        if not self.food_store.exists():
+            raise FileNotFoundError(f"food_data.json 없음: {self.food_store.path}")
+        return self.food_store.data
 
     def get_food(self, food_id: int) -> Optional[Dict]:
         """특정 음식 데이터 조회"""
-        data = self.load_food_data()
-        return data.get(str(food_id))
+        self.load_food_data()
+        return self.food_store.get(food_id)
 
     def run(self, food_id: int) -> PipelineResult:
         """
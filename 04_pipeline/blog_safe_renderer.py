@@ -17,6 +17,12 @@ macOS 폰트 경로 적용 (최부장)
 from PIL import Image, ImageDraw, ImageFont
 from pathlib import Path
 import os
+import sys
+
+# 04_pipeline 형제 모듈 import 지원
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from infographic_toolkit import emoji_image, load_font
 
 # ============================================================
 # 폰트 설정 (macOS)
@@ -55,33 +61,20 @@ def font(weight, size):
     w = weight_map.get(weight, "Regular")
     path = FONT_PATHS.get(w, FONT_PATHS["Regular"])
 
-    if path.exists():
-        return ImageFont.truetype(str(path), size)
+    # 핸들 캐시 재사용 (없는 파일도 1회만 시도)
+    fnt = load_font(path, size, fallback=False)
+    if fnt:
+        return fnt
 
     # Fallback to system font
-    try:
-        return ImageFont.truetype("/System/Library/Fonts/AppleSDGothicNeo.ttc", size)
-    except:
-        return ImageFont.load_default()
+    return load_font("/System/Library/Fonts/AppleSDGothicNeo.ttc", size)
 
 
 def render_emoji(emoji_char, target_size):
-    """이모지를 이미지로 렌더링"""
+    """이모지를 이미지로 렌더링 (문자/크기별 캐시, 붙이기 전용)"""
     if not EMOJI_AVAILABLE:
         return None
-
-    try:
-        canvas = Image.new('RGBA', (150, 150), (0, 0, 0, 0))
-        d = ImageDraw.Draw(canvas)
-        d.text((0, 0), emoji_char, font=EMOJI_FONT, embedded_color=True)
-        bbox = canvas.getbbox()
-        if bbox:
-            emoji_crop = canvas.crop(bbox)
-            emoji_crop = emoji_crop.resize((target_size, target_size), Image.LANCZOS)
-            return emoji_crop
-    except:
-        pass
-    return None
+    return emoji_image(emoji_char, target_size, EMOJI_FONT)
 
 
 # ============================================================
@@ -0,0 +1,463 @@
+#!/usr/bin/env python3
+"""
+caption_audit_runner.py - 증분 캡션 전수 검수 실행기
+
+caption_rule_verifier / blog_caption_audit / validate_blog_captions / audit_captions 공용:
+- 콘텐츠 트리 1회 순회: 폴더마다 디렉터리 목록 1회로 플랫폼별 캡션 결정
+  (새 경로 insta|blog|thread/caption.txt > 플랫 구조 caption.txt / thread_caption.txt
+   > OLD *_Caption.txt, 경로마다 exists() probe 없음)
+- 결과 캐시: (캡션 파일 해시, 규칙 버전, 검사 함수 지문, 음식 정보) 키
+  → 바뀐 캡션만 다시 검사 (캡션 3개 수정 후 재실행 = 캡션 3개 검사 시간)
+- 캐시 미스 항목은 프로세스 풀에서 병렬 검사 (소수면 현재 프로세스에서 바로)
+- 기계 판독용 리포트: 항목별 JSONL + 요약 JSON
+
+사용법:
+    from caption_audit_runner import CaptionAuditRunner
+
+    runner = CaptionAuditRunner(food_data)
+    report = runner.run(platforms=["blog"], num_range=(8, 200))
+    report.records, report.summary
+    runner.write_report(report)  # logs/caption_audit/caption_audit.jsonl + _summary.json
+
+검사 함수: checker(text, platform, food) -> {"failed": [...], "details": {...}, ...}
+  - 모듈 최상위 함수여야 함 (프로세스 풀 전달)
+  - food = {"num", "name", "english_name", "safety"}
+  - 기본값 rules_check: caption_rules 엔진 evaluate() (severity error 만 실패)
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import hashlib
+import inspect
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+# 숫자 폴더명 import 지원 (04_pipeline 형제 모듈)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from batch_executor import default_workers
+from caption_rules import get_caption_rules
+
+PROJECT_ROOT = Path(__file__).parent.parent
+CONTENTS_DIR = PROJECT_ROOT / "01_contents"
+DEFAULT_CACHE_PATH = PROJECT_ROOT / ".cache" / "caption_audit" / "results.json"
+DEFAULT_REPORT_DIR = PROJECT_ROOT / "logs" / "caption_audit"
+
+PLATFORMS = ("instagram", "blog", "threads")
+# 캐시 파일 스키마가 바뀌면 올려서 기존 캐시 무효화
+CACHE_SCHEMA_VERSION = 2
+# 캐시 미스가 이 개수 이하면 프로세스 풀을 띄우지 않음 (기동 비용 > 검사 비용)
+INLINE_THRESHOLD = 8
+
+FOLDER_PATTERN = re.compile(r"^(\d{3})_")
+
+# 플랫폼 → (새 경로 폴더, 플랫 구조 폴더, 플랫 구조 파일, OLD 파일 접미사)
+# 우선순위: 새 경로 (v2) > 플랫 구조 (2026-02-13) > OLD 파일명 (v1, 플랫 구조 폴더 안)
+_LAYOUT = {
+    "instagram": ("insta", "01_Insta&Thread", "caption.txt", "_Insta_Caption.txt"),
+    "blog": ("blog", "02_Blog", "caption.txt", "_Blog_Caption.txt"),
+    "threads": ("thread", "01_Insta&Thread", "thread_caption.txt", "_Threads_Caption.txt"),
+}
+
+Checker = Callable[[str, str, Dict[str, Any]], Dict[str, Any]]
+
+
+# ============================================
+# 콘텐츠 트리 순회
+# ============================================
+
+@dataclass
+class ContentFolder:
+    """콘텐츠 폴더 1개 + 플랫폼별 캡션 경로 (없으면 키 없음)"""
+    num: int
+    name: str
+    path: Path
+    captions: Dict[str, Path] = field(default_factory=dict)
+
+
+def _list_dir(path: Path) -> Dict[str, bool]:
+    """이름 → 디렉터리 여부 (없는 폴더는 빈 dict)"""
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name: entry.is_dir() for entry in entries}
+    except (FileNotFoundError, NotADirectoryError):
+        return {}
+
+
+def find_caption_files(folder: Path) -> Dict[str, Path]:
+    """폴더의 플랫폼별 캡션 (새 경로 > 플랫 구조 > OLD 파일명 / 디렉터리 목록 조회만)"""
+    folder = Path(folder)
+    top = _list_dir(folder)
+    listings: Dict[str, Dict[str, bool]] = {}
+
+    def listing(name: str) -> Dict[str, bool]:
+        if name not in listings:
+            listings[name] = _list_dir(folder / name) if top.get(name) else {}
+        return listings[name]
+
+    captions = {}
+    for platform, (new_dir, flat_dir, flat_name, old_suffix) in _LAYOUT.items():
+        if listing(new_dir).get("caption.txt") is False:
+            captions[platform] = folder / new_dir / "caption.txt"
+        elif listing(flat_dir).get(flat_name) is False:
+            captions[platform] = folder / flat_dir / flat_name
+        else:
+            old = sorted(name for name, is_dir in listing(flat_dir).items()
+                         if not is_dir and name.endswith(old_suffix))
+            if old:
+                captions[platform] = folder / flat_dir / old[0]
+    return captions
+
+
+def scan_contents(contents_dir=CONTENTS_DIR,
+                  num_range: Optional[Tuple[int, int]] = None) -> List[ContentFolder]:
+    """콘텐츠 트리 1회 순회 → 번호순 ContentFolder 목록 (num_range 는 양끝 포함)"""
+    folders = []
+    for name, is_dir in _list_dir(Path(contents_dir)).items():
+        match = FOLDER_PATTERN.match(name)
+        if not is_dir or not match:
+            continue
+        num = int(match.group(1))
+        if num_range and not num_range[0] <= num <= num_range[1]:
+            continue
+        path = Path(contents_dir) / name
+        folders.append(ContentFolder(num=num, name=name, path=path, captions=find_caption_files(path)))
+    folders.sort(key=lambda f: (f.num, f.name))
+    return folders
+
+
+# ============================================
+# 검사 함수
+# ============================================
+
+def rules_check(text: str, platform: str, food: Dict[str, Any]) -> Dict[str, Any]:
+    """기본 검사: caption_rules 선언형 규칙 (info 는 실패로 세지 않음)"""
+    findings = get_caption_rules().evaluate(text, platform, food.get("safety"))
+    errors = [f for f in findings if f.severity == "error"]
+    return {
+        "failed": [f.rule for f in errors],
+        "details": {f.rule: f.message for f in errors},
+        "findings": [f.to_dict() for f in findings],
+    }
+
+
+def checker_fingerprint(checker: Checker) -> str:
+    """검사 함수 지문: 이름 + 정의 파일 내용 + 규칙 버전 (어느 쪽이 바뀌어도 캐시 무효)"""
+    hasher = hashlib.sha256(f"{checker.__module__}.{checker.__qualname__}".encode())
+    try:
+        hasher.update(Path(inspect.getfile(checker)).read_bytes())
+    except (TypeError, OSError):
+        pass
+    hasher.update(get_caption_rules().version.encode())
+    return hasher.hexdigest()[:16]
+
+
+def cache_key(*parts: Any) -> str:
+    """결과 캐시 키 (JSON 직렬화 가능한 값들 → sha256)"""
+    raw = json.dumps(parts, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+def _check_file(checker: Checker, path: str, platform: str, food: Dict[str, Any]) -> Dict[str, Any]:
+    """워커: 캡션 1개 검사 (예외는 error 로 반환, 풀 전체는 계속)"""
+    try:
+        text = Path(path).read_text(encoding="utf-8")
+        return {"result": checker(text, platform, food), "error": None}
+    except Exception as e:
+        return {"result": None, "error": f"{type(e).__name__}: {e}"}
+
+
+# ============================================
+# 결과 캐시
+# ============================================
+
+class AuditCache:
+    """
+    캡션 경로 → {stat, sha256, results: {검사 함수 지문: {key, result}}} JSON 캐시
+
+    - 파일이 아닌 캡션(시트 셀 등)은 임의 이름 + cache_key(텍스트, ...) 로 get / put
+    - stat (mtime_ns, size) 가 같으면 해시 재계산 없이 재사용
+    - 결과는 검사 함수(checker) 별로 보관 → 같은 캐시 파일을 쓰는 도구끼리 덮어쓰지 않음
+    - key 가 다르면 (내용 / 규칙 / 검사 함수 / 음식 정보 변경) 미스
+    - save(): 임시 파일 + os.replace (중간에 죽어도 이전 캐시 유지)
+    """
+
+    def __init__(self, path=None):
+        self.path = Path(path or DEFAULT_CACHE_PATH)
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            if data.get("schema") == CACHE_SCHEMA_VERSION:
+                self.entries = data.get("entries", {})
+        except (FileNotFoundError, ValueError, AttributeError):
+            pass
+
+    def file_hash(self, path: Path) -> str:
+        """캡션 파일 sha256 (stat 이 같으면 캐시된 값)"""
+        stat = path.stat()
+        signature = [stat.st_mtime_ns, stat.st_size]
+        entry = self.entries.get(str(path))
+        if entry and entry.get("stat") == signature and entry.get("sha256"):
+            return entry["sha256"]
+        digest = hashlib.sha256(path.read_bytes()).hexdigest()
+        # 내용이 같으면 (touch 등) 이전 결과 유지 - key 에 해시가 들어 있어 바뀐 내용은 어차피 미스
+        self.entries.setdefault(str(path), {}).update(stat=signature, sha256=digest)
+        self._dirty = True
+        return digest
+
+    def get(self, path: Path, key: str, checker: str = "") -> Optional[Dict[str, Any]]:
+        slot = self.entries.get(str(path), {}).get("results", {}).get(checker)
+        if slot and slot.get("key") == key and "result" in slot:
+            return slot["result"]
+        return None
+
+    def put(self, path: Path, key: str, result: Dict[str, Any], checker: str = ""):
+        entry = self.entries.setdefault(str(path), {})
+        entry.setdefault("results", {})[checker] = {"key": key, "result": result}
+        self._dirty = True
+
+    def prune(self):
+        """사라진 캡션 파일 항목 제거 (파일 캐시 전용)"""
+        missing = [p for p in self.entries if not Path(p).exists()]
+        for p in missing:
+            del self.entries[p]
+        self._dirty = self._dirty or bool(missing)
+
+    def save(self):
+        if not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+        tmp.write_text(json.dumps({"schema": CACHE_SCHEMA_VERSION, "entries": self.entries},
+                                  ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, self.path)
+        self._dirty = False
+
+
+# ============================================
+# 실행기
+# ============================================
+
+@dataclass
+class AuditRecord:
+    """캡션 1개 검수 결과 (JSONL 한 줄)"""
+    num: int
+    folder: str
+    platform: str
+    path: str
+    name: str
+    safety: str
+    status: str  # pass | fail | error | skip
+    failed: List[Any] = field(default_factory=list)
+    details: Dict[str, Any] = field(default_factory=dict)
+    result: Optional[Dict[str, Any]] = None
+    cached: bool = False
+    error: Optional[str] = None
+    sha256: str = ""
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass
+class AuditReport:
+    """검수 실행 결과"""
+    records: List[AuditRecord]
+    summary: Dict[str, Any]
+    folders: List[ContentFolder] = field(default_factory=list)
+
+    def by_platform(self, platform: str) -> List[AuditRecord]:
+        return [r for r in self.records if r.platform == platform]
+
+
+class CaptionAuditRunner:
+    """
+    콘텐츠 트리 전체 캡션 검수 (증분 + 병렬)
+
+    Args:
+        food_data: {"번호": {"name", "english_name", "safety"}} (food_data.json)
+        checker: 검사 함수 (모듈 최상위 함수, 기본: rules_check)
+        cache_path: 결과 캐시 파일 (None: .cache/caption_audit/results.json, False: 캐시 끔)
+        workers: 프로세스 수 (None: default_workers())
+    """
+
+    def __init__(self, food_data: Dict[str, Dict], checker: Checker = rules_check,
+                 contents_dir=CONTENTS_DIR, cache_path=None, workers: Optional[int] = None,
+                 inline_threshold: int = INLINE_THRESHOLD, log: Callable[[str], None] = print):
+        self.food_data = food_data
+        self.checker = checker
+        self.contents_dir = Path(contents_dir)
+        self.cache = AuditCache(cache_path) if cache_path is not False else None
+        self.workers = max(1, int(workers)) if workers else default_workers()
+        self.inline_threshold = inline_threshold
+        self.log = log
+        self.fingerprint = checker_fingerprint(checker)
+
+    def food_info(self, num: int, folder: str = "") -> Dict[str, Any]:
+        """검사 함수에 넘기는 음식 정보 (food_data 에 없으면 safety UNKNOWN)"""
+        data = self.food_data.get(str(num), {})
+        fallback = folder.split("_", 1)[1] if "_" in folder else folder
+        return {
+            "num": num,
+            "name": data.get("name", fallback),
+            "english_name": data.get("english_name", fallback),
+            "safety": data.get("safety", "UNKNOWN"),
+        }
+
+    def run(self, platforms: Iterable[str] = PLATFORMS, num_range: Optional[Tuple[int, int]] = None,
+            skip_unknown: bool = True) -> AuditReport:
+        """
+        검수 실행
+
+        Args:
+            platforms: 검사할 플랫폼 (instagram / blog / threads)
+            num_range: (시작, 끝) 번호 (양끝 포함)
+            skip_unknown: 안전도 모르는 음식은 검사 없이 skip
+        """
+        started = time.monotonic()
+        platforms = [p for p in PLATFORMS if p in set(platforms)]
+        folders = scan_contents(self.contents_dir, num_range)
+
+        records: List[AuditRecord] = []
+        pending: List[Tuple[AuditRecord, Dict[str, Any], str]] = []
+        for folder in folders:
+            food = self.food_info(folder.num, folder.name)
+            for platform in platforms:
+                path = folder.captions.get(platform)
+                if path is None:
+                    continue
+                record = AuditRecord(num=folder.num, folder=folder.name, platform=platform, path=str(path),
+                                     name=food["name"], safety=food["safety"], status="skip")
+                records.append(record)
+                if skip_unknown and food["safety"] == "UNKNOWN":
+                    record.error = "안전도 정보 없음"
+                    continue
+                try:
+                    record.sha256 = (self.cache.file_hash(path) if self.cache
+                                     else hashlib.sha256(path.read_bytes()).hexdigest())
+                except OSError as e:
+                    record.status, record.error = "error", f"{type(e).__name__}: {e}"
+                    continue
+                key = cache_key(record.sha256, platform, food, self.fingerprint)
+                cached = self.cache.get(path, key, self.fingerprint) if self.cache else None
+                if cached is not None:
+                    self._apply(record, {"result": cached, "error": None})
+                    record.cached = True
+                else:
+                    pending.append((record, food, key))
+
+        if pending:
+            self.log(f"🔍 캡션 검사 {len(pending)}건 (캐시 적중 {sum(r.cached for r in records)}건)")
+        for (record, _, key), outcome in zip(pending, self._check_all(pending)):
+            self._apply(record, outcome)
+            if self.cache and outcome["error"] is None:
+                self.cache.put(Path(record.path), key, outcome["result"], self.fingerprint)
+
+        if self.cache:
+            self.cache.prune()
+            self.cache.save()
+
+        summary = self._summarize(records, len(pending), time.monotonic() - started)
+        return AuditReport(records=records, summary=summary, folders=folders)
+
+    def _check_all(self, pending) -> List[Dict[str, Any]]:
+        """캐시 미스 검사 (소수면 현재 프로세스, 아니면 프로세스 풀 / 입력 순서 유지)"""
+        jobs = [(record.path, record.platform, food) for record, food, _ in pending]
+        if self.workers == 1 or len(jobs) <= self.inline_threshold:
+            return [_check_file(self.checker, *job) for job in jobs]
+        workers = min(self.workers, len(jobs))
+        chunksize = max(1, len(jobs) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(_check_file, [self.checker] * len(jobs), *zip(*jobs),
+                                 chunksize=chunksize))
+
+    @staticmethod
+    def _apply(record: AuditRecord, outcome: Dict[str, Any]):
+        if outcome["error"] is not None:
+            record.status, record.error = "error", outcome["error"]
+            return
+        result = outcome["result"] or {}
+        record.result = result
+        record.failed = list(result.get("failed", []))
+        record.details = dict(result.get("details", {}))
+        record.status = "fail" if record.failed else "pass"
+
+    def _summarize(self, records: List[AuditRecord], checked: int, elapsed: float) -> Dict[str, Any]:
+        by_platform: Dict[str, Dict[str, int]] = {}
+        fail_by_check: Dict[str, int] = {}
+        for record in records:
+            counts = by_platform.setdefault(record.platform, {"pass": 0, "fail": 0, "error": 0, "skip": 0})
+            counts[record.status] += 1
+            for check in record.failed:
+                name = f"{record.platform}:{check}"
+                fail_by_check[name] = fail_by_check.get(name, 0) + 1
+        return {
+            "generated_at": datetime.now().isoformat(),
+            "rules_version": get_caption_rules().version,
+            "checker": f"{self.checker.__module__}.{self.checker.__qualname__}",
+            "total": len(records),
+            "pass": sum(r.status == "pass" for r in records),
+            "fail": sum(r.status == "fail" for r in records),
+            "error": sum(r.status == "error" for r in records),
+            "skip": sum(r.status == "skip" for r in records),
+            "cached": sum(r.cached for r in records),
+            "checked": checked,
+            "elapsed": round(elapsed, 3),
+            "by_platform": by_platform,
+            "fail_by_check": dict(sorted(fail_by_check.items(), key=lambda x: -x[1])),
+        }
+
+    def write_report(self, report: AuditReport, report_dir=None,
+                     name: str = "caption_audit") -> Tuple[Path, Path]:
+        """리포트 저장 → (항목별 JSONL, 요약 JSON) 경로"""
+        report_dir = Path(report_dir or DEFAULT_REPORT_DIR)
+        report_dir.mkdir(parents=True, exist_ok=True)
+        records_path = report_dir / f"{name}.jsonl"
+        summary_path = report_dir / f"{name}_summary.json"
+        with open(records_path, "w", encoding="utf-8") as f:
+            for record in report.records:
+                f.write(json.dumps(record.to_dict(), ensure_ascii=False) + "\n")
+        with open(summary_path, "w", encoding="utf-8") as f:
+            json.dump(report.summary, f, ensure_ascii=False, indent=2)
+        return records_path, summary_path
+
+
+def format_summary(summary: Dict[str, Any]) -> str:
+    """요약 1줄 (콘솔 출력용)"""
+    return (f"검수 {summary['total']}건: ✅ {summary['pass']} / ❌ {summary['fail']} / "
+            f"⚠️ 오류 {summary['error']} / ⏭️ {summary['skip']} "
+            f"(검사 {summary['checked']}건, 캐시 {summary['cached']}건, {summary['elapsed']:.1f}초)")
+
+
+def main():
+    """전체 캡션 기본 규칙 검수 + 리포트 저장"""
+    import argparse
+    from food_data_store import load_food_data
+
+    parser = argparse.ArgumentParser(description="증분 캡션 전수 검수")
+    parser.add_argument("--platform", action="append", choices=PLATFORMS, help="검사 플랫폼 (반복 가능)")
+    parser.add_argument("--range", nargs=2, type=int, metavar=("START", "END"), help="번호 범위")
+    parser.add_argument("--workers", type=int, default=None, help="프로세스 수")
+    parser.add_argument("--no-cache", action="store_true", help="캐시 없이 전부 검사")
+    args = parser.parse_args()
+
+    runner = CaptionAuditRunner(load_food_data(), workers=args.workers,
+                                cache_path=False if args.no_cache else None)
+    report = runner.run(platforms=args.platform or PLATFORMS,
+                        num_range=tuple(args.range) if args.range else None)
+    records_path, summary_path = runner.write_report(report)
+    print(format_summary(report.summary))
+    print(f"📄 리포트: {records_path}")
+    print(f"📊 요약: {summary_path}")
+    return 0 if report.summary["fail"] == 0 and report.summary["error"] == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
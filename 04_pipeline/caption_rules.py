@@ -0,0 +1,358 @@
+#!/usr/bin/env python3
+"""
+caption_rules.py - 컴파일된 캡션 규칙 엔진
+
+caption_validator / caption_rule_verifier / layers.validator / post_validator /
+validators_strict 공용:
+- 규칙 정의: 02_config/caption_rules.json (키워드 그룹 / 정규식 / 안전도 이모지 /
+  해시태그 범위 / 선언형 규칙) + toxicity_keywords.json (독성 키워드)
+- 모든 키워드 그룹 → Aho-Corasick 오토마톤 1개, 텍스트 1회 순회로 전체 그룹 매칭
+  (키워드마다 `kw in text` 반복 대신)
+- 정규식은 로드 시 1회 컴파일, 스캔 결과에 텍스트별로 캐시
+- evaluate(): 플랫폼/안전도별 선언형 규칙 → 구조화된 Finding 목록
+
+사용법:
+    from caption_rules import get_caption_rules
+
+    rules = get_caption_rules()
+    scan = rules.scan(caption)
+    scan.has("cta"), scan.matched("forbidden_blocked"), scan.count("hashtag")
+    findings = rules.evaluate(caption, "instagram", "CAUTION")
+
+그룹 매칭은 부분 문자열 기준 (ignore_case 그룹은 소문자 비교)
+"""
+
+import re
+import json
+import hashlib
+from collections import deque
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_RULES_PATH = PROJECT_ROOT / "02_config" / "caption_rules.json"
+
+SCAN_CACHE_SIZE = 64
+TOXICITY_GROUP_PREFIX = "toxicity:"
+
+
+class CaptionRuleError(ValueError):
+    """규칙 정의 오류 (없는 그룹/정규식 참조, 알 수 없는 규칙 타입)"""
+
+
+# ============================================
+# Aho-Corasick
+# ============================================
+
+class KeywordAutomaton:
+    """
+    다중 패턴 매칭 오토마톤
+
+    패턴 n개를 텍스트 1회 순회로 모두 찾음 (겹치는 매치 포함)
+    """
+
+    def __init__(self, patterns: Sequence[str]):
+        self.patterns = list(patterns)
+        goto: List[Dict[str, int]] = [{}]
+        output: List[List[int]] = [[]]
+        for pid, pattern in enumerate(self.patterns):
+            node = 0
+            for ch in pattern:
+                nxt = goto[node].get(ch)
+                if nxt is None:
+                    goto.append({})
+                    output.append([])
+                    nxt = len(goto) - 1
+                    goto[node][ch] = nxt
+                node = nxt
+            output[node].append(pid)
+
+        fail = [0] * len(goto)
+        order = []
+        queue = deque(goto[0].values())
+        while queue:
+            node = queue.popleft()
+            order.append(node)
+            for ch, nxt in goto[node].items():
+                queue.append(nxt)
+                f = fail[node]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                target = goto[f].get(ch, 0)
+                fail[nxt] = target if target != nxt else 0
+                output[nxt] = output[nxt] + output[fail[nxt]]
+
+        # 실패 링크를 미리 펼친 전이표 (DFA): 스캔 시 문자당 dict 조회 1회
+        # 표에 없는 문자 → 루트 (패턴 첫 글자만 루트 전이에 있음)
+        delta: List[Dict[str, int]] = [dict(goto[0])] + [None] * (len(goto) - 1)
+        for node in order:
+            table = dict(delta[fail[node]])
+            table.update(goto[node])
+            delta[node] = table
+
+        self._delta = delta
+        self._output = output
+
+    def iter_matches(self, text: str) -> Iterable[Tuple[int, int]]:
+        """(시작 위치, 패턴 번호)"""
+        delta, output, patterns = self._delta, self._output, self.patterns
+        node = 0
+        for i, ch in enumerate(text):
+            node = delta[node].get(ch, 0)
+            if output[node]:
+                for pid in output[node]:
+                    yield i - len(patterns[pid]) + 1, pid
+
+
+# ============================================
+# 스캔 결과 / 규칙 결과
+# ============================================
+
+@dataclass
+class Finding:
+    """규칙 위반 1건"""
+    rule: str
+    severity: str
+    message: str
+    matches: List[str] = field(default_factory=list)
+    value: Optional[int] = None
+
+    def to_dict(self) -> Dict:
+        return {"rule": self.rule, "severity": self.severity, "message": self.message,
+                "matches": self.matches, "value": self.value}
+
+
+class CaptionScan:
+    """
+    텍스트 1개의 스캔 결과 (읽기 전용)
+
+    - 그룹: has / matched (설정 순서) / count (출현 수, 겹침 포함) / first (첫 위치)
+    - 정규식: search / findall (이름별 1회 실행 후 캐시)
+    """
+
+    def __init__(self, rules: "CaptionRules", text: str, hits: Dict[str, Dict[str, List[int]]]):
+        self.rules = rules
+        self.text = text
+        self._hits = hits
+        self._search: Dict[str, Optional[re.Match]] = {}
+        self._findall: Dict[str, List] = {}
+
+    def has(self, group: str) -> bool:
+        self.rules.keywords(group)
+        return bool(self._hits.get(group))
+
+    def matched(self, group: str) -> List[str]:
+        """매치된 키워드 (설정 파일 순서)"""
+        found = self._hits.get(group, {})
+        return [kw for kw in self.rules.keywords(group) if kw in found]
+
+    def count(self, group: str) -> int:
+        self.rules.keywords(group)
+        return sum(len(starts) for starts in self._hits.get(group, {}).values())
+
+    def first(self, group: str) -> Optional[int]:
+        """그룹 키워드 첫 출현 위치 (없으면 None)"""
+        self.rules.keywords(group)
+        starts = [s[0] for s in self._hits.get(group, {}).values() if s]
+        return min(starts) if starts else None
+
+    def search(self, name: str) -> Optional[re.Match]:
+        if name not in self._search:
+            self._search[name] = self.rules.regex(name).search(self.text)
+        return self._search[name]
+
+    def findall(self, name: str) -> List:
+        if name not in self._findall:
+            self._findall[name] = self.rules.regex(name).findall(self.text)
+        return self._findall[name]
+
+    def toxicity_categories(self) -> List[str]:
+        """언급된 독성 카테고리 (toxicity_keywords.json 순서)"""
+        return [g[len(TOXICITY_GROUP_PREFIX):] for g in self.rules.toxicity_groups if self._hits.get(g)]
+
+
+# ============================================
+# 규칙 엔진
+# ============================================
+
+class CaptionRules:
+    """
+    caption_rules.json → 컴파일된 규칙 집합
+
+    Args:
+        path: 규칙 파일 (기본: 02_config/caption_rules.json)
+    """
+
+    RULE_TYPES = ("require_any", "require_all", "forbid_any", "count_range", "max_length", "mention")
+
+    def __init__(self, path=None):
+        self.path = Path(path or DEFAULT_RULES_PATH)
+        raw = self.path.read_bytes()
+        config = json.loads(raw)
+        digest = hashlib.sha256(raw)
+
+        self.groups: Dict[str, List[str]] = {}
+        self._ignore_case: Dict[str, bool] = {}
+        for name, spec in config.get("keyword_groups", {}).items():
+            self.groups[name] = list(spec["keywords"])
+            self._ignore_case[name] = bool(spec.get("ignore_case", False))
+
+        self.safety_emoji = {k: tuple(v) for k, v in config.get("safety_emoji", {}).items()}
+        for safety, emojis in self.safety_emoji.items():
+            self.groups[f"safety_emoji:{safety}"] = list(emojis)
+            self._ignore_case[f"safety_emoji:{safety}"] = False
+
+        self.toxicity_groups: List[str] = []
+        source = config.get("toxicity_source")
+        if source:
+            toxicity_path = self.path.parent / source
+            toxicity_raw = toxicity_path.read_bytes()
+            digest.update(toxicity_raw)
+            for category, spec in json.loads(toxicity_raw).get("categories", {}).items():
+                name = f"{TOXICITY_GROUP_PREFIX}{category}"
+                self.groups[name] = list(dict.fromkeys(spec.get("toxin_name", []) + spec.get("symptoms", [])))
+                self._ignore_case[name] = False
+                self.toxicity_groups.append(name)
+
+        self.hashtag_bounds = {k: tuple(v) for k, v in config.get("hashtag_bounds", {}).items()}
+        self.length_limits = dict(config.get("length_limits", {}))
+        self._regexes = {
+            name: re.compile(spec["pattern"], re.IGNORECASE if spec.get("ignore_case") else 0)
+            for name, spec in config.get("regexes", {}).items()
+        }
+        self.rules = list(config.get("rules", []))
+        for rule in self.rules:
+            if rule.get("type") not in self.RULE_TYPES:
+                raise CaptionRuleError(f"알 수 없는 규칙 타입: {rule.get('id')} ({rule.get('type')})")
+
+        self.version = f"{config.get('_metadata', {}).get('version', '0')}-{digest.hexdigest()[:12]}"
+        self._compile()
+        self.scan = lru_cache(maxsize=SCAN_CACHE_SIZE)(self._scan)
+
+    def _compile(self):
+        """모든 그룹 키워드 → 소문자 패턴 1세트 (같은 문자열은 패턴 1개 공유)"""
+        pattern_ids: Dict[str, int] = {}
+        # 패턴 번호 → [(그룹, 원래 키워드, 대소문자 구분)]
+        self._entries: List[List[Tuple[str, str, bool]]] = []
+        for group, keywords in self.groups.items():
+            case_sensitive = not self._ignore_case[group]
+            for keyword in keywords:
+                if not keyword:
+                    continue
+                lowered = keyword.lower()
+                pid = pattern_ids.get(lowered)
+                if pid is None:
+                    pid = pattern_ids[lowered] = len(self._entries)
+                    self._entries.append([])
+                self._entries[pid].append((group, keyword, case_sensitive))
+        self._automaton = KeywordAutomaton(list(pattern_ids))
+
+    def _scan(self, text: str) -> CaptionScan:
+        text = text or ""
+        lowered = text.lower()
+        # lower() 가 길이를 바꾸는 문자(드묾)가 있으면 위치 대조 불가 → 대소문자 구분 키워드는 직접 확인
+        aligned = len(lowered) == len(text)
+        hits: Dict[str, Dict[str, List[int]]] = {}
+        deferred = set()
+        for start, pid in self._automaton.iter_matches(lowered):
+            for group, keyword, case_sensitive in self._entries[pid]:
+                if case_sensitive:
+                    if not aligned:
+                        deferred.add((group, keyword))
+                        continue
+                    if text[start:start + len(keyword)] != keyword:
+                        continue
+                hits.setdefault(group, {}).setdefault(keyword, []).append(start)
+        for group, keyword in deferred:
+            starts = [m.start() for m in re.finditer(f"(?={re.escape(keyword)})", text)]
+            if starts:
+                hits.setdefault(group, {})[keyword] = starts
+        return CaptionScan(self, text, hits)
+
+    # --- 조회 ---
+
+    def keywords(self, group: str) -> List[str]:
+        try:
+            return self.groups[group]
+        except KeyError:
+            raise CaptionRuleError(f"정의되지 않은 키워드 그룹: {group}") from None
+
+    def regex(self, name: str) -> re.Pattern:
+        try:
+            return self._regexes[name]
+        except KeyError:
+            raise CaptionRuleError(f"정의되지 않은 정규식: {name}") from None
+
+    def strip_emoji(self, text: str) -> str:
+        """이모지 제거 (앞뒤 공백 정리)"""
+        return self.regex("emoji").sub("", text).strip()
+
+    # --- 선언형 규칙 ---
+
+    def evaluate(self, text: str, platform: str, safety: Optional[str] = None) -> List[Finding]:
+        """
+        플랫폼/안전도에 해당하는 규칙 평가 (스캔 1회)
+
+        Returns:
+            위반 Finding 목록 (규칙 파일 순서)
+        """
+        scan = self.scan(text or "")
+        safety = (safety or "").upper()
+        findings = []
+        for rule in self.rules:
+            if platform not in rule.get("platforms", [platform]):
+                continue
+            if "safety" in rule and safety not in rule["safety"]:
+                continue
+            finding = self._check(rule, scan, safety)
+            if finding is not None:
+                findings.append(finding)
+        return findings
+
+    def _check(self, rule: Dict, scan: CaptionScan, safety: str) -> Optional[Finding]:
+        kind = rule["type"]
+        fmt = {"count": None, "min": None, "max": None, "matches": "", "expected": ()}
+        matches: List[str] = []
+        value = None
+
+        if kind in ("require_any", "forbid_any", "count_range"):
+            group = rule["group"].format(safety=safety)
+            # 알 수 없는 안전도의 안전도 이모지 그룹: 필요한 이모지 없음 → 항상 위반
+            unknown_safety = group.startswith("safety_emoji:") and group not in self.groups
+            fmt["expected"] = () if unknown_safety else tuple(self.keywords(group))
+
+        if kind == "require_any":
+            failed = unknown_safety or not scan.has(group)
+        elif kind == "require_all":
+            failed = not all(scan.has(g) for g in rule["groups"])
+        elif kind == "forbid_any":
+            matches = scan.matched(group)
+            failed = bool(matches)
+        elif kind == "mention":
+            matches = [g[len(TOXICITY_GROUP_PREFIX):] for g in self.toxicity_groups if scan.has(g)] \
+                if rule["group"] == f"{TOXICITY_GROUP_PREFIX}*" else scan.matched(rule["group"])
+            failed = bool(matches)
+        elif kind == "count_range":
+            value = scan.count(group)
+            low, high = self.hashtag_bounds[rule["bounds"]] if "bounds" in rule else (rule.get("min"), rule.get("max"))
+            fmt.update(min=low, max=high)
+            failed = (low is not None and value < low) or (high is not None and value > high)
+        else:  # max_length
+            value = len(scan.text)
+            limit = self.length_limits[rule["limit"]]
+            fmt["max"] = limit
+            failed = value > limit
+
+        if not failed:
+            return None
+        fmt.update(count=value, matches=", ".join(matches))
+        return Finding(rule=rule["id"], severity=rule.get("severity", "error"),
+                       message=rule["message"].format(**fmt), matches=matches, value=value)
+
+
+@lru_cache(maxsize=1)
+def get_caption_rules() -> CaptionRules:
+    """기본 규칙 집합 (프로세스당 1회 컴파일)"""
+    return CaptionRules()
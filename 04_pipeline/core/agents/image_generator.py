@@ -6,17 +6,13 @@ Author: 최기술 대리
 """
 
 import os
-import asyncio
-import httpx
-from typing import Any, Dict, List
+import time
+from typing import Any, Dict, List, Optional
 from pathlib import Path
 from dotenv import load_dotenv
-from PIL import Image
-import io
 from .base import BaseAgent, AgentResult, retry
-
-# Instagram 표준 이미지 크기
-INSTAGRAM_SIZE = (1080, 1080)
+from ..fal_generation import FalGenerationStage, FalImageJob
+from ..generation_cache import deterministic_seed, get_generation_cache
 
 # 커스텀 예외 임포트
 import sys
@@ -67,7 +63,12 @@ class ImageGeneratorAgent(BaseAgent):
         provider = self.config.get("provider", "fal")
 
         if provider == "fal":
-            images = await self._generate_fal_flux(prompts, topic)
+            # G2 재시도: _regenerate 슬라이드만 seed 변경 (나머지는 생성 캐시 재사용)
+            images = await self._generate_fal_flux(
+                prompts, topic,
+                regenerate=input_data.get("_regenerate"),
+                seed_offset=input_data.get("_attempt", 0),
+            )
         elif provider == "dalle3":
             images = await self._generate_dalle3(prompts, topic)
         elif provider == "stability":
@@ -82,13 +83,17 @@ class ImageGeneratorAgent(BaseAgent):
         )
 
     @retry(max_attempts=3, delay=2.0)
-    async def _generate_fal_flux(self, prompts: List, topic: str) -> List[Dict]:
+    async def _generate_fal_flux(self, prompts: List, topic: str,
+                                 regenerate: Optional[List[int]] = None,
+                                 seed_offset: int = 0) -> List[Dict]:
         """
         fal.ai Flux 2 Pro API로 이미지 생성
 
         - 모델: fal-ai/flux-2-pro
         - 크기: 1080x1080 (Instagram 정사각형)
         - 인증: FAL_KEY 환경변수
+        - 캐시: (모델, 프롬프트, 크기, seed) 같으면 이전 결과 재사용
+        - regenerate: seed_offset 을 적용할 슬라이드 index (새 이미지 강제)
         """
         import fal_client
 
@@ -104,111 +109,49 @@ class ImageGeneratorAgent(BaseAgent):
         output_dir = Path(__file__).parent.parent / "outputs" / topic
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        images = []
+        jobs = [
+            FalImageJob(
+                index=p["index"],
+                type=p.get("type", "content"),
+                prompt=p.get("prompt", p.get("text", f"{topic} dog food image")),
+                path=output_dir / f"{topic}_{p['index']:02d}_{p.get('type', 'content')}.png",
+                seed=self._slide_seed(p, topic, regenerate, seed_offset),
+            )
+            for p in prompts
+        ]
+
+        # 전체 프롬프트 동시 제출 (공유 클라이언트, 디코드는 워커 스레드)
+        stage = FalGenerationStage(
+            subscribe=fal_client.subscribe,
+            max_concurrency=self.config.get("max_concurrency"),
+            cache=get_generation_cache(),
+            log=self.log,
+        )
+        started = time.monotonic()
+        async with stage:
+            results = await stage.generate(jobs)
+        elapsed = time.monotonic() - started
 
-        for p in prompts:
-            prompt_text = p.get("prompt", p.get("text", f"{topic} dog food image"))
-            self.log(f"  [{p['index']}/{len(prompts)}] 생성 중: {prompt_text[:50]}...")
-
-            try:
-                # fal.ai Flux 2 Pro 호출 (비동기를 동기 래핑)
-                result = await asyncio.to_thread(
-                    fal_client.subscribe,
-                    "fal-ai/flux-2-pro",
-                    arguments={
-                        "prompt": prompt_text,
-                        "image_size": {"width": 1080, "height": 1080},
-                        "num_images": 1,
-                        "output_format": "png",
-                        "safety_tolerance": "5",
-                    }
-                )
-
-                # 결과에서 이미지 URL 추출
-                image_url = result["images"][0]["url"]
-
-                # 이미지 다운로드 후 로컬 저장 (타임아웃 30초)
-                image_path = output_dir / f"{topic}_{p['index']:02d}_{p.get('type', 'content')}.png"
-                async with httpx.AsyncClient(timeout=30.0) as client:
-                    response = await client.get(image_url)
-                    response.raise_for_status()
-
-                    # PIL로 이미지 로드 및 1080x1080 리사이즈
-                    img = Image.open(io.BytesIO(response.content))
-                    if img.size != INSTAGRAM_SIZE:
-                        img = img.resize(INSTAGRAM_SIZE, Image.Resampling.LANCZOS)
-                    img.save(image_path, "PNG", optimize=True)
-
-                self.log(f"  [{p['index']}/{len(prompts)}] 완료: {image_path.name} ({INSTAGRAM_SIZE[0]}x{INSTAGRAM_SIZE[1]})")
-
-                images.append({
-                    "index": p["index"],
-                    "type": p.get("type", "content"),
-                    "path": str(image_path),
-                    "exists": True,
-                    "url": image_url,
-                    "provider": "fal-flux-2-pro"
-                })
-
-            except httpx.HTTPStatusError as e:
-                # HTTP 에러 (다운로드 실패)
-                error_msg = f"이미지 다운로드 실패 (HTTP {e.response.status_code})"
-                self.log(f"  [{p['index']}/{len(prompts)}] {error_msg}", level="error")
-                images.append({
-                    "index": p["index"],
-                    "type": p.get("type", "content"),
-                    "path": "",
-                    "exists": False,
-                    "error": error_msg,
-                    "error_type": "download_error"
-                })
-
-            except httpx.TimeoutException as e:
-                # 타임아웃
-                error_msg = "이미지 다운로드 타임아웃"
-                self.log(f"  [{p['index']}/{len(prompts)}] {error_msg}", level="error")
-                images.append({
-                    "index": p["index"],
-                    "type": p.get("type", "content"),
-                    "path": "",
-                    "exists": False,
-                    "error": error_msg,
-                    "error_type": "timeout"
-                })
-
-            except KeyError as e:
-                # API 응답 구조 오류
-                error_msg = f"API 응답 파싱 실패: {str(e)}"
-                self.log(f"  [{p['index']}/{len(prompts)}] {error_msg}", level="error")
-                images.append({
-                    "index": p["index"],
-                    "type": p.get("type", "content"),
-                    "path": "",
-                    "exists": False,
-                    "error": error_msg,
-                    "error_type": "api_response_error"
-                })
-
-            except Exception as e:
-                # 기타 에러
-                error_type = type(e).__name__
-                error_msg = f"{error_type}: {str(e)}"
-                self.log(f"  [{p['index']}/{len(prompts)}] 실패: {error_msg}", level="error")
-                images.append({
-                    "index": p["index"],
-                    "type": p.get("type", "content"),
-                    "path": "",
-                    "exists": False,
-                    "error": error_msg,
-                    "error_type": error_type.lower()
-                })
-
-        # 성공/실패 통계
+        images = [r.to_dict() for r in results]
+
+        # 성공/실패 통계 (전체 소요 ≈ 가장 느린 1장)
         success_count = sum(1 for img in images if img["exists"])
-        self.log(f"생성 완료: {success_count}/{len(images)}개 성공")
+        cached_count = sum(1 for r in results if r.cached)
+        if cached_count:
+            self.log(f"생성 캐시 재사용: {cached_count}/{len(images)}개")
+        slowest = max((r.latency.get("total", 0.0) for r in results), default=0.0)
+        self.log(f"생성 완료: {success_count}/{len(images)}개 성공 "
+                 f"({elapsed:.1f}초, 최장 {slowest:.1f}초, 동시 {stage.max_concurrency})")
 
         return images
 
+    @staticmethod
+    def _slide_seed(prompt: Dict, topic: str, regenerate: Optional[List[int]], seed_offset: int) -> int:
+        """프롬프트 기반 결정적 seed (regenerate 대상이면 offset 적용)"""
+        text = prompt.get("prompt", prompt.get("text", f"{topic} dog food image"))
+        offset = seed_offset if regenerate and prompt["index"] in regenerate else 0
+        return deterministic_seed(text, offset)
+
     async def _generate_placeholder(self, prompts: List, topic: str) -> List[Dict]:
         """플레이스홀더 이미지 (실제 생성 없이 경로만 반환)"""
         base_path = Path(self.config.get("_global", {}).get("paths", {}).get("images", "."))
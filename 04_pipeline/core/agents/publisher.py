@@ -32,11 +32,15 @@
 import os           # 운영체제 기능 (환경변수 읽기 등)
 import asyncio      # 비동기 처리 (여러 작업을 동시에!)
 import aiohttp      # 인터넷 요청 보내기 (Instagram API 호출용)
-import ssl          # SSL 인증서 처리
-import certifi      # Mozilla CA 인증서 번들
-from typing import Any, Dict, List, Optional  # 타입 힌트 (코드 가독성용)
+from typing import Any, Dict, List  # 타입 힌트 (코드 가독성용)
 from pathlib import Path  # 파일 경로 다루기
 from .base import BaseAgent, AgentResult, retry  # 우리가 만든 기본 에이전트
+from ..cloudinary_upload import (  # 병렬 업로드 + 해시 기록
+    CloudinaryUploadStage, UploadJob, known_assets, read_metadata, record_assets, write_metadata
+)
+from ..carousel_publisher import (  # Instagram/Threads 공용 게시 엔진
+    CarouselPublisher, instagram_platform, threads_platform
+)
 
 # ------------------------------------------------------------
 # ☁️ Cloudinary 라이브러리 불러오기
@@ -374,21 +378,28 @@ class PublisherAgent(BaseAgent):
 
         # ----------------------------------------------------
         # 📸 나머지 플랫폼 처리
+        #
+        # Instagram, Threads는 서로 기다릴 필요가 없어요.
+        # 그래서 동시에 게시해요! (asyncio.gather)
         # ----------------------------------------------------
-        for platform in platforms:
-            if platform == "cloudinary":
-                continue  # 이미 위에서 처리함
-
-            elif platform == "instagram":
-                # Instagram은 Cloudinary URL이 필요!
-                if cloudinary_urls:
-                    result = await self._publish_instagram(cloudinary_urls, topic)
-                else:
-                    result = {
-                        "success": False,
-                        "error": "❌ Cloudinary URL이 없어요! 먼저 Cloudinary 업로드가 필요해요."
-                    }
-                results["instagram"] = result
+        publishers = {
+            "instagram": self._publish_instagram,
+            "threads": self._publish_threads,
+        }
+        targets = [p for p in platforms if p in publishers]
+
+        if targets and cloudinary_urls:
+            # Instagram/Threads는 Cloudinary URL이 필요!
+            outcomes = await asyncio.gather(*(
+                publishers[p](cloudinary_urls, topic) for p in targets
+            ))
+            results.update(zip(targets, outcomes))
+        else:
+            for platform in targets:
+                results[platform] = {
+                    "success": False,
+                    "error": "❌ Cloudinary URL이 없어요! 먼저 Cloudinary 업로드가 필요해요."
+                }
 
         # --------------------------------------------------------
         # 📌 Step 5: 최종 결과 반환
@@ -462,47 +473,60 @@ class PublisherAgent(BaseAgent):
         urls = []      # 성공한 URL들
         errors = []    # 실패한 것들
 
-        for i, image_path in enumerate(image_paths):
-            try:
-                # 파일 이름 생성 (예: apple_00, apple_01, ...)
-                public_id = f"{topic}_{i:02d}"
+        # ----------------------------------------------------
+        # 📌 이전 업로드 기록 (이미지 폴더의 metadata.json)
+        #
+        # 파일 내용(SHA-256)과 public_id가 같으면 다시 안 올려요.
+        # 같은 이미지를 매번 덮어쓰기 업로드하던 시간을 아껴요!
+        # ----------------------------------------------------
+        metadata_path = Path(image_paths[0]).parent / "metadata.json"
+        metadata = read_metadata(metadata_path)
 
-                # --------------------------------------------
-                # 🚀 Cloudinary에 업로드!
-                #
-                # cloudinary.uploader.upload() 함수 설명:
-                #   - image_path: 업로드할 파일
-                #   - folder: 저장할 폴더 이름
-                #   - public_id: 파일 이름 (URL에 표시됨)
-                #   - overwrite: 같은 이름 있으면 덮어쓰기
-                # --------------------------------------------
-                result = cloudinary.uploader.upload(
-                    image_path,
-                    folder=folder,
-                    public_id=public_id,
-                    overwrite=True,
-                    resource_type="image"
-                )
+        # 파일 이름 생성 (예: apple_00, apple_01, ...)
+        jobs = [
+            UploadJob(Path(image_path), folder, f"{topic}_{i:02d}")
+            for i, image_path in enumerate(image_paths)
+        ]
 
+        # --------------------------------------------
+        # 🚀 Cloudinary에 병렬 업로드!
+        #
+        # 업로드는 스레드 풀에서 동시에 진행돼요.
+        # (이벤트 루프를 막지 않아서 다른 작업도 계속 돌아가요)
+        # --------------------------------------------
+        stage = CloudinaryUploadStage(cloudinary.uploader.upload)
+        results = await stage.upload_async(jobs, known_assets(metadata))
+
+        for r in results:
+            if r.ok:
                 # 성공! URL 저장
                 urls.append({
-                    "index": i,
-                    "public_id": result.get("public_id"),
-                    "secure_url": result.get("secure_url"),  # HTTPS URL
-                    "format": result.get("format"),
-                    "bytes": result.get("bytes")
+                    "index": r.index,
+                    "public_id": r.response.get("public_id", r.public_id),
+                    "secure_url": r.secure_url,  # HTTPS URL
+                    "format": r.response.get("format"),
+                    "bytes": r.response.get("bytes"),
+                    "sha256": r.sha256,
+                    "skipped": r.skipped
                 })
-
-                self.log(f"  ✅ {Path(image_path).name} → Cloudinary")
-
-            except Exception as e:
+                mark = "♻️" if r.skipped else "✅"
+                self.log(f"  {mark} {r.path.name} → Cloudinary")
+            else:
                 # 실패... 에러 기록
+                error = r.error or "secure_url 없음"
                 errors.append({
-                    "index": i,
-                    "file": Path(image_path).name,
-                    "error": str(e)
+                    "index": r.index,
+                    "file": r.path.name,
+                    "error": error
                 })
-                self.log(f"  ❌ {Path(image_path).name}: {e}", level="error")
+                self.log(f"  ❌ {r.path.name}: {error}", level="error")
+
+        # 해시/URL 기록 저장 (실패해도 업로드 결과는 유효)
+        if urls:
+            try:
+                write_metadata(metadata_path, record_assets(metadata, results))
+            except OSError as e:
+                self.log(f"  ⚠️ 업로드 기록 저장 실패: {e}", level="warning")
 
         # 하나라도 성공하면 성공으로 처리
         success = len(urls) > 0
@@ -617,135 +641,24 @@ class PublisherAgent(BaseAgent):
         urls_to_post = image_urls[:10]  # 최대 10장
         self.log(f"📸 Instagram 캐러셀 게시 시작 ({len(urls_to_post)}장)")
 
-        try:
-            # ----------------------------------------------------
-            # 📌 aiohttp 세션 시작
-            #
-            # 💡 aiohttp란?
-            #    인터넷 요청을 보내는 라이브러리예요.
-            #    async/await과 함께 사용하면 빠르게 처리할 수 있어요.
-            #
-            # 💡 async with란?
-            #    사용이 끝나면 자동으로 연결을 정리해줘요.
-            #    "with문 끝나면 알아서 닫아줘~" 같은 느낌이에요.
-            # ----------------------------------------------------
-            # SSL 컨텍스트 생성 (certifi CA 번들 사용)
-            ssl_context = ssl.create_default_context(cafile=certifi.where())
-            connector = aiohttp.TCPConnector(ssl=ssl_context)
-            async with aiohttp.ClientSession(connector=connector) as session:
-
-                # ================================================
-                # 🎯 STEP 1: 각 이미지별 미디어 컨테이너 생성
-                #
-                # 💡 컨테이너란?
-                #    이미지를 Instagram 서버에 '등록'하는 거예요.
-                #    아직 게시는 안 되고, 준비만 하는 단계!
-                #
-                #    비유: 택배 보내기 전에 박스에 담는 것
-                # ================================================
-                container_ids = []  # 생성된 컨테이너 ID들 저장
-
-                for i, url in enumerate(urls_to_post):
-                    # 컨테이너 생성 요청
-                    container_id = await self._create_instagram_media_container(
-                        session=session,
-                        ig_user_id=ig_user_id,
-                        access_token=access_token,
-                        image_url=url,
-                        is_carousel_item=True  # 캐러셀 아이템임을 표시!
-                    )
-
-                    if container_id:
-                        container_ids.append(container_id)
-                        self.log(f"  [{i+1}/{len(urls_to_post)}] ✅ 미디어 컨테이너 생성 완료")
-                    else:
-                        self.log(f"  [{i+1}/{len(urls_to_post)}] ❌ 미디어 컨테이너 생성 실패", level="error")
-
-                # ------------------------------------------------
-                # ⚠️ 캐러셀은 최소 2장 필요!
-                # ------------------------------------------------
-                if len(container_ids) < 2:
-                    return {
-                        "success": False,
-                        "error": f"❌ 캐러셀은 최소 2장이 필요해요! (현재: {len(container_ids)}장)"
-                    }
-
-                # ================================================
-                # 🎯 STEP 2: 캐러셀 컨테이너 생성
-                #
-                # 💡 캐러셀 컨테이너란?
-                #    여러 개의 미디어 컨테이너를 하나로 묶는 거예요.
-                #    "이 이미지들을 한 게시물로 묶어줘!"
-                # ================================================
-                caption = self._generate_caption(topic)  # 캡션 생성
-
-                carousel_id = await self._create_instagram_carousel(
-                    session=session,
-                    ig_user_id=ig_user_id,
-                    access_token=access_token,
-                    children_ids=container_ids,  # 위에서 만든 컨테이너들
-                    caption=caption
-                )
-
-                if not carousel_id:
-                    return {
-                        "success": False,
-                        "error": "❌ 캐러셀 컨테이너 생성 실패"
-                    }
-
-                self.log("✅ 캐러셀 컨테이너 생성 완료")
+        # --------------------------------------------------------
+        # 📌 3단계: 게시 엔진으로 캐러셀 게시
+        #
+        # 💡 게시 엔진(CarouselPublisher)이 하는 일:
+        #    [1] 이미지별 미디어 컨테이너를 '동시에' 만들어요
+        #        (한 장씩 기다리지 않아서 훨씬 빨라요!)
+        #    [2] 컨테이너들을 캐러셀로 묶어요
+        #    [3] 처리 상태를 점점 간격을 늘려가며 확인해요 (지수 백오프)
+        #    [4] 실제 게시!
+        #
+        # ⚠️ 캐러셀은 최소 2장 필요! (실패한 장은 빼고 진행)
+        # --------------------------------------------------------
+        caption = self._generate_caption(topic)  # 캡션 생성
+        platform = instagram_platform(ig_user_id, access_token, api_base=INSTAGRAM_GRAPH_API_BASE)
 
-                # ================================================
-                # 🎯 STEP 3: 실제 게시!
-                #
-                # 💡 이제 진짜로 Instagram에 올라가요!
-                #    media_publish 엔드포인트를 호출합니다.
-                #
-                # ⚠️ Instagram은 미디어 처리에 시간이 필요해요!
-                #    컨테이너 생성 후 10초 대기
-                # ================================================
-                # 미디어 상태 확인 (FINISHED 될 때까지 대기)
-                self.log("⏳ Instagram 미디어 처리 상태 확인 중...")
-                max_wait = 120  # 최대 120초 대기 (7장 이상일 경우 오래 걸림)
-                wait_interval = 5  # 5초마다 체크
-                waited = 0
-                empty_count = 0  # 빈 상태 연속 횟수
-
-                while waited < max_wait:
-                    status_url = f"{INSTAGRAM_GRAPH_API_BASE}/{carousel_id}"
-                    status_params = {
-                        "fields": "status_code",
-                        "access_token": access_token
-                    }
-                    async with session.get(status_url, params=status_params) as resp:
-                        status_result = await resp.json()
-                        status_code = status_result.get("status_code", "")
-                        self.log(f"   상태: {status_code if status_code else '(처리중)'}")
-
-                        if status_code == "FINISHED":
-                            self.log("✅ 미디어 처리 완료!")
-                            break
-                        elif status_code == "ERROR":
-                            self.log("❌ 미디어 처리 오류!", level="error")
-                            return {
-                                "success": False,
-                                "error": "❌ Instagram 미디어 처리 오류"
-                            }
-                        elif not status_code:
-                            empty_count += 1
-                            if empty_count >= 10:  # 50초 이상 빈 상태면 진행
-                                self.log("⚠️ 상태 확인 타임아웃, 게시 시도...")
-                                break
-
-                    await asyncio.sleep(wait_interval)
-                    waited += wait_interval
-
-                publish_result = await self._publish_instagram_media(
-                    session=session,
-                    ig_user_id=ig_user_id,
-                    access_token=access_token,
-                    creation_id=carousel_id
-                )
+        try:
+            async with CarouselPublisher(log=self.log) as engine:
+                outcome = await engine.publish_carousel(platform, urls_to_post, caption, min_children=2)
 
                 # ------------------------------------------------
                 # 📌 결과 확인 (2026-02-04 강화)
@@ -755,32 +668,28 @@ class PublisherAgent(BaseAgent):
                 # 2. 성공 조건 = media_id 존재
                 # 3. media_id 없으면 무조건 실패 처리
                 # ------------------------------------------------
-                raw_id = publish_result.get("id")
-                post_id = str(raw_id) if raw_id else None  # 🔴 str() 변환 필수
-
-                # media_id (post_id) 존재 여부 확인
-                if not post_id:
-                    # ❌ media_id 없음 = 게시 실패
-                    error_info = publish_result.get("error", {})
-                    error_msg = error_info.get("message", "media_id 없음") if isinstance(error_info, dict) else str(error_info)
-                    self.log(f"❌ 게시 실패: media_id 없음 (응답: {publish_result})", level="error")
-                    return {
+                if not outcome.success:
+                    self.log(f"❌ Instagram 게시 실패: {outcome.error}", level="error")
+                    result = {
                         "success": False,
-                        "error": f"❌ 게시 실패: {error_msg}",
-                        "raw_response": publish_result
+                        "error": f"❌ {outcome.error}",
+                        "timings": outcome.timings
                     }
+                    if outcome.raw_response:
+                        result["raw_response"] = outcome.raw_response
+                    return result
+
+                post_id = outcome.post_id
 
                 # media_id 유효성 검사 (Instagram media_id는 숫자로 구성)
-                if not str(post_id).isdigit():
+                if not post_id.isdigit():
                     self.log(f"⚠️ 의심스러운 post_id 형식: {post_id}", level="warning")
 
                 # 🎉 성공! (media_id 존재 확인됨)
                 self.log(f"🎉 Instagram 게시 완료! (ID: {post_id})")
 
                 # 게시물 정보 조회 (permalink = 게시물 URL)
-                post_info = await self._get_instagram_post_info(
-                    session, post_id, access_token
-                )
+                post_info = await engine.post_info(platform, post_id)
 
                 # permalink 존재 여부로 실제 게시 이중 확인
                 permalink = post_info.get("permalink", "")
@@ -791,9 +700,10 @@ class PublisherAgent(BaseAgent):
                     "success": True,
                     "post_id": post_id,
                     "permalink": permalink,
-                    "container_count": len(container_ids),
+                    "container_count": outcome.container_count,
                     "caption": caption,
-                    "verified": bool(permalink)  # permalink 조회 성공 여부
+                    "verified": bool(permalink),  # permalink 조회 성공 여부
+                    "timings": outcome.timings
                 }
 
         # --------------------------------------------------------
@@ -812,208 +722,6 @@ class PublisherAgent(BaseAgent):
                 "error": f"❌ Instagram 게시 오류: {str(e)}"
             }
 
-    # ============================================================
-    # 📦 미디어 컨테이너 생성 함수
-    #
-    # 💡 이 함수가 하는 일:
-    #    이미지 URL을 Instagram 서버에 등록해요.
-    #    등록하면 "컨테이너 ID"를 받아요.
-    #    이 ID로 나중에 게시할 수 있어요!
-    # ============================================================
-    async def _create_instagram_media_container(
-        self,
-        session: aiohttp.ClientSession,
-        ig_user_id: str,
-        access_token: str,
-        image_url: str,
-        is_carousel_item: bool = False
-    ) -> Optional[str]:
-        """
-        📦 Instagram 미디어 컨테이너 생성
-
-        [API 엔드포인트]
-        POST https://graph.facebook.com/v21.0/{ig-user-id}/media
-
-        [필수 파라미터]
-        - image_url: 이미지 URL (공개 접근 가능해야 해요!)
-        - access_token: 인증 토큰
-        - is_carousel_item: True면 캐러셀용
-
-        [반환값]
-        - 성공: 컨테이너 ID (문자열)
-        - 실패: None
-        """
-
-        # API 엔드포인트 URL
-        url = f"{INSTAGRAM_GRAPH_API_BASE}/{ig_user_id}/media"
-
-        # 요청 파라미터
-        params = {
-            "image_url": image_url,
-            "access_token": access_token
-        }
-
-        # 캐러셀 아이템이면 표시
-        if is_carousel_item:
-            params["is_carousel_item"] = "true"
-
-        try:
-            # POST 요청 보내기
-            async with session.post(url, data=params) as response:
-                result = await response.json()
-
-                # 성공하면 ID 반환 (🔴 str() 변환 필수 - API가 int 반환할 수 있음)
-                if "id" in result:
-                    return str(result["id"])
-                else:
-                    # ----------------------------------------
-                    # ⚠️ 에러 처리
-                    # ----------------------------------------
-                    error = result.get("error", {})
-                    error_msg = error.get("message", "Unknown error")
-                    error_code = error.get("code", "")
-
-                    # 토큰 만료 체크 (190, 102는 토큰 관련 에러 코드)
-                    if error_code in [190, 102]:
-                        self.log(f"❌ Instagram 토큰이 만료됐어요!", level="error")
-                        self.log(f"   새 토큰을 발급받아주세요.", level="error")
-                    else:
-                        self.log(f"❌ 컨테이너 생성 실패: {error_msg}", level="error")
-
-                    return None
-
-        except Exception as e:
-            self.log(f"❌ 컨테이너 요청 오류: {e}", level="error")
-            return None
-
-    # ============================================================
-    # 📦 캐러셀 컨테이너 생성 함수
-    #
-    # 💡 이 함수가 하는 일:
-    #    여러 개의 미디어 컨테이너를 하나의 캐러셀로 묶어요.
-    #    캡션(설명글)도 여기서 추가해요!
-    # ============================================================
-    async def _create_instagram_carousel(
-        self,
-        session: aiohttp.ClientSession,
-        ig_user_id: str,
-        access_token: str,
-        children_ids: List[str],
-        caption: str
-    ) -> Optional[str]:
-        """
-        📦 Instagram 캐러셀 컨테이너 생성
-
-        [API 엔드포인트]
-        POST https://graph.facebook.com/v21.0/{ig-user-id}/media
-
-        [필수 파라미터]
-        - media_type: "CAROUSEL" (캐러셀임을 표시)
-        - children: 미디어 컨테이너 ID들 (쉼표로 구분)
-        - caption: 게시물 설명글
-
-        [반환값]
-        - 성공: 캐러셀 컨테이너 ID
-        - 실패: None
-        """
-
-        url = f"{INSTAGRAM_GRAPH_API_BASE}/{ig_user_id}/media"
-
-        params = {
-            "media_type": "CAROUSEL",
-            "children": ",".join(children_ids),  # ID들을 쉼표로 연결
-            "caption": caption,
-            "access_token": access_token
-        }
-
-        try:
-            async with session.post(url, data=params) as response:
-                result = await response.json()
-
-                if "id" in result:
-                    return str(result["id"])  # 🔴 str() 변환 필수
-                else:
-                    error = result.get("error", {})
-                    self.log(f"❌ 캐러셀 생성 실패: {error.get('message', 'Unknown')}", level="error")
-                    return None
-
-        except Exception as e:
-            self.log(f"❌ 캐러셀 요청 오류: {e}", level="error")
-            return None
-
-    # ============================================================
-    # 🚀 미디어 게시 함수
-    #
-    # 💡 이 함수가 하는 일:
-    #    준비된 캐러셀을 실제로 Instagram에 게시해요!
-    #    이 함수가 호출되면 진짜로 올라가요!
-    # ============================================================
-    async def _publish_instagram_media(
-        self,
-        session: aiohttp.ClientSession,
-        ig_user_id: str,
-        access_token: str,
-        creation_id: str
-    ) -> Dict:
-        """
-        🚀 Instagram 미디어 게시 (최종 단계!)
-
-        [API 엔드포인트]
-        POST https://graph.facebook.com/v21.0/{ig-user-id}/media_publish
-
-        [필수 파라미터]
-        - creation_id: 캐러셀 컨테이너 ID
-
-        [반환값]
-        - 성공: {"id": "게시물ID"}
-        - 실패: {"error": {...}}
-        """
-
-        url = f"{INSTAGRAM_GRAPH_API_BASE}/{ig_user_id}/media_publish"
-
-        params = {
-            "creation_id": creation_id,
-            "access_token": access_token
-        }
-
-        try:
-            async with session.post(url, data=params) as response:
-                result = await response.json()
-                # 상세 로깅
-                self.log(f"📋 media_publish 응답: {result}")
-                return result
-
-        except Exception as e:
-            return {"error": {"message": str(e)}}
-
-    # ============================================================
-    # 📋 게시물 정보 조회 함수
-    # ============================================================
-    async def _get_instagram_post_info(
-        self,
-        session: aiohttp.ClientSession,
-        post_id: str,
-        access_token: str
-    ) -> Dict:
-        """
-        📋 게시물 정보 조회 (permalink 등)
-
-        게시 후에 게시물 URL을 알아내기 위해 호출해요.
-        """
-
-        url = f"{INSTAGRAM_GRAPH_API_BASE}/{post_id}"
-
-        params = {
-            "fields": "id,permalink,timestamp,media_type",
-            "access_token": access_token
-        }
-
-        try:
-            async with session.get(url, params=params) as response:
-                return await response.json()
-        except Exception:
-            return {}
-
     # ============================================================
     # ✏️ 캡션 생성 함수
     #
@@ -1282,8 +990,41 @@ class PublisherAgent(BaseAgent):
         return {"success": False, "error": "Twitter API 미구현"}
 
     # ============================================================
-    # 🧵 Threads 게시 (미구현)
+    # 🧵 Threads 캐러셀 게시
+    #
+    # Instagram과 같은 게시 엔진을 써요.
+    # (Threads는 자식 컨테이너 처리가 끝나야 캐러셀을 만들 수 있어요)
     # ============================================================
-    async def _publish_threads(self, image_paths: List[str], topic: str) -> Dict:
-        """🧵 Threads 게시 (향후 구현 예정)"""
-        return {"success": False, "error": "Threads API 미구현"}
+    async def _publish_threads(self, image_urls: List[str], topic: str) -> Dict:
+        """🧵 Threads 캐러셀 게시 (Cloudinary URL 사용)"""
+        access_token = os.getenv("THREADS_ACCESS_TOKEN")
+        threads_user_id = os.getenv("THREADS_USER_ID")
+
+        if not access_token or not threads_user_id:
+            self.log("⚠️ Threads 토큰/사용자ID 없음", level="warning")
+            return {"success": False, "error": "❌ Threads 토큰 미설정"}
+
+        urls_to_post = image_urls[:10]
+        self.log(f"🧵 Threads 캐러셀 게시 시작 ({len(urls_to_post)}장)")
+        caption = self._generate_caption(topic)
+
+        try:
+            async with CarouselPublisher(log=self.log) as engine:
+                outcome = await engine.publish_carousel(
+                    threads_platform(threads_user_id, access_token), urls_to_post, caption
+                )
+        except Exception as e:
+            return {"success": False, "error": f"❌ Threads 게시 오류: {str(e)}"}
+
+        if not outcome.success:
+            self.log(f"❌ Threads 게시 실패: {outcome.error}", level="error")
+            return {"success": False, "error": f"❌ {outcome.error}", "timings": outcome.timings}
+
+        return {
+            "success": True,
+            "post_id": outcome.post_id,
+            "permalink": outcome.post_url,
+            "container_count": outcome.container_count,
+            "caption": caption,
+            "timings": outcome.timings
+        }
@@ -2,6 +2,10 @@
 TextOverlayAgent - 텍스트 오버레이 에이전트
 이미지에 텍스트 오버레이 적용 (Puppeteer 활용)
 
+렌더링은 상주 렌더 워커(core.render_worker) 사용:
+- 브라우저를 띄워 둔 채 콘텐츠의 모든 슬라이드를 요청 1건으로 렌더링
+- 워커 사용 불가(node/puppeteer 없음) 시 기존 스크립트 subprocess 로 대체
+
 Author: 최기술 대리
 """
 
@@ -11,6 +15,9 @@ import os
 from typing import Any, Dict, List, Optional
 from pathlib import Path
 from .base import BaseAgent, AgentResult
+from ..render_worker import RenderWorkerError, SlideJob, get_render_worker
+
+IMAGE_SUFFIXES = ('.png', '.jpg', '.jpeg')
 
 
 class TextOverlayAgent(BaseAgent):
@@ -97,7 +104,10 @@ class TextOverlayAgent(BaseAgent):
                     "count": result.get("count", 0),
                     "topic": topic
                 },
-                metadata={"mode": result.get("mode", "simple")}
+                metadata={
+                    "mode": result.get("mode", "simple"),
+                    "timings": result.get("timings", {}),
+                }
             )
         else:
             self.log(f"✗ 오버레이 실패: {result['error']}", level="error")
@@ -135,9 +145,103 @@ class TextOverlayAgent(BaseAgent):
 
         self.log(f"이미지 {copied}개 → media_bank/instagram_ready/{topic}/ 복사 완료")
 
+    def _find_text_config(self, topic: str) -> Optional[Path]:
+        """{topic}_text.json 위치 (core/config → 02_config/settings 순)"""
+        candidates = [
+            Path(__file__).parent.parent / "config" / f"{topic}_text.json",
+            Path(__file__).resolve().parents[3] / "02_config" / "settings" / f"{topic}_text.json",
+        ]
+        return next((path for path in candidates if path.exists()), None)
+
     async def _run_simple_mode(self, topic: str) -> Dict:
         """
-        단순 모드: 기존 Puppeteer 스크립트 호출
+        단순 모드: {topic}_text.json + media_bank/instagram_ready/{topic}/ 이미지
+
+        상주 렌더 워커로 전체 슬라이드를 한 번에 렌더링,
+        워커 사용 불가 시 기존 Puppeteer 스크립트 호출
+        """
+        config_path = self._find_text_config(topic)
+        if config_path is not None:
+            try:
+                return await self._run_worker_mode(topic, config_path)
+            except RenderWorkerError as e:
+                self.log(f"렌더 워커 사용 불가, Puppeteer 스크립트로 대체: {e}", level="warning")
+        return await self._run_script_mode(topic)
+
+    def _build_slides(self, topic: str, text_data: List[Dict], images: List[Path],
+                      output_dir: Path) -> List[SlideJob]:
+        """텍스트 데이터 + 이미지 → 슬라이드 HTML (TextOverlayCrew v8.3 템플릿)"""
+        import base64
+        from ..crews.text_overlay_crew import TextOverlayCrew
+
+        templates = TextOverlayCrew()
+        slides = []
+        for i, (text, image) in enumerate(zip(text_data, images)):
+            mime = "image/png" if image.suffix.lower() == ".png" else "image/jpeg"
+            image_src = f"data:{mime};base64,{base64.b64encode(image.read_bytes()).decode()}"
+            slide_type = text.get("type", "content")
+            title = text.get("title", "")
+            subtitle = text.get("subtitle")
+
+            if slide_type == "cover":
+                html = templates._generate_cover_html(image_src, title.upper())
+            elif slide_type == "cta":
+                html = templates._generate_cta_html(image_src, title, subtitle)
+            else:
+                html = templates._generate_content_html(image_src, title, subtitle)
+            slides.append(SlideJob(html=html, output=str(output_dir / f"{topic}_{i:02d}.png")))
+        return slides
+
+    async def _run_worker_mode(self, topic: str, config_path: Path) -> Dict:
+        """상주 렌더 워커로 슬라이드 일괄 렌더링 (슬라이드별 소요 시간 포함)"""
+        with open(config_path, "r", encoding="utf-8") as f:
+            text_data = json.load(f)
+
+        image_dir = Path(__file__).parent.parent / "media_bank" / "instagram_ready" / topic
+        images = sorted(
+            p for p in image_dir.glob("*")
+            if p.suffix.lower() in IMAGE_SUFFIXES and not p.name.startswith('.')
+        ) if image_dir.exists() else []
+        if not images:
+            return {
+                "success": False,
+                "error": f"이미지 없음: {image_dir}",
+                "mode": "worker"
+            }
+        if len(images) != len(text_data):
+            self.log(f"이미지 {len(images)}장 / 텍스트 {len(text_data)}개 불일치, 앞에서부터 매칭", level="warning")
+
+        output_dir = Path(__file__).parent.parent / "images" / topic
+        output_dir.mkdir(parents=True, exist_ok=True)
+        slides = await asyncio.to_thread(self._build_slides, topic, text_data, images, output_dir)
+
+        self.log(f"'{topic}' 렌더 워커 오버레이 시작 ({len(slides)}장)")
+        results = await get_render_worker().render_async(slides)
+
+        failed = [r for r in results if not r.ok]
+        timings = {Path(r.output).name: r.ms for r in results}
+        if failed:
+            return {
+                "success": False,
+                "error": f"렌더링 실패 {len(failed)}/{len(results)}장: {failed[0].error}",
+                "mode": "worker",
+                "timings": timings
+            }
+
+        output_images = [r.output for r in results]
+        self.log(f"슬라이드별 렌더링(ms): {timings}")
+        return {
+            "success": True,
+            "count": len(output_images),
+            "output_dir": str(output_dir),
+            "output_images": output_images,
+            "mode": "worker",
+            "timings": timings
+        }
+
+    async def _run_script_mode(self, topic: str) -> Dict:
+        """
+        기존 Puppeteer 스크립트 호출 (렌더 워커 사용 불가 시)
         config/{topic}_text.json 사용
         """
         scripts_path = Path(__file__).parent.parent / "scripts"
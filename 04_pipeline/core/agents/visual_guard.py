@@ -6,6 +6,7 @@ BLOCK 조건 하나라도 걸리면 게시 중단
 """
 
 import os
+import sys
 import hashlib
 import json
 from pathlib import Path
@@ -26,6 +27,11 @@ except ImportError:
 # 프로젝트 루트
 ROOT = Path(__file__).parent.parent.parent
 
+sys.path.insert(0, str(ROOT))
+from image_analysis import ImageData, ImageLike, as_image_data, brightness_mask, color_counts, color_mask, region
+from image_hash_index import ImageHashIndex, OVERLAY_MATCH_RADIUS
+from food_data_store import get_food_store
+
 
 class CheckResult(Enum):
     PASS = "PASS"
@@ -85,6 +91,15 @@ class VisualGuard:
         "danger": {"hex": "#FF6B6B", "rgb": (255, 107, 107), "name": "빨강"},
     }
 
+    # 텍스트 색상 판정 범위 (R, G, B 포함 범위, 순서대로 우선 판정)
+    TEXT_COLOR_RANGES = {
+        "safe": ((50, 110), (145, 205), (50, 110)),      # 초록 #4CAF50 ±30
+        "caution": ((225, 255), (190, 255), (30, 100)),  # 노랑 #FFD93D ±30
+        "danger": ((225, 255), (80, 140), (80, 140)),    # 빨강 #FF6B6B ±30
+        "white": ((241, 255), (241, 255), (241, 255)),   # 흰색 (>240)
+    }
+    YELLOW_RANGE = ((201, 255), (181, 255), (0, 119))
+
     # 기준 콘텐츠 (비교용)
     REFERENCE_CONTENTS = {
         "safe": ["032_boiled_egg_삶은달걀", "026_spinach_시금치"],
@@ -108,19 +123,41 @@ class VisualGuard:
 
     def __init__(self):
         self.checks: List[CheckItem] = []
+        self.cta_index = ImageHashIndex.for_pool("cta_source", [self.CTA_SOURCE_DIR])
         self.cta_hashes = self._load_cta_hashes()
+        # 폴더 검증 1회 동안 디코드 이미지/배경 분석 공유
+        self._image_cache: Dict[Tuple[Path, int], ImageData] = {}
+        self._style_cache: Dict[Path, Dict] = {}
 
     def _load_cta_hashes(self) -> set:
-        """best_cta 폴더의 실사 이미지 해시 로드"""
-        hashes = set()
-        if self.CTA_SOURCE_DIR.exists():
-            for img_path in self.CTA_SOURCE_DIR.glob("*.jpg"):
-                try:
-                    with open(img_path, "rb") as f:
-                        hashes.add(hashlib.md5(f.read()).hexdigest())
-                except Exception:
-                    pass
-        return hashes
+        """best_cta 폴더의 실사 이미지 지각 해시 로드 (변경 파일만 재해시)"""
+        try:
+            self.cta_index.update()
+        except Exception as e:
+            print(f"Warning: CTA 해시 인덱스 갱신 실패: {e}")
+        return self.cta_index.hashes()
+
+    def _find_cta_source(self, cta_path: Path) -> Optional[Tuple[int, str]]:
+        """CTA 이미지의 실사 원본 검색 (텍스트 오버레이 후에도 추적, (거리, 경로))"""
+        if not self.cta_hashes:
+            return None
+        matches = self.cta_index.query(cta_path, radius=OVERLAY_MATCH_RADIUS)
+        return matches[0] if matches else None
+
+    def _load_image(self, img_path: Path) -> ImageData:
+        """이미지 1회 디코드 (같은 폴더 검증 내 재사용)"""
+        path = Path(img_path)
+        key = (path, path.stat().st_mtime_ns)
+        if key not in self._image_cache:
+            self._image_cache[key] = ImageData.open(path)
+        return self._image_cache[key]
+
+    def _background_style_of(self, img_path: Path) -> Dict:
+        """파일별 배경 스타일 (표지는 본문마다 재분석하지 않음)"""
+        key = Path(img_path)
+        if key not in self._style_cache:
+            self._style_cache[key] = self._analyze_background_style(self._load_image(key).image)
+        return self._style_cache[key]
 
     def _add_check(self, name: str, result: CheckResult, reason: str, details: Dict = None):
         """검사 항목 추가"""
@@ -188,25 +225,24 @@ class VisualGuard:
                     return True
         return False
 
-    def _check_text_is_white(self, img: Image.Image, top_percent: int = 25) -> bool:
+    def _check_text_is_white(self, img: ImageLike, top_percent: int = 25) -> bool:
         """상단 영역의 텍스트가 흰색인지 확인"""
-        # 상단 25% 영역 추출
-        height = img.height
-        top_region = img.crop((0, 0, img.width, int(height * top_percent / 100)))
+        data = as_image_data(img)
+        # 상단 25% 영역
+        pixels = region(data, 0, int(data.height * top_percent / 100))
 
         # 흰색 픽셀 비율 확인 (텍스트 영역)
-        pixels = list(top_region.getdata())
-        white_count = sum(1 for p in pixels if isinstance(p, tuple) and len(p) >= 3 and p[0] > 240 and p[1] > 240 and p[2] > 240)
+        white_count = int(color_mask(pixels, self.TEXT_COLOR_RANGES["white"]).sum())
 
         # 흰색 픽셀이 일정 비율 이상이면 흰색 텍스트로 판단
-        return white_count > len(pixels) * 0.01  # 1% 이상
+        return white_count > pixels.shape[0] * pixels.shape[1] * 0.01  # 1% 이상
 
-    def _check_text_color_by_safety(self, img: Image.Image, safety: str, bottom_percent: int = 30) -> Tuple[bool, str, Dict]:
+    def _check_text_color_by_safety(self, img: ImageLike, safety: str, bottom_percent: int = 30) -> Tuple[bool, str, Dict]:
         """
         하단 영역의 텍스트가 안전도에 맞는 색상인지 확인
 
         Args:
-            img: PIL Image
+            img: PIL Image 또는 ImageData
             safety: "safe", "caution", "danger"
             bottom_percent: 검사할 하단 영역 비율 (기본 30%)
 
@@ -217,48 +253,18 @@ class VisualGuard:
             return False, "unknown", {"error": f"Unknown safety: {safety}"}
 
         expected = self.SAFETY_COLORS[safety]
-        expected_rgb = expected["rgb"]
-
-        height = img.height
-        width = img.width
-        # 하단 30% 영역 추출
-        bottom_region = img.crop((0, int(height * (100 - bottom_percent) / 100), width, height))
-
-        # 각 안전도 색상별 픽셀 카운트
-        color_counts = {"safe": 0, "caution": 0, "danger": 0, "white": 0}
-        total_bright = 0
-
-        for y in range(0, bottom_region.height, 2):
-            for x in range(0, bottom_region.width, 3):
-                try:
-                    pixel = bottom_region.getpixel((x, y))
-                    if not isinstance(pixel, tuple) or len(pixel) < 3:
-                        continue
-                    r, g, b = pixel[:3]
-
-                    brightness = (r + g + b) / 3
-                    if brightness < 100:
-                        continue  # 어두운 픽셀 스킵
-
-                    total_bright += 1
-
-                    # 초록색 #4CAF50 (76, 175, 80) ±30
-                    if 50 <= r <= 110 and 145 <= g <= 205 and 50 <= b <= 110:
-                        color_counts["safe"] += 1
-                    # 노란색 #FFD93D (255, 217, 61) ±30
-                    elif 225 <= r <= 255 and 190 <= g <= 255 and 30 <= b <= 100:
-                        color_counts["caution"] += 1
-                    # 빨간색 #FF6B6B (255, 107, 107) ±30
-                    elif 225 <= r <= 255 and 80 <= g <= 140 and 80 <= b <= 140:
-                        color_counts["danger"] += 1
-                    # 흰색
-                    elif r > 240 and g > 240 and b > 240:
-                        color_counts["white"] += 1
-                except Exception:
-                    pass
+
+        data = as_image_data(img)
+        # 하단 30% 영역 (세로 2px, 가로 3px 간격 샘플링)
+        pixels = region(data, int(data.height * (100 - bottom_percent) / 100), None, step=(2, 3))
+
+        # 어두운 픽셀 제외 후 안전도 색상별 픽셀 카운트
+        bright = brightness_mask(pixels, 100)
+        total_bright = int(bright.sum())
+        color_counts_by_name = color_counts(pixels, self.TEXT_COLOR_RANGES, base_mask=bright)
 
         # 가장 많은 색상 찾기
-        detected = max(color_counts.items(), key=lambda x: x[1])
+        detected = max(color_counts_by_name.items(), key=lambda x: x[1])
         detected_color = detected[0]
         detected_count = detected[1]
 
@@ -271,20 +277,18 @@ class VisualGuard:
             "expected_hex": expected["hex"],
             "detected_color": detected_color,
             "detected_count": detected_count,
-            "color_counts": color_counts,
+            "color_counts": color_counts_by_name,
             "total_bright": total_bright
         }
 
         return is_correct, detected_color, details
 
-    def _check_text_is_yellow(self, img: Image.Image, bottom_percent: int = 25) -> bool:
+    def _check_text_is_yellow(self, img: ImageLike, bottom_percent: int = 25) -> bool:
         """하단 영역의 텍스트가 노란색인지 확인 (DEPRECATED - 안전도 기반 사용 권장)"""
-        height = img.height
-        bottom_region = img.crop((0, int(height * (100 - bottom_percent) / 100), img.width, height))
-        pixels = list(bottom_region.getdata())
-        yellow_count = sum(1 for p in pixels if isinstance(p, tuple) and len(p) >= 3
-                          and p[0] > 200 and p[1] > 180 and p[2] < 120)
-        return yellow_count > len(pixels) * 0.005
+        data = as_image_data(img)
+        pixels = region(data, int(data.height * (100 - bottom_percent) / 100))
+        yellow_count = int(color_mask(pixels, self.YELLOW_RANGE).sum())
+        return yellow_count > pixels.shape[0] * pixels.shape[1] * 0.005
 
     # ========== 표지 검증 ==========
 
@@ -295,7 +299,8 @@ class VisualGuard:
             return CheckResult.BLOCK
 
         try:
-            img = Image.open(cover_path)
+            data = self._load_image(cover_path)
+            img = data.image
         except Exception as e:
             self._add_check("cover_readable", CheckResult.BLOCK, f"이미지 읽기 실패: {e}")
             return CheckResult.BLOCK
@@ -321,7 +326,7 @@ class VisualGuard:
                 result = CheckResult.CAUTION
 
         # 2. 텍스트 색상 확인 (흰색)
-        if self._check_text_is_white(img):
+        if self._check_text_is_white(data):
             self._add_check("cover_text_color", CheckResult.PASS, "텍스트 색상 흰색 확인")
         else:
             self._add_check("cover_text_color", CheckResult.BLOCK, "텍스트 색상이 흰색이 아님")
@@ -339,22 +344,37 @@ class VisualGuard:
 
     # ========== 본문 검증 ==========
 
+    # food_data.json 안전도 -> 텍스트 색상 규칙 (FORBIDDEN 은 빨강)
+    FOOD_DATA_SAFETY_MAP = {"SAFE": "safe", "CAUTION": "caution", "DANGER": "danger", "FORBIDDEN": "danger"}
+
     def _load_food_safety_db(self) -> Dict:
-        """food_safety.json 로드"""
-        safety_file = ROOT / "config/settings/food_safety.json"
-        if safety_file.exists():
-            try:
-                with open(safety_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except Exception:
-                pass
-        return {"safe": [], "caution": [], "danger": []}
+        """안전도별 영문명 목록 (food_data.json 공용 저장소 기반)"""
+        db = {"safe": [], "caution": [], "danger": []}
+        try:
+            for level, names in get_food_store().english_names_by_safety().items():
+                mapped = self.FOOD_DATA_SAFETY_MAP.get(level.upper())
+                if mapped:
+                    db[mapped].extend(n for n in names if n)
+        except Exception:
+            pass
+        return db
 
     def _get_food_safety(self, folder_path: Path) -> str:
         """폴더명에서 음식명 추출 후 안전도 확인"""
         folder_name = folder_path.name.lower()
 
-        # food_safety.json에서 확인
+        # food_data.json 인덱스 조회 (번호 접두 / 영문명 / 한글명)
+        try:
+            store = get_food_store()
+            food_id = store.resolve_folder(folder_path.name)
+            if food_id:
+                mapped = self.FOOD_DATA_SAFETY_MAP.get(store.safety_of(food_id, ""))
+                if mapped:
+                    return mapped
+        except Exception:
+            pass
+
+        # 부분 일치 (폴더명에 영문명 포함)
         safety_db = self._load_food_safety_db()
 
         for safety_level in ["safe", "caution", "danger"]:
@@ -379,7 +399,8 @@ class VisualGuard:
             return CheckResult.BLOCK
 
         try:
-            img = Image.open(content_path)
+            data = self._load_image(content_path)
+            img = data.image
         except Exception as e:
             self._add_check("content_readable", CheckResult.BLOCK, f"이미지 읽기 실패: {e}")
             return CheckResult.BLOCK
@@ -404,7 +425,7 @@ class VisualGuard:
             self._add_check("content_text_broken", CheckResult.PASS, "텍스트 정상")
 
         # 2. 본문 텍스트 색상 확인 (안전도 기반)
-        is_correct, detected_color, details = self._check_text_color_by_safety(img, safety)
+        is_correct, detected_color, details = self._check_text_color_by_safety(data, safety)
 
         expected_info = self.SAFETY_COLORS.get(safety, {})
         expected_name = expected_info.get("name", "알 수 없음")
@@ -429,9 +450,8 @@ class VisualGuard:
         # 3. 배경 스타일 확인 (표지와 비교)
         if cover_path and cover_path.exists():
             try:
-                cover_img = Image.open(cover_path)
-                cover_style = self._analyze_background_style(cover_img)
-                content_style = self._analyze_background_style(img)
+                cover_style = self._background_style_of(cover_path)
+                content_style = self._background_style_of(content_path)
 
                 if cover_style["warm_tone"] != content_style["warm_tone"]:
                     self._add_check(
@@ -461,12 +481,19 @@ class VisualGuard:
 
         # 1. 실사 해시 확인
         try:
-            cta_hash = self._get_image_hash(cta_path)
-
-            # CTA 원본이 best_cta에서 온 것인지 확인
-            # (텍스트 오버레이 후에는 해시가 달라지므로, 원본 검증은 생성 시점에)
-            # 여기서는 AI 생성 이미지 특성 확인
+            # CTA 원본이 best_cta에서 온 것인지 확인 (지각 해시 반경 질의)
+            source = self._find_cta_source(cta_path)
+            if source:
+                distance, source_path = source
+                self._add_check(
+                    "cta_is_real_photo",
+                    CheckResult.PASS,
+                    f"실사 원본 확인: {Path(source_path).name} (해밍 거리 {distance})",
+                    {"source": source_path, "distance": distance}
+                )
+                return result
 
+            # 원본 미검출 시 AI 생성 이미지 특성 확인
             img = Image.open(cta_path)
 
             # 이미지 크기 확인 (실사는 보통 다양한 크기)
@@ -531,6 +558,8 @@ class VisualGuard:
     def verify_content_folder(self, folder_path: Path, safety: str = None) -> VisualGuardResult:
         """콘텐츠 폴더 전체 검증 (안전도 기반)"""
         self.checks = []  # 초기화
+        self._image_cache = {}
+        self._style_cache = {}
 
         folder = Path(folder_path)
         if not folder.exists():
@@ -601,6 +630,10 @@ class VisualGuard:
             if overall_result != CheckResult.BLOCK:
                 overall_result = CheckResult.CAUTION
 
+        # 디코드 이미지 해제 (라이브러리 순회 시 메모리 누적 방지)
+        self._image_cache = {}
+        self._style_cache = {}
+
         # 결과 생성
         checks_dict = [
             {
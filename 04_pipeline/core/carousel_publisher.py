@@ -0,0 +1,375 @@
+#!/usr/bin/env python3
+"""
+carousel_publisher.py - Instagram / Threads 캐러셀 게시 엔진
+
+PublisherAgent / threads_post / publish_dual_platform 공용 엔진:
+- 공유 aiohttp 세션 1개로 모든 요청 처리 (연결 재사용)
+- 자식 컨테이너 병렬 생성 (결과는 이미지 순서 유지)
+- 엔드포인트별 요청 제한 (동시 요청 수 + 최소 간격)
+- 상태 확인은 고정 sleep 대신 지수 백오프 폴링
+- 여러 플랫폼 게시를 동시에 실행 (publish_many)
+
+사용법:
+    async with CarouselPublisher() as engine:
+        ig, th = await engine.publish_many([
+            (instagram_platform(ig_user_id, ig_token), urls, ig_caption),
+            (threads_platform(th_user_id, th_token), urls, th_caption),
+        ])
+"""
+
+import asyncio
+import ssl
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+try:
+    import aiohttp
+    import certifi
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+INSTAGRAM_GRAPH_API_BASE = "https://graph.facebook.com/v21.0"
+THREADS_API_BASE = "https://graph.threads.net/v1.0"
+
+STATUS_FINISHED = "FINISHED"
+STATUS_ERROR = "ERROR"
+STATUS_TIMEOUT = "TIMEOUT"
+
+# Graph API 토큰 만료/무효 에러 코드
+TOKEN_ERROR_CODES = (190, 102)
+
+
+# ============================================
+# 플랫폼 정의
+# ============================================
+
+@dataclass
+class Platform:
+    """캐러셀 게시 API 차이점 (엔드포인트/필드 이름)"""
+    name: str
+    api_base: str
+    user_id: str
+    access_token: str
+    media_endpoint: str
+    publish_endpoint: str
+    caption_field: str
+    status_field: str
+    child_params: Dict[str, str] = field(default_factory=dict)
+    wait_children: bool = False       # 캐러셀 생성 전 자식 FINISHED 대기
+    publish_on_timeout: bool = False  # 상태 확인 타임아웃 시에도 게시 시도
+    post_url_template: Optional[str] = None
+
+
+def instagram_platform(user_id: str, access_token: str,
+                       api_base: str = INSTAGRAM_GRAPH_API_BASE) -> Platform:
+    """Instagram Graph API (자식 컨테이너 대기 없음, 타임아웃 시 게시 시도)"""
+    return Platform(
+        name="instagram",
+        api_base=api_base,
+        user_id=user_id,
+        access_token=access_token,
+        media_endpoint="media",
+        publish_endpoint="media_publish",
+        caption_field="caption",
+        status_field="status_code",
+        child_params={"is_carousel_item": "true"},
+        publish_on_timeout=True,
+    )
+
+
+def threads_platform(user_id: str, access_token: str,
+                     api_base: str = THREADS_API_BASE) -> Platform:
+    """Threads API (자식 컨테이너 FINISHED 후 캐러셀 생성)"""
+    return Platform(
+        name="threads",
+        api_base=api_base,
+        user_id=user_id,
+        access_token=access_token,
+        media_endpoint="threads",
+        publish_endpoint="threads_publish",
+        caption_field="text",
+        status_field="status",
+        child_params={"media_type": "IMAGE", "is_carousel_item": "true"},
+        wait_children=True,
+        post_url_template="https://www.threads.net/@sunshinedogfood/post/{post_id}",
+    )
+
+
+# ============================================
+# 요청 제한 / 백오프
+# ============================================
+
+@dataclass
+class RateLimit:
+    """엔드포인트별 제한 (동시 요청 수, 요청 시작 간 최소 간격 초)"""
+    max_concurrent: int = 4
+    min_interval: float = 0.0
+
+
+DEFAULT_LIMITS = {
+    "container": RateLimit(max_concurrent=4, min_interval=0.25),
+    "status": RateLimit(max_concurrent=8, min_interval=0.0),
+    "publish": RateLimit(max_concurrent=1, min_interval=1.0),
+    "info": RateLimit(max_concurrent=4, min_interval=0.0),
+}
+
+
+class _Limiter:
+    """세마포어 + 최소 간격 (요청 시작 시각 기준)"""
+
+    def __init__(self, limit: RateLimit):
+        self.limit = limit
+        self._semaphore = asyncio.Semaphore(max(1, limit.max_concurrent))
+        self._lock = asyncio.Lock()
+        self._next_start = 0.0
+
+    async def __aenter__(self):
+        await self._semaphore.acquire()
+        if self.limit.min_interval > 0:
+            async with self._lock:
+                now = time.monotonic()
+                wait = self._next_start - now
+                self._next_start = max(now, self._next_start) + self.limit.min_interval
+            if wait > 0:
+                await asyncio.sleep(wait)
+        return self
+
+    async def __aexit__(self, *exc):
+        self._semaphore.release()
+
+
+@dataclass
+class Backoff:
+    """상태 폴링 간격 (initial * factor^n, 최대 max_interval, 총 timeout 초)"""
+    initial: float = 1.0
+    factor: float = 1.6
+    max_interval: float = 10.0
+    timeout: float = 120.0
+
+    def intervals(self):
+        interval, elapsed = self.initial, 0.0
+        while elapsed < self.timeout:
+            step = min(interval, self.max_interval, self.timeout - elapsed)
+            yield step
+            elapsed += step
+            interval *= self.factor
+
+
+@dataclass
+class PublishOutcome:
+    """플랫폼별 게시 결과"""
+    platform: str
+    success: bool
+    post_id: Optional[str] = None
+    post_url: Optional[str] = None
+    carousel_id: Optional[str] = None
+    container_count: int = 0
+    error: Optional[str] = None
+    raw_response: Dict = field(default_factory=dict)
+    timings: Dict[str, float] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        result = {"success": self.success, "platform": self.platform}
+        for key in ("post_id", "post_url", "carousel_id", "error"):
+            value = getattr(self, key)
+            if value:
+                result[key] = value
+        result["container_count"] = self.container_count
+        result["timings"] = self.timings
+        if self.raw_response and not self.success:
+            result["raw_response"] = self.raw_response
+        return result
+
+
+# ============================================
+# 게시 엔진
+# ============================================
+
+class CarouselPublisher:
+    """
+    캐러셀 게시 엔진
+
+    - session: 외부 세션 주입 가능 (없으면 certifi SSL 세션 생성, 종료 시 닫음)
+    - limits: 엔드포인트 종류별 RateLimit (플랫폼별로 따로 적용)
+    - log: 진행 로그 함수 (기본 print)
+    """
+
+    def __init__(self, session=None, limits: Optional[Dict[str, RateLimit]] = None,
+                 backoff: Optional[Backoff] = None, log: Callable[[str], None] = print):
+        self.session = session
+        self._owns_session = session is None
+        self.limits = dict(DEFAULT_LIMITS, **(limits or {}))
+        self.backoff = backoff or Backoff()
+        self.log = log
+        self._limiters: Dict[Tuple[str, str], _Limiter] = {}
+
+    async def __aenter__(self):
+        if self.session is None:
+            if not AIOHTTP_AVAILABLE:
+                raise RuntimeError("aiohttp 라이브러리 없음: pip install aiohttp certifi")
+            ssl_context = ssl.create_default_context(cafile=certifi.where())
+            self.session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(ssl=ssl_context))
+        return self
+
+    async def __aexit__(self, *exc):
+        if self._owns_session and self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    # ---------- 요청 ----------
+
+    def _limiter(self, platform: Platform, kind: str) -> _Limiter:
+        key = (platform.name, kind)
+        if key not in self._limiters:
+            self._limiters[key] = _Limiter(self.limits.get(kind, RateLimit()))
+        return self._limiters[key]
+
+    async def _request(self, platform: Platform, kind: str, method: str, path: str,
+                       payload: Dict[str, str]) -> Dict:
+        """Graph API 요청 (JSON 응답, 네트워크 오류는 {"error": {...}})"""
+        url = f"{platform.api_base}/{path}"
+        payload = dict(payload, access_token=platform.access_token)
+        async with self._limiter(platform, kind):
+            try:
+                if method == "GET":
+                    request = self.session.get(url, params=payload)
+                else:
+                    request = self.session.post(url, data=payload)
+                async with request as response:
+                    result = await response.json()
+                    return result if isinstance(result, dict) else {"error": {"message": str(result)}}
+            except Exception as e:
+                return {"error": {"message": str(e)}}
+
+    @staticmethod
+    def _error_message(result: Dict) -> str:
+        error = result.get("error", {})
+        if isinstance(error, dict):
+            if error.get("code") in TOKEN_ERROR_CODES:
+                return f"토큰 만료 - 새 토큰을 발급받아주세요 ({error.get('message', '')})"
+            return error.get("message", "Unknown error")
+        return str(error)
+
+    # ---------- 단계 ----------
+
+    async def create_child(self, platform: Platform, image_url: str) -> Dict:
+        """자식 컨테이너 생성 ({"id": ...} 또는 {"error": ...})"""
+        params = dict(platform.child_params, image_url=image_url)
+        return await self._request(platform, "container", "POST",
+                                   f"{platform.user_id}/{platform.media_endpoint}", params)
+
+    async def create_children(self, platform: Platform, image_urls: Sequence[str]) -> List[Optional[str]]:
+        """자식 컨테이너 병렬 생성 (실패는 None, 이미지 순서 유지)"""
+        results = await asyncio.gather(*(self.create_child(platform, url) for url in image_urls))
+        ids = []
+        for i, result in enumerate(results):
+            if "id" in result:
+                ids.append(str(result["id"]))
+                self.log(f"  [{platform.name}] [{i + 1}/{len(image_urls)}] ✅ 컨테이너 생성")
+            else:
+                ids.append(None)
+                self.log(f"  [{platform.name}] [{i + 1}/{len(image_urls)}] ❌ 컨테이너 실패: {self._error_message(result)}")
+        return ids
+
+    async def create_carousel(self, platform: Platform, children_ids: Sequence[str], caption: str) -> Dict:
+        params = {
+            "media_type": "CAROUSEL",
+            "children": ",".join(children_ids),
+            platform.caption_field: caption,
+        }
+        return await self._request(platform, "container", "POST",
+                                   f"{platform.user_id}/{platform.media_endpoint}", params)
+
+    async def wait_ready(self, platform: Platform, container_id: str,
+                         backoff: Optional[Backoff] = None) -> str:
+        """FINISHED / ERROR / TIMEOUT 반환 (지수 백오프 폴링)"""
+        for interval in (backoff or self.backoff).intervals():
+            result = await self._request(platform, "status", "GET", container_id,
+                                         {"fields": platform.status_field})
+            status = result.get(platform.status_field, "")
+            if status in (STATUS_FINISHED, STATUS_ERROR):
+                return status
+            await asyncio.sleep(interval)
+        return STATUS_TIMEOUT
+
+    async def publish(self, platform: Platform, creation_id: str) -> Dict:
+        return await self._request(platform, "publish", "POST",
+                                   f"{platform.user_id}/{platform.publish_endpoint}",
+                                   {"creation_id": creation_id})
+
+    async def post_info(self, platform: Platform, post_id: str,
+                        fields: str = "id,permalink,timestamp,media_type") -> Dict:
+        return await self._request(platform, "info", "GET", post_id, {"fields": fields})
+
+    # ---------- 전체 흐름 ----------
+
+    async def publish_carousel(self, platform: Platform, image_urls: Sequence[str], caption: str,
+                               min_children: Optional[int] = None) -> PublishOutcome:
+        """
+        캐러셀 게시 (자식 병렬 생성 → 캐러셀 → 상태 대기 → 게시)
+
+        min_children: 이 수 이상 성공하면 실패한 자식은 빼고 진행 (기본: 전부 성공해야 진행)
+        """
+        outcome = PublishOutcome(platform=platform.name, success=False)
+        started = time.monotonic()
+
+        def mark(stage: str):
+            outcome.timings[stage] = round(time.monotonic() - started, 3)
+
+        child_ids = await self.create_children(platform, image_urls)
+        mark("children")
+        created = [cid for cid in child_ids if cid]
+        required = len(image_urls) if min_children is None else min_children
+        if len(created) < max(required, 2):
+            outcome.error = f"컨테이너 생성 실패: {len(created)}/{len(image_urls)}장"
+            return outcome
+        outcome.container_count = len(created)
+
+        if platform.wait_children:
+            statuses = await asyncio.gather(*(self.wait_ready(platform, cid) for cid in created))
+            mark("children_ready")
+            not_ready = [cid for cid, status in zip(created, statuses) if status != STATUS_FINISHED]
+            if not_ready:
+                outcome.error = f"컨테이너 준비 실패: {', '.join(not_ready)}"
+                return outcome
+
+        carousel = await self.create_carousel(platform, created, caption)
+        mark("carousel")
+        if "id" not in carousel:
+            outcome.error = f"캐러셀 생성 실패: {self._error_message(carousel)}"
+            outcome.raw_response = carousel
+            return outcome
+        outcome.carousel_id = str(carousel["id"])
+        self.log(f"  [{platform.name}] ✅ 캐러셀 컨테이너 생성: {outcome.carousel_id}")
+
+        status = await self.wait_ready(platform, outcome.carousel_id)
+        mark("carousel_ready")
+        if status == STATUS_ERROR or (status == STATUS_TIMEOUT and not platform.publish_on_timeout):
+            outcome.error = f"캐러셀 처리 {'오류' if status == STATUS_ERROR else '타임아웃'}"
+            return outcome
+        if status == STATUS_TIMEOUT:
+            self.log(f"  [{platform.name}] ⚠️ 상태 확인 타임아웃, 게시 시도...")
+
+        result = await self.publish(platform, outcome.carousel_id)
+        mark("publish")
+        raw_id = result.get("id")
+        if not raw_id:
+            # 성공 조건 = media_id 존재
+            outcome.error = f"게시 실패: {self._error_message(result) if 'error' in result else 'media_id 없음'}"
+            outcome.raw_response = result
+            return outcome
+
+        outcome.success = True
+        outcome.post_id = str(raw_id)
+        if platform.post_url_template:
+            outcome.post_url = platform.post_url_template.format(post_id=outcome.post_id)
+        self.log(f"  [{platform.name}] 🎉 게시 완료 (ID: {outcome.post_id}, {outcome.timings['publish']}초)")
+        return outcome
+
+    async def publish_many(self, jobs: Sequence[Tuple[Platform, Sequence[str], str]]) -> List[PublishOutcome]:
+        """여러 플랫폼 동시 게시 (jobs 순서대로 결과)"""
+        return list(await asyncio.gather(*(
+            self.publish_carousel(platform, urls, caption) for platform, urls, caption in jobs
+        )))
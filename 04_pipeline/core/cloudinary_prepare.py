@@ -27,6 +27,15 @@ except ImportError:
     CLOUDINARY_AVAILABLE = False
     print("[WARN] cloudinary 라이브러리 없음: pip install cloudinary")
 
+try:
+    from .cloudinary_upload import (
+        CloudinaryUploadStage, UploadJob, assets_match, known_assets, record_assets
+    )
+except ImportError:
+    from cloudinary_upload import (
+        CloudinaryUploadStage, UploadJob, assets_match, known_assets, record_assets
+    )
+
 PROJECT_ROOT = Path(__file__).parent.parent
 
 
@@ -84,11 +93,12 @@ def prepare_cloudinary(folder_path: Path, food_id: str) -> Tuple[bool, str]:
             with open(metadata_path, 'r', encoding='utf-8') as f:
                 metadata = json.load(f)
 
-            # 이미 완료된 경우 스킵
+            # 이미 완료된 경우 스킵 (기록된 해시와 현재 이미지가 같을 때만)
             image_urls = metadata.get("image_urls", [])
             if (metadata.get("cloudinary_uploaded") and
                 isinstance(image_urls, list) and
-                len(image_urls) >= 4):
+                len(image_urls) >= 4 and
+                assets_match(folder_path, metadata)):
                 print(f"[CLOUDINARY] 이미 준비됨: {food_id}")
                 return (True, "이미 준비됨")
         except Exception as e:
@@ -115,28 +125,24 @@ def prepare_cloudinary(folder_path: Path, food_id: str) -> Tuple[bool, str]:
     print(f"[CLOUDINARY] 이미지 {len(image_files)}장 발견")
 
     # ═══════════════════════════════════════════
-    # STEP 3: Cloudinary 업로드
+    # STEP 3: Cloudinary 업로드 (병렬, 해시 일치 시 생략)
     # ═══════════════════════════════════════════
-    try:
-        urls = []
-
-        for img_path in image_files[:4]:  # 최대 4장
-            result = cloudinary.uploader.upload(
-                str(img_path),
-                folder=f"project_sunshine/{food_id}",
-                public_id=img_path.stem,
-                overwrite=True
-            )
-
-            url = result.get('secure_url')
-            if url:
-                urls.append(url)
-                print(f"[CLOUDINARY] 업로드: {img_path.name} → {url[:60]}...")
-            else:
-                print(f"[CLOUDINARY] URL 없음: {img_path.name}")
-
-    except Exception as e:
-        return (False, f"업로드 실패: {str(e)}")
+    cloudinary_folder = f"project_sunshine/{food_id}"
+    jobs = [UploadJob(img_path, cloudinary_folder, img_path.stem) for img_path in image_files[:4]]  # 최대 4장
+    results = CloudinaryUploadStage(cloudinary.uploader.upload).upload(jobs, known_assets(metadata))
+
+    failed = [r for r in results if r.error]
+    if failed:
+        return (False, f"업로드 실패: {failed[0].path.name}: {failed[0].error}")
+
+    urls = []
+    for r in results:
+        if r.secure_url:
+            urls.append(r.secure_url)
+            action = "재사용" if r.skipped else "업로드"
+            print(f"[CLOUDINARY] {action}: {r.path.name} → {r.secure_url[:60]}...")
+        else:
+            print(f"[CLOUDINARY] URL 없음: {r.path.name}")
 
     # ═══════════════════════════════════════════
     # STEP 4: 검증 — URL 개수/타입
@@ -159,7 +165,8 @@ def prepare_cloudinary(folder_path: Path, food_id: str) -> Tuple[bool, str]:
     metadata["image_urls"] = urls  # 반드시 list[str]
     metadata["cloudinary_uploaded"] = True
     metadata["cloudinary_uploaded_at"] = datetime.now().isoformat()
-    metadata["cloudinary_folder"] = f"project_sunshine/{food_id}"
+    metadata["cloudinary_folder"] = cloudinary_folder
+    record_assets(metadata, results)
 
     with open(metadata_path, 'w', encoding='utf-8') as f:
         json.dump(metadata, f, ensure_ascii=False, indent=2)
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+cloudinary_upload.py - Cloudinary 병렬 업로드 단계
+
+PublisherAgent / cloudinary_prepare 공용 업로드 단계:
+- 스레드 풀 병렬 업로드 (동시 업로드 수 제한, 결과는 입력 순서 유지)
+- async 호출 시 이벤트 루프를 막지 않도록 executor 에서 실행
+- 파일별 SHA-256 을 secure_url 과 함께 metadata.json 에 기록
+  → 다음 업로드 때 해시/public_id/폴더가 같으면 업로드 생략
+
+metadata.json 기록 형식:
+    "cloudinary_assets": {
+        "apple_00_cover.png": {
+            "sha256": "...", "secure_url": "https://...",
+            "public_id": "project_sunshine/apple/apple_00", "folder": "project_sunshine/apple",
+            "uploaded_at": "2026-..."
+        }
+    }
+
+환경 변수:
+    CLOUDINARY_UPLOAD_WORKERS=4    동시 업로드 수
+"""
+
+import os
+import json
+import asyncio
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Union
+
+try:
+    import cloudinary.uploader
+    CLOUDINARY_AVAILABLE = True
+except ImportError:
+    CLOUDINARY_AVAILABLE = False
+
+ASSETS_KEY = "cloudinary_assets"
+DEFAULT_WORKERS = 4
+
+Uploader = Callable[..., Dict]
+
+
+def file_sha256(path: Union[str, Path], chunk_size: int = 1 << 20) -> str:
+    """파일 SHA-256 (청크 단위)"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _default_workers() -> int:
+    try:
+        return max(1, int(os.getenv("CLOUDINARY_UPLOAD_WORKERS", DEFAULT_WORKERS)))
+    except ValueError:
+        return DEFAULT_WORKERS
+
+
+@dataclass
+class UploadJob:
+    """업로드 1건 (public_id 는 폴더 제외 이름)"""
+    path: Path
+    folder: str
+    public_id: str
+    options: Dict = field(default_factory=dict)
+
+    @property
+    def full_public_id(self) -> str:
+        return f"{self.folder}/{self.public_id}" if self.folder else self.public_id
+
+
+@dataclass
+class UploadResult:
+    """업로드 결과 (skipped=True 면 기존 기록 재사용, 예외는 error, URL 누락은 secure_url=None)"""
+    index: int
+    path: Path
+    public_id: str
+    folder: str = ""
+    sha256: Optional[str] = None
+    secure_url: Optional[str] = None
+    skipped: bool = False
+    error: Optional[str] = None
+    response: Dict = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and bool(self.secure_url)
+
+
+class CloudinaryUploadStage:
+    """
+    Cloudinary 병렬 업로드 단계
+
+    - uploader: cloudinary.uploader.upload 호환 callable (테스트 시 교체)
+    - known: 기존 metadata.json 의 cloudinary_assets (해시 일치 시 생략)
+    """
+
+    def __init__(self, uploader: Optional[Uploader] = None, max_workers: Optional[int] = None):
+        if uploader is None:
+            if not CLOUDINARY_AVAILABLE:
+                raise RuntimeError("cloudinary 라이브러리 없음: pip install cloudinary")
+            uploader = cloudinary.uploader.upload
+        self.uploader = uploader
+        self.max_workers = max_workers or _default_workers()
+
+    # ---------- 단건 ----------
+
+    def _upload_one(self, index: int, job: UploadJob, known: Dict[str, Dict]) -> UploadResult:
+        result = UploadResult(index=index, path=job.path, public_id=job.full_public_id, folder=job.folder)
+        try:
+            result.sha256 = file_sha256(job.path)
+            record = known.get(job.path.name) or {}
+            if (record.get("sha256") == result.sha256
+                    and record.get("public_id") == job.full_public_id
+                    and record.get("secure_url")):
+                result.secure_url = record["secure_url"]
+                result.skipped = True
+                return result
+
+            response = self.uploader(
+                str(job.path),
+                folder=job.folder,
+                public_id=job.public_id,
+                overwrite=True,
+                resource_type="image",
+                **job.options,
+            ) or {}
+            result.response = response
+            result.secure_url = response.get("secure_url")
+        except Exception as e:
+            result.error = str(e)
+        return result
+
+    # ---------- 일괄 ----------
+
+    def upload(self, jobs: Sequence[UploadJob], known: Optional[Dict[str, Dict]] = None) -> List[UploadResult]:
+        """병렬 업로드 (입력 순서대로 결과 반환, 실패는 result.error)"""
+        known = known or {}
+        if not jobs:
+            return []
+        workers = min(self.max_workers, len(jobs))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="cloudinary") as pool:
+            futures = [pool.submit(self._upload_one, i, job, known) for i, job in enumerate(jobs)]
+            return [f.result() for f in futures]
+
+    async def upload_async(self, jobs: Sequence[UploadJob],
+                           known: Optional[Dict[str, Dict]] = None) -> List[UploadResult]:
+        """이벤트 루프를 막지 않는 업로드 (executor 에서 upload 실행)"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.upload, list(jobs), known)
+
+
+# ============================================
+# metadata.json 기록
+# ============================================
+
+def read_metadata(metadata_path: Path) -> Dict:
+    """metadata.json 읽기 (없거나 깨졌으면 빈 dict)"""
+    try:
+        with open(metadata_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def known_assets(metadata: Dict) -> Dict[str, Dict]:
+    """metadata 의 업로드 기록 (파일명 -> 기록)"""
+    assets = metadata.get(ASSETS_KEY)
+    return assets if isinstance(assets, dict) else {}
+
+
+def record_assets(metadata: Dict, results: Sequence[UploadResult]) -> Dict:
+    """성공한 업로드의 해시/URL 을 metadata 에 기록 (metadata 수정 후 반환)"""
+    assets = dict(known_assets(metadata))
+    now = datetime.now().isoformat()
+    for r in results:
+        if not r.ok:
+            continue
+        previous = assets.get(r.path.name, {})
+        assets[r.path.name] = {
+            "sha256": r.sha256,
+            "secure_url": r.secure_url,
+            "public_id": r.public_id,
+            "folder": r.folder,
+            "uploaded_at": previous.get("uploaded_at", now) if r.skipped else now,
+        }
+    metadata[ASSETS_KEY] = assets
+    return metadata
+
+
+def write_metadata(metadata_path: Path, metadata: Dict):
+    """metadata.json 원자적 저장"""
+    tmp_path = metadata_path.with_suffix(".json.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(metadata, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, metadata_path)
+
+
+def assets_match(folder_path: Path, metadata: Dict) -> bool:
+    """기록된 해시가 폴더의 현재 이미지와 모두 일치하는지 (기록 없으면 True)"""
+    for name, record in known_assets(metadata).items():
+        try:
+            if record.get("sha256") != file_sha256(folder_path / name):
+                return False
+        except OSError:
+            return False
+    return True
@@ -0,0 +1,476 @@
+#!/usr/bin/env python3
+"""
+content_catalog.py - 콘텐츠 폴더 증분 카탈로그
+
+봇 버튼 / 대시보드 새로고침 / 동기화 스크립트마다 contents 폴더를 다시 걷고
+metadata.json 을 다시 파싱하던 것을 메모리 인덱스 조회로 대체:
+- food_id → 폴더, 위치(상태 폴더), 상태, 이미지 목록, metadata
+- 최초 1회 전체 스캔 후 스냅샷(.cache/content_catalog/) 저장 → 재시작 시 재사용
+- 이후 refresh() 는 mtime 비교로 바뀐 폴더만 다시 읽음
+  (watchdog 설치 시 watch() 로 파일 이벤트 기반 무효화, 주기 스캔 생략)
+- 폴더 이동/metadata 수정 직후에는 invalidate(path) 로 즉시 반영
+
+지원 구조:
+    contents/{1_cover_only,2_body_ready,3_approved}/<폴더>
+    contents/4_posted/<YYYY-MM>/<폴더>, contents/4_posted/<폴더>
+    contents/<폴더>                       (플랫 구조)
+
+사용법:
+    catalog = get_catalog(PROJECT_ROOT / "contents")
+    entry = catalog.find("apple", locations=["2_body_ready", "3_approved"])
+    entry.path, entry.status, entry.metadata, entry.has_image("apple_01.png")
+
+환경 변수:
+    CONTENT_CATALOG_REFRESH=2      mtime 재확인 최소 간격 (초)
+"""
+
+import os
+import re
+import json
+import time
+import hashlib
+import threading
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:  # 선택 의존성
+    FileSystemEventHandler = object
+    Observer = None
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+SNAPSHOT_DIR = PROJECT_ROOT / ".cache" / "content_catalog"
+SNAPSHOT_VERSION = 1
+
+STATUS_LOCATIONS = {
+    "1_cover_only": "cover_only",
+    "2_body_ready": "body_ready",
+    "3_approved": "approved",
+    "4_posted": "posted",
+}
+POSTED_DIR = "4_posted"
+MONTH_DIR = re.compile(r"^\d{4}-\d{2}$")
+IMAGE_SUFFIXES = {".png", ".jpg", ".jpeg", ".webp"}
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, default))
+    except ValueError:
+        return default
+
+
+def food_id_from_name(folder_name: str) -> str:
+    """폴더명에서 food_id 추출 (NNN_food_id_한글명 → food_id)"""
+    parts = folder_name.split("_")
+    if len(parts) > 1 and parts[0].isdigit():
+        parts = parts[1:]
+    ascii_parts = []
+    for part in parts:
+        if not part or not part.isascii():
+            break
+        ascii_parts.append(part)
+    return "_".join(ascii_parts or parts).lower()
+
+
+def _mtime(path: Path) -> float:
+    try:
+        return path.stat().st_mtime
+    except OSError:
+        return 0.0
+
+
+@dataclass
+class ContentEntry:
+    """콘텐츠 폴더 1개"""
+    food_id: str
+    folder: str                 # 절대 경로
+    location: str               # contents 기준 상위 폴더 ("" = 루트, "4_posted/2026-02")
+    images: List[str] = field(default_factory=list)
+    metadata: Dict = field(default_factory=dict)
+    mtime: float = 0.0          # 폴더 mtime (파일 추가/삭제)
+    meta_mtime: float = 0.0     # metadata.json mtime (내용 수정)
+
+    @property
+    def path(self) -> Path:
+        return Path(self.folder)
+
+    @property
+    def name(self) -> str:
+        return self.path.name
+
+    @property
+    def location_status(self) -> Optional[str]:
+        """폴더 위치 기준 상태 (루트면 None)"""
+        return STATUS_LOCATIONS.get(self.location.split("/")[0])
+
+    @property
+    def status(self) -> str:
+        """
+        metadata + 파일 기준 상태
+        우선순위: posted > approved > body_ready > cover_only
+        """
+        if self.location_status == "posted" or self.metadata.get("instagram_media_id"):
+            return "posted"
+        if self.metadata.get("pd_approved") is True:
+            return "approved"
+        if all(self.has_image(f"{self.food_id}_{i:02d}.png") for i in range(4)):
+            return "body_ready"
+        return "cover_only"
+
+    @property
+    def tokens(self) -> Set[str]:
+        """폴더명 조각 (숫자 접미사 제거 포함) - 이름 기반 검색용"""
+        parts = self.name.lower().split("_")
+        return {p for p in parts if p} | {p.rstrip("0123456789") for p in parts if p.rstrip("0123456789")}
+
+    def has_image(self, filename: str) -> bool:
+        return filename in self.images
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+
+def _read_entry(folder: Path, location: str) -> ContentEntry:
+    """폴더 1개 읽기 (이미지 목록 + metadata.json)"""
+    images = []
+    try:
+        for child in folder.iterdir():
+            if child.suffix.lower() in IMAGE_SUFFIXES and child.is_file():
+                images.append(child.name)
+    except OSError:
+        pass
+
+    food_id = food_id_from_name(folder.name)
+    meta_path = folder / "metadata.json"
+    if not meta_path.exists():
+        # v1 호환: {food_id}_00_metadata.json
+        meta_path = folder / f"{food_id}_00_metadata.json"
+    metadata = {}
+    if meta_path.exists():
+        try:
+            metadata = json.loads(meta_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            metadata = {}
+    if isinstance(metadata.get("food_id"), str) and metadata["food_id"]:
+        food_id = metadata["food_id"].lower()
+
+    return ContentEntry(
+        food_id=food_id,
+        folder=str(folder),
+        location=location,
+        images=sorted(images),
+        metadata=metadata if isinstance(metadata, dict) else {},
+        mtime=_mtime(folder),
+        meta_mtime=_mtime(meta_path),
+    )
+
+
+class _WatchHandler(FileSystemEventHandler):
+    """watchdog 이벤트 → 해당 경로 무효화"""
+
+    def __init__(self, catalog: "ContentCatalog"):
+        self.catalog = catalog
+
+    def on_any_event(self, event):
+        self.catalog.invalidate(event.src_path)
+        dest = getattr(event, "dest_path", None)
+        if dest:
+            self.catalog.invalidate(dest)
+
+
+class ContentCatalog:
+    """
+    콘텐츠 폴더 인덱스
+
+    - 조회(find / entry_for / entries)는 메모리 dict 조회, 호출 전 refresh() 자동 수행
+    - refresh 는 refresh_interval 안에서는 생략 (무효화된 경로가 있으면 즉시)
+    """
+
+    def __init__(self, contents_dir: Path, snapshot_path: Optional[Path] = None,
+                 refresh_interval: Optional[float] = None):
+        self.contents_dir = Path(contents_dir).resolve()
+        if snapshot_path is None:
+            digest = hashlib.sha1(str(self.contents_dir).encode()).hexdigest()[:12]
+            snapshot_path = SNAPSHOT_DIR / f"{digest}.json"
+        self.snapshot_path = Path(snapshot_path)
+        self.refresh_interval = (refresh_interval if refresh_interval is not None
+                                 else _env_float("CONTENT_CATALOG_REFRESH", 2.0))
+        self.stats = {"full_scans": 0, "refreshes": 0, "reparsed": 0}
+
+        self._entries: Dict[str, ContentEntry] = {}
+        self._containers: Dict[str, float] = {}
+        self._by_food_id: Dict[str, List[str]] = {}
+        self._by_token: Dict[str, List[str]] = {}
+        self._dirty: Set[str] = set()
+        self._last_refresh = 0.0
+        self._loaded = False
+        self._observer = None
+        self._lock = threading.RLock()
+
+    # ---------- 스냅샷 ----------
+
+    def _load_snapshot(self) -> bool:
+        try:
+            data = json.loads(self.snapshot_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return False
+        if data.get("version") != SNAPSHOT_VERSION or data.get("contents_dir") != str(self.contents_dir):
+            return False
+        self._containers = data.get("containers", {})
+        self._entries = {e["folder"]: ContentEntry(**e) for e in data.get("entries", [])}
+        self._rebuild_indexes()
+        return True
+
+    def _save_snapshot(self):
+        data = {
+            "version": SNAPSHOT_VERSION,
+            "contents_dir": str(self.contents_dir),
+            "containers": self._containers,
+            "entries": [e.to_dict() for e in self._entries.values()],
+        }
+        try:
+            self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.snapshot_path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp, self.snapshot_path)
+        except OSError:
+            pass
+
+    def _rebuild_indexes(self):
+        self._by_food_id, self._by_token = {}, {}
+        for key in sorted(self._entries, key=lambda k: self._entries[k].name):
+            entry = self._entries[key]
+            for food_id in dict.fromkeys((entry.food_id, food_id_from_name(entry.name))):
+                self._by_food_id.setdefault(food_id, []).append(key)
+            for token in entry.tokens:
+                self._by_token.setdefault(token, []).append(key)
+
+    # ---------- 스캔 ----------
+
+    def _location_of(self, container: Path) -> str:
+        return "" if container == self.contents_dir else container.relative_to(self.contents_dir).as_posix()
+
+    def _scan_container(self, container: Path) -> bool:
+        """컨테이너 자식 목록 다시 읽기 (새 폴더 추가 / 사라진 폴더 제거)"""
+        location = self._location_of(container)
+        self._containers[str(container)] = _mtime(container)
+        children = set()
+        try:
+            dirs = [c for c in container.iterdir() if c.is_dir() and not c.name.startswith(".")]
+        except OSError:
+            dirs = []
+
+        for child in dirs:
+            if container == self.contents_dir and child.name in STATUS_LOCATIONS:
+                self._scan_container(child)
+                continue
+            if location == POSTED_DIR and MONTH_DIR.match(child.name):
+                self._scan_container(child)
+                continue
+            children.add(str(child))
+            if str(child) not in self._entries:
+                self._entries[str(child)] = _read_entry(child, location)
+                self.stats["reparsed"] += 1
+
+        # 사라진 폴더 / 하위 컨테이너 제거
+        for key in [k for k, e in self._entries.items() if e.location == location and k not in children]:
+            del self._entries[key]
+        for key in [k for k in self._containers
+                    if Path(k).parent == container and not Path(k).exists()]:
+            self._drop_container(key)
+        return True
+
+    def _drop_container(self, key: str):
+        self._containers.pop(key, None)
+        location = self._location_of(Path(key))
+        for entry_key in [k for k, e in self._entries.items() if e.location == location]:
+            del self._entries[entry_key]
+
+    def _full_scan(self):
+        self._entries, self._containers = {}, {}
+        if self.contents_dir.exists():
+            self._scan_container(self.contents_dir)
+        self.stats["full_scans"] += 1
+
+    def _refresh_changed(self, only: Optional[Iterable[str]] = None) -> int:
+        """mtime 이 바뀐 컨테이너/폴더만 다시 읽기 (only: 확인할 경로 제한)"""
+        changed = 0
+        containers = list(self._containers) if only is None else [p for p in only if p in self._containers]
+        for key in containers:
+            path = Path(key)
+            if not path.exists():
+                self._drop_container(key)
+                changed += 1
+            elif _mtime(path) != self._containers.get(key):
+                self._scan_container(path)
+                changed += 1
+
+        entries = list(self._entries) if only is None else [p for p in only if p in self._entries]
+        for key in entries:
+            entry = self._entries.get(key)
+            if entry is None:
+                continue
+            path = entry.path
+            if not path.exists():
+                del self._entries[key]
+                changed += 1
+                continue
+            meta_path = path / "metadata.json"
+            if not meta_path.exists():
+                meta_path = path / f"{entry.food_id}_00_metadata.json"
+            if _mtime(path) != entry.mtime or _mtime(meta_path) != entry.meta_mtime:
+                self._entries[key] = _read_entry(path, entry.location)
+                self.stats["reparsed"] += 1
+                changed += 1
+        return changed
+
+    def refresh(self, force: bool = False) -> int:
+        """
+        인덱스 갱신
+
+        Returns:
+            다시 읽은 컨테이너/폴더 수 (생략 시 0)
+        """
+        with self._lock:
+            now = time.monotonic()
+            if not self._loaded:
+                self._loaded = True
+                if not self._load_snapshot():
+                    self._full_scan()
+                    self._rebuild_indexes()
+                    self._save_snapshot()
+                    self._last_refresh = now
+                    return len(self._entries)
+                force = True
+
+            dirty, self._dirty = self._dirty, set()
+            if "*" in dirty:
+                self._full_scan()
+                changed = len(self._entries)
+            elif dirty and not force:
+                changed = self._refresh_changed(dirty)
+            elif force or (self._observer is None and now - self._last_refresh >= self.refresh_interval):
+                changed = self._refresh_changed()
+            else:
+                return 0
+
+            self._last_refresh = now
+            self.stats["refreshes"] += 1
+            if changed:
+                self._rebuild_indexes()
+                self._save_snapshot()
+            return changed
+
+    def invalidate(self, path=None):
+        """경로 무효화 (폴더 이동/metadata 수정 후 호출, None 이면 전체 재스캔)"""
+        with self._lock:
+            if path is None:
+                self._dirty.add("*")
+                return
+            path = Path(path).resolve()
+            # 변경 파일 → 소속 콘텐츠 폴더 / 컨테이너 표시
+            for candidate in (path, *path.parents):
+                key = str(candidate)
+                if key in self._entries or key in self._containers:
+                    self._dirty.add(key)
+                    break
+                if candidate == self.contents_dir:
+                    break
+            # 이동/삭제로 새 위치가 생기면 부모 컨테이너도 재확인
+            parent = str(path.parent)
+            if parent in self._containers:
+                self._dirty.add(parent)
+
+    def watch(self) -> bool:
+        """watchdog 파일 이벤트 기반 무효화 시작 (미설치 시 False → mtime 주기 확인 유지)"""
+        if Observer is None or self._observer is not None or not self.contents_dir.exists():
+            return self._observer is not None
+        observer = Observer()
+        observer.schedule(_WatchHandler(self), str(self.contents_dir), recursive=True)
+        observer.daemon = True
+        observer.start()
+        self._observer = observer
+        return True
+
+    def stop(self):
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer = None
+
+    # ---------- 조회 ----------
+
+    def entries(self, locations: Optional[Iterable[str]] = None) -> List[ContentEntry]:
+        """전체 항목 (이름순), locations 지정 시 해당 위치만 (4_posted 는 월별 하위 포함)"""
+        self.refresh()
+        with self._lock:
+            items = sorted(self._entries.values(), key=lambda e: e.name)
+        if locations is None:
+            return items
+        locations = list(locations)
+        return [e for e in items if _location_rank(e.location, locations) is not None]
+
+    def entry_for(self, folder) -> Optional[ContentEntry]:
+        """폴더 경로로 조회"""
+        self.refresh()
+        with self._lock:
+            return self._entries.get(str(Path(folder).resolve()))
+
+    def find_all(self, food_id: str, locations: Optional[Iterable[str]] = None,
+                 match_name: bool = True) -> List[ContentEntry]:
+        """
+        food_id 로 조회 (metadata/폴더명 food_id 일치 → 폴더명 조각 일치 순)
+
+        Args:
+            locations: 검색 위치 및 우선순위 (예: ["2_body_ready", "3_approved", ""])
+            match_name: 폴더명 조각(숫자 접미사 제거 포함) 일치도 허용
+        """
+        self.refresh()
+        key = food_id.lower()
+        with self._lock:
+            keys = list(self._by_food_id.get(key, []))
+            if match_name:
+                keys += [k for k in self._by_token.get(key, []) if k not in keys]
+            found = [self._entries[k] for k in keys]
+        if locations is None:
+            return found
+        locations = list(locations)
+        ranked = [(_location_rank(e.location, locations), i, e) for i, e in enumerate(found)]
+        return [e for rank, _, e in sorted((r for r in ranked if r[0] is not None), key=lambda r: r[:2])]
+
+    def find(self, food_id: str, locations: Optional[Iterable[str]] = None,
+             match_name: bool = True) -> Optional[ContentEntry]:
+        found = self.find_all(food_id, locations, match_name)
+        return found[0] if found else None
+
+    def by_status(self) -> Dict[str, List[ContentEntry]]:
+        """상태별 항목 (metadata + 파일 기준)"""
+        result: Dict[str, List[ContentEntry]] = {s: [] for s in STATUS_LOCATIONS.values()}
+        for entry in self.entries():
+            result.setdefault(entry.status, []).append(entry)
+        return result
+
+
+def _location_rank(location: str, locations: List[str]) -> Optional[int]:
+    top = location.split("/")[0]
+    for rank, wanted in enumerate(locations):
+        if location == wanted or (wanted == POSTED_DIR and top == POSTED_DIR):
+            return rank
+    return None
+
+
+_catalogs: Dict[Path, ContentCatalog] = {}
+_catalogs_lock = threading.Lock()
+
+
+def get_catalog(contents_dir) -> ContentCatalog:
+    """contents 폴더별 공용 카탈로그"""
+    resolved = Path(contents_dir).resolve()
+    with _catalogs_lock:
+        catalog = _catalogs.get(resolved)
+        if catalog is None:
+            catalog = _catalogs[resolved] = ContentCatalog(resolved)
+        return catalog
@@ -187,6 +187,17 @@ class CreativeReviewCrew:
         result = await self.vlm.compare_with_gold_standard(images, gold_images)
         return result
 
+    async def _review_all_async(self, images: list) -> dict:
+        """5개 검수 일괄 실행 (VLM 호출 병렬, 동일 이미지/프롬프트는 응답 캐시)"""
+        checks = await asyncio.gather(
+            self._check_aesthetic_async(images),
+            self._check_emotion_async(images),
+            self._check_storytelling_async(images),
+            self._check_diversity_async(images),
+            self._compare_with_gold_standard_async(images),
+        )
+        return dict(zip(["aesthetic", "emotion", "storytelling", "diversity", "gold_comparison"], checks))
+
     def _check_aesthetic(self, images: list) -> dict:
         """AestheticAgent: 미적 균형 검사 (동기 래퍼)"""
         return run_async(self._check_aesthetic_async(images))
@@ -253,9 +264,12 @@ class CreativeReviewCrew:
         categories = {}
         total_score = 0
 
+        # 5개 검수를 한 번에 병렬 실행 (결과 출력은 기존 순서대로)
+        reviews = run_async(self._review_all_async(images))
+
         # 1. 미적 균형 검사
         print("[1/5] 미적 균형 검사...")
-        aesthetic = self._check_aesthetic(images)
+        aesthetic = reviews["aesthetic"]
         categories["aesthetic"] = aesthetic
         # 점수 정규화 (총 25점 만점)
         aesthetic_score = min(aesthetic.get("total", 15), 25)
@@ -264,7 +278,7 @@ class CreativeReviewCrew:
 
         # 2. 감성 품질 검사
         print("[2/5] 감성 품질 검사...")
-        emotion = self._check_emotion(images)
+        emotion = reviews["emotion"]
         categories["emotion"] = emotion
         emotion_score = min(emotion.get("total", 15), 25)
         total_score += emotion_score
@@ -272,7 +286,7 @@ class CreativeReviewCrew:
 
         # 3. 스토리텔링 검사
         print("[3/5] 스토리텔링 검사...")
-        storytelling = self._check_storytelling(images)
+        storytelling = reviews["storytelling"]
         categories["storytelling"] = storytelling
         storytelling_score = min(storytelling.get("total", 15), 25)
         total_score += storytelling_score
@@ -280,7 +294,7 @@ class CreativeReviewCrew:
 
         # 4. 다양성 검사
         print("[4/5] 다양성 검사...")
-        diversity = self._check_diversity(images)
+        diversity = reviews["diversity"]
         categories["diversity"] = diversity
         diversity_score = min(diversity.get("total", 15), 25)
         total_score += diversity_score
@@ -288,7 +302,7 @@ class CreativeReviewCrew:
 
         # 5. Gold Standard 비교
         print("[5/5] Gold Standard(체리) 비교...")
-        gold_comparison = self._compare_with_gold_standard(images)
+        gold_comparison = reviews["gold_comparison"]
         print(f"      유사도: {gold_comparison.get('similarity_score', 0)}%")
 
         # 등급 결정 (Phase 6/7: 기준 상향)
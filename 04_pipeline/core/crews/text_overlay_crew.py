@@ -23,6 +23,8 @@ sys.path.insert(0, str(ROOT))
 from dotenv import load_dotenv
 load_dotenv(ROOT / ".env")
 
+from core.render_worker import RenderWorkerError, SlideJob, SlideRender, get_render_worker
+
 
 # v8.3 텍스트 스펙
 COVER_TEXT_SPEC = {
@@ -411,6 +413,7 @@ const puppeteer = require('puppeteer');
 
         processed_images = []
         spec_checks = []
+        jobs = []
 
         for slide in slides:
             idx = slide.get("index", 0)
@@ -451,22 +454,35 @@ const puppeteer = require('puppeteer');
                 html = self._generate_content_html(image_src, title, subtitle)
                 output_file = output_path / f"{food_name}_{idx:02d}_content.png"
 
-            # 렌더링
             print(f"   [{idx+1}/{len(slides)}] {slide_type}: {title[:20]}...")
+            jobs.append((slide_type, SlideJob(html=html, output=str(output_file))))
 
-            success = asyncio.get_event_loop().run_until_complete(
-                self._render_with_puppeteer(html, str(output_file))
-            )
-
-            if success:
+        # 렌더링: 상주 렌더 워커로 일괄 (사용 불가 시 슬라이드별 node 실행)
+        try:
+            renders = get_render_worker().render([job for _, job in jobs])
+        except RenderWorkerError as e:
+            print(f"   ⚠️ 렌더 워커 사용 불가, 슬라이드별 렌더링: {e}")
+            loop = asyncio.new_event_loop()
+            try:
+                renders = [
+                    SlideRender(output=job.output,
+                                ok=loop.run_until_complete(self._render_with_puppeteer(job.html, job.output)))
+                    for _, job in jobs
+                ]
+            finally:
+                loop.close()
+
+        for (slide_type, job), render in zip(jobs, renders):
+            output_file = Path(job.output)
+            if render.ok:
                 processed_images.append(str(output_file))
-                print(f"       ✓ {output_file.name}")
+                print(f"       ✓ {output_file.name} ({render.ms}ms)")
 
                 # 스펙 검증
                 spec_result = self._verify_spec(slide_type, str(output_file))
                 spec_checks.append(spec_result)
             else:
-                print(f"       ✗ 렌더링 실패")
+                print(f"       ✗ {output_file.name} 렌더링 실패: {render.error or ''}")
 
         # 결과 요약
         print()
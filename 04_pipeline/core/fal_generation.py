@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+fal_generation.py - fal.ai 이미지 병렬 생성 단계
+
+ImageGeneratorAgent 용 생성 단계:
+- 슬라이드 프롬프트 전체를 동시에 제출 (동시 생성 수 제한, 결과는 프롬프트 순서 유지)
+- 공유 httpx.AsyncClient 1개로 다운로드 (연결 재사용)
+- 디코드 / LANCZOS 리사이즈 / PNG 인코딩은 워커 스레드 풀에서 실행
+  → 이벤트 루프를 막지 않음
+- 이미지별 단계 소요 시간 기록 (generate / download / encode / total)
+- 생성 캐시 (core.generation_cache): 프롬프트 기반 결정적 seed, 적중 시 fal 호출 생략
+
+9장 캐러셀 기준 전체 소요 시간 ≈ 가장 느린 1장 (순차 합계 X)
+
+환경 변수:
+    FAL_MAX_CONCURRENCY=4      동시 생성 수
+    FAL_DECODE_WORKERS=4       디코드/인코딩 워커 수
+"""
+
+import io
+import os
+import time
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from PIL import Image
+
+try:
+    from .generation_cache import GenerationCache, cache_key, deterministic_seed
+except ImportError:
+    from core.generation_cache import GenerationCache, cache_key, deterministic_seed
+
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+FAL_MODEL = "fal-ai/flux-2-pro"
+PROVIDER_NAME = "fal-flux-2-pro"
+CACHE_PROVIDER = "fal"
+
+# Instagram 표준 이미지 크기
+INSTAGRAM_SIZE = (1080, 1080)
+
+DEFAULT_CONCURRENCY = 4
+DEFAULT_DECODE_WORKERS = 4
+DOWNLOAD_TIMEOUT = 30.0
+
+Subscribe = Callable[..., Dict]
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return max(1, int(os.getenv(name, default)))
+    except ValueError:
+        return default
+
+
+@dataclass
+class FalImageJob:
+    """생성 1건 (슬라이드 index/type, 프롬프트, 저장 경로, seed 미지정 시 프롬프트 기반)"""
+    index: int
+    prompt: str
+    path: Path
+    type: str = "content"
+    seed: Optional[int] = None
+
+    @property
+    def resolved_seed(self) -> int:
+        return self.seed if self.seed is not None else deterministic_seed(self.prompt)
+
+
+@dataclass
+class FalImageResult:
+    """생성 결과 (실패는 error/error_type, latency 는 단계별 초, cached=True 면 캐시 재사용)"""
+    index: int
+    type: str
+    path: Path
+    url: Optional[str] = None
+    seed: Optional[int] = None
+    cached: bool = False
+    error: Optional[str] = None
+    error_type: Optional[str] = None
+    latency: Dict[str, float] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def to_dict(self) -> Dict:
+        """ImageGeneratorAgent 출력 형식"""
+        if self.ok:
+            return {
+                "index": self.index,
+                "type": self.type,
+                "path": str(self.path),
+                "exists": True,
+                "url": self.url,
+                "provider": PROVIDER_NAME,
+                "seed": self.seed,
+                "cached": self.cached,
+                "latency": self.latency,
+            }
+        return {
+            "index": self.index,
+            "type": self.type,
+            "path": "",
+            "exists": False,
+            "error": self.error,
+            "error_type": self.error_type,
+            "latency": self.latency,
+        }
+
+
+def decode_resize_save(content: bytes, path: Path, size: Tuple[int, int] = INSTAGRAM_SIZE) -> Tuple[int, int]:
+    """PNG 디코드 → (필요 시) LANCZOS 리사이즈 → 최적화 저장 (워커 스레드에서 실행)"""
+    with Image.open(io.BytesIO(content)) as img:
+        img.load()
+        if img.size != size:
+            img = img.resize(size, Image.Resampling.LANCZOS)
+        tmp_path = path.with_suffix(".png.tmp")
+        img.save(tmp_path, "PNG", optimize=True)
+    os.replace(tmp_path, path)
+    return size
+
+
+def _classify_error(e: Exception) -> Tuple[str, str]:
+    """예외 → (error_msg, error_type) (기존 ImageGeneratorAgent 분류 유지)"""
+    if HTTPX_AVAILABLE and isinstance(e, httpx.HTTPStatusError):
+        return f"이미지 다운로드 실패 (HTTP {e.response.status_code})", "download_error"
+    if (HTTPX_AVAILABLE and isinstance(e, httpx.TimeoutException)) or isinstance(e, asyncio.TimeoutError):
+        return "이미지 다운로드 타임아웃", "timeout"
+    if isinstance(e, KeyError):
+        return f"API 응답 파싱 실패: {str(e)}", "api_response_error"
+    error_type = type(e).__name__
+    return f"{error_type}: {str(e)}", error_type.lower()
+
+
+class FalGenerationStage:
+    """
+    fal.ai 병렬 생성 단계
+
+    - subscribe: fal_client.subscribe 호환 callable (테스트 시 교체)
+    - client: httpx.AsyncClient 호환 (없으면 생성, 종료 시 닫음)
+    - max_concurrency: 동시 생성 수 (fal 큐 제출 + 다운로드)
+    - decode_workers: 디코드/리사이즈/인코딩 스레드 수
+    - cache: GenerationCache (None 이면 캐시 없이 매번 생성)
+    - log: 진행 로그 함수 (기본 print)
+    """
+
+    def __init__(self, subscribe: Optional[Subscribe] = None, client=None,
+                 max_concurrency: Optional[int] = None, decode_workers: Optional[int] = None,
+                 model: str = FAL_MODEL, size: Tuple[int, int] = INSTAGRAM_SIZE,
+                 cache: Optional[GenerationCache] = None,
+                 log: Callable[[str], None] = print):
+        if subscribe is None:
+            import fal_client
+            subscribe = fal_client.subscribe
+        self.subscribe = subscribe
+        self.client = client
+        self._owns_client = client is None
+        self.max_concurrency = max_concurrency or _env_int("FAL_MAX_CONCURRENCY", DEFAULT_CONCURRENCY)
+        self.decode_workers = decode_workers or _env_int("FAL_DECODE_WORKERS", DEFAULT_DECODE_WORKERS)
+        self.model = model
+        self.size = size
+        self.cache = cache
+        self.log = log
+        self._pool: Optional[ThreadPoolExecutor] = None
+
+    async def __aenter__(self):
+        if self.client is None:
+            if not HTTPX_AVAILABLE:
+                raise RuntimeError("httpx 라이브러리 없음: pip install httpx")
+            self.client = httpx.AsyncClient(
+                timeout=DOWNLOAD_TIMEOUT,
+                limits=httpx.Limits(max_connections=self.max_concurrency,
+                                    max_keepalive_connections=self.max_concurrency),
+            )
+        self._pool = ThreadPoolExecutor(max_workers=self.decode_workers, thread_name_prefix="fal-decode")
+        return self
+
+    async def __aexit__(self, *exc):
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+        if self._owns_client and self.client is not None:
+            await self.client.aclose()
+            self.client = None
+
+    # ---------- 단건 ----------
+
+    def _arguments(self, prompt: str, seed: int) -> Dict:
+        return {
+            "prompt": prompt,
+            "image_size": {"width": self.size[0], "height": self.size[1]},
+            "num_images": 1,
+            "output_format": "png",
+            "safety_tolerance": "5",
+            "seed": seed,
+        }
+
+    async def _generate_one(self, job: FalImageJob, total: int,
+                            semaphore: asyncio.Semaphore) -> FalImageResult:
+        result = FalImageResult(index=job.index, type=job.type, path=job.path, seed=job.resolved_seed)
+        loop = asyncio.get_running_loop()
+
+        key = None
+        if self.cache is not None:
+            # 캐시 확인은 동시 생성 제한 밖에서 (적중 슬라이드는 대기 없음)
+            started = time.monotonic()
+            key = cache_key(CACHE_PROVIDER, self.model, job.prompt, self.size, result.seed)
+            if await loop.run_in_executor(self._pool, self.cache.restore, key, job.path):
+                result.cached = True
+                result.latency["total"] = round(time.monotonic() - started, 3)
+                self.log(f"  [{job.index}/{total}] 캐시 재사용: {job.path.name}")
+                return result
+
+        async with semaphore:
+            started = time.monotonic()
+
+            def mark(stage: str, since: float) -> float:
+                now = time.monotonic()
+                result.latency[stage] = round(now - since, 3)
+                return now
+
+            try:
+                self.log(f"  [{job.index}/{total}] 생성 중: {job.prompt[:50]}...")
+                # fal_client.subscribe 는 동기 (큐 제출 + 완료 대기) → 스레드에서 실행
+                response = await asyncio.to_thread(self.subscribe, self.model,
+                                                   arguments=self._arguments(job.prompt, result.seed))
+                result.url = response["images"][0]["url"]
+                t = mark("generate", started)
+
+                download = await self.client.get(result.url)
+                download.raise_for_status()
+                t = mark("download", t)
+
+                await loop.run_in_executor(self._pool, decode_resize_save,
+                                           download.content, job.path, self.size)
+                mark("encode", t)
+                if key is not None:
+                    await loop.run_in_executor(self._pool, self._store, key, job, result)
+                mark("total", started)
+                self.log(f"  [{job.index}/{total}] 완료: {job.path.name} "
+                         f"({self.size[0]}x{self.size[1]}, {result.latency['total']}초)")
+            except Exception as e:
+                result.error, result.error_type = _classify_error(e)
+                mark("total", started)
+                self.log(f"  [{job.index}/{total}] 실패: {result.error}")
+        return result
+
+    def _store(self, key: str, job: FalImageJob, result: FalImageResult):
+        try:
+            self.cache.put(key, job.path, metadata={
+                "provider": CACHE_PROVIDER,
+                "model": self.model,
+                "prompt": job.prompt,
+                "size": f"{self.size[0]}x{self.size[1]}",
+                "seed": result.seed,
+                "source_url": result.url,
+            })
+        except OSError as e:
+            self.log(f"  [{job.index}] 캐시 저장 실패 (무시): {e}")
+
+    # ---------- 일괄 ----------
+
+    async def generate(self, jobs: Sequence[FalImageJob]) -> List[FalImageResult]:
+        """전체 동시 생성 (max_concurrency 제한, 입력 순서대로 결과 반환)"""
+        if not jobs:
+            return []
+        if self._pool is None:
+            async with self:
+                return await self.generate(jobs)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        return list(await asyncio.gather(*(
+            self._generate_one(job, len(jobs), semaphore) for job in jobs
+        )))
@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+"""
+generation_cache.py - 이미지 생성 결과 캐시 (내용 주소 기반)
+
+image_utils / ImageGeneratorAgent 공용 캐시:
+- 키: (provider, model, 정규화 프롬프트, 크기, seed) SHA-256
+- seed 미지정 시 정규화 프롬프트에서 결정적 seed 계산
+  → 같은 프롬프트는 같은 seed, 재실행해도 같은 이미지
+- 결과 파일 + 메타데이터(json)를 .cache/generation/ 에 저장 (원자적 저장)
+- TTL 만료 / 전체 용량 초과 시 오래 안 쓴 항목부터 정리
+- 프롬프트가 바뀐 슬라이드만 캐시 미스 → 재시도 시 그 슬라이드만 재생성
+
+저장 구조:
+    .cache/generation/ab/ab12....png
+    .cache/generation/ab/ab12....json   {"provider", "model", "prompt", "size", "seed",
+                                          "created_at", "last_used", "bytes", ...}
+
+환경 변수:
+    GENERATION_CACHE=off            캐시 끄기
+    GENERATION_CACHE_TTL_DAYS=30    항목 유효 기간
+    GENERATION_CACHE_MAX_MB=2048    전체 용량 상한
+"""
+
+import os
+import json
+import time
+import shutil
+import hashlib
+import threading
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+CACHE_DIR = PROJECT_ROOT / ".cache" / "generation"
+
+DEFAULT_TTL_DAYS = 30
+DEFAULT_MAX_MB = 2048
+# put() 시 만료 항목 전체 스캔 최소 간격 (용량 초과 시에는 즉시 정리)
+SWEEP_INTERVAL = 3600
+SEED_RANGE = 2 ** 31 - 1
+
+Size = Union[str, Tuple[int, int]]
+
+
+def normalize_prompt(prompt: str) -> str:
+    """공백 정규화 (연속 공백/줄바꿈 → 공백 1칸, 앞뒤 공백 제거)"""
+    return " ".join(str(prompt).split())
+
+
+def _size_text(size: Size) -> str:
+    if isinstance(size, (tuple, list)):
+        return f"{size[0]}x{size[1]}"
+    return str(size)
+
+
+def deterministic_seed(prompt: str, offset: int = 0) -> int:
+    """정규화 프롬프트 기반 결정적 seed (offset 으로 같은 프롬프트 새 이미지)"""
+    digest = hashlib.sha256(normalize_prompt(prompt).encode("utf-8")).hexdigest()
+    return (int(digest[:12], 16) + offset) % SEED_RANGE
+
+
+def cache_key(provider: str, model: str, prompt: str, size: Size, seed: Optional[int]) -> str:
+    """(provider, model, 정규화 프롬프트, 크기, seed) → SHA-256"""
+    material = json.dumps(
+        [provider, model, normalize_prompt(prompt), _size_text(size), seed],
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+def _env_enabled() -> bool:
+    return os.getenv("GENERATION_CACHE", "on").lower() not in ("0", "off", "false", "no")
+
+
+def _env_number(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, default))
+    except ValueError:
+        return default
+
+
+class GenerationCache:
+    """
+    생성 결과 디스크 캐시
+
+    - ttl_seconds: 생성 후 유효 기간 (None 이면 만료 없음)
+    - max_bytes: 전체 용량 상한 (초과 시 last_used 오래된 순 삭제)
+    - 전체 크기는 첫 저장 때 1회 스캔 후 증분 추적 (저장마다 메타 전체 재스캔 없음)
+    """
+
+    def __init__(self, cache_dir: Optional[Union[str, Path]] = None,
+                 ttl_seconds: Optional[float] = None, max_bytes: Optional[int] = None):
+        self.cache_dir = Path(cache_dir or CACHE_DIR)
+        if ttl_seconds is None:
+            ttl_seconds = _env_number("GENERATION_CACHE_TTL_DAYS", DEFAULT_TTL_DAYS) * 86400
+        if max_bytes is None:
+            max_bytes = int(_env_number("GENERATION_CACHE_MAX_MB", DEFAULT_MAX_MB) * 1024 * 1024)
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.stats = {"hits": 0, "misses": 0, "stores": 0, "evicted": 0}
+        self._total_bytes: Optional[int] = None
+        self._last_sweep = time.time()
+        self._lock = threading.Lock()
+
+    # ---------- 경로 ----------
+
+    def _meta_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def _read_meta(self, key: str) -> Optional[Dict]:
+        try:
+            with open(self._meta_path(key), "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            return meta if isinstance(meta, dict) else None
+        except (OSError, ValueError):
+            return None
+
+    def _write_meta(self, key: str, meta: Dict):
+        path = self._meta_path(key)
+        tmp_path = path.with_suffix(".json.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(meta, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, path)
+
+    def _expired(self, meta: Dict, now: float) -> bool:
+        return bool(self.ttl_seconds) and now - meta.get("created_at", 0) > self.ttl_seconds
+
+    # ---------- 조회 / 저장 ----------
+
+    def get(self, key: str) -> Optional[Path]:
+        """캐시 파일 경로 (없거나 만료면 None, 조회 시 last_used 갱신)"""
+        meta = self._read_meta(key)
+        now = time.time()
+        path = self.cache_dir / key[:2] / meta["file"] if meta and meta.get("file") else None
+        if path is None or not path.exists() or self._expired(meta, now):
+            with self._lock:
+                self.stats["misses"] += 1
+            return None
+        meta["last_used"] = now
+        try:
+            self._write_meta(key, meta)
+        except OSError:
+            pass
+        with self._lock:
+            self.stats["hits"] += 1
+        return path
+
+    def put(self, key: str, source: Union[str, Path, bytes], suffix: str = ".png",
+            metadata: Optional[Dict] = None) -> Path:
+        """결과 저장 (파일 경로 또는 bytes, 원자적 저장 후 용량 정리)"""
+        folder = self.cache_dir / key[:2]
+        folder.mkdir(parents=True, exist_ok=True)
+        if not isinstance(source, (bytes, bytearray)):
+            suffix = Path(source).suffix or suffix
+        path = folder / f"{key}{suffix}"
+        previous = self._read_meta(key)
+        tmp_path = folder / f"{key}{suffix}.tmp"
+        if isinstance(source, (bytes, bytearray)):
+            tmp_path.write_bytes(source)
+        else:
+            shutil.copyfile(source, tmp_path)
+        os.replace(tmp_path, path)
+
+        now = time.time()
+        meta = dict(metadata or {})
+        meta.update({
+            "key": key,
+            "file": path.name,
+            "bytes": path.stat().st_size,
+            "created_at": now,
+            "last_used": now,
+        })
+        self._write_meta(key, meta)
+        with self._lock:
+            self.stats["stores"] += 1
+            if self._total_bytes is not None:
+                self._total_bytes += meta["bytes"] - (previous or {}).get("bytes", 0)
+        self._evict_if_needed(now)
+        return path
+
+    def restore(self, key: str, destination: Union[str, Path]) -> Optional[Path]:
+        """캐시 적중 시 destination 으로 복사 (미스면 None)"""
+        cached = self.get(key)
+        if cached is None:
+            return None
+        destination = Path(destination)
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = destination.with_name(destination.name + ".tmp")
+        shutil.copyfile(cached, tmp_path)
+        os.replace(tmp_path, destination)
+        return destination
+
+    # ---------- 정리 ----------
+
+    def _entries(self) -> List[Tuple[str, Dict]]:
+        entries = []
+        if not self.cache_dir.exists():
+            return entries
+        for meta_path in self.cache_dir.glob("*/*.json"):
+            key = meta_path.stem
+            meta = self._read_meta(key)
+            if meta is not None:
+                entries.append((key, meta))
+        return entries
+
+    def _remove(self, key: str, meta: Dict):
+        for path in (self.cache_dir / key[:2] / meta.get("file", ""), self._meta_path(key)):
+            try:
+                if path.is_file():
+                    path.unlink()
+            except OSError:
+                pass
+        with self._lock:
+            self.stats["evicted"] += 1
+
+    def _evict_if_needed(self, now: float):
+        """용량 초과 또는 스캔 간격 경과 시에만 evict()"""
+        if self._total_bytes is None:
+            total = sum(meta.get("bytes", 0) for _, meta in self._entries())
+            with self._lock:
+                self._total_bytes = total
+        over_budget = bool(self.max_bytes) and self._total_bytes > self.max_bytes
+        if over_budget or now - self._last_sweep >= SWEEP_INTERVAL:
+            self.evict()
+
+    def evict(self) -> int:
+        """만료 항목 삭제 후 용량 초과분을 last_used 오래된 순으로 삭제 (삭제 수 반환)"""
+        now = time.time()
+        removed = 0
+        alive = []
+        for key, meta in self._entries():
+            if self._expired(meta, now):
+                self._remove(key, meta)
+                removed += 1
+            else:
+                alive.append((key, meta))
+
+        total = sum(meta.get("bytes", 0) for _, meta in alive)
+        if self.max_bytes:
+            for key, meta in sorted(alive, key=lambda item: item[1].get("last_used", 0)):
+                if total <= self.max_bytes:
+                    break
+                self._remove(key, meta)
+                total -= meta.get("bytes", 0)
+                removed += 1
+        with self._lock:
+            self._total_bytes = total
+            self._last_sweep = now
+        return removed
+
+    # ---------- 조회 후 생성 ----------
+
+    def fetch_or_generate(self, provider: str, model: str, prompt: str, size: Size,
+                          generate: Callable[[int], Optional[Union[str, Path]]],
+                          seed: Optional[int] = None,
+                          destination: Optional[Union[str, Path]] = None,
+                          metadata: Optional[Dict] = None) -> Tuple[Optional[str], bool]:
+        """
+        캐시 확인 후 없으면 generate(seed) 호출 → (파일 경로, 캐시 적중 여부)
+
+        - seed 미지정 시 deterministic_seed(prompt)
+        - destination 지정 시 적중 결과를 그 경로로 복사 (미지정 시 캐시 파일 경로 반환)
+        - generate 가 None 을 반환하면 저장하지 않음
+        """
+        if seed is None:
+            seed = deterministic_seed(prompt)
+        key = cache_key(provider, model, prompt, size, seed)
+
+        if destination is not None:
+            hit = self.restore(key, destination)
+        else:
+            hit = self.get(key)
+        if hit is not None:
+            return str(hit), True
+
+        result = generate(seed)
+        if result:
+            meta = dict(metadata or {})
+            meta.update({
+                "provider": provider,
+                "model": model,
+                "prompt": normalize_prompt(prompt),
+                "size": _size_text(size),
+                "seed": seed,
+            })
+            try:
+                self.put(key, result, metadata=meta)
+            except OSError:
+                pass
+        return (str(result) if result else None), False
+
+
+_default_cache: Optional[GenerationCache] = None
+
+
+def get_generation_cache() -> Optional[GenerationCache]:
+    """프로세스 공용 캐시 (GENERATION_CACHE=off 면 None)"""
+    global _default_cache
+    if not _env_enabled():
+        return None
+    if _default_cache is None:
+        _default_cache = GenerationCache()
+    return _default_cache
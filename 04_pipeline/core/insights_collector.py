@@ -0,0 +1,457 @@
+#!/usr/bin/env python3
+"""
+insights_collector.py - Instagram 인사이트 수집기 (Graph API batch)
+
+대시보드(content_manager) / instagram_stats_collector / stats_collector_daemon 공용:
+- 게시물당 2회 + 계정 3회 순차 requests.get 대신 Graph API batch 요청
+  (요청 최대 50개를 POST 1회로, batch 여러 개는 스레드 풀에서 동시 실행)
+- 필드 그룹별 증분 갱신: 게시 후 경과 시간이 짧을수록 자주, 오래된 게시물은 드물게
+    meta      timestamp / permalink / media_type     최초 1회
+    counts    like_count / comments_count              15분 ~ 24시간
+    insights  reach / saved / shares (insights edge)   1시간 ~ 7일
+- 게시물별 1행 저장 (core.state_db instagram_insights, 그룹별 수집 시각 + 다음 갱신 시각)
+
+사용법:
+    collector = InsightsCollector()
+    result = collector.refresh_posts([{"id": "1789...", "timestamp": "..."}])
+    result["posts"]  # fetch_post_insights 와 같은 형태의 dict 목록
+    account = collector.refresh_account("day")
+
+환경 변수:
+    INSIGHTS_MAX_WORKERS=4     동시 batch 요청 수
+"""
+
+import os
+import json
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+try:
+    from .state_db import StateDB, dumps, get_state_db, loads
+except ImportError:
+    from core.state_db import StateDB, dumps, get_state_db, loads
+
+GRAPH_URL = "https://graph.facebook.com"
+GRAPH_VERSION = "v21.0"
+BATCH_LIMIT = 50            # Graph API batch 1회 최대 요청 수
+REQUEST_TIMEOUT = 30
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_USER_ID = "17841478336612378"
+
+META_FIELDS = "timestamp,permalink,media_type"
+COUNT_FIELDS = "like_count,comments_count"
+# Note: impressions 메트릭은 v22.0부터 지원 중단, reach/saved/shares만 사용
+INSIGHT_METRICS = "reach,saved,shares"
+ACCOUNT_METRICS = ("reach", "profile_views", "accounts_engaged", "total_interactions")
+FIELD_GROUPS = ("meta", "counts", "insights")
+
+# 게시 후 경과 시간별 갱신 주기: (경과 상한, counts TTL, insights TTL)
+REFRESH_POLICY: List[Tuple[Optional[timedelta], timedelta, timedelta]] = [
+    (timedelta(days=1), timedelta(minutes=15), timedelta(hours=1)),
+    (timedelta(days=7), timedelta(hours=1), timedelta(hours=6)),
+    (timedelta(days=30), timedelta(hours=6), timedelta(hours=24)),
+    (None, timedelta(hours=24), timedelta(days=7)),
+]
+
+# batch(요청 목록) → 응답 목록 (항목: {"code": int, "body": str} 또는 None)
+BatchPost = Callable[[Dict[str, str]], List[Optional[Dict[str, Any]]]]
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return max(1, int(os.getenv(name, default)))
+    except ValueError:
+        return default
+
+
+def parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+    """Graph API 시각 (2026-01-10T09:00:00+0000) / ISO 문자열 → 로컬 naive datetime"""
+    if not value:
+        return None
+    for parse in (datetime.fromisoformat, lambda v: datetime.strptime(v, "%Y-%m-%dT%H:%M:%S%z")):
+        try:
+            parsed = parse(value)
+        except (TypeError, ValueError):
+            continue
+        return parsed.astimezone().replace(tzinfo=None) if parsed.tzinfo else parsed
+    return None
+
+
+def group_ttls(posted_at: Optional[datetime], now: datetime) -> Dict[str, Optional[timedelta]]:
+    """게시 경과 시간 기준 그룹별 TTL (meta 는 None = 재수집 안 함)"""
+    age = now - posted_at if posted_at else timedelta(0)
+    for limit, counts_ttl, insights_ttl in REFRESH_POLICY:
+        if limit is None or age < limit:
+            return {"meta": None, "counts": counts_ttl, "insights": insights_ttl}
+    raise AssertionError("REFRESH_POLICY 마지막 항목은 상한 None")
+
+
+def _requests_post(data: Dict[str, str]) -> List[Optional[Dict[str, Any]]]:
+    import requests
+
+    response = requests.post(GRAPH_URL, data=data, timeout=REQUEST_TIMEOUT)
+    response.raise_for_status()
+    return response.json()
+
+
+def _body(item: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """batch 응답 항목 → 본문 (실패/타임아웃은 None)"""
+    if not item or item.get("code") != 200:
+        return None
+    try:
+        return json.loads(item.get("body") or "{}")
+    except ValueError:
+        return None
+
+
+def _metric_values(body: Dict[str, Any], total_value: bool = False) -> Dict[str, Any]:
+    values = {}
+    for item in body.get("data", []):
+        if total_value:
+            values[item.get("name")] = item.get("total_value", {}).get("value", 0)
+        elif item.get("values"):
+            values[item.get("name")] = item["values"][-1].get("value", 0)
+    return values
+
+
+def build_post_record(post_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
+    """원시 필드 → 대시보드 인사이트 형태 (engagement / engagement_rate 계산)"""
+    likes = data.get("likes", 0)
+    comments = data.get("comments", 0)
+    saved = data.get("saved", 0)
+    shares = data.get("shares", 0)
+    reach = data.get("reach", 0)
+    engagement = likes + comments + saved + shares
+    return {
+        "post_id": post_id,
+        "likes": likes,
+        "comments": comments,
+        "saved": saved,
+        "shares": shares,
+        # impressions는 reach와 동일하게 처리 (v22.0+ 호환성)
+        "impressions": reach,
+        "reach": reach,
+        "engagement": engagement,
+        "engagement_rate": round(engagement / reach * 100, 2) if reach > 0 else 0,
+        "timestamp": data.get("timestamp"),
+        "permalink": data.get("permalink"),
+        "media_type": data.get("media_type"),
+        "fetched_at": data.get("fetched_at"),
+    }
+
+
+class InsightsCollector:
+    """
+    Instagram 게시물 / 계정 인사이트 수집기
+
+    - refresh_posts(): 갱신 주기가 지난 필드 그룹만 batch 요청 → 게시물별 행 UPSERT
+    - cached(): API 호출 없이 저장된 인사이트 조회
+    - refresh_account(): 계정 정보 + 인사이트 3종을 batch 1회로
+    """
+
+    def __init__(self, access_token: Optional[str] = None, user_id: Optional[str] = None,
+                 db: Optional[StateDB] = None, post: Optional[BatchPost] = None,
+                 max_workers: Optional[int] = None, log: Callable[[str], None] = print):
+        """
+        Args:
+            access_token: Graph API 토큰 (기본: INSTAGRAM_ACCESS_TOKEN)
+            user_id: 비즈니스 계정 ID (기본: INSTAGRAM_BUSINESS_ID / INSTAGRAM_USER_ID)
+            db: 저장 DB (기본: 공용 state.db)
+            post: batch 전송 함수 (기본: requests.post, 테스트 대역 주입용)
+            max_workers: 동시 batch 요청 수
+        """
+        self.access_token = access_token or os.getenv("INSTAGRAM_ACCESS_TOKEN")
+        self.user_id = (user_id or os.getenv("INSTAGRAM_BUSINESS_ID")
+                        or os.getenv("INSTAGRAM_USER_ID") or DEFAULT_USER_ID)
+        self.db = db or get_state_db()
+        self.post = post or _requests_post
+        self.max_workers = max_workers or _env_int("INSIGHTS_MAX_WORKERS", DEFAULT_MAX_WORKERS)
+        self.log = log
+
+    @property
+    def configured(self) -> bool:
+        return bool(self.access_token)
+
+    # ---------- 저장소 ----------
+
+    def _load_rows(self, post_ids: Sequence[str]) -> Dict[str, Dict[str, Any]]:
+        rows = {}
+        for start in range(0, len(post_ids), 500):
+            chunk = list(post_ids[start:start + 500])
+            marks = ",".join("?" * len(chunk))
+            for row in self.db.query(
+                f"SELECT post_id, posted_at, data, fetched FROM instagram_insights WHERE post_id IN ({marks})",
+                chunk,
+            ):
+                rows[row["post_id"]] = {
+                    "posted_at": row["posted_at"],
+                    "data": loads(row["data"], {}),
+                    "fetched": loads(row["fetched"], {}),
+                }
+        return rows
+
+    def _write_rows(self, rows: Dict[str, Dict[str, Any]], now: datetime):
+        with self.db.transaction():
+            for post_id, row in rows.items():
+                posted_at = parse_timestamp(row["data"].get("timestamp") or row.get("posted_at"))
+                ttls = group_ttls(posted_at, now)
+                fetched = {group: parse_timestamp(row["fetched"].get(group)) for group in ttls}
+                expires = [fetched[group] + ttl for group, ttl in ttls.items()
+                           if ttl is not None and fetched[group]]
+                self.db.execute(
+                    """INSERT OR REPLACE INTO instagram_insights
+                       (post_id, posted_at, data, fetched, expires_at, updated_at)
+                       VALUES (?, ?, ?, ?, ?, ?)""",
+                    (post_id, posted_at.isoformat() if posted_at else None, dumps(row["data"]),
+                     dumps(row["fetched"]), min(expires).isoformat() if expires else None,
+                     now.isoformat()),
+                )
+
+    def cached(self, post_ids: Optional[Iterable[str]] = None,
+               limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """저장된 게시물 인사이트 (post_ids 지정 시 그 순서, 아니면 최신 게시물 순)"""
+        if post_ids is not None:
+            post_ids = list(post_ids)
+            rows = self._load_rows(post_ids)
+            records = [build_post_record(pid, rows[pid]["data"]) for pid in post_ids if pid in rows]
+            return records[:limit] if limit else records
+
+        sql = "SELECT post_id, data FROM instagram_insights ORDER BY posted_at DESC, post_id"
+        params: Tuple = ()
+        if limit:
+            sql += " LIMIT ?"
+            params = (limit,)
+        return [build_post_record(row["post_id"], loads(row["data"], {})) for row in self.db.query(sql, params)]
+
+    def last_updated(self) -> Optional[str]:
+        row = self.db.query_one("SELECT MAX(updated_at) AS updated_at FROM instagram_insights")
+        return row["updated_at"] if row else None
+
+    def import_legacy_cache(self, path) -> int:
+        """기존 insights_cache.json ({"posts": {id: 인사이트}}) 최초 1회 가져오기"""
+        def importer(cache: Dict) -> int:
+            rows = {}
+            for post_id, record in (cache.get("posts") or {}).items():
+                fetched_at = record.get("fetched_at")
+                rows[post_id] = {
+                    "posted_at": record.get("timestamp"),
+                    "data": {k: record.get(k) for k in ("likes", "comments", "saved", "shares", "reach",
+                                                        "timestamp", "permalink", "media_type", "fetched_at")
+                             if record.get(k) is not None},
+                    "fetched": {group: fetched_at for group in FIELD_GROUPS} if fetched_at else {},
+                }
+            if rows:
+                self._write_rows(rows, datetime.now())
+            account = cache.get("account")
+            if account and account.get("fetched_at"):
+                self.db.execute(
+                    "INSERT OR REPLACE INTO instagram_account_insights (period, data, fetched_at) VALUES (?, ?, ?)",
+                    (account.get("period", "day"), dumps(account), account["fetched_at"]),
+                )
+            return len(rows)
+
+        return self.db.import_json_once(path, "instagram_insights", importer)
+
+    # ---------- batch ----------
+
+    def _run_batches(self, batches: List[List[Dict[str, str]]]) -> Tuple[List[List[Optional[Dict]]], int]:
+        """batch 여러 개 동시 전송 → (batch별 응답 목록, 실패 batch 수)"""
+        def send(batch):
+            data = {"access_token": self.access_token, "include_headers": "false",
+                    "batch": json.dumps(batch)}
+            try:
+                responses = self.post(data)
+                if not isinstance(responses, list):
+                    raise ValueError(f"batch 응답 형식 오류: {responses!r:.200}")
+                return responses, False
+            except Exception as e:
+                self.log(f"[Insights] batch 요청 실패 ({len(batch)}건): {e}")
+                return [None] * len(batch), True
+
+        if not batches:
+            return [], 0
+        workers = min(self.max_workers, len(batches))
+        if workers == 1:
+            outcomes = [send(batch) for batch in batches]
+        else:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="insights") as pool:
+                outcomes = list(pool.map(send, batches))
+        return [responses for responses, _ in outcomes], sum(failed for _, failed in outcomes)
+
+    # ---------- 게시물 ----------
+
+    def _due_groups(self, row: Optional[Dict[str, Any]], posted_at: Optional[datetime],
+                    now: datetime, force: bool) -> List[str]:
+        if force or row is None:
+            return list(FIELD_GROUPS)
+        due = []
+        for group, ttl in group_ttls(posted_at, now).items():
+            fetched = parse_timestamp(row["fetched"].get(group))
+            if fetched is None or (ttl is not None and now - fetched >= ttl):
+                due.append(group)
+        return due
+
+    def refresh_posts(self, posts: Iterable[Union[str, Dict[str, Any]]],
+                      force: bool = False) -> Dict[str, Any]:
+        """
+        게시물 인사이트 갱신 (주기가 지난 그룹만)
+
+        Args:
+            posts: 게시물 ID 또는 {"id", "timestamp"} dict (미디어 목록 응답 그대로)
+            force: True 면 모든 그룹 재수집
+
+        Returns:
+            {"posts": 입력 순서 인사이트 목록, "updated": 갱신 게시물 수,
+             "skipped": 캐시 유지 수, "requests": 요청 수, "batches": batch 수, "errors": 실패 요청 수}
+        """
+        now = datetime.now()
+        order, listed_at = [], {}
+        for post in posts:
+            post_id = post.get("id") if isinstance(post, dict) else post
+            if post_id and post_id not in listed_at:
+                order.append(post_id)
+                listed_at[post_id] = post.get("timestamp") if isinstance(post, dict) else None
+
+        rows = self._load_rows(order)
+        # 게시물별 요청 묶음 (같은 게시물 요청은 같은 batch 로)
+        plans: List[Tuple[str, List[Tuple[str, str]]]] = []
+        for post_id in order:
+            row = rows.get(post_id)
+            posted_at = parse_timestamp((row or {}).get("data", {}).get("timestamp") or listed_at[post_id])
+            due = self._due_groups(row, posted_at, now, force) if self.configured else []
+            requests_ = []
+            if "meta" in due or "counts" in due:
+                fields = COUNT_FIELDS + ("," + META_FIELDS if "meta" in due else "")
+                requests_.append(("fields", f"{GRAPH_VERSION}/{post_id}?fields={fields}"))
+            if "insights" in due:
+                requests_.append(("insights", f"{GRAPH_VERSION}/{post_id}/insights?metric={INSIGHT_METRICS}"))
+            if requests_:
+                plans.append((post_id, requests_))
+
+        batches: List[List[Dict[str, str]]] = []
+        slots: List[List[Tuple[str, str]]] = []  # batch 별 (post_id, 종류)
+        for post_id, requests_ in plans:
+            if not batches or len(batches[-1]) + len(requests_) > BATCH_LIMIT:
+                batches.append([])
+                slots.append([])
+            for kind, url in requests_:
+                batches[-1].append({"method": "GET", "relative_url": url})
+                slots[-1].append((post_id, kind))
+
+        responses, _ = self._run_batches(batches)
+
+        errors, changed = 0, {}
+        fetched_iso = now.isoformat()
+        for batch_slots, batch_responses in zip(slots, responses):
+            for (post_id, kind), item in zip(batch_slots, batch_responses):
+                body = _body(item)
+                if body is None:
+                    errors += 1
+                    continue
+                row = changed.get(post_id) or rows.get(post_id) or {
+                    "posted_at": listed_at[post_id], "data": {}, "fetched": {}}
+                data, fetched = dict(row["data"]), dict(row["fetched"])
+                if kind == "fields":
+                    data["likes"] = body.get("like_count", 0)
+                    data["comments"] = body.get("comments_count", 0)
+                    fetched["counts"] = fetched_iso
+                    if "timestamp" in body or "permalink" in body:
+                        for key in ("timestamp", "permalink", "media_type"):
+                            data[key] = body.get(key)
+                        fetched["meta"] = fetched_iso
+                else:
+                    values = _metric_values(body)
+                    for key in ("reach", "saved", "shares"):
+                        data[key] = values.get(key, 0)
+                    fetched["insights"] = fetched_iso
+                data["fetched_at"] = fetched_iso
+                changed[post_id] = {"posted_at": row.get("posted_at"), "data": data, "fetched": fetched}
+
+        if changed:
+            self._write_rows(changed, now)
+            rows.update(changed)
+
+        request_count = sum(len(batch) for batch in batches)
+        if request_count:
+            self.log(f"[Insights] {len(changed)}/{len(order)}개 게시물 갱신 "
+                     f"(요청 {request_count}건 / batch {len(batches)}회, 실패 {errors}건)")
+        return {
+            "posts": [build_post_record(pid, rows[pid]["data"]) for pid in order if pid in rows],
+            "updated": len(changed),
+            "skipped": len(order) - len(plans),
+            "requests": request_count,
+            "batches": len(batches),
+            "errors": errors,
+        }
+
+    # ---------- 계정 ----------
+
+    def cached_account(self, period: str = "day") -> Optional[Dict[str, Any]]:
+        row = self.db.query_one("SELECT data FROM instagram_account_insights WHERE period = ?", (period,))
+        return loads(row["data"]) if row else None
+
+    def refresh_account(self, period: str = "day", max_age: Optional[timedelta] = timedelta(hours=1),
+                        force: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        계정 인사이트 (계정 정보 / reach / total_value 메트릭을 batch 1회로)
+
+        Args:
+            period: "day", "week", "days_28"
+            max_age: 이 시간 안에 수집한 값이 있으면 API 호출 생략
+        """
+        cached = self.cached_account(period)
+        if cached and not force and max_age is not None:
+            fetched = parse_timestamp(cached.get("fetched_at"))
+            if fetched and datetime.now() - fetched < max_age:
+                return cached
+        if not self.configured or not self.user_id:
+            return cached
+
+        api_period = period if period in ("day", "week", "days_28") else "day"
+        base = f"{GRAPH_VERSION}/{self.user_id}"
+        batch = [
+            {"method": "GET", "relative_url":
+                f"{base}?fields=id,username,followers_count,follows_count,media_count,profile_picture_url,biography"},
+            # reach는 period 기반 메트릭
+            {"method": "GET", "relative_url": f"{base}/insights?metric=reach&period={api_period}"},
+            # profile_views, accounts_engaged, total_interactions는 total_value 메트릭
+            {"method": "GET", "relative_url":
+                f"{base}/insights?metric=profile_views,accounts_engaged,total_interactions"
+                f"&metric_type=total_value&period={api_period}"},
+        ]
+        (responses,), failed = self._run_batches([batch])
+        if failed:
+            return cached
+
+        # 계정 정보 실패 (토큰 만료 / 권한 / 한도) → 0 으로 덮어쓰지 않고 이전 값 유지
+        account = _body(responses[0])
+        if account is None:
+            self.log(f"[Insights] 계정 정보 조회 실패 (code={(responses[0] or {}).get('code')}) → 이전 값 유지")
+            return cached
+        # insights 하위 요청이 실패한 메트릭은 이전 값 유지
+        insights = {key: (cached or {}).get(key, 0) for key in ACCOUNT_METRICS}
+        for item, total_value in ((responses[1], False), (responses[2], True)):
+            body = _body(item)
+            if body is not None:
+                insights.update(_metric_values(body, total_value=total_value))
+        result = {
+            "user_id": self.user_id,
+            "username": account.get("username", ""),
+            "followers_count": account.get("followers_count", 0),
+            "follows_count": account.get("follows_count", 0),
+            "media_count": account.get("media_count", 0),
+            "profile_picture_url": account.get("profile_picture_url", ""),
+            "biography": account.get("biography", ""),
+            "reach": insights.get("reach", 0),
+            "profile_views": insights.get("profile_views", 0),
+            "accounts_engaged": insights.get("accounts_engaged", 0),
+            "total_interactions": insights.get("total_interactions", 0),
+            "period": period,
+            "fetched_at": datetime.now().isoformat(),
+        }
+        self.db.execute(
+            "INSERT OR REPLACE INTO instagram_account_insights (period, data, fetched_at) VALUES (?, ?, ?)",
+            (period, dumps(result), result["fetched_at"]),
+        )
+        return result
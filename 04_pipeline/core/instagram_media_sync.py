@@ -0,0 +1,411 @@
+#!/usr/bin/env python3
+"""
+instagram_media_sync.py - Instagram 미디어 목록 증분 동기화
+
+sync_loop / sync_from_instagram / sync_instagram_to_local / fetch_instagram_posts 공용:
+- /media 목록을 paging.next 커서 끝까지 따라감 (100개 초과 게시물 누락 방지)
+- 로컬 인덱스 (core.state_db instagram_media, 미디어 1개 = 1행)
+- 증분 동기화: 최신 게시물부터 읽다가 이미 아는 미디어가 나온 페이지에서 중단
+  → 평소 실행은 API 호출 1회 (새 게시물 수 / 페이지 크기 만큼만 추가)
+- 전체 동기화: 인덱스가 비었거나 마지막 전체 동기화가 오래되면 (기본 7일)
+  전체 목록을 다시 읽어 캡션 수정 / 삭제된 게시물까지 반영
+- 중간 페이지 실패 시 아무것도 기록하지 않음 (high-water mark 뒤 누락 방지)
+
+사용법:
+    sync = MediaSync()
+    sync.sync()                 # 증분 (필요 시 자동 전체)
+    for media in sync.media():  # 최신순 {"id", "caption", "timestamp", "permalink", "media_type"}
+        ...
+    sync.posted_records()       # [{"media_id", "food_id", "posted_id", "posted_at", ...}]
+
+환경 변수:
+    INSTAGRAM_FULL_SYNC_DAYS=7     전체 동기화 주기 (일)
+"""
+
+import os
+import re
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Set
+
+try:
+    from .state_db import StateDB, dumps, get_state_db, loads
+except ImportError:
+    from core.state_db import StateDB, dumps, get_state_db, loads
+
+GRAPH_URL = "https://graph.facebook.com"
+GRAPH_VERSION = "v21.0"
+MEDIA_FIELDS = "id,caption,timestamp,permalink,media_type"
+FULL_PAGE_SIZE = 100
+INCREMENTAL_PAGE_SIZE = 25
+REQUEST_TIMEOUT = 30
+DEFAULT_FULL_SYNC_DAYS = 7
+
+LAST_FULL_SYNC_KEY = "instagram_media:last_full_sync"
+LAST_SYNC_KEY = "instagram_media:last_sync"
+
+# (url, params) → 응답 JSON
+Get = Callable[[str, Optional[Dict[str, Any]]], Dict[str, Any]]
+
+
+# 음식명 매핑 (캡션 → food_id)
+FOOD_MAPPING = {
+    # 과일
+    'apple': 'apple', '사과': 'apple',
+    'banana': 'banana', '바나나': 'banana',
+    'blueberry': 'blueberry', 'blueberries': 'blueberry', '블루베리': 'blueberry',
+    'cherry': 'cherry', 'cherries': 'cherry', '체리': 'cherry',
+    'grape': 'grape', '포도': 'grape',
+    'kiwi': 'kiwi', '키위': 'kiwi',
+    'mango': 'mango', '망고': 'mango',
+    'orange': 'orange', '오렌지': 'orange',
+    'papaya': 'papaya', '파파야': 'papaya',
+    'peach': 'peach', '복숭아': 'peach',
+    'pear': 'pear', '배': 'pear',
+    'pineapple': 'pineapple', '파인애플': 'pineapple',
+    'strawberry': 'strawberry', '딸기': 'strawberry',
+    'watermelon': 'watermelon', '수박': 'watermelon',
+
+    # 채소
+    'avocado': 'avocado', '아보카도': 'avocado',
+    'broccoli': 'broccoli', '브로콜리': 'broccoli',
+    'carrot': 'carrot', '당근': 'carrot',
+    'celery': 'celery', '셀러리': 'celery',
+    'cucumber': 'cucumber', '오이': 'cucumber',
+    'kale': 'kale', '케일': 'kale',
+    'olive': 'olive', '올리브': 'olive',
+    'pumpkin': 'pumpkin', '호박': 'pumpkin',
+    'spinach': 'spinach', '시금치': 'spinach',
+    'sweet potato': 'sweet_potato', '고구마': 'sweet_potato',
+    'zucchini': 'zucchini', '애호박': 'zucchini',
+
+    # 단백질
+    'beef': 'beef', '소고기': 'beef',
+    'boiled egg': 'boiled_egg', '삶은 달걀': 'boiled_egg', '삶은달걀': 'boiled_egg',
+    'chicken': 'chicken', '닭고기': 'chicken',
+    'salmon': 'salmon', '연어': 'salmon',
+    'shrimp': 'shrimp', '새우': 'shrimp',
+    'tuna': 'tuna', '참치': 'tuna',
+    'samgyeopsal': 'samgyeopsal', '삼겹살': 'samgyeopsal',
+    'yangnyeom chicken': 'yangnyeom_chicken', '양념치킨': 'yangnyeom_chicken',
+
+    # 가공식품/기타
+    'budweiser': 'budweiser', '버드와이저': 'budweiser',
+    'coca cola': 'coca_cola', 'cola': 'coca_cola', '콜라': 'coca_cola',
+    'ice cream': 'icecream', 'icecream': 'icecream', '아이스크림': 'icecream',
+    'kitkat': 'kitkat', '킷캣': 'kitkat',
+    'pasta': 'pasta', '파스타': 'pasta',
+    'pringles': 'pringles', '프링글스': 'pringles',
+    'rice': 'rice', '쌀': 'rice', '밥': 'rice',
+    'sausage': 'sausage', '소시지': 'sausage',
+}
+
+
+# 한글 음식명 뒤에 붙어도 같은 단어로 보는 조사
+KOREAN_PARTICLES = "은|는|이|가|을|를|도|와|과|의|랑"
+
+
+def _caption_pattern(key: str) -> "re.Pattern":
+    """음식명 단어 경계 패턴 (appears → pear, 양배추 → 배 같은 부분 일치 방지)"""
+    if re.search(r'[가-힣]', key):
+        return re.compile(rf'(?<![가-힣]){re.escape(key)}(?:{KOREAN_PARTICLES})?(?![가-힣])')
+    return re.compile(rf'\b{re.escape(key)}\b')
+
+
+_CAPTION_PATTERNS = [(key, _caption_pattern(key))
+                     for key in sorted(FOOD_MAPPING.keys(), key=len, reverse=True)]
+
+
+def food_id_from_caption(caption: str) -> str:
+    """
+    캡션에서 food_id 추출 (첫 줄만 검사, 추정값)
+
+    음식명이 단어 단위로 나와야 일치 (긴 이름 우선, 긴 이름 안의 짧은 이름은 무시)
+    서로 다른 음식이 둘 이상이면 'unknown'
+    """
+    if not caption:
+        return 'unknown'
+
+    # 첫 줄만 추출
+    first_line = caption.split('\n')[0].strip().lower()
+
+    # 이모지 및 특수문자 제거
+    clean_line = re.sub(r'[^\w\s가-힣]', ' ', first_line)
+    clean_line = ' '.join(clean_line.split())
+
+    claimed = []
+    found = set()
+    for key, pattern in _CAPTION_PATTERNS:
+        for match in pattern.finditer(clean_line):
+            start, end = match.span()
+            if any(start < c_end and c_start < end for c_start, c_end in claimed):
+                continue
+            claimed.append((start, end))
+            found.add(FOOD_MAPPING[key])
+
+    return found.pop() if len(found) == 1 else 'unknown'
+
+
+def shortcode_from_permalink(permalink: str) -> str:
+    """permalink에서 shortcode 추출"""
+    # https://www.instagram.com/p/DUPHwxiUT7/ → DUPHwxiUT7
+    if not permalink:
+        return ''
+
+    match = re.search(r'/p/([A-Za-z0-9_-]+)', permalink)
+    if match:
+        return match.group(1)
+    return ''
+
+
+def posted_records(raw_posts: list, log: Callable[[str], None] = print) -> list:
+    """미디어 목록 → 게시 레코드 (food_id / shortcode / posted_id, instagram_posts.json 형식)"""
+
+    result = []
+
+    for post in raw_posts:
+        caption = post.get('caption', '')
+        permalink = post.get('permalink', '')
+
+        food_id = food_id_from_caption(caption)
+        shortcode = shortcode_from_permalink(permalink)
+
+        if food_id == 'unknown':
+            log(f"  ⚠️ 음식 식별 불가: {caption[:50]}...")
+            continue
+
+        posted_id = f"{food_id}__{shortcode}" if shortcode else food_id
+
+        # timestamp 파싱
+        timestamp = post.get('timestamp', '')
+        posted_at = timestamp[:10] if timestamp else ''
+
+        result.append({
+            'media_id': post.get('id', ''),
+            'food_id': food_id,
+            'shortcode': shortcode,
+            'posted_id': posted_id,
+            'posted_at': posted_at,
+            'permalink': permalink,
+            'caption_preview': caption[:100] if caption else ''
+        })
+
+    return result
+
+
+def match_known_media(media: List[Dict[str, Any]], known_media: Dict[str, str],
+                      log: Callable[[str], None] = print) -> Set[str]:
+    """
+    미디어 목록 → 게시된 food_id 집합 (Instagram SSOT 용)
+
+    로컬 기록(metadata.json / publishing_history)의 media_id → food_id 와 일치하는 미디어만 포함
+    캡션 추정은 판정에 쓰지 않고, 일치하지 않는 미디어는 로그로만 남김
+    """
+    food_ids = set()
+    unmatched = []
+    for item in media:
+        food_id = known_media.get(str(item.get('id', '')))
+        if food_id:
+            food_ids.add(food_id.lower())
+        else:
+            unmatched.append(f"{item.get('id', '')}({food_id_from_caption(item.get('caption', ''))}?)")
+    if unmatched:
+        preview = ", ".join(unmatched[:5]) + (" …" if len(unmatched) > 5 else "")
+        log(f"  ℹ️ 로컬 기록과 일치하지 않는 게시물 {len(unmatched)}건 (posted 판정 제외): {preview}")
+    return food_ids
+
+
+class MediaSyncError(Exception):
+    """Instagram 미디어 목록 조회 실패"""
+    pass
+
+
+def _requests_get(url: str, params: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    import requests
+
+    response = requests.get(url, params=params, timeout=REQUEST_TIMEOUT)
+    try:
+        data = response.json()
+    except ValueError:
+        raise MediaSyncError(f"Instagram API 응답 오류: {response.status_code}")
+    if response.status_code != 200 and "error" not in data:
+        raise MediaSyncError(f"Instagram API 오류: {response.status_code}")
+    return data
+
+
+def _full_sync_days() -> float:
+    try:
+        return float(os.getenv("INSTAGRAM_FULL_SYNC_DAYS", DEFAULT_FULL_SYNC_DAYS))
+    except ValueError:
+        return DEFAULT_FULL_SYNC_DAYS
+
+
+class MediaSync:
+    """
+    Instagram 미디어 인덱스 동기화
+
+    - sync(): 커서 페이지네이션 + 증분/전체 판단, 결과 요약 dict 반환
+    - media() / media_ids() / high_water_mark(): 인덱스 조회 (API 호출 없음)
+    - fetch_media(): 미디어 1개 최신 조회 (만료되는 media_url / children 용)
+    """
+
+    def __init__(self, access_token: Optional[str] = None, account_id: Optional[str] = None,
+                 db: Optional[StateDB] = None, get: Optional[Get] = None,
+                 fields: str = MEDIA_FIELDS, log: Callable[[str], None] = print):
+        """
+        Args:
+            access_token: Graph API 토큰 (기본: INSTAGRAM_ACCESS_TOKEN)
+            account_id: 비즈니스 계정 ID (기본: INSTAGRAM_BUSINESS_ACCOUNT_ID / INSTAGRAM_BUSINESS_ID)
+            db: 인덱스 DB (기본: 공용 state.db)
+            get: GET 함수 (기본: requests.get, 테스트 대역 주입용)
+        """
+        self.access_token = access_token or os.getenv("INSTAGRAM_ACCESS_TOKEN")
+        self.account_id = (account_id or os.getenv("INSTAGRAM_BUSINESS_ACCOUNT_ID")
+                           or os.getenv("INSTAGRAM_BUSINESS_ID"))
+        self.db = db or get_state_db()
+        self.get = get or _requests_get
+        self.fields = fields
+        self.log = log
+
+    @property
+    def configured(self) -> bool:
+        return bool(self.access_token and self.account_id)
+
+    # ---------- 상태 ----------
+
+    def _state(self, key: str) -> Optional[str]:
+        row = self.db.query_one("SELECT value FROM sync_state WHERE key = ?", (key,))
+        return row["value"] if row else None
+
+    def _set_state(self, key: str, value: str):
+        self.db.execute("INSERT OR REPLACE INTO sync_state (key, value) VALUES (?, ?)", (key, value))
+
+    def needs_full_sync(self) -> bool:
+        last = self._state(LAST_FULL_SYNC_KEY)
+        if not last or not self.db.query_one("SELECT 1 FROM instagram_media LIMIT 1"):
+            return True
+        try:
+            return datetime.now() - datetime.fromisoformat(last) >= timedelta(days=_full_sync_days())
+        except ValueError:
+            return True
+
+    # ---------- 조회 ----------
+
+    def media(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """인덱스 미디어 목록 (최신순)"""
+        sql = "SELECT data FROM instagram_media ORDER BY timestamp DESC, media_id DESC"
+        params = ()
+        if limit:
+            sql += " LIMIT ?"
+            params = (limit,)
+        return [loads(row["data"], {}) for row in self.db.query(sql, params)]
+
+    def posted_records(self) -> List[Dict[str, Any]]:
+        """인덱스 미디어 → 게시 레코드 (food_id 식별된 것만, 최신순)"""
+        return posted_records(self.media(), log=lambda msg: None)
+
+    def media_ids(self) -> Set[str]:
+        return {row["media_id"] for row in self.db.query("SELECT media_id FROM instagram_media")}
+
+    def high_water_mark(self) -> Optional[Dict[str, str]]:
+        """가장 최근 미디어 {"id", "timestamp"} (인덱스가 비었으면 None)"""
+        row = self.db.query_one(
+            "SELECT media_id, timestamp FROM instagram_media ORDER BY timestamp DESC, media_id DESC LIMIT 1")
+        return {"id": row["media_id"], "timestamp": row["timestamp"]} if row else None
+
+    def last_synced(self) -> Optional[str]:
+        return self._state(LAST_SYNC_KEY)
+
+    # ---------- API ----------
+
+    def _pages(self, page_size: int):
+        """/media 페이지 순회 (paging.next 커서)"""
+        url = f"{GRAPH_URL}/{GRAPH_VERSION}/{self.account_id}/media"
+        params = {"access_token": self.access_token, "fields": self.fields, "limit": page_size}
+        while url:
+            data = self.get(url, params)
+            if "error" in data:
+                raise MediaSyncError(f"Instagram API 오류: {data['error'].get('message', 'Unknown error')}")
+            yield data.get("data", [])
+            url = data.get("paging", {}).get("next")
+            params = None  # 다음 페이지 URL에 이미 파라미터 포함
+
+    def fetch_media(self, media_id: str, fields: str = "id,media_type,media_url,children{media_url,media_type}"
+                    ) -> Optional[Dict[str, Any]]:
+        """미디어 1개 최신 조회 (실패 시 None)"""
+        if not self.access_token:
+            return None
+        try:
+            data = self.get(f"{GRAPH_URL}/{GRAPH_VERSION}/{media_id}",
+                            {"access_token": self.access_token, "fields": fields})
+        except Exception as e:
+            self.log(f"  ⚠️ 미디어 조회 실패 ({media_id}): {e}")
+            return None
+        return None if "error" in data else data
+
+    # ---------- 동기화 ----------
+
+    def sync(self, full: Optional[bool] = None) -> Dict[str, Any]:
+        """
+        인덱스 동기화
+
+        Args:
+            full: True=전체, False=증분, None=자동 (인덱스 비었음 / 전체 주기 경과 시 전체)
+
+        Returns:
+            {"full", "pages", "fetched", "new", "updated", "removed", "total"}
+
+        Raises:
+            MediaSyncError: API 오류 (이 경우 인덱스는 변경되지 않음)
+        """
+        if not self.configured:
+            raise MediaSyncError("Instagram API 환경변수 미설정")
+        if full is None:
+            full = self.needs_full_sync()
+
+        known = self.media_ids()
+        fetched: Dict[str, Dict[str, Any]] = {}
+        pages = 0
+        for page in self._pages(FULL_PAGE_SIZE if full else INCREMENTAL_PAGE_SIZE):
+            pages += 1
+            for media in page:
+                if media.get("id"):
+                    fetched.setdefault(media["id"], media)
+            # 증분: 페이지 마지막(가장 오래된) 미디어를 이미 알면 이후는 모두 기존 게시물
+            if not full and page and page[-1].get("id") in known:
+                break
+
+        now = datetime.now().isoformat()
+        new = [mid for mid in fetched if mid not in known]
+        removed = sorted(known - set(fetched)) if full else []
+        with self.db.transaction():
+            self.db.executemany(
+                "INSERT OR REPLACE INTO instagram_media (media_id, timestamp, data, synced_at) VALUES (?, ?, ?, ?)",
+                [(mid, media.get("timestamp"), dumps(media), now) for mid, media in fetched.items()],
+            )
+            if removed:
+                self.db.executemany("DELETE FROM instagram_media WHERE media_id = ?", [(mid,) for mid in removed])
+            self._set_state(LAST_SYNC_KEY, now)
+            if full:
+                self._set_state(LAST_FULL_SYNC_KEY, now)
+
+        total = self.db.query_one("SELECT COUNT(*) AS n FROM instagram_media")["n"]
+        result = {
+            "full": full,
+            "pages": pages,
+            "fetched": len(fetched),
+            "new": len(new),
+            "updated": len(fetched) - len(new),
+            "removed": len(removed),
+            "total": total,
+        }
+        self.log(f"  📸 Instagram 미디어 {'전체' if full else '증분'} 동기화: "
+                 f"신규 {len(new)}개, 삭제 {len(removed)}개, 총 {total}개 (페이지 {pages}회)")
+        return result
+
+    def sync_safe(self, full: Optional[bool] = None) -> Optional[Dict[str, Any]]:
+        """sync() 실패 시 로그만 남기고 None (기존 인덱스로 계속 진행)"""
+        try:
+            return self.sync(full)
+        except Exception as e:
+            self.log(f"  ⚠️ Instagram 미디어 동기화 실패 (기존 인덱스 사용): {e}")
+            return None
@@ -974,6 +974,12 @@ class SunshinePipelineV5:
                     gate_score.feedback,
                     gate_score.issues
                 )
+                if agent_key == "image":
+                    # 실패 슬라이드만 새 seed 로 재생성 (나머지는 생성 캐시 적중)
+                    regenerate = self._slides_to_regenerate(agent_result.data)
+                    current_input["_regenerate"] = regenerate
+                    current_input["_attempt"] = attempt + 1
+                    print(f"   🎯 재생성 대상 슬라이드: {regenerate}")
                 print(f"   🔧 피드백 반영 후 재시도...")
 
         # 최대 시도 후에도 실패
@@ -1003,6 +1009,21 @@ class SunshinePipelineV5:
         }
         return enhanced_input
 
+    @staticmethod
+    def _slides_to_regenerate(image_data: Dict) -> List[int]:
+        """
+        G2 재시도 대상 슬라이드 index
+
+        - 생성 실패/파일 누락 슬라이드만 (나머지는 캐시 재사용)
+        - 전부 정상인데 점수 미달이면 전체 (같은 seed 면 같은 이미지라 재시도 의미 없음)
+        """
+        images = [img for img in (image_data or {}).get("images", []) if isinstance(img, dict)]
+        missing = [
+            img["index"] for img in images
+            if "index" in img and (not img.get("exists") or not Path(img.get("path") or "").is_file())
+        ]
+        return missing or [img["index"] for img in images if "index" in img]
+
     def _create_failure_result(self, gate_name: str, retry_result: RetryResult) -> Dict:
         """실패 결과 생성"""
         return {
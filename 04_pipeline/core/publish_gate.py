@@ -17,10 +17,13 @@ PD 승인 없이 게시 불가
    Instagram API > Sheets > Local metadata > Folder
 """
 
+import copy
 import json
 from pathlib import Path
 from datetime import datetime
 
+from core.content_catalog import get_catalog
+
 PROJECT_ROOT = Path(__file__).parent.parent
 
 
@@ -30,7 +33,7 @@ class BlockedError(Exception):
 
 
 def get_content_metadata(food_id: str) -> dict | None:
-    """콘텐츠 메타데이터 로드 (v2: contents/ + metadata.json)"""
+    """콘텐츠 메타데이터 로드 (v2: contents/ + metadata.json, 콘텐츠 카탈로그 조회)"""
     import re
 
     # v2: contents/ 폴더
@@ -38,19 +41,11 @@ def get_content_metadata(food_id: str) -> dict | None:
     if not images_dir.exists():
         return None
 
-    # 폴더 찾기
+    # 폴더 찾기 (metadata.json / v1 {food_id}_00_metadata.json 은 카탈로그가 읽어 둠)
     pattern = re.compile(rf'^\d{{3}}_{food_id}_')
-    for folder in images_dir.iterdir():
-        if folder.is_dir() and pattern.match(folder.name):
-            # v2: metadata.json
-            metadata_file = folder / "metadata.json"
-            # v1 호환: {food_id}_00_metadata.json
-            if not metadata_file.exists():
-                v1_file = folder / f"{food_id}_00_metadata.json"
-                if v1_file.exists():
-                    metadata_file = v1_file
-            if metadata_file.exists():
-                return json.loads(metadata_file.read_text())
+    for entry in get_catalog(images_dir).find_all(food_id, locations=[""]):
+        if pattern.match(entry.name) and entry.metadata:
+            return copy.deepcopy(entry.metadata)
     return None
 
 
@@ -87,6 +82,7 @@ def update_content_metadata(food_id: str, updates: dict) -> bool:
 
             # 저장
             metadata_file.write_text(json.dumps(metadata, indent=2, ensure_ascii=False))
+            get_catalog(images_dir).invalidate(metadata_file)
             return True
 
     return False
@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+render_worker.py - 상주 Puppeteer 렌더 워커 클라이언트
+
+TextOverlayAgent / TextOverlayCrew 공용:
+- 05_services/scripts/render_server.js 를 한 번 띄워 두고 재사용
+  → 콘텐츠마다 node + Chromium 콜드 스타트 비용 없음
+- stdin/stdout 줄 단위 JSON 프로토콜 (요청 id 로 응답 매칭)
+- 요청 1건에 슬라이드 여러 장, 슬라이드별 소요 시간(ms) 반환
+- 워커 프로세스가 죽으면 자동 재시작 후 해당 요청 1회 재시도
+- 동기 호출 (render) / async 호출 (render_async, 이벤트 루프 비차단) 모두 지원
+
+사용법:
+    worker = get_render_worker()
+    results = await worker.render_async([
+        SlideJob(html=cover_html, output="/abs/apple_00.png"),
+        SlideJob(html=body_html, output="/abs/apple_01.png"),
+    ])
+    [r.ms for r in results]
+
+환경 변수:
+    RENDER_WORKER_PAGES=4          워커 동시 렌더링 페이지 수
+    RENDER_WORKER_TIMEOUT=120      요청 1건 응답 대기 (초)
+"""
+
+import os
+import json
+import atexit
+import asyncio
+import itertools
+import subprocess
+import threading
+from collections import deque
+from concurrent.futures import Future, TimeoutError as FutureTimeout
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+RENDER_SERVER_JS = PROJECT_ROOT / "05_services" / "scripts" / "render_server.js"
+
+START_TIMEOUT = 60.0
+DEFAULT_REQUEST_TIMEOUT = 120.0
+MAX_RESTARTS = 3
+
+
+class RenderWorkerError(RuntimeError):
+    """워커 실행/통신 실패 (node 없음, 브라우저 실행 실패, 프로세스 종료, 타임아웃)"""
+
+
+class RenderWorkerTimeout(RenderWorkerError):
+    """요청 응답 타임아웃 (재시도하지 않음)"""
+
+
+@dataclass
+class SlideJob:
+    """렌더링 1장 (html 또는 html_path, output 은 절대 경로)"""
+    output: str
+    html: Optional[str] = None
+    html_path: Optional[str] = None
+    width: int = 1080
+    height: int = 1080
+
+    def to_dict(self) -> Dict:
+        data = {"output": str(Path(self.output).resolve()), "width": self.width, "height": self.height}
+        if self.html_path:
+            data["html_path"] = str(Path(self.html_path).resolve())
+        else:
+            data["html"] = self.html or ""
+        return data
+
+
+@dataclass
+class SlideRender:
+    """렌더링 결과 (ms: 슬라이드 소요 시간)"""
+    output: str
+    ok: bool
+    ms: int = 0
+    error: Optional[str] = None
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, default))
+    except ValueError:
+        return default
+
+
+class RenderWorker:
+    """
+    상주 렌더 워커 관리자
+
+    - command: 워커 실행 명령 (기본: node render_server.js)
+    - request_timeout: 요청 응답 대기 (초)
+    - max_restarts: 연속 자동 재시작 허용 횟수 (초과 시 RenderWorkerError, 렌더 성공 시 초기화)
+    """
+
+    def __init__(self, command: Optional[Sequence[str]] = None, cwd: Optional[Path] = None,
+                 env: Optional[Dict[str, str]] = None, request_timeout: Optional[float] = None,
+                 start_timeout: float = START_TIMEOUT, max_restarts: int = MAX_RESTARTS):
+        self.command = list(command or ["node", str(RENDER_SERVER_JS)])
+        self.cwd = Path(cwd or RENDER_SERVER_JS.parent)
+        self.env = env
+        self.request_timeout = request_timeout or _env_float("RENDER_WORKER_TIMEOUT", DEFAULT_REQUEST_TIMEOUT)
+        self.start_timeout = start_timeout
+        self.max_restarts = max_restarts
+        self.restarts = 0
+        self.stats = {"requests": 0, "slides": 0, "starts": 0}
+
+        self._process: Optional[subprocess.Popen] = None
+        self._ready: Optional[Future] = None
+        self._pending: Dict[int, Tuple[subprocess.Popen, Future]] = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.RLock()
+        self._stderr_tail: deque = deque(maxlen=20)
+
+    # ---------- 프로세스 ----------
+
+    @property
+    def running(self) -> bool:
+        return self._process is not None and self._process.poll() is None
+
+    def start(self):
+        """워커 실행 후 ready 메시지 대기"""
+        with self._lock:
+            if self.running:
+                return
+            self._ready = Future()
+            try:
+                self._process = subprocess.Popen(
+                    self.command,
+                    cwd=str(self.cwd),
+                    env=dict(os.environ, **(self.env or {})),
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    text=True,
+                    encoding="utf-8",
+                    bufsize=1,
+                )
+            except OSError as e:
+                self._process = None
+                raise RenderWorkerError(f"렌더 워커 실행 실패: {e}") from e
+            self.stats["starts"] += 1
+            process = self._process
+            threading.Thread(target=self._read_stdout, args=(process, self._ready), daemon=True,
+                             name="render-worker-stdout").start()
+            threading.Thread(target=self._read_stderr, args=(process,), daemon=True,
+                             name="render-worker-stderr").start()
+            ready = self._ready
+
+        try:
+            message = ready.result(timeout=self.start_timeout)
+        except FutureTimeout:
+            self.close()
+            raise RenderWorkerError(f"렌더 워커 시작 타임아웃 ({self.start_timeout:.0f}초)")
+        except RenderWorkerError:
+            self.close()
+            raise
+        if not message.get("ready"):
+            self.close()
+            raise RenderWorkerError(message.get("error") or "렌더 워커 시작 실패")
+
+    def _read_stdout(self, process: subprocess.Popen, ready: Future):
+        for line in process.stdout:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                message = json.loads(line)
+            except ValueError:
+                self._stderr_tail.append(line)
+                continue
+            if "ready" in message:
+                if not ready.done():
+                    ready.set_result(message)
+                continue
+            with self._lock:
+                _, future = self._pending.pop(message.get("id"), (None, None))
+            if future is not None and not future.done():
+                future.set_result(message)
+
+        # EOF: 프로세스 종료 → 이 프로세스에 보낸 요청 모두 실패 처리
+        process.wait()
+        error = RenderWorkerError(self._exit_message(process))
+        with self._lock:
+            orphaned = [rid for rid, (owner, _) in self._pending.items() if owner is process]
+            futures = [self._pending.pop(rid)[1] for rid in orphaned]
+        for future in futures:
+            if not future.done():
+                future.set_exception(error)
+        if not ready.done():
+            ready.set_exception(error)
+
+    def _read_stderr(self, process: subprocess.Popen):
+        for line in process.stderr:
+            self._stderr_tail.append(line.rstrip())
+
+    def _exit_message(self, process: subprocess.Popen) -> str:
+        tail = " | ".join(list(self._stderr_tail)[-3:])
+        return f"렌더 워커 종료 (exit {process.returncode})" + (f": {tail}" if tail else "")
+
+    def _ensure_running(self):
+        with self._lock:
+            if self.running:
+                return
+            if self._process is not None:
+                # 비정상 종료 → 재시작
+                if self.restarts >= self.max_restarts:
+                    raise RenderWorkerError(f"렌더 워커 재시작 한도 초과 ({self.max_restarts}회)")
+                self.restarts += 1
+                self._process = None
+        self.start()
+
+    def close(self, timeout: float = 5.0):
+        """워커 종료 (shutdown 요청 → 대기 → kill)"""
+        with self._lock:
+            process, self._process = self._process, None
+        if process is None:
+            return
+        if process.poll() is None:
+            try:
+                process.stdin.write(json.dumps({"id": 0, "op": "shutdown"}) + "\n")
+                process.stdin.flush()
+                process.stdin.close()
+                process.wait(timeout=timeout)
+            except (OSError, ValueError, subprocess.TimeoutExpired):
+                process.kill()
+                process.wait()
+
+    # ---------- 요청 ----------
+
+    def request(self, payload: Dict, timeout: Optional[float] = None) -> Dict:
+        """요청 1건 전송 후 응답 대기 (워커 없으면 시작)"""
+        self._ensure_running()
+        future: Future = Future()
+        with self._lock:
+            request_id = next(self._ids)
+            process = self._process
+            self._pending[request_id] = (process, future)
+            try:
+                process.stdin.write(json.dumps(dict(payload, id=request_id), ensure_ascii=False) + "\n")
+                process.stdin.flush()
+            except (OSError, ValueError, AttributeError) as e:
+                self._pending.pop(request_id, None)
+                raise RenderWorkerError(f"렌더 워커 전송 실패: {e}") from e
+        try:
+            return future.result(timeout=timeout or self.request_timeout)
+        except FutureTimeout:
+            with self._lock:
+                self._pending.pop(request_id, None)
+            # 응답 없는 워커는 정리 (다음 요청에서 재시작)
+            self._kill(process)
+            raise RenderWorkerTimeout(f"렌더 워커 응답 타임아웃 ({timeout or self.request_timeout:.0f}초)")
+
+    def _kill(self, process: subprocess.Popen):
+        if process.poll() is None:
+            process.kill()
+            process.wait()
+
+    def ping(self) -> Dict:
+        return self.request({"op": "ping"}, timeout=10)
+
+    def render(self, slides: Sequence[SlideJob], timeout: Optional[float] = None) -> List[SlideRender]:
+        """
+        슬라이드 일괄 렌더링 (입력 순서대로 결과)
+
+        워커가 도중에 죽으면 재시작 후 1회 재시도, 그래도 실패하면 RenderWorkerError
+        (응답 타임아웃은 워커만 정리하고 재시도하지 않음)
+        """
+        if not slides:
+            return []
+        payload = {"op": "render", "slides": [s.to_dict() for s in slides]}
+        try:
+            response = self.request(payload, timeout)
+        except RenderWorkerTimeout:
+            raise
+        except RenderWorkerError:
+            if self.running or self._process is None:
+                raise
+            response = self.request(payload, timeout)
+
+        if "results" not in response:
+            raise RenderWorkerError(response.get("error") or "렌더 응답 형식 오류")
+        self.restarts = 0
+        self.stats["requests"] += 1
+        self.stats["slides"] += len(slides)
+        return [
+            SlideRender(output=r.get("output", ""), ok=bool(r.get("ok")), ms=int(r.get("ms", 0)),
+                        error=r.get("error"))
+            for r in response["results"]
+        ]
+
+    async def render_async(self, slides: Sequence[SlideJob],
+                           timeout: Optional[float] = None) -> List[SlideRender]:
+        """이벤트 루프를 막지 않는 렌더링 (스레드에서 render 실행)"""
+        return await asyncio.to_thread(self.render, list(slides), timeout)
+
+
+_default_worker: Optional[RenderWorker] = None
+_default_lock = threading.Lock()
+
+
+def get_render_worker() -> RenderWorker:
+    """프로세스 공용 워커 (첫 렌더링 때 시작, 인터프리터 종료 시 정리)"""
+    global _default_worker
+    with _default_lock:
+        if _default_worker is None:
+            _default_worker = RenderWorker()
+            atexit.register(_default_worker.close)
+        return _default_worker
@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+"""
+state_db.py - 공용 SQLite 상태 저장소 (WAL)
+
+StateStore / MetricsCollector / ErrorAggregator / APIUsageTracker /
+RetryManager / ABTestManager / InsightsCollector / MediaSync 공용 저장 계층:
+- JSON 문서 전체 재직렬화 대신 테이블 단위 INSERT / UPSERT
+  → 이벤트 1건 쓰기 비용 O(1) (누적 이력 크기와 무관)
+- WAL 모드 + busy_timeout → 야간 워커 / 봇 / 대시보드 동시 접근 시 덮어쓰기 없음
+- 읽기-수정-쓰기는 BEGIN IMMEDIATE 트랜잭션 (transaction())
+- 기존 JSON 파일은 최초 1회만 가져오기 (import_json_once, json_imports 테이블에 기록)
+
+사용법:
+    db = get_state_db()
+    with db.transaction():
+        db.execute("INSERT INTO error_records (...) VALUES (...)", params)
+    rows = db.query("SELECT * FROM pipeline_states WHERE status = ?", ("failed",))
+
+환경 변수:
+    SUNFLOW_STATE_DB=/path/state.db   기본 DB 경로 변경 (기본: 02_config/data/state.db)
+"""
+
+import os
+import json
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Union
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+DEFAULT_DB_PATH = PROJECT_ROOT / "02_config" / "data" / "state.db"
+
+BUSY_TIMEOUT_MS = 10_000
+SCHEMA_VERSION = 3
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS json_imports (
+    source      TEXT PRIMARY KEY,
+    rows        INTEGER NOT NULL DEFAULT 0,
+    imported_at TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS pipeline_states (
+    food_name  TEXT PRIMARY KEY,
+    status     TEXT,
+    updated_at TEXT,
+    saved_at   TEXT NOT NULL,
+    data       TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_pipeline_states_status ON pipeline_states (status);
+CREATE INDEX IF NOT EXISTS idx_pipeline_states_updated ON pipeline_states (updated_at);
+
+CREATE TABLE IF NOT EXISTS daily_metrics (
+    date       TEXT PRIMARY KEY,
+    data       TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS error_records (
+    id          INTEGER PRIMARY KEY AUTOINCREMENT,
+    error_id    TEXT NOT NULL,
+    date        TEXT NOT NULL,
+    timestamp   TEXT NOT NULL,
+    severity    TEXT NOT NULL,
+    category    TEXT NOT NULL,
+    message     TEXT NOT NULL,
+    source      TEXT,
+    trace_id    TEXT,
+    fingerprint TEXT NOT NULL,
+    context     TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_error_records_date ON error_records (date);
+CREATE INDEX IF NOT EXISTS idx_error_records_time ON error_records (timestamp, severity);
+CREATE INDEX IF NOT EXISTS idx_error_records_fingerprint ON error_records (fingerprint);
+
+CREATE TABLE IF NOT EXISTS api_usage (
+    id            INTEGER PRIMARY KEY AUTOINCREMENT,
+    timestamp     TEXT NOT NULL,
+    date          TEXT NOT NULL,
+    api_name      TEXT NOT NULL,
+    operation     TEXT,
+    count         INTEGER NOT NULL DEFAULT 1,
+    tokens_input  INTEGER NOT NULL DEFAULT 0,
+    tokens_output INTEGER NOT NULL DEFAULT 0,
+    cost_usd      REAL NOT NULL DEFAULT 0,
+    metadata      TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_api_usage_date ON api_usage (date, api_name);
+
+CREATE TABLE IF NOT EXISTS api_usage_daily (
+    date          TEXT NOT NULL,
+    api_name      TEXT NOT NULL,
+    count         INTEGER NOT NULL DEFAULT 0,
+    cost          REAL NOT NULL DEFAULT 0,
+    tokens_input  INTEGER NOT NULL DEFAULT 0,
+    tokens_output INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (date, api_name)
+);
+
+CREATE TABLE IF NOT EXISTS retry_failures (
+    topic         TEXT PRIMARY KEY,
+    topic_kr      TEXT,
+    attempt       INTEGER NOT NULL DEFAULT 0,
+    status        TEXT NOT NULL,
+    error         TEXT,
+    timestamp     TEXT NOT NULL,
+    next_retry_at TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_retry_failures_status ON retry_failures (status);
+
+CREATE TABLE IF NOT EXISTS ab_tests (
+    test_id    TEXT PRIMARY KEY,
+    topic_en   TEXT,
+    status     TEXT,
+    updated_at TEXT,
+    data       TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_ab_tests_status ON ab_tests (status);
+
+CREATE TABLE IF NOT EXISTS instagram_insights (
+    post_id    TEXT PRIMARY KEY,
+    posted_at  TEXT,
+    data       TEXT NOT NULL,
+    fetched    TEXT NOT NULL,
+    expires_at TEXT,
+    updated_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_instagram_insights_expires ON instagram_insights (expires_at);
+CREATE INDEX IF NOT EXISTS idx_instagram_insights_posted ON instagram_insights (posted_at);
+
+CREATE TABLE IF NOT EXISTS instagram_account_insights (
+    period     TEXT PRIMARY KEY,
+    data       TEXT NOT NULL,
+    fetched_at TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS instagram_media (
+    media_id  TEXT PRIMARY KEY,
+    timestamp TEXT,
+    data      TEXT NOT NULL,
+    synced_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_instagram_media_timestamp ON instagram_media (timestamp);
+
+CREATE TABLE IF NOT EXISTS sync_state (
+    key   TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+def dumps(value: Any) -> str:
+    """JSON 컬럼 직렬화 (한글 유지, datetime 등은 문자열)"""
+    return json.dumps(value, ensure_ascii=False, default=str)
+
+
+def loads(text: Optional[str], default: Any = None) -> Any:
+    """JSON 컬럼 역직렬화 (NULL/깨진 값은 default)"""
+    if not text:
+        return default
+    try:
+        return json.loads(text)
+    except ValueError:
+        return default
+
+
+def default_db_path() -> Path:
+    return Path(os.getenv("SUNFLOW_STATE_DB") or DEFAULT_DB_PATH)
+
+
+class StateDB:
+    """
+    SQLite 상태 DB (스레드별 커넥션, autocommit + 명시적 트랜잭션)
+
+    - execute/query: 단일 문장은 autocommit
+    - transaction(): BEGIN IMMEDIATE ~ COMMIT (중첩 시 바깥 트랜잭션에 합류)
+    """
+
+    def __init__(self, path: Union[str, Path, None] = None):
+        self.path = Path(path or default_db_path())
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        self._schema_lock = threading.Lock()
+        self._schema_ready = False
+
+    # ---------- 커넥션 ----------
+
+    def connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            return conn
+        conn = sqlite3.connect(str(self.path), timeout=BUSY_TIMEOUT_MS / 1000,
+                               isolation_level=None, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(f"PRAGMA busy_timeout={BUSY_TIMEOUT_MS}")
+        self._local.conn = conn
+        self._local.depth = 0
+        self._ensure_schema(conn)
+        return conn
+
+    def _ensure_schema(self, conn: sqlite3.Connection):
+        with self._schema_lock:
+            if self._schema_ready:
+                return
+            if conn.execute("PRAGMA user_version").fetchone()[0] < SCHEMA_VERSION:
+                conn.executescript(SCHEMA)
+                conn.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+            self._schema_ready = True
+
+    def close(self):
+        """현재 스레드 커넥션 종료"""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    # ---------- 실행 ----------
+
+    def execute(self, sql: str, params: Sequence = ()) -> sqlite3.Cursor:
+        return self.connect().execute(sql, params)
+
+    def executemany(self, sql: str, rows) -> sqlite3.Cursor:
+        return self.connect().executemany(sql, rows)
+
+    def query(self, sql: str, params: Sequence = ()) -> List[sqlite3.Row]:
+        return self.execute(sql, params).fetchall()
+
+    def query_one(self, sql: str, params: Sequence = ()) -> Optional[sqlite3.Row]:
+        return self.execute(sql, params).fetchone()
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """쓰기 트랜잭션 (BEGIN IMMEDIATE: 시작 시점에 쓰기 잠금 확보)"""
+        conn = self.connect()
+        if self._local.depth:
+            self._local.depth += 1
+            try:
+                yield conn
+            finally:
+                self._local.depth -= 1
+            return
+
+        conn.execute("BEGIN IMMEDIATE")
+        self._local.depth = 1
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        else:
+            conn.execute("COMMIT")
+        finally:
+            self._local.depth = 0
+
+    # ---------- JSON 가져오기 ----------
+
+    def import_json_once(self, source: Union[str, Path], table: str,
+                         importer: Callable[[Any], int]) -> int:
+        """
+        기존 JSON 파일을 최초 1회만 가져오기
+
+        Args:
+            source: JSON 파일 경로 (없으면 아무것도 하지 않음)
+            table: 대상 테이블명 (가져오기 기록 키 구분용)
+            importer: 파싱된 JSON 을 받아 INSERT 후 행 수 반환 (트랜잭션 안에서 호출)
+
+        Returns:
+            가져온 행 수 (이미 가져왔거나 파일이 없거나 실패하면 0, 실패는 기록 안 함)
+        """
+        source = Path(source)
+        key = f"{table}:{source.resolve()}"
+        if self.query_one("SELECT 1 FROM json_imports WHERE source = ?", (key,)):
+            return 0
+        if not source.exists():
+            return 0
+
+        # 실패 시 롤백 + 기록하지 않음 → 다음 실행에서 재시도
+        try:
+            with self.transaction():
+                # 다른 프로세스가 먼저 가져갔는지 잠금 안에서 재확인
+                if self.query_one("SELECT 1 FROM json_imports WHERE source = ?", (key,)):
+                    return 0
+                with open(source, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                rows = importer(data) or 0
+                self.execute(
+                    "INSERT INTO json_imports (source, rows, imported_at) VALUES (?, ?, ?)",
+                    (key, rows, datetime.now().isoformat()),
+                )
+        except Exception as e:
+            # 읽기 실패 / 손상 JSON / 예상과 다른 구조 (importer 의 AttributeError·TypeError 등)
+            print(f"[StateDB] JSON 가져오기 실패 ({source.name}): {type(e).__name__}: {e}")
+            return 0
+        return rows
+
+
+_databases: Dict[Path, StateDB] = {}
+_databases_lock = threading.Lock()
+
+
+def get_state_db(path: Union[str, Path, None] = None) -> StateDB:
+    """경로별 공용 StateDB (기본: SUNFLOW_STATE_DB 또는 02_config/data/state.db)"""
+    resolved = Path(path or default_db_path()).resolve()
+    with _databases_lock:
+        db = _databases.get(resolved)
+        if db is None:
+            db = _databases[resolved] = StateDB(resolved)
+        return db
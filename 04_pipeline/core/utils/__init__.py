@@ -14,6 +14,7 @@ from .trace_manager import (
 from .health_check import (
     HealthChecker,
     HealthStatus,
+    get_health_checker,
     get_health_status,
 )
 
@@ -89,6 +90,7 @@ __all__ = [
     # Health
     "HealthChecker",
     "HealthStatus",
+    "get_health_checker",
     "get_health_status",
     # Backup
     "BackupManager",
@@ -30,6 +30,8 @@ from dataclasses import dataclass, field, asdict
 from enum import Enum
 import statistics
 
+from ..state_db import StateDB, dumps, get_state_db, loads
+
 
 class TestStatus(str, Enum):
     """A/B Test Status"""
@@ -157,12 +159,13 @@ class ABTestManager:
         result = manager.determine_winner(test.test_id)
     """
 
-    def __init__(self, data_path: Optional[str] = None):
+    def __init__(self, data_path: Optional[str] = None, db: Optional[StateDB] = None):
         """
         Initialize ABTestManager
 
         Args:
-            data_path: Path to ab_tests.json (default: config/data/ab_tests.json)
+            data_path: Path to legacy ab_tests.json, imported once (default: config/data/ab_tests.json)
+            db: State DB (default: sibling .db of data_path if given, otherwise shared DB)
         """
         if data_path:
             self.data_path = Path(data_path)
@@ -173,36 +176,43 @@ class ABTestManager:
         # Ensure directory exists
         self.data_path.parent.mkdir(parents=True, exist_ok=True)
 
+        # One row per test in ab_tests table (legacy JSON imported once)
+        self.db = db or get_state_db(self.data_path.with_suffix(".db") if data_path else None)
+        self.db.import_json_once(self.data_path, "ab_tests", self._import_tests)
+
         # Load existing tests
         self.tests: Dict[str, ABTest] = {}
         self._load_tests()
 
+    def _import_tests(self, data: Dict) -> int:
+        """Import legacy ab_tests.json"""
+        tests = data.get('tests', {})
+        for test_data in tests.values():
+            self._write_test(self._dict_to_test(test_data))
+        return len(tests)
+
     def _load_tests(self) -> None:
-        """Load tests from JSON file"""
-        if self.data_path.exists():
+        """Load tests from state DB"""
+        for row in self.db.query("SELECT test_id, data FROM ab_tests ORDER BY rowid"):
             try:
-                with open(self.data_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-
-                for test_id, test_data in data.get('tests', {}).items():
-                    self.tests[test_id] = self._dict_to_test(test_data)
-
-            except (json.JSONDecodeError, Exception) as e:
-                print(f"Warning: Failed to load AB tests: {e}")
-                self.tests = {}
-
-    def _save_tests(self) -> None:
-        """Save tests to JSON file"""
-        data = {
-            'tests': {
-                test_id: self._test_to_dict(test)
-                for test_id, test in self.tests.items()
-            },
-            'last_updated': datetime.now().isoformat()
-        }
+                self.tests[row['test_id']] = self._dict_to_test(loads(row['data'], {}))
+            except Exception as e:
+                print(f"Warning: Failed to load AB test {row['test_id']}: {e}")
+
+    def _write_test(self, test: ABTest) -> None:
+        self.db.execute(
+            "INSERT INTO ab_tests (test_id, topic_en, status, updated_at, data) VALUES (?, ?, ?, ?, ?) "
+            "ON CONFLICT (test_id) DO UPDATE SET topic_en = excluded.topic_en, status = excluded.status, "
+            "updated_at = excluded.updated_at, data = excluded.data",
+            (test.test_id, test.topic_en, test.status.value, test.updated_at, dumps(self._test_to_dict(test)))
+        )
 
-        with open(self.data_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+    def _save_tests(self, test_id: Optional[str] = None) -> None:
+        """Save tests to state DB (only the given test's row when test_id is set)"""
+        targets = [self.tests[test_id]] if test_id in self.tests else list(self.tests.values())
+        with self.db.transaction():
+            for test in targets:
+                self._write_test(test)
 
     def _test_to_dict(self, test: ABTest) -> Dict:
         """Convert ABTest to dict for JSON serialization"""
@@ -345,7 +355,7 @@ class ABTestManager:
         )
 
         self.tests[test_id] = test
-        self._save_tests()
+        self._save_tests(test_id)
 
         print(f"[ABTest] Created: {test_id}")
         print(f"  Topic: {topic_kr} ({topic_en})")
@@ -387,7 +397,7 @@ class ABTestManager:
         """Delete a test"""
         if test_id in self.tests:
             del self.tests[test_id]
-            self._save_tests()
+            self.db.execute("DELETE FROM ab_tests WHERE test_id = ?", (test_id,))
             print(f"[ABTest] Deleted: {test_id}")
             return True
         return False
@@ -456,7 +466,7 @@ class ABTestManager:
                 print(f"[ABTest] Test started: {test_id}")
 
         test.updated_at = datetime.now().isoformat()
-        self._save_tests()
+        self._save_tests(test_id)
 
         print(f"[ABTest] Registered variant {variant_id} for {test_id}")
         return True
@@ -512,7 +522,7 @@ class ABTestManager:
         variant.metrics.calculate_engagement_rate(followers)
         test.updated_at = datetime.now().isoformat()
 
-        self._save_tests()
+        self._save_tests(test_id)
         return True
 
     def sync_from_instagram_stats(
@@ -636,7 +646,7 @@ class ABTestManager:
         test.status = TestStatus.COMPLETED
         test.updated_at = datetime.now().isoformat()
 
-        self._save_tests()
+        self._save_tests(test_id)
 
         result = {
             'status': 'completed',
@@ -8,12 +8,16 @@ Phase 2.5 HARD FAIL 규칙 자동 검증:
 """
 
 import json
+import sys
 import hashlib
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from image_hash_index import ImageHashIndex, OVERLAY_MATCH_RADIUS
+
 
 @dataclass
 class ValidationResult:
@@ -129,7 +133,23 @@ class ContentValidator:
                 }
             )
 
-        # 해시 불일치 - 추가 검증 시도
+        # 해시 불일치 - 지각 해시로 실사 원본 추적 (텍스트 오버레이 후)
+        source = self._find_perceptual_cta_match(cta_file)
+        if source:
+            distance, source_path = source
+            return ValidationResult(
+                passed=True,
+                details={
+                    "file": str(cta_file),
+                    "hash": file_hash,
+                    "verification": "perceptual_match",
+                    "source": source_path,
+                    "distance": distance,
+                    "message": "CTA 슬라이드가 실사 소스와 유사합니다 (지각 해시)."
+                }
+            )
+
+        # 추가 검증 시도
         # (파일 크기, 메타데이터 등으로 AI 여부 추정)
         is_likely_real = self._check_likely_real_photo(cta_file)
 
@@ -184,6 +204,19 @@ class ContentValidator:
         self._real_cta_hashes = hashes
         return hashes
 
+    def _find_perceptual_cta_match(self, file_path: Path) -> Optional[Tuple[int, str]]:
+        """실사 CTA 풀 지각 해시 인덱스 질의 -> (거리, 원본 경로)"""
+        cta_root = self.project_root / "content/images/sunshine/cta_source"
+        if not cta_root.exists():
+            return None
+        try:
+            index = ImageHashIndex.for_pool("cta_source_all", [cta_root])
+            index.update()
+            matches = index.query(file_path, radius=OVERLAY_MATCH_RADIUS)
+        except Exception:
+            return None
+        return matches[0] if matches else None
+
     def _calculate_file_hash(self, file_path: Path) -> str:
         """파일 MD5 해시 계산"""
         hash_md5 = hashlib.md5()
@@ -5,7 +5,6 @@ SunFlow Error Aggregator (P2)
 - 패턴 감지 및 알림
 """
 
-import json
 import hashlib
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -14,6 +13,8 @@ from dataclasses import dataclass, asdict
 from collections import defaultdict
 from enum import Enum
 
+from ..state_db import StateDB, dumps, get_state_db, loads
+
 # 프로젝트 루트
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 
@@ -51,27 +52,47 @@ class ErrorRecord:
 
 
 class ErrorAggregator:
-    """에러 집계자"""
+    """에러 집계자 (에러 1건 = 행 1개 INSERT, core.state_db error_records 테이블)"""
 
-    def __init__(self):
+    def __init__(self, db: Optional[StateDB] = None):
         self.project_root = PROJECT_ROOT
         self.error_dir = self.project_root / "config" / "logs" / "errors"
         self.error_dir.mkdir(parents=True, exist_ok=True)
         self.today_file = self.error_dir / f"errors_{datetime.now().strftime('%Y%m%d')}.json"
-        self._load_today_errors()
-
-    def _load_today_errors(self):
-        """오늘 에러 로드"""
-        if self.today_file.exists():
-            with open(self.today_file, 'r', encoding='utf-8') as f:
-                self.errors = json.load(f)
-        else:
-            self.errors = {"date": datetime.now().strftime('%Y-%m-%d'), "records": []}
+        self.db = db or get_state_db()
+        for legacy_file in sorted(self.error_dir.glob("errors_*.json")):
+            self.db.import_json_once(legacy_file, "error_records", self._import_errors)
 
-    def _save_errors(self):
-        """에러 저장"""
-        with open(self.today_file, 'w', encoding='utf-8') as f:
-            json.dump(self.errors, f, ensure_ascii=False, indent=2)
+    def _import_errors(self, data: Dict) -> int:
+        """기존 errors_YYYYMMDD.json 가져오기"""
+        records = data.get("records", [])
+        for record in records:
+            self._save_errors(record)
+        return len(records)
+
+    @property
+    def errors(self) -> Dict:
+        """오늘 에러 {"date", "records"}"""
+        date = datetime.now().strftime('%Y-%m-%d')
+        return {"date": date, "records": self._query_records("WHERE date = ?", (date,))}
+
+    def _query_records(self, where: str, params: tuple = ()) -> List[Dict]:
+        rows = self.db.query(
+            "SELECT error_id, timestamp, severity, category, message, source, trace_id, context, fingerprint "
+            f"FROM error_records {where} ORDER BY id",
+            params
+        )
+        return [dict(row, context=loads(row["context"], {})) for row in rows]
+
+    def _save_errors(self, record: Dict):
+        """에러 저장 (추가 전용)"""
+        self.db.execute(
+            "INSERT INTO error_records (error_id, date, timestamp, severity, category, message, source, "
+            "trace_id, fingerprint, context) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (record["error_id"], record["timestamp"][:10], record["timestamp"], record["severity"],
+             record["category"], record["message"], record.get("source"), record.get("trace_id"),
+             record["fingerprint"], dumps(record.get("context") or {}))
+        )
 
     def _generate_fingerprint(self, message: str, source: str, category: str) -> str:
         """에러 핑거프린트 생성 (동일 에러 식별)"""
@@ -145,7 +166,7 @@ class ErrorAggregator:
         )
 
         # 저장
-        self.errors["records"].append({
+        self._save_errors({
             "error_id": error_id,
             "timestamp": record.timestamp,
             "severity": severity.value,
@@ -156,7 +177,6 @@ class ErrorAggregator:
             "context": context or {},
             "fingerprint": fingerprint
         })
-        self._save_errors()
 
         return record
 
@@ -165,16 +185,11 @@ class ErrorAggregator:
         if date is None:
             date = datetime.now().strftime('%Y-%m-%d')
 
-        # 해당 날짜 파일 로드
-        date_file = self.error_dir / f"errors_{date.replace('-', '')}.json"
-        if not date_file.exists():
+        # 해당 날짜 기록 조회
+        records = self._query_records("WHERE date = ?", (date,))
+        if not records:
             return {"date": date, "total": 0, "by_severity": {}, "by_category": {}}
 
-        with open(date_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-
-        records = data.get("records", [])
-
         # 심각도별 집계
         by_severity = defaultdict(int)
         for r in records:
@@ -240,12 +255,10 @@ class ErrorAggregator:
         """최근 심각 에러"""
         cutoff = datetime.now() - timedelta(hours=hours)
 
-        critical_errors = []
-        for record in self.errors.get("records", []):
-            if record["severity"] in ["critical", "error"]:
-                record_time = datetime.fromisoformat(record["timestamp"])
-                if record_time >= cutoff:
-                    critical_errors.append(record)
+        critical_errors = self._query_records(
+            "WHERE timestamp >= ? AND severity IN ('critical', 'error')",
+            (cutoff.isoformat(),)
+        )
 
         return sorted(critical_errors, key=lambda x: x["timestamp"], reverse=True)
 
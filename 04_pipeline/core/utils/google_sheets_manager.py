@@ -15,13 +15,21 @@ Google Sheets 콘텐츠 관리자
 
     # 새 콘텐츠 추가
     manager.add_content('027', 'cabbage', '양배추', 'SAFE')
+
+    # 여러 건 쓰기는 batch_update 1회로 (읽기는 스냅샷 캐시, core.utils.sheet_gateway)
+    with manager.batch():
+        for topic in topics:
+            manager.update_content(topic, {'게시상태': '게시완료'})
 """
 
 import os
 import json
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from contextlib import contextmanager
+from typing import Optional, List, Dict, Any, Iterator
+
+from .sheet_gateway import SheetGateway
 
 try:
     import gspread
@@ -53,10 +61,31 @@ class ContentSheetManager:
         self._client = None
         self._sheet = None
         self._worksheet = None
+        self._gateway = None
 
         # 로컬 캐시 (CSV 백업)
         self.local_cache_path = Path(__file__).parent.parent.parent / 'config' / 'data' / 'published_contents.csv'
 
+    @property
+    def gateway(self) -> Optional[SheetGateway]:
+        """연결된 워크시트의 게이트웨이 (스냅샷 캐시 + 쓰기 버퍼, 미연결이면 None)"""
+        if self._worksheet is None:
+            return None
+        if self._gateway is None or self._gateway.worksheet is not self._worksheet:
+            self._gateway = SheetGateway(self._worksheet)
+        return self._gateway
+
+    @contextmanager
+    def batch(self) -> Iterator[Optional[SheetGateway]]:
+        """블록 안의 시트 쓰기를 모아 끝에서 1회 전송 (연결 실패면 그냥 실행)"""
+        if self._worksheet is None:
+            self.connect()
+        if self.gateway is None:
+            yield None
+            return
+        with self.gateway.batch() as gateway:
+            yield gateway
+
     @property
     def is_configured(self) -> bool:
         """Google Sheets 설정 여부 확인"""
@@ -110,24 +139,25 @@ class ContentSheetManager:
                 return self._get_from_local_cache()
 
         try:
-            records = self._worksheet.get_all_records()
-            return records
+            return self.gateway.records()
         except Exception as e:
             print(f"⚠️ 시트 읽기 실패, 로컬 캐시 사용: {e}")
             return self._get_from_local_cache()
 
     def is_published(self, topic_en: str) -> bool:
         """해당 주제가 이미 게시되었는지 확인"""
-        contents = self.get_all_contents()
-        for content in contents:
-            if content.get('영문명', '').lower() == topic_en.lower():
-                return content.get('게시상태') == '게시완료'
-        return False
+        content = self.get_content(topic_en)
+        return bool(content) and content.get('게시상태') == '게시완료'
 
     def get_content(self, topic_en: str) -> Optional[Dict[str, Any]]:
-        """특정 주제 정보 가져오기"""
-        contents = self.get_all_contents()
-        for content in contents:
+        """특정 주제 정보 가져오기 (시트는 영문명 → 행 인덱스 조회)"""
+        if self._worksheet or self.connect():
+            try:
+                return self.gateway.find(topic_en)
+            except Exception as e:
+                print(f"⚠️ 시트 읽기 실패, 로컬 캐시 사용: {e}")
+
+        for content in self._get_from_local_cache():
             if content.get('영문명', '').lower() == topic_en.lower():
                 return content
         return None
@@ -167,7 +197,8 @@ class ContentSheetManager:
         row = [number, topic_en, topic_kr, folder_name, safety, status, publish_date, instagram_url]
 
         try:
-            self._worksheet.append_row(row)
+            self.gateway.stage_append(row)
+            self.gateway.autoflush()
             print(f"✅ 시트에 추가됨: {topic_kr} ({topic_en})")
 
             # 로컬 캐시도 업데이트
@@ -189,19 +220,18 @@ class ContentSheetManager:
                 return False
 
         try:
-            # 해당 행 찾기
-            cell = self._worksheet.find(topic_en, in_column=2)  # 영문명 컬럼
-            if not cell:
+            # 해당 행 찾기 (스냅샷 인덱스, API 호출 없음)
+            row_num = self.gateway.row_of(topic_en)
+            if not row_num:
                 print(f"❌ '{topic_en}' 콘텐츠를 찾을 수 없음")
                 return False
 
-            row_num = cell.row
-
-            # 업데이트할 컬럼 찾아서 수정
+            # 업데이트할 컬럼 모아서 1회 전송 (batch() 안이면 블록 끝에서)
             for col_name, value in updates.items():
                 if col_name in self.COLUMNS:
                     col_idx = self.COLUMNS.index(col_name) + 1
-                    self._worksheet.update_cell(row_num, col_idx, value)
+                    self.gateway.stage_update(row_num, col_idx, value)
+            self.gateway.autoflush()
 
             print(f"✅ '{topic_en}' 업데이트 완료")
             return True
@@ -274,11 +304,15 @@ class ContentSheetManager:
                     content.get('게시일', ''),
                     content.get('인스타URL', '')
                 ]
-                try:
-                    self._worksheet.append_row(row)
-                    added += 1
-                except:
-                    pass
+                self.gateway.stage_append(row)
+                added += 1
+
+        # 추가 행은 append_rows 1회로 전송
+        try:
+            self.gateway.autoflush()
+        except Exception as e:
+            print(f"❌ 시트 동기화 실패: {e}")
+            return 0
 
         print(f"✅ {added}개 항목 동기화 완료")
         return added
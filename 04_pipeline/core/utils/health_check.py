@@ -3,20 +3,42 @@ SunFlow Health Check (P1)
 - 시스템 상태 점검
 - API 연결 확인
 - 리소스 모니터링
+- 체크 동시 실행 (체크별 타임아웃) + 체크별 TTL 캐시
+- 백그라운드 갱신 스냅샷 (/health 는 스냅샷만 반환)
+
+환경 변수:
+    HEALTH_REFRESH_INTERVAL=30     백그라운드 갱신 주기 (초)
 """
 
 import os
 import json
+import time
 import asyncio
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, Optional, Tuple
 from dataclasses import dataclass, asdict
 from enum import Enum
 
 # 프로젝트 루트
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 
+DEFAULT_CHECK_TIMEOUT = 5.0     # 초
+DEFAULT_CHECK_TTL = 30.0        # 초
+FAILURE_TTL = 10.0              # 실패/타임아웃 결과는 짧게 캐시
+DEFAULT_REFRESH_INTERVAL = 30.0
+
+# 체크별 (타임아웃, 캐시 TTL) - 자주 안 바뀌는 설정 체크는 길게
+CHECK_POLICY: Dict[str, Tuple[float, float]] = {
+    "filesystem": (DEFAULT_CHECK_TIMEOUT, 300.0),
+    "config": (DEFAULT_CHECK_TIMEOUT, 60.0),
+    "instagram_token": (10.0, 300.0),
+    "cloudinary": (10.0, 300.0),
+    "telegram": (10.0, 300.0),
+    "content_queue": (DEFAULT_CHECK_TIMEOUT, 30.0),
+    "disk_space": (DEFAULT_CHECK_TIMEOUT, 60.0),
+}
+
 
 class HealthStatus(Enum):
     """상태 레벨"""
@@ -47,13 +69,23 @@ class SystemHealth:
 
 
 class HealthChecker:
-    """시스템 헬스체크"""
+    """
+    시스템 헬스체크
+
+    - checks 의 체크 함수 (일반 함수는 워커 스레드, 코루틴 함수는 그대로) 를 동시 실행
+    - 체크별 타임아웃 / TTL 캐시 (CHECK_POLICY)
+    - start_background_refresh() 로 스냅샷을 주기적으로 갱신, snapshot() 은 즉시 반환
+    """
 
     _start_time = datetime.now()
 
-    def __init__(self):
+    def __init__(self, policy: Optional[Dict[str, Tuple[float, float]]] = None):
         self.project_root = PROJECT_ROOT
-        self.checks = {
+        self.policy = dict(CHECK_POLICY, **(policy or {}))
+        self._cache: Dict[str, Tuple[float, ComponentHealth]] = {}  # name → (만료 monotonic, 결과)
+        self._snapshot: Optional[SystemHealth] = None
+        self._refresh_task: Optional[asyncio.Task] = None
+        self.checks: Dict[str, Callable] = {
             "filesystem": self._check_filesystem,
             "config": self._check_config,
             "instagram_token": self._check_instagram_token,
@@ -63,31 +95,99 @@ class HealthChecker:
             "disk_space": self._check_disk_space,
         }
 
-    async def run_all_checks(self) -> SystemHealth:
-        """모든 헬스체크 실행"""
-        components = {}
+    async def _run_check(self, name: str, check_func: Callable, force: bool = False) -> ComponentHealth:
+        """체크 1개 (TTL 안이면 캐시, 아니면 타임아웃 걸고 실행)"""
+        cached = self._cache.get(name)
+        if cached and not force and time.monotonic() < cached[0]:
+            return cached[1]
 
-        for name, check_func in self.checks.items():
-            try:
-                result = await check_func()
-                components[name] = result
-            except Exception as e:
-                components[name] = ComponentHealth(
-                    name=name,
-                    status=HealthStatus.UNHEALTHY,
-                    message=f"Check failed: {str(e)}",
-                    last_check=datetime.now().isoformat()
-                )
+        timeout, ttl = self.policy.get(name, (DEFAULT_CHECK_TIMEOUT, DEFAULT_CHECK_TTL))
+        try:
+            if asyncio.iscoroutinefunction(check_func):
+                result = await asyncio.wait_for(check_func(), timeout)
+            else:
+                result = await asyncio.wait_for(asyncio.to_thread(check_func), timeout)
+        except asyncio.TimeoutError:
+            result = ComponentHealth(
+                name=name,
+                status=HealthStatus.UNHEALTHY,
+                message=f"Check timed out after {timeout:g}s",
+                last_check=datetime.now().isoformat()
+            )
+        except Exception as e:
+            result = ComponentHealth(
+                name=name,
+                status=HealthStatus.UNHEALTHY,
+                message=f"Check failed: {str(e)}",
+                last_check=datetime.now().isoformat()
+            )
+
+        if result.status == HealthStatus.UNHEALTHY:
+            ttl = min(ttl, FAILURE_TTL)
+        self._cache[name] = (time.monotonic() + ttl, result)
+        return result
+
+    async def run_all_checks(self, force: bool = False) -> SystemHealth:
+        """
+        모든 헬스체크 동시 실행
+
+        Args:
+            force: True 면 캐시 무시하고 전부 다시 실행
+        """
+        names = list(self.checks)
+        results = await asyncio.gather(
+            *(self._run_check(name, self.checks[name], force) for name in names)
+        )
+        components = dict(zip(names, results))
 
         # 전체 상태 결정
         overall = self._determine_overall_status(components)
 
-        return SystemHealth(
+        health = SystemHealth(
             overall_status=overall,
             timestamp=datetime.now().isoformat(),
             components=components,
             uptime_seconds=(datetime.now() - self._start_time).total_seconds()
         )
+        self._snapshot = health
+        return health
+
+    def snapshot(self) -> Optional[SystemHealth]:
+        """마지막 run_all_checks 결과 (아직 없으면 None)"""
+        return self._snapshot
+
+    @property
+    def refreshing(self) -> bool:
+        return bool(self._refresh_task and not self._refresh_task.done())
+
+    async def _refresh_loop(self, interval: float):
+        while True:
+            try:
+                await self.run_all_checks()
+            except Exception as e:
+                print(f"[Health] 갱신 실패: {e}")
+            await asyncio.sleep(interval)
+
+    def start_background_refresh(self, interval: Optional[float] = None) -> asyncio.Task:
+        """실행 중인 이벤트 루프에서 스냅샷 주기 갱신 시작 (이미 실행 중이면 그 태스크)"""
+        if self.refreshing:
+            return self._refresh_task
+        if interval is None:
+            try:
+                interval = float(os.getenv("HEALTH_REFRESH_INTERVAL", DEFAULT_REFRESH_INTERVAL))
+            except ValueError:
+                interval = DEFAULT_REFRESH_INTERVAL
+        self._refresh_task = asyncio.get_running_loop().create_task(self._refresh_loop(interval))
+        return self._refresh_task
+
+    async def stop_background_refresh(self):
+        task, self._refresh_task = self._refresh_task, None
+        if task:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
 
     def _determine_overall_status(self, components: Dict[str, ComponentHealth]) -> HealthStatus:
         """전체 상태 결정"""
@@ -102,7 +202,7 @@ class HealthChecker:
         else:
             return HealthStatus.UNKNOWN
 
-    async def _check_filesystem(self) -> ComponentHealth:
+    def _check_filesystem(self) -> ComponentHealth:
         """파일시스템 체크"""
         required_dirs = [
             "core/agents",
@@ -135,7 +235,7 @@ class HealthChecker:
                 details={"missing": missing}
             )
 
-    async def _check_config(self) -> ComponentHealth:
+    def _check_config(self) -> ComponentHealth:
         """설정 파일 체크"""
         required_files = [
             "config/settings/publishing_history.json",
@@ -178,7 +278,7 @@ class HealthChecker:
                 last_check=datetime.now().isoformat()
             )
 
-    async def _check_instagram_token(self) -> ComponentHealth:
+    def _check_instagram_token(self) -> ComponentHealth:
         """Instagram 토큰 체크"""
         token = os.environ.get("INSTAGRAM_ACCESS_TOKEN")
 
@@ -210,7 +310,7 @@ class HealthChecker:
             details={"token_length": len(token)}
         )
 
-    async def _check_cloudinary(self) -> ComponentHealth:
+    def _check_cloudinary(self) -> ComponentHealth:
         """Cloudinary 설정 체크"""
         required_vars = [
             "CLOUDINARY_CLOUD_NAME",
@@ -246,7 +346,7 @@ class HealthChecker:
             last_check=datetime.now().isoformat()
         )
 
-    async def _check_telegram(self) -> ComponentHealth:
+    def _check_telegram(self) -> ComponentHealth:
         """Telegram 봇 설정 체크"""
         token = os.environ.get("TELEGRAM_BOT_TOKEN")
         chat_id = os.environ.get("TELEGRAM_CHAT_ID")
@@ -280,7 +380,7 @@ class HealthChecker:
             last_check=datetime.now().isoformat()
         )
 
-    async def _check_content_queue(self) -> ComponentHealth:
+    def _check_content_queue(self) -> ComponentHealth:
         """콘텐츠 큐 체크"""
         queue_file = self.project_root / "config" / "data" / "content_queue.json"
 
@@ -313,7 +413,7 @@ class HealthChecker:
                 last_check=datetime.now().isoformat()
             )
 
-    async def _check_disk_space(self) -> ComponentHealth:
+    def _check_disk_space(self) -> ComponentHealth:
         """디스크 공간 체크"""
         import shutil
 
@@ -362,10 +462,21 @@ class HealthChecker:
         }
 
 
+_default_checker: Optional[HealthChecker] = None
+
+
+def get_health_checker() -> HealthChecker:
+    """공용 HealthChecker (체크 캐시 / 스냅샷 공유)"""
+    global _default_checker
+    if _default_checker is None:
+        _default_checker = HealthChecker()
+    return _default_checker
+
+
 async def get_health_status() -> Dict:
-    """헬스 상태 조회 (API용)"""
-    checker = HealthChecker()
-    health = await checker.run_all_checks()
+    """헬스 상태 조회 (API용, 백그라운드 갱신 중이면 스냅샷 그대로 반환)"""
+    checker = get_health_checker()
+    health = (checker.snapshot() if checker.refreshing else None) or await checker.run_all_checks()
     return checker.to_dict(health)
 
 
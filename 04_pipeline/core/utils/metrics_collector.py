@@ -6,12 +6,15 @@ SunFlow Metrics Collector
 
 import os
 import json
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 from dataclasses import dataclass, asdict, field
 from enum import Enum
 
+from ..state_db import StateDB, dumps, get_state_db, loads
+
 # 프로젝트 루트
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 
@@ -112,13 +115,15 @@ class MonthlyReport:
 
 
 class MetricsCollector:
-    """메트릭 수집기"""
+    """메트릭 수집기 (일자별 1행, core.state_db daily_metrics 테이블)"""
 
-    def __init__(self):
+    def __init__(self, db: Optional[StateDB] = None):
         self.data_dir = PROJECT_ROOT / "config" / "data"
         self.metrics_file = self.data_dir / "daily_metrics.json"
         self.report_dir = PROJECT_ROOT / "reports"
+        self.db = db or get_state_db()
         self._ensure_dirs()
+        self.db.import_json_once(self.metrics_file, "daily_metrics", self._import_metrics)
         self._load_metrics()
 
     def _ensure_dirs(self):
@@ -126,26 +131,50 @@ class MetricsCollector:
         self.data_dir.mkdir(parents=True, exist_ok=True)
         self.report_dir.mkdir(parents=True, exist_ok=True)
 
+    def _import_metrics(self, data: Dict) -> int:
+        """기존 daily_metrics.json 가져오기"""
+        daily = [DailyMetrics(**d) for d in data.get('daily', [])]
+        for m in daily:
+            self._write_daily(m)
+        return len(daily)
+
     def _load_metrics(self):
         """저장된 메트릭 로드"""
-        if self.metrics_file.exists():
-            with open(self.metrics_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                self.metrics = {
-                    d['date']: DailyMetrics(**d)
-                    for d in data.get('daily', [])
-                }
-        else:
-            self.metrics = {}
+        rows = self.db.query("SELECT data FROM daily_metrics ORDER BY date")
+        self.metrics = {}
+        for row in rows:
+            m = DailyMetrics(**loads(row['data'], {}))
+            self.metrics[m.date] = m
+
+    def _write_daily(self, daily: DailyMetrics):
+        self.db.execute(
+            "INSERT INTO daily_metrics (date, data, updated_at) VALUES (?, ?, ?) "
+            "ON CONFLICT (date) DO UPDATE SET data = excluded.data, updated_at = excluded.updated_at",
+            (daily.date, dumps(asdict(daily)), datetime.now().isoformat())
+        )
 
-    def _save_metrics(self):
-        """메트릭 저장"""
-        data = {
-            'daily': [asdict(m) for m in self.metrics.values()],
-            'last_updated': datetime.now().isoformat()
-        }
-        with open(self.metrics_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+    def _save_metrics(self, date: str = None):
+        """메트릭 저장 (date 지정 시 해당 일자 1행만)"""
+        targets = [self.metrics[date]] if date in self.metrics else list(self.metrics.values())
+        with self.db.transaction():
+            for daily in targets:
+                self._write_daily(daily)
+
+    @contextmanager
+    def _update_daily(self) -> Iterator[DailyMetrics]:
+        """
+        오늘 메트릭 트랜잭션 갱신
+
+        잠금 안에서 DB 최신 행을 다시 읽어 수정 후 저장
+        → 다른 프로세스(야간 워커/봇/대시보드)의 기록을 덮어쓰지 않음
+        """
+        date = datetime.now().strftime('%Y-%m-%d')
+        with self.db.transaction():
+            row = self.db.query_one("SELECT data FROM daily_metrics WHERE date = ?", (date,))
+            daily = DailyMetrics(**loads(row['data'], {})) if row else DailyMetrics(date=date)
+            self.metrics[date] = daily
+            yield daily
+            self._write_daily(daily)
 
     def get_or_create_daily(self, date: str = None) -> DailyMetrics:
         """일간 메트릭 조회 또는 생성"""
@@ -161,49 +190,44 @@ class MetricsCollector:
 
     def record_health_check(self, success: bool):
         """헬스체크 기록"""
-        daily = self.get_or_create_daily()
-        daily.health_checks_total += 1
-        if success:
-            daily.health_checks_success += 1
-        else:
-            daily.health_checks_fail += 1
-
-        # 가동률 계산
-        if daily.health_checks_total > 0:
-            daily.uptime_percent = (
-                daily.health_checks_success / daily.health_checks_total * 100
-            )
+        with self._update_daily() as daily:
+            daily.health_checks_total += 1
+            if success:
+                daily.health_checks_success += 1
+            else:
+                daily.health_checks_fail += 1
 
-        self._save_metrics()
+            # 가동률 계산
+            if daily.health_checks_total > 0:
+                daily.uptime_percent = (
+                    daily.health_checks_success / daily.health_checks_total * 100
+                )
 
     def record_circuit_event(self, circuit_name: str, recovery_time: float = None):
         """서킷 브레이커 이벤트 기록"""
-        daily = self.get_or_create_daily()
-        daily.circuit_open_count += 1
-
-        if recovery_time:
-            # 이동 평균 계산
-            if daily.circuit_recovery_time_avg == 0:
-                daily.circuit_recovery_time_avg = recovery_time
-            else:
-                daily.circuit_recovery_time_avg = (
-                    daily.circuit_recovery_time_avg + recovery_time
-                ) / 2
-
-        self._save_metrics()
+        with self._update_daily() as daily:
+            daily.circuit_open_count += 1
+
+            if recovery_time:
+                # 이동 평균 계산
+                if daily.circuit_recovery_time_avg == 0:
+                    daily.circuit_recovery_time_avg = recovery_time
+                else:
+                    daily.circuit_recovery_time_avg = (
+                        daily.circuit_recovery_time_avg + recovery_time
+                    ) / 2
 
     def record_publish(self, success: bool, retry_count: int = 0):
         """게시 결과 기록"""
-        daily = self.get_or_create_daily()
-        daily.publish_attempts += 1
+        with self._update_daily() as daily:
+            daily.publish_attempts += 1
 
-        if success:
-            daily.publish_success += 1
-        else:
-            daily.publish_fail += 1
+            if success:
+                daily.publish_success += 1
+            else:
+                daily.publish_fail += 1
 
-        daily.retry_count += retry_count
-        self._save_metrics()
+            daily.retry_count += retry_count
 
     def record_instagram_stats(
         self,
@@ -214,69 +238,61 @@ class MetricsCollector:
         shares: int = 0
     ):
         """Instagram 통계 기록"""
-        daily = self.get_or_create_daily()
-        daily.followers = followers
-        daily.likes = likes
-        daily.comments = comments
-        daily.saves = saves
-        daily.shares = shares
-
-        # 참여율 계산
-        if followers > 0:
-            total_engagement = likes + comments + saves + shares
-            daily.engagement_rate = total_engagement / followers * 100
-
-        self._save_metrics()
+        with self._update_daily() as daily:
+            daily.followers = followers
+            daily.likes = likes
+            daily.comments = comments
+            daily.saves = saves
+            daily.shares = shares
+
+            # 참여율 계산
+            if followers > 0:
+                total_engagement = likes + comments + saves + shares
+                daily.engagement_rate = total_engagement / followers * 100
 
     def record_api_cost(self, service: str, calls: int, cost: float):
         """API 비용 기록"""
-        daily = self.get_or_create_daily()
+        with self._update_daily() as daily:
 
-        if service == 'fal_ai':
-            daily.fal_ai_calls += calls
-            daily.fal_ai_cost += cost
-        elif service == 'cloudinary':
-            daily.cloudinary_calls += calls
-
-        self._save_metrics()
+            if service == 'fal_ai':
+                daily.fal_ai_calls += calls
+                daily.fal_ai_cost += cost
+            elif service == 'cloudinary':
+                daily.cloudinary_calls += calls
 
     def record_error(self, severity: str):
         """에러 기록"""
-        daily = self.get_or_create_daily()
-        daily.errors_total += 1
-
-        if severity == 'P0':
-            daily.errors_p0 += 1
-        elif severity == 'P1':
-            daily.errors_p1 += 1
-        elif severity == 'P2':
-            daily.errors_p2 += 1
-        else:
-            daily.errors_p3 += 1
-
-        self._save_metrics()
+        with self._update_daily() as daily:
+            daily.errors_total += 1
+
+            if severity == 'P0':
+                daily.errors_p0 += 1
+            elif severity == 'P1':
+                daily.errors_p1 += 1
+            elif severity == 'P2':
+                daily.errors_p2 += 1
+            else:
+                daily.errors_p3 += 1
 
     def record_quality_gate(self, gate: str, passed: bool):
         """품질 게이트 기록"""
-        daily = self.get_or_create_daily()
-
-        if gate == 'G1':
-            if passed:
-                daily.g1_pass += 1
-            else:
-                daily.g1_fail += 1
-        elif gate == 'G2':
-            if passed:
-                daily.g2_pass += 1
-            else:
-                daily.g2_fail += 1
-        elif gate == 'G3':
-            if passed:
-                daily.g3_pass += 1
-            else:
-                daily.g3_fail += 1
-
-        self._save_metrics()
+        with self._update_daily() as daily:
+
+            if gate == 'G1':
+                if passed:
+                    daily.g1_pass += 1
+                else:
+                    daily.g1_fail += 1
+            elif gate == 'G2':
+                if passed:
+                    daily.g2_pass += 1
+                else:
+                    daily.g2_fail += 1
+            elif gate == 'G3':
+                if passed:
+                    daily.g3_pass += 1
+                else:
+                    daily.g3_fail += 1
 
     # ===== 집계 메서드 =====
 
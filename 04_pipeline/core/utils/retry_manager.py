@@ -5,7 +5,7 @@ Project Sunshine - RetryManager
 기능:
 - 게시 실패 시 자동 재시도 (최대 3회)
 - 재시도 간격: exponential backoff (5분, 15분, 30분)
-- 실패 이력 기록 (publish_schedule.json)
+- 실패 이력 기록 (core.state_db retry_failures 테이블, 토픽당 1행)
 - 최종 실패 시 텔레그램 알림
 
 작성자: 김대리
@@ -13,7 +13,6 @@ Project Sunshine - RetryManager
 """
 
 import asyncio
-import json
 import os
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -21,6 +20,8 @@ from typing import Callable, Optional, Dict, Any, Awaitable
 from dataclasses import dataclass, field, asdict
 from enum import Enum
 
+from ..state_db import StateDB, get_state_db
+
 
 class RetryStatus(Enum):
     """재시도 상태"""
@@ -67,14 +68,17 @@ class RetryManager:
     RETRY_INTERVALS = [5, 15, 30]  # 5분, 15분, 30분
     MAX_RETRIES = 3
 
-    def __init__(self, schedule_path: Optional[Path] = None):
+    def __init__(self, schedule_path: Optional[Path] = None, db: Optional[StateDB] = None):
         """초기화
 
         Args:
-            schedule_path: publish_schedule.json 경로 (기본: config/settings/)
+            schedule_path: publish_schedule.json 경로 (기본: config/settings/, 기존 실패 이력 1회 가져오기용)
+            db: 상태 DB (기본: schedule_path 지정 시 같은 위치의 .db, 아니면 공용 DB)
         """
         self.root = Path(__file__).parent.parent.parent
         self.schedule_path = schedule_path or self.root / "config" / "settings" / "publish_schedule.json"
+        self.db = db or get_state_db(Path(schedule_path).with_suffix(".db") if schedule_path else None)
+        self.db.import_json_once(self.schedule_path, "retry_failures", self._import_failures)
         self._notifier = None
 
     @property
@@ -88,30 +92,29 @@ class RetryManager:
                 self._notifier = None
         return self._notifier
 
-    def _load_schedule(self) -> Dict[str, Any]:
-        """스케줄 파일 로드"""
-        if not self.schedule_path.exists():
-            return {
-                "scheduled": [],
-                "completed": [],
-                "failed": [],
-                "settings": {
-                    "default_time": "18:00",
-                    "timezone": "Asia/Seoul",
-                    "notify_telegram": True,
-                    "auto_retry": True,
-                    "max_retries": self.MAX_RETRIES
-                }
-            }
-
-        with open(self.schedule_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+    def _import_failures(self, schedule: Dict[str, Any]) -> int:
+        """publish_schedule.json 의 RetryManager 실패 기록 가져오기 (ContentQueue 항목 제외)"""
+        records = [
+            f for f in schedule.get("failed", [])
+            if f.get("topic") and f.get("status") in ("pending_retry", "exhausted")
+        ]
+        for record in records:
+            self._save_failure(record)
+        return len(records)
+
+    def _save_failure(self, record: Dict[str, Any]) -> None:
+        """토픽 실패 기록 저장 (같은 토픽은 최신 기록으로 교체)"""
+        self.db.execute(
+            "INSERT OR REPLACE INTO retry_failures "
+            "(topic, topic_kr, attempt, status, error, timestamp, next_retry_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (record["topic"], record.get("topic_kr"), record.get("attempt", 0), record["status"],
+             record.get("error"), record.get("timestamp") or datetime.now().isoformat(),
+             record.get("next_retry_at"))
+        )
 
-    def _save_schedule(self, data: Dict[str, Any]) -> None:
-        """스케줄 파일 저장"""
-        self.schedule_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.schedule_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+    def _query_failures(self, status: str) -> list:
+        rows = self.db.query("SELECT * FROM retry_failures WHERE status = ? ORDER BY rowid", (status,))
+        return [dict(row) for row in rows]
 
     def _get_retry_interval(self, attempt: int) -> int:
         """재시도 간격 계산 (분)
@@ -145,8 +148,6 @@ class RetryManager:
             error: 오류 메시지
             next_retry_at: 다음 재시도 예정 시간
         """
-        schedule = self._load_schedule()
-
         record = {
             "topic": topic,
             "topic_kr": topic_kr,
@@ -157,16 +158,8 @@ class RetryManager:
             "status": "pending_retry" if next_retry_at else "exhausted"
         }
 
-        # 기존 실패 기록에서 같은 토픽 제거 (최신 기록만 유지)
-        schedule["failed"] = [
-            f for f in schedule.get("failed", [])
-            if f.get("topic") != topic
-        ]
-
-        # 새 기록 추가
-        schedule["failed"].append(record)
-
-        self._save_schedule(schedule)
+        # 같은 토픽은 최신 기록만 유지
+        self._save_failure(record)
         print(f"   [RetryManager] 실패 기록 저장: {topic} (시도 {attempt}/{self.MAX_RETRIES})")
 
     def _record_success(self, topic: str, topic_kr: str, result: Dict[str, Any]) -> None:
@@ -177,15 +170,8 @@ class RetryManager:
             topic_kr: 한글 토픽명
             result: 게시 결과
         """
-        schedule = self._load_schedule()
-
         # 실패 기록에서 제거
-        schedule["failed"] = [
-            f for f in schedule.get("failed", [])
-            if f.get("topic") != topic
-        ]
-
-        self._save_schedule(schedule)
+        self.db.execute("DELETE FROM retry_failures WHERE topic = ?", (topic,))
         print(f"   [RetryManager] 성공 기록, 실패 이력 제거: {topic}")
 
     def _send_final_failure_notification(
@@ -361,11 +347,7 @@ class RetryManager:
         Returns:
             재시도 대기 목록
         """
-        schedule = self._load_schedule()
-        return [
-            f for f in schedule.get("failed", [])
-            if f.get("status") == "pending_retry"
-        ]
+        return self._query_failures("pending_retry")
 
     def get_exhausted_items(self) -> list:
         """재시도 소진된 항목 조회
@@ -373,11 +355,7 @@ class RetryManager:
         Returns:
             재시도 소진 목록
         """
-        schedule = self._load_schedule()
-        return [
-            f for f in schedule.get("failed", [])
-            if f.get("status") == "exhausted"
-        ]
+        return self._query_failures("exhausted")
 
     def clear_failure_record(self, topic: str) -> bool:
         """특정 토픽의 실패 기록 제거
@@ -388,16 +366,9 @@ class RetryManager:
         Returns:
             제거 성공 여부
         """
-        schedule = self._load_schedule()
-        original_count = len(schedule.get("failed", []))
+        cursor = self.db.execute("DELETE FROM retry_failures WHERE topic = ?", (topic,))
 
-        schedule["failed"] = [
-            f for f in schedule.get("failed", [])
-            if f.get("topic") != topic
-        ]
-
-        if len(schedule["failed"]) < original_count:
-            self._save_schedule(schedule)
+        if cursor.rowcount > 0:
             print(f"   [RetryManager] 실패 기록 제거: {topic}")
             return True
 
@@ -412,16 +383,14 @@ class RetryManager:
         Returns:
             초기화 성공 여부
         """
-        schedule = self._load_schedule()
-
-        for item in schedule.get("failed", []):
-            if item.get("topic") == topic:
-                item["attempt"] = 0
-                item["status"] = "pending_retry"
-                item["next_retry_at"] = datetime.now().isoformat()
-                self._save_schedule(schedule)
-                print(f"   [RetryManager] 재시도 횟수 초기화: {topic}")
-                return True
+        cursor = self.db.execute(
+            "UPDATE retry_failures SET attempt = 0, status = 'pending_retry', next_retry_at = ? WHERE topic = ?",
+            (datetime.now().isoformat(), topic)
+        )
+
+        if cursor.rowcount > 0:
+            print(f"   [RetryManager] 재시도 횟수 초기화: {topic}")
+            return True
 
         return False
 
@@ -0,0 +1,340 @@
+"""
+Google Sheets 게이트웨이 - 스냅샷 캐시 + 일괄 쓰기
+
+ContentSheetManager / sync_local_to_sheet / sync_100_foods_to_sheets / sync_loop 공용:
+- 읽기: get_all_values() 1회 → 스냅샷 (짧은 TTL 동안 재사용) + 키 컬럼(영문명) → 행 번호 인덱스
+- 쓰기: 셀 업데이트 / 행 추가를 모아 두었다가 flush() 1회
+  (업데이트는 batch_update 1회, 추가는 append_rows 1회)
+- 쓴 값은 스냅샷에 바로 반영 → 같은 동기화 안의 다음 읽기와 일치
+- 추가 예약 행에 대한 업데이트는 추가할 값에 합침 (전송 전 빈 행에 쓰지 않음)
+- batch() 끝의 flush 가 실패하면 예약을 버리고 스냅샷 무효화
+  → 오래 쓰는 게이트웨이(sync_loop 등)가 보내지 못한 값을 시트 값으로 착각하지 않음
+- 429 / 5xx 는 지수 백오프로 재시도 (분당 쿼터 초과는 보통 1분 안에 풀림)
+
+사용법:
+    from core.utils.sheet_gateway import SheetGateway
+
+    gateway = SheetGateway(worksheet)
+    with gateway.batch():                      # 블록 끝에서 flush 1회
+        for topic, status in changes.items():
+            row = gateway.row_of(topic)
+            if row:
+                gateway.stage_update(row, '게시상태', status)
+    gateway.stats()  # {"reads": 1, "writes": 1, ...}
+
+환경 변수:
+    SHEET_SNAPSHOT_TTL=<초>   스냅샷 유지 시간 (기본: 30, 0 이면 매번 새로 읽기)
+"""
+
+import os
+import time
+import random
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+DEFAULT_TTL = 30.0
+QUOTA_RETRIES = 5
+QUOTA_BASE_DELAY = 2.0
+QUOTA_MAX_DELAY = 64.0
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+Column = Union[str, int]
+
+
+def default_ttl() -> float:
+    """스냅샷 TTL (SHEET_SNAPSHOT_TTL 환경 변수, 없으면 30초)"""
+    try:
+        return max(0.0, float(os.getenv("SHEET_SNAPSHOT_TTL", DEFAULT_TTL)))
+    except ValueError:
+        return DEFAULT_TTL
+
+
+def error_status(error: Exception) -> Optional[int]:
+    """gspread APIError 등의 HTTP 상태 코드 (없으면 None)"""
+    response = getattr(error, "response", None)
+    status = getattr(response, "status_code", None)
+    if status is None:
+        status = getattr(error, "code", None)
+    return status if isinstance(status, int) else None
+
+
+def is_retryable(error: Exception) -> bool:
+    """쿼터 초과(429) / 일시 장애(5xx) 여부"""
+    return error_status(error) in RETRY_STATUS
+
+
+def a1(row: int, col: int) -> str:
+    """(행, 열) 1-based → A1 표기 (예: (2, 15) → O2)"""
+    letters = ""
+    while col:
+        col, rem = divmod(col - 1, 26)
+        letters = chr(65 + rem) + letters
+    return f"{letters}{row}"
+
+
+# ============================================
+# 스냅샷
+# ============================================
+
+@dataclass
+class SheetSnapshot:
+    """
+    시트 값 스냅샷 (1행 = 헤더, 데이터 행 i → 시트 행 i + 2)
+
+    records() 는 get_all_records() 와 같은 dict 목록 (값은 문자열 그대로)
+    """
+    header: List[str]
+    rows: List[List[str]]
+    key_column: str
+    fetched_at: float
+    _index: Optional[Dict[str, int]] = field(default=None, repr=False)
+
+    @classmethod
+    def from_values(cls, values: List[List[Any]], key_column: str, fetched_at: float) -> "SheetSnapshot":
+        header = [str(v) for v in values[0]] if values else []
+        rows = [list(row) for row in values[1:]]
+        return cls(header=header, rows=rows, key_column=key_column, fetched_at=fetched_at)
+
+    def column_index(self, column: Column) -> int:
+        """컬럼 이름 또는 1-based 번호 → 1-based 번호"""
+        if isinstance(column, int):
+            return column
+        try:
+            return self.header.index(column) + 1
+        except ValueError:
+            raise KeyError(f"시트에 없는 컬럼: {column}") from None
+
+    def value(self, row: int, column: Column) -> Any:
+        values = self.rows[row - 2] if 2 <= row < len(self.rows) + 2 else []
+        col = self.column_index(column)
+        return values[col - 1] if col <= len(values) else ""
+
+    def column_values(self, column: Column) -> List[Any]:
+        """데이터 행의 컬럼 값 (헤더 제외)"""
+        return [self.value(row, column) for row in range(2, len(self.rows) + 2)]
+
+    def record(self, row: int) -> Dict[str, Any]:
+        values = self.rows[row - 2]
+        return {name: values[i] if i < len(values) else "" for i, name in enumerate(self.header)}
+
+    def records(self) -> List[Dict[str, Any]]:
+        return [self.record(row) for row in range(2, len(self.rows) + 2)]
+
+    @property
+    def index(self) -> Dict[str, int]:
+        """키(소문자, 공백 제거) → 시트 행 번호 (중복이면 첫 행)"""
+        if self._index is None:
+            self._index = {}
+            if self.key_column in self.header:
+                for row, key in enumerate(self.column_values(self.key_column), start=2):
+                    self._index.setdefault(str(key).strip().lower(), row)
+        return self._index
+
+    def row_of(self, key: str) -> Optional[int]:
+        return self.index.get(str(key).strip().lower()) if key else None
+
+    def apply_update(self, row: int, col: int, value: Any):
+        """쓰기 반영 (행/열이 모자라면 늘림)"""
+        while len(self.rows) < row - 1:
+            self.rows.append([])
+        values = self.rows[row - 2]
+        values.extend([""] * (col - len(values)))
+        values[col - 1] = value
+        if self.header and self.header[col - 1:col] == [self.key_column]:
+            self._index = None
+
+    def apply_append(self, values: Sequence[Any]):
+        self.rows.append(list(values))
+        if self.key_column in self.header:
+            key = self.value(len(self.rows) + 1, self.key_column)
+            self.index.setdefault(str(key).strip().lower(), len(self.rows) + 1)
+
+
+# ============================================
+# 게이트웨이
+# ============================================
+
+class SheetGateway:
+    """
+    워크시트 1개에 대한 읽기 캐시 + 쓰기 버퍼
+
+    Args:
+        worksheet: gspread Worksheet (get_all_values / batch_update / append_rows)
+        key_column: 행 인덱스 키 컬럼 (기본: 영문명)
+        ttl: 스냅샷 유지 시간 (초, None: default_ttl())
+        retries: 429 / 5xx 재시도 횟수
+        base_delay: 첫 재시도 대기 (초, 시도마다 2배, 최대 QUOTA_MAX_DELAY)
+        value_input_option: 셀 업데이트 입력 방식 (update_cell 과 같은 USER_ENTERED)
+    """
+
+    def __init__(self, worksheet, key_column: str = '영문명', ttl: Optional[float] = None,
+                 retries: int = QUOTA_RETRIES, base_delay: float = QUOTA_BASE_DELAY,
+                 value_input_option: str = 'USER_ENTERED',
+                 clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep,
+                 log: Callable[[str], None] = print):
+        self.worksheet = worksheet
+        self.key_column = key_column
+        self.ttl = default_ttl() if ttl is None else ttl
+        self.retries = max(0, int(retries))
+        self.base_delay = base_delay
+        self.value_input_option = value_input_option
+        self.clock = clock
+        self.sleep = sleep
+        self.log = log
+
+        self._snapshot: Optional[SheetSnapshot] = None
+        self._updates: Dict[Tuple[int, int], Any] = {}
+        self._appends: List[List[Any]] = []
+        self._batch_depth = 0
+        self._stats = {"reads": 0, "writes": 0, "retries": 0, "cache_hits": 0}
+
+    # ---------- API 호출 ----------
+
+    def call(self, method: str, *args, **kwargs) -> Any:
+        """워크시트 메서드 호출 (429 / 5xx 는 지수 백오프 + 지터로 재시도)"""
+        delay = self.base_delay
+        for attempt in range(self.retries + 1):
+            try:
+                return getattr(self.worksheet, method)(*args, **kwargs)
+            except Exception as e:
+                if attempt >= self.retries or not is_retryable(e):
+                    raise
+                wait = min(delay, QUOTA_MAX_DELAY) * (1 + random.random() * 0.1)
+                self._stats["retries"] += 1
+                self.log(f"⏳ 시트 {method} {error_status(e)} → {wait:.1f}초 후 재시도 "
+                         f"({attempt + 1}/{self.retries})")
+                self.sleep(wait)
+                delay *= 2
+
+    # ---------- 읽기 ----------
+
+    def snapshot(self, force: bool = False) -> SheetSnapshot:
+        """시트 스냅샷 (TTL 안이면 캐시, 아니면 get_all_values 1회)"""
+        now = self.clock()
+        if not force and self._snapshot is not None and now - self._snapshot.fetched_at < self.ttl:
+            self._stats["cache_hits"] += 1
+            return self._snapshot
+        values = self.call("get_all_values")
+        self._stats["reads"] += 1
+        self._snapshot = SheetSnapshot.from_values(values, self.key_column, now)
+        # 아직 flush 안 된 쓰기는 새 스냅샷에도 반영
+        for (row, col), value in self._updates.items():
+            self._snapshot.apply_update(row, col, value)
+        for values in self._appends:
+            self._snapshot.apply_append(values)
+        return self._snapshot
+
+    def invalidate(self):
+        """다음 읽기에서 새로 가져오기"""
+        self._snapshot = None
+
+    def records(self) -> List[Dict[str, Any]]:
+        return self.snapshot().records()
+
+    def row_of(self, key: str) -> Optional[int]:
+        """키 컬럼 값 → 시트 행 번호 (대소문자 무시)"""
+        return self.snapshot().row_of(key)
+
+    def find(self, key: str) -> Optional[Dict[str, Any]]:
+        """키 컬럼 값 → 행 dict"""
+        snapshot = self.snapshot()
+        row = snapshot.row_of(key)
+        return snapshot.record(row) if row else None
+
+    # ---------- 쓰기 ----------
+
+    def stage_update(self, row: int, column: Column, value: Any):
+        """셀 업데이트 예약 (같은 셀은 마지막 값, 추가 예약 행이면 추가할 값에 반영)"""
+        snapshot = self.snapshot()
+        col = snapshot.column_index(column)
+        first_append = len(snapshot.rows) + 2 - len(self._appends)
+        if first_append <= row < first_append + len(self._appends):
+            values = self._appends[row - first_append]
+            values.extend([""] * (col - len(values)))
+            values[col - 1] = value
+        else:
+            self._updates[(row, col)] = value
+        snapshot.apply_update(row, col, value)
+
+    def stage_append(self, values: Sequence[Any]):
+        """행 추가 예약"""
+        self._appends.append(list(values))
+        if self._snapshot is not None:
+            self._snapshot.apply_append(values)
+
+    @property
+    def pending(self) -> int:
+        """flush 대기 중인 셀 / 행 수"""
+        return len(self._updates) + len(self._appends)
+
+    def flush(self) -> int:
+        """
+        예약된 쓰기 전송 (업데이트 batch_update 1회 + 추가 append_rows 1회)
+
+        실패하면 예약은 그대로 두고 예외 (다시 flush 가능, 다시 보내지 않을 거면 discard())
+
+        Returns:
+            전송한 셀 / 행 수
+        """
+        sent = 0
+        if self._updates:
+            data = [{'range': a1(row, col), 'values': [[value]]}
+                    for (row, col), value in sorted(self._updates.items())]
+            self.call("batch_update", data, value_input_option=self.value_input_option)
+            self._stats["writes"] += 1
+            sent += len(self._updates)
+            self._updates.clear()
+        if self._appends:
+            self.call("append_rows", self._appends, value_input_option='RAW')
+            self._stats["writes"] += 1
+            sent += len(self._appends)
+            self._appends = []
+            # 실제로 붙은 행 위치는 시트가 정함 → 다음 읽기에서 다시 가져오기
+            self.invalidate()
+        return sent
+
+    @property
+    def batching(self) -> bool:
+        return self._batch_depth > 0
+
+    def autoflush(self) -> int:
+        """batch() 밖이면 바로 flush (단건 호출용, 실패하면 예약 버림)"""
+        if self.batching:
+            return 0
+        try:
+            return self.flush()
+        except Exception:
+            self.discard()
+            raise
+
+    @contextmanager
+    def batch(self) -> Iterator["SheetGateway"]:
+        """
+        블록 안의 쓰기를 모아 끝에서 flush 1회 (중첩 시 가장 바깥에서)
+
+        블록 안에서 예외가 나면 전송하지 않고, flush 가 실패하면 예약을 버린 뒤 예외
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        except BaseException:
+            self._batch_depth -= 1
+            if not self.batching and self.pending:
+                self.log(f"⚠️ 시트 쓰기 {self.pending}건 취소 (예외)")
+                self.discard()
+            raise
+        self._batch_depth -= 1
+        if not self.batching:
+            self.autoflush()
+
+    def discard(self):
+        """예약된 쓰기 버리기 (스냅샷도 버림)"""
+        self._updates.clear()
+        self._appends = []
+        self.invalidate()
+
+    def stats(self) -> Dict[str, int]:
+        """API 호출 통계 (reads / writes / retries / cache_hits)"""
+        return dict(self._stats)
@@ -2,21 +2,171 @@
 SunFlow Trace Manager (P0)
 - 전 구간 통합 Trace ID 시스템
 - 파이프라인 실행 추적 및 로깅
+- 상세 로그: 추가 전용 JSONL 세그먼트 + 작은 롤링 인덱스 (TraceLog)
+  → 이벤트마다 트레이스 파일 전체를 다시 쓰지 않음, 컨텍스트 종료 시 일괄 기록
+- 구간별 소요 시간 (TRACE_END / FUNC_RETURN 의 duration_ms)
 """
 
+import os
+import time
 import uuid
 import json
+import atexit
 import logging
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from contextlib import contextmanager
 from functools import wraps
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
 # 프로젝트 루트
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 LOG_DIR = PROJECT_ROOT / "config" / "logs" / "traces"
 
+SEGMENT_MAX_BYTES = 64 * 1024 * 1024   # 세그먼트 파일 최대 크기 (초과 시 다음 번호)
+INDEX_LIMIT = 1000                     # 인덱스 유지 트레이스 수 (오래된 것부터 제외)
+FLUSH_EVENTS = 100                     # 컨텍스트 종료 전이라도 이 이상 쌓이면 기록
+
+
+class TraceLog:
+    """
+    트레이스 상세 로그 저장소
+
+    - segments/traces_YYYYMMDD[_N].jsonl: 이벤트 1줄씩 추가 전용
+    - trace_index.json: {trace_id: segments, offset, event_count, last_event, mtime}
+      (최근 INDEX_LIMIT 개만 유지 → 조회 시 세그먼트 전체 스캔 불필요,
+       인덱스에서 빠진 트레이스만 전체 스캔)
+    - 세그먼트 추가 + 인덱스 갱신은 잠금 파일(.trace.lock)로 프로세스 간 직렬화
+    """
+
+    def __init__(self, log_dir: Path):
+        self.log_dir = Path(log_dir)
+        self.segment_dir = self.log_dir / "segments"
+        self.index_file = self.log_dir / "trace_index.json"
+        self.segment_dir.mkdir(parents=True, exist_ok=True)
+
+    @contextmanager
+    def _locked(self):
+        with open(self.log_dir / ".trace.lock", "a") as lock:
+            if fcntl:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl:
+                    fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def _segment_path(self) -> Path:
+        base = f"traces_{datetime.now().strftime('%Y%m%d')}"
+        path = self.segment_dir / f"{base}.jsonl"
+        n = 0
+        while path.exists() and path.stat().st_size >= SEGMENT_MAX_BYTES:
+            n += 1
+            path = self.segment_dir / f"{base}_{n}.jsonl"
+        return path
+
+    def load_index(self) -> Dict[str, Dict]:
+        try:
+            with open(self.index_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_index(self, index: Dict[str, Dict]):
+        if len(index) > INDEX_LIMIT:
+            keep = sorted(index.values(), key=lambda e: e["mtime"], reverse=True)[:INDEX_LIMIT]
+            index = {e["trace_id"]: e for e in keep}
+        tmp = self.index_file.with_suffix(".tmp")
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(index, f, ensure_ascii=False)
+        os.replace(tmp, self.index_file)
+
+    def append(self, events_by_trace: Dict[str, List[Dict]]):
+        """트레이스별 이벤트 묶음 추가 (쓰기 1회 + 인덱스 갱신 1회)"""
+        with self._locked():
+            segment = self._segment_path()
+            with open(segment, 'ab') as f:
+                offset = f.seek(0, os.SEEK_END)
+                chunks, first_offsets = [], {}
+                for trace_id, events in events_by_trace.items():
+                    first_offsets[trace_id] = offset
+                    for event in events:
+                        record = json.dumps({"trace_id": trace_id, **event}, ensure_ascii=False)
+                        line = (record + "\n").encode("utf-8")
+                        chunks.append(line)
+                        offset += len(line)
+                f.write(b"".join(chunks))
+
+            index = self.load_index()
+            now = time.time()
+            for trace_id, events in events_by_trace.items():
+                entry = index.get(trace_id)
+                if entry is None:
+                    entry = index[trace_id] = {
+                        "trace_id": trace_id,
+                        "created_at": events[0]["timestamp"],
+                        "segments": [segment.name],
+                        "offset": first_offsets[trace_id],
+                        "event_count": 0,
+                    }
+                elif segment.name not in entry["segments"]:
+                    entry["segments"].append(segment.name)
+                entry["event_count"] += len(events)
+                entry["last_event"] = events[-1]["event"]
+                entry["updated_at"] = events[-1]["timestamp"]
+                entry["mtime"] = now
+            self._save_index(index)
+
+    def read(self, trace_id: str) -> Optional[List[Dict]]:
+        """
+        인덱스의 세그먼트/오프셋부터 해당 트레이스 이벤트만 읽기
+
+        인덱스에서 제외된(INDEX_LIMIT 초과) 트레이스는 세그먼트 전체 스캔으로 조회
+        """
+        entry = self.load_index().get(trace_id)
+        if entry is None:
+            events = []
+            for path in self._all_segments():
+                self._scan(path, trace_id, events)
+            return events or None
+        events = []
+        for i, name in enumerate(entry["segments"]):
+            path = self.segment_dir / name
+            if path.exists():
+                self._scan(path, trace_id, events, entry["offset"] if i == 0 else 0)
+        return events
+
+    def _all_segments(self) -> List[Path]:
+        """세그먼트 파일 (기록 순서: 날짜 → 번호)"""
+        def order(path: Path):
+            parts = path.stem.split("_")
+            return parts[1], int(parts[2]) if len(parts) > 2 and parts[2].isdigit() else 0
+        return sorted(self.segment_dir.glob("traces_*.jsonl"), key=order)
+
+    @staticmethod
+    def _scan(path: Path, trace_id: str, events: List[Dict], offset: int = 0):
+        with open(path, 'rb') as f:
+            f.seek(offset)
+            for line in f:
+                if trace_id.encode() not in line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                if record.pop("trace_id", None) == trace_id:
+                    events.append(record)
+
+    def recent(self, limit: int = 10) -> List[Dict]:
+        entries = sorted(self.load_index().values(), key=lambda e: e["mtime"], reverse=True)
+        return entries[:limit]
+
 
 class TraceManager:
     """통합 Trace ID 관리자"""
@@ -24,6 +174,11 @@ class TraceManager:
     _current_trace_id: Optional[str] = None
     _trace_stack: list = []
 
+    # 기록 대기 이벤트 (trace_id → events), 열린 컨텍스트 수 (trace_id → depth)
+    _buffers: Dict[str, List[Dict]] = {}
+    _open_contexts: Dict[str, int] = {}
+    _buffer_lock = threading.Lock()
+
     def __init__(self):
         self.log_dir = LOG_DIR
         self.log_dir.mkdir(parents=True, exist_ok=True)
@@ -70,26 +225,45 @@ class TraceManager:
     @classmethod
     @contextmanager
     def trace_context(cls, trace_id: Optional[str] = None, operation: str = "unknown"):
-        """Trace 컨텍스트 매니저"""
+        """Trace 컨텍스트 매니저 (종료 시 버퍼 기록, TRACE_END 에 duration_ms)"""
         if trace_id is None:
             trace_id = cls.generate_trace_id()
 
         # 스택에 푸시
-        cls._trace_stack.append(cls._current_trace_id)
+        parent_id = cls._current_trace_id
+        cls._trace_stack.append(parent_id)
         cls._current_trace_id = trace_id
+        with cls._buffer_lock:
+            cls._open_contexts[trace_id] = cls._open_contexts.get(trace_id, 0) + 1
 
         manager = cls()
-        manager.log_event("TRACE_START", {"operation": operation})
+        start_data = {"operation": operation}
+        if parent_id and parent_id != trace_id:
+            start_data["parent_trace_id"] = parent_id
+        manager.log_event("TRACE_START", start_data)
+        started = time.perf_counter()
 
         try:
             yield trace_id
         except Exception as e:
-            manager.log_event("TRACE_ERROR", {"operation": operation, "error": str(e)})
+            manager.log_event("TRACE_ERROR", {
+                "operation": operation,
+                "error": str(e),
+                "duration_ms": _elapsed_ms(started)
+            })
             raise
         finally:
-            manager.log_event("TRACE_END", {"operation": operation})
+            manager.log_event("TRACE_END", {"operation": operation, "duration_ms": _elapsed_ms(started)})
             # 스택에서 팝
             cls._current_trace_id = cls._trace_stack.pop() if cls._trace_stack else None
+            with cls._buffer_lock:
+                depth = cls._open_contexts.get(trace_id, 1) - 1
+                if depth:
+                    cls._open_contexts[trace_id] = depth
+                else:
+                    cls._open_contexts.pop(trace_id, None)
+            if not depth:
+                manager.flush(trace_id)
 
     def log_event(self, event_type: str, data: Dict[str, Any] = None):
         """이벤트 로깅"""
@@ -109,60 +283,61 @@ class TraceManager:
         self._save_trace_detail(trace_id, log_data)
 
     def _save_trace_detail(self, trace_id: str, log_data: Dict):
-        """트레이스 상세 로그 저장"""
+        """트레이스 상세 로그 버퍼링 (열린 컨텍스트가 없거나 버퍼가 차면 바로 기록)"""
         if trace_id == "NO-TRACE":
             return
 
-        trace_file = self.log_dir / f"{trace_id}.json"
+        cls = type(self)
+        with cls._buffer_lock:
+            buffer = cls._buffers.setdefault(trace_id, [])
+            buffer.append(log_data)
+            flush_now = trace_id not in cls._open_contexts or len(buffer) >= FLUSH_EVENTS
 
-        # 기존 데이터 로드 또는 새로 생성
-        if trace_file.exists():
-            with open(trace_file, 'r', encoding='utf-8') as f:
-                trace_data = json.load(f)
-        else:
-            trace_data = {
-                "trace_id": trace_id,
-                "created_at": datetime.now().isoformat(),
-                "events": []
-            }
-
-        # 이벤트 추가
-        trace_data["events"].append(log_data)
-        trace_data["updated_at"] = datetime.now().isoformat()
+        if flush_now:
+            self.flush(trace_id)
 
-        # 저장
-        with open(trace_file, 'w', encoding='utf-8') as f:
-            json.dump(trace_data, f, ensure_ascii=False, indent=2)
+    def flush(self, trace_id: Optional[str] = None):
+        """버퍼 이벤트를 JSONL 세그먼트에 기록 (trace_id 없으면 전체)"""
+        cls = type(self)
+        with cls._buffer_lock:
+            trace_ids = [trace_id] if trace_id else list(cls._buffers)
+            pending = {t: cls._buffers.pop(t) for t in trace_ids if cls._buffers.get(t)}
+        if pending:
+            TraceLog(self.log_dir).append(pending)
 
     def get_trace_history(self, trace_id: str) -> Optional[Dict]:
         """특정 Trace ID의 히스토리 조회"""
-        trace_file = self.log_dir / f"{trace_id}.json"
+        self.flush(trace_id)
+        events = TraceLog(self.log_dir).read(trace_id)
+
+        if events is not None:
+            return {
+                "trace_id": trace_id,
+                "created_at": events[0]["timestamp"] if events else None,
+                "updated_at": events[-1]["timestamp"] if events else None,
+                "events": events
+            }
 
+        # 이전 형식 ({trace_id}.json) 호환
+        trace_file = self.log_dir / f"{trace_id}.json"
         if trace_file.exists():
             with open(trace_file, 'r', encoding='utf-8') as f:
                 return json.load(f)
         return None
 
     def get_recent_traces(self, limit: int = 10) -> list:
-        """최근 트레이스 목록 조회"""
-        trace_files = sorted(
-            self.log_dir.glob("SF-*.json"),
-            key=lambda x: x.stat().st_mtime,
-            reverse=True
-        )[:limit]
-
-        traces = []
-        for tf in trace_files:
-            with open(tf, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                traces.append({
-                    "trace_id": data["trace_id"],
-                    "created_at": data["created_at"],
-                    "event_count": len(data["events"]),
-                    "last_event": data["events"][-1]["event"] if data["events"] else None
-                })
-
-        return traces
+        """최근 트레이스 목록 조회 (인덱스만 읽음)"""
+        self.flush()
+        return [
+            {
+                "trace_id": entry["trace_id"],
+                "created_at": entry["created_at"],
+                "updated_at": entry.get("updated_at"),
+                "event_count": entry["event_count"],
+                "last_event": entry.get("last_event")
+            }
+            for entry in TraceLog(self.log_dir).recent(limit)
+        ]
 
 
 def traced(operation: str = None):
@@ -179,12 +354,14 @@ def traced(operation: str = None):
                     "args_count": len(args),
                     "kwargs_keys": list(kwargs.keys())
                 })
+                started = time.perf_counter()
 
                 result = func(*args, **kwargs)
 
                 manager.log_event("FUNC_RETURN", {
                     "function": func.__name__,
-                    "success": True
+                    "success": True,
+                    "duration_ms": _elapsed_ms(started)
                 })
 
                 return result
@@ -200,12 +377,14 @@ def traced(operation: str = None):
                     "args_count": len(args),
                     "kwargs_keys": list(kwargs.keys())
                 })
+                started = time.perf_counter()
 
                 result = await func(*args, **kwargs)
 
                 manager.log_event("ASYNC_FUNC_RETURN", {
                     "function": func.__name__,
-                    "success": True
+                    "success": True,
+                    "duration_ms": _elapsed_ms(started)
                 })
 
                 return result
@@ -219,6 +398,22 @@ def traced(operation: str = None):
     return decorator
 
 
+def _elapsed_ms(started: float) -> float:
+    return round((time.perf_counter() - started) * 1000, 2)
+
+
+@atexit.register
+def _flush_pending_traces():
+    """종료 시 기록 대기 이벤트 저장"""
+    pending = {t: e for t, e in TraceManager._buffers.items() if e}
+    TraceManager._buffers.clear()
+    if pending:
+        try:
+            TraceLog(LOG_DIR).append(pending)
+        except OSError:
+            pass
+
+
 # 편의 함수
 def get_trace_id() -> Optional[str]:
     """현재 Trace ID 가져오기"""
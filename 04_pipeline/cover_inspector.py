@@ -9,17 +9,26 @@ WO-COVER-PROCESS-v2.0
 3. 폰트/환경 검증 (Pillow 버전, 폰트 SHA256)
 4. Golden 이미지 회귀 테스트 (SSIM >= 0.995 또는 픽셀 차이 <= 0.5%)
 
+이미지 비교/영역 분석은 image_analysis (NumPy 배열) 사용,
+검수 1회당 이미지는 한 번만 디코드.
+
 승인: PD 박세준 (2026-02-12)
 """
 
 import os
+import sys
 import hashlib
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, Optional, Tuple
 
 import PIL
-from PIL import Image, ImageChops, ImageStat
+
+sys.path.insert(0, str(Path(__file__).parent))
+from image_analysis import (
+    ImageData, ImageLike, amplified_diff, as_image_data,
+    mean_brightness, pixel_diff_rate, region, ssim,
+)
 
 # ============================================================================
 # 프로젝트 설정
@@ -84,96 +93,37 @@ def get_file_sha256(file_path: Path) -> str:
 # Golden Regression 테스트 (v2)
 # ============================================================================
 
-def calculate_pixel_diff_rate(img1: Image.Image, img2: Image.Image) -> float:
+def calculate_pixel_diff_rate(img1: ImageLike, img2: ImageLike) -> float:
     """
     두 이미지의 픽셀 차이율 계산 (0~100%)
 
     차이 픽셀 수 / 전체 픽셀 수 * 100
     임계값: RGB 각 채널 10 이상 차이 시 다른 픽셀로 판정
     """
-    if img1.size != img2.size:
-        img2 = img2.resize(img1.size, Image.LANCZOS)
-
-    img1_rgb = img1.convert("RGB")
-    img2_rgb = img2.convert("RGB")
-
-    diff = ImageChops.difference(img1_rgb, img2_rgb)
+    return pixel_diff_rate(img1, img2, threshold=10)
 
-    # 차이가 있는 픽셀 수 계산
-    threshold = 10  # RGB 각 채널 10 이상 차이
-    diff_pixels = 0
-    total_pixels = img1.size[0] * img1.size[1]
 
-    for pixel in diff.getdata():
-        if any(c > threshold for c in pixel):
-            diff_pixels += 1
-
-    return (diff_pixels / total_pixels) * 100
-
-
-def calculate_ssim_approx(img1: Image.Image, img2: Image.Image) -> float:
+def calculate_ssim(img1: ImageLike, img2: ImageLike) -> float:
     """
-    간이 SSIM 계산 (PIL만 사용)
+    윈도우 SSIM 계산 (11x11 가우시안, 그레이스케일)
 
-    실제 SSIM과 유사하게 밝기/대비/구조 비교
-    scikit-image 없이 PIL로 근사값 계산
+    scikit-image structural_similarity(gaussian_weights=True) 와 같은 정의
     """
-    if img1.size != img2.size:
-        img2 = img2.resize(img1.size, Image.LANCZOS)
-
-    img1_gray = img1.convert("L")
-    img2_gray = img2.convert("L")
-
-    stat1 = ImageStat.Stat(img1_gray)
-    stat2 = ImageStat.Stat(img2_gray)
-
-    # 평균
-    mean1 = stat1.mean[0]
-    mean2 = stat2.mean[0]
-
-    # 분산
-    var1 = stat1.var[0]
-    var2 = stat2.var[0]
-
-    # 공분산 근사 (차이 이미지 기반)
-    diff = ImageChops.difference(img1_gray, img2_gray)
-    diff_stat = ImageStat.Stat(diff)
-    mean_diff = diff_stat.mean[0]
-
-    # SSIM 상수
-    C1 = (0.01 * 255) ** 2
-    C2 = (0.03 * 255) ** 2
-
-    # 밝기 비교
-    luminance = (2 * mean1 * mean2 + C1) / (mean1 ** 2 + mean2 ** 2 + C1)
-
-    # 대비 비교
-    contrast = (2 * (var1 ** 0.5) * (var2 ** 0.5) + C2) / (var1 + var2 + C2)
+    return round(max(0.0, min(1.0, ssim(img1, img2))), 4)
 
-    # 구조 비교 (mean_diff 기반 근사)
-    structure = 1 - (mean_diff / 255)
 
-    # SSIM 근사값
-    ssim = luminance * contrast * structure
+# 하위 호환 (v2 초기: ImageStat 기반 근사값 -> 실제 SSIM)
+calculate_ssim_approx = calculate_ssim
 
-    return round(max(0, min(1, ssim)), 4)
 
-
-def generate_diff_image(img1: Image.Image, img2: Image.Image, output_path: Path) -> None:
+def generate_diff_image(img1: ImageLike, img2: ImageLike, output_path: Path) -> None:
     """차이 이미지 생성 및 저장"""
-    if img1.size != img2.size:
-        img2 = img2.resize(img1.size, Image.LANCZOS)
-
-    diff = ImageChops.difference(img1.convert("RGB"), img2.convert("RGB"))
-
     # 차이 강조 (10배 증폭)
-    diff = diff.point(lambda x: min(255, x * 10))
-
-    diff.save(output_path, "PNG")
+    amplified_diff(img1, img2, gain=10).save(output_path, "PNG")
 
 
 def run_golden_regression_test(
-    cover_path: str,
+    cover_path: ImageLike,
     golden_path: str,
     log_dir: Path
 ) -> Dict:
@@ -195,13 +145,13 @@ def run_golden_regression_test(
     }
 
     try:
-        cover_img = Image.open(cover_path)
-        golden_img = Image.open(golden_path)
+        cover_img = as_image_data(cover_path)
+        golden_img = ImageData.open(golden_path).resized(cover_img.size)
 
         # SSIM 계산
-        ssim = calculate_ssim_approx(cover_img, golden_img)
-        result["ssim_score"] = ssim
-        result["ssim_pass"] = ssim >= MIN_SSIM_SCORE
+        ssim_score = calculate_ssim(cover_img, golden_img)
+        result["ssim_score"] = ssim_score
+        result["ssim_pass"] = ssim_score >= MIN_SSIM_SCORE
 
         # 픽셀 차이율 계산
         pixel_diff = calculate_pixel_diff_rate(cover_img, golden_img)
@@ -222,7 +172,7 @@ def run_golden_regression_test(
         # SSIM 점수 저장
         ssim_path = log_dir / "ssim_score.txt"
         with open(ssim_path, "w") as f:
-            f.write(f"SSIM Score: {ssim}\n")
+            f.write(f"SSIM Score: {ssim_score}\n")
             f.write(f"Min Required: {MIN_SSIM_SCORE}\n")
             f.write(f"Pixel Diff: {pixel_diff:.3f}%\n")
             f.write(f"Max Allowed: {MAX_PIXEL_DIFF_PERCENT}%\n")
@@ -239,11 +189,11 @@ def run_golden_regression_test(
 # 4단계 검증 시스템 (v2)
 # ============================================================================
 
-def stage1_spec_validation(cover_path: str) -> Dict:
+def stage1_spec_validation(cover_path: str, image: Optional[ImageData] = None) -> Dict:
     """Stage 1: Spec 검증 (해상도, 포맷)"""
     result = {"stage": "spec", "checks": {}, "pass": True}
 
-    img = Image.open(cover_path)
+    img = image or ImageData.open(cover_path)
 
     # 해상도
     width, height = img.size
@@ -266,11 +216,15 @@ def stage1_spec_validation(cover_path: str) -> Dict:
     return result
 
 
-def stage2_parameter_validation(cover_path: str, expected_english: str) -> Dict:
+def stage2_parameter_validation(
+    cover_path: str,
+    expected_english: str,
+    image: Optional[ImageData] = None
+) -> Dict:
     """Stage 2: 코드 파라미터 검증 (UPPERCASE, 그라데이션)"""
     result = {"stage": "parameter", "checks": {}, "pass": True}
 
-    img = Image.open(cover_path).convert("RGBA")
+    img = image or ImageData.open(cover_path)
 
     # UPPERCASE
     uppercase_pass = expected_english == expected_english.upper()
@@ -281,9 +235,7 @@ def stage2_parameter_validation(cover_path: str, expected_english: str) -> Dict:
     }
 
     # 그라데이션 (상단 밝기 분석)
-    top_region = img.crop((0, 0, img.size[0], 50))
-    pixels = list(top_region.getdata())
-    avg_brightness = sum(sum(p[:3]) / 3 for p in pixels) / len(pixels)
+    avg_brightness = mean_brightness(region(img, 0, 50))
     gradient_pass = avg_brightness < 200
     result["checks"]["gradient"] = {
         "expected": "상단 어둡게 (<200)",
@@ -312,7 +264,12 @@ def stage3_environment_validation() -> Dict:
     return result
 
 
-def stage4_golden_regression(cover_path: str, english_name: str, log_dir: Path) -> Dict:
+def stage4_golden_regression(
+    cover_path: str,
+    english_name: str,
+    log_dir: Path,
+    image: Optional[ImageData] = None
+) -> Dict:
     """Stage 4: Golden 이미지 회귀 테스트"""
     result = {"stage": "golden_regression", "checks": {}, "pass": False}
 
@@ -328,7 +285,7 @@ def stage4_golden_regression(cover_path: str, english_name: str, log_dir: Path)
         return result
 
     # 회귀 테스트 실행
-    regression = run_golden_regression_test(cover_path, str(golden_path), log_dir)
+    regression = run_golden_regression_test(image or cover_path, str(golden_path), log_dir)
 
     result["checks"]["ssim"] = {
         "expected": f">= {MIN_SSIM_SCORE}",
@@ -396,15 +353,22 @@ def inspect_cover(
     log_dir = LOG_DIR / date_str / english_name.lower()
     log_dir.mkdir(parents=True, exist_ok=True)
 
+    # 이미지 1회 디코드 (전 단계 공유)
+    try:
+        cover_img = ImageData.open(cover)
+    except Exception as e:
+        result["error"] = f"이미지 읽기 실패: {e}"
+        return result
+
     # ─────────────────────────────────────────────────────
     # Stage 1: Spec 검증
     # ─────────────────────────────────────────────────────
-    result["stages"]["spec"] = stage1_spec_validation(cover_path)
+    result["stages"]["spec"] = stage1_spec_validation(cover_path, cover_img)
 
     # ─────────────────────────────────────────────────────
     # Stage 2: 코드 파라미터 검증
     # ─────────────────────────────────────────────────────
-    result["stages"]["parameter"] = stage2_parameter_validation(cover_path, english_name)
+    result["stages"]["parameter"] = stage2_parameter_validation(cover_path, english_name, cover_img)
 
     # ─────────────────────────────────────────────────────
     # Stage 3: 폰트/환경 검증
@@ -416,7 +380,7 @@ def inspect_cover(
     # ─────────────────────────────────────────────────────
     if run_golden_test:
         result["stages"]["golden_regression"] = stage4_golden_regression(
-            cover_path, english_name, log_dir
+            cover_path, english_name, log_dir, cover_img
         )
     else:
         result["stages"]["golden_regression"] = {
@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+"""
+food_data_store.py - food_data.json 공용 저장소
+
+배치 스크립트/에이전트/봇이 각자 json.load + 선형 탐색하던 음식 데이터를
+프로세스 단위 1회 로드 + 사전 인덱스로 조회:
+- 지연 로드 (첫 조회 시)
+- mtime/크기 검증 캐시 (파일 변경 시 자동 재로드)
+- 인덱스: 번호, 영문명(대소문자/구분자 무시), 한글명, 안전도
+- 선택: pickle 스냅샷 (스키마 버전 + 원본 mtime 검증, 콜드 스타트 단축)
+
+반환되는 dict 는 프로세스 공용 (읽기 전용). 수정이 필요하면 copy.deepcopy 사용.
+
+사용법:
+    from food_data_store import get_food_store
+
+    store = get_food_store()
+    store.get(44)                  # {"name": "아몬드", "english_name": "almonds", ...}
+    store.find("sweet potato")     # 영문/한글/번호 모두 허용
+    store.ids_by_safety("FORBIDDEN")
+    store.data                     # 기존 json.load 결과와 동일한 dict
+    store.require()                # data + 파일 없으면 FileNotFoundError
+
+환경 변수:
+    FOOD_DATA_PATH=<경로>          데이터 파일 (기본: 02_config/food_data.json)
+    FOOD_DATA_SNAPSHOT=on          pickle 스냅샷 사용
+"""
+
+import os
+import json
+import hashlib
+import pickle
+import re
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# 번호 폴더 구조 우선, 레거시 config/ 경로 폴백
+FOOD_DATA_CANDIDATES = (
+    PROJECT_ROOT / "02_config" / "food_data.json",
+    PROJECT_ROOT / "config" / "food_data.json",
+)
+SNAPSHOT_DIR = PROJECT_ROOT / ".cache" / "food_data"
+
+# 스냅샷 구조가 바뀌면 올려서 기존 스냅샷 무시
+SNAPSHOT_SCHEMA_VERSION = 1
+
+SAFETY_LEVELS = ("SAFE", "CAUTION", "DANGER", "FORBIDDEN")
+
+FoodId = Union[int, str]
+
+_NON_ALNUM = re.compile(r"[^0-9a-z가-힣]+")
+
+
+def normalize_name(name: str) -> str:
+    """조회용 이름 정규화 (소문자, 공백/밑줄/하이픈 제거)"""
+    return _NON_ALNUM.sub("", str(name).lower())
+
+
+def default_food_data_path() -> Path:
+    """환경 변수 > 02_config > config 순으로 존재하는 경로"""
+    env_path = os.getenv("FOOD_DATA_PATH")
+    if env_path:
+        return Path(env_path)
+    for candidate in FOOD_DATA_CANDIDATES:
+        if candidate.exists():
+            return candidate
+    return FOOD_DATA_CANDIDATES[0]
+
+
+def _snapshot_enabled() -> bool:
+    return os.getenv("FOOD_DATA_SNAPSHOT", "off").lower() in ("1", "on", "true", "yes")
+
+
+class FoodDataStore:
+    """
+    food_data.json 인덱스 저장소
+
+    - 조회마다 stat 1회로 변경 감지 (변경 시 재로드 + 인덱스 재구축)
+    - 파일이 없으면 빈 데이터 (exists() 로 확인)
+    """
+
+    def __init__(self, path: Optional[Union[str, Path]] = None, snapshot: Optional[bool] = None):
+        self.path = Path(path) if path else default_food_data_path()
+        self.snapshot = _snapshot_enabled() if snapshot is None else snapshot
+        self.loads = 0
+        self._signature: Optional[Tuple[int, int]] = None
+        self._data: Dict[str, Dict] = {}
+        self._by_english: Dict[str, str] = {}
+        self._by_korean: Dict[str, str] = {}
+        self._by_safety: Dict[str, List[str]] = {}
+        self._lock = threading.Lock()
+
+    # ---------- 로드 ----------
+
+    def _stat_signature(self) -> Optional[Tuple[int, int]]:
+        try:
+            st = self.path.stat()
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def _snapshot_path(self) -> Path:
+        path_key = hashlib.sha1(str(self.path.resolve()).encode("utf-8")).hexdigest()[:12]
+        return SNAPSHOT_DIR / f"{self.path.stem}.{path_key}.pkl"
+
+    def _read_snapshot(self, signature: Tuple[int, int]) -> Optional[Dict]:
+        try:
+            with open(self._snapshot_path(), "rb") as f:
+                payload = pickle.load(f)
+        except Exception:
+            return None
+        if payload.get("schema") != SNAPSHOT_SCHEMA_VERSION or tuple(payload.get("signature", ())) != signature:
+            return None
+        return payload
+
+    def _write_snapshot(self, signature: Tuple[int, int]):
+        path = self._snapshot_path()
+        payload = {
+            "schema": SNAPSHOT_SCHEMA_VERSION,
+            "signature": signature,
+            "data": self._data,
+            "by_english": self._by_english,
+            "by_korean": self._by_korean,
+            "by_safety": self._by_safety,
+        }
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".tmp")
+            with open(tmp_path, "wb") as f:
+                pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
+
+    def _build_indexes(self):
+        by_english, by_korean, by_safety = {}, {}, {level: [] for level in SAFETY_LEVELS}
+        for food_id, entry in self._data.items():
+            if not isinstance(entry, dict):
+                continue
+            english = entry.get("english_name")
+            if english:
+                by_english.setdefault(normalize_name(english), food_id)
+            korean = entry.get("name")
+            if korean:
+                by_korean.setdefault(normalize_name(korean), food_id)
+            safety = str(entry.get("safety", "")).upper()
+            by_safety.setdefault(safety, []).append(food_id)
+        self._by_english = by_english
+        self._by_korean = by_korean
+        self._by_safety = by_safety
+
+    def _ensure_loaded(self):
+        signature = self._stat_signature()
+        if signature == self._signature:
+            return
+        with self._lock:
+            if signature == self._signature:
+                return
+            if signature is None:
+                self._data = {}
+                self._build_indexes()
+            else:
+                payload = self._read_snapshot(signature) if self.snapshot else None
+                if payload:
+                    self._data = payload["data"]
+                    self._by_english = payload["by_english"]
+                    self._by_korean = payload["by_korean"]
+                    self._by_safety = payload["by_safety"]
+                else:
+                    with open(self.path, "r", encoding="utf-8") as f:
+                        self._data = json.load(f)
+                    self._build_indexes()
+                    if self.snapshot:
+                        self._write_snapshot(signature)
+                self.loads += 1
+            self._signature = signature
+
+    def reload(self):
+        """강제 재로드"""
+        self._signature = None
+        self._ensure_loaded()
+
+    # ---------- 조회 ----------
+
+    def exists(self) -> bool:
+        return self.path.exists()
+
+    @property
+    def data(self) -> Dict[str, Dict]:
+        """전체 데이터 ({"1": {...}, "2": {...}}, json.load 결과와 동일)"""
+        self._ensure_loaded()
+        return self._data
+
+    def require(self) -> Dict[str, Dict]:
+        """data 와 동일, 파일이 없으면 FileNotFoundError (기존 open() 로더 동작)"""
+        if not self.exists():
+            raise FileNotFoundError(f"food_data.json 없음: {self.path}")
+        return self.data
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __contains__(self, food_id: FoodId) -> bool:
+        return self.get(food_id) is not None
+
+    def get(self, food_id: FoodId, default: Optional[Dict] = None) -> Optional[Dict]:
+        """번호로 조회 (44, "44", "044" 모두 허용)"""
+        self._ensure_loaded()
+        key = str(food_id).strip()
+        if key.isdigit():
+            key = str(int(key))
+        return self._data.get(key, default)
+
+    def id_by_english(self, english_name: str) -> Optional[str]:
+        self._ensure_loaded()
+        return self._by_english.get(normalize_name(english_name))
+
+    def id_by_korean(self, korean_name: str) -> Optional[str]:
+        self._ensure_loaded()
+        return self._by_korean.get(normalize_name(korean_name))
+
+    def by_english(self, english_name: str) -> Optional[Dict]:
+        """영문명 조회 ("sweet_potato" = "SweetPotato" = "sweet potato")"""
+        food_id = self.id_by_english(english_name)
+        return self._data.get(food_id) if food_id else None
+
+    def by_korean(self, korean_name: str) -> Optional[Dict]:
+        """한글명 조회 (공백 무시)"""
+        food_id = self.id_by_korean(korean_name)
+        return self._data.get(food_id) if food_id else None
+
+    def find_id(self, query: FoodId) -> Optional[str]:
+        """번호/영문명/한글명 -> 번호 문자열"""
+        if self.get(query) is not None:
+            key = str(query).strip()
+            return str(int(key)) if key.isdigit() else key
+        query = str(query)
+        return self.id_by_english(query) or self.id_by_korean(query)
+
+    def find(self, query: FoodId) -> Optional[Dict]:
+        """번호/영문명/한글명 통합 조회"""
+        food_id = self.find_id(query)
+        return self._data.get(food_id) if food_id else None
+
+    def resolve_folder(self, folder_name: str) -> Optional[str]:
+        """
+        콘텐츠 폴더명 -> 번호
+
+        "044_Almonds", "169_duck_오리고기" 처럼 번호 접두가 있으면 번호 우선,
+        없으면 구분자로 나눈 연속 토큰 묶음을 긴 것부터 영문/한글명으로 조회
+        ("sweet_potato_final" -> "sweetpotato").
+        """
+        self._ensure_loaded()
+        tokens = [t for t in re.split(r"[_\-\s]+", str(folder_name)) if t]
+        if tokens and tokens[0].isdigit():
+            if self.get(tokens[0]) is not None:
+                return str(int(tokens[0]))
+            tokens = tokens[1:]
+        for size in range(len(tokens), 0, -1):
+            for start in range(len(tokens) - size + 1):
+                name = "".join(tokens[start:start + size])
+                food_id = self.id_by_english(name) or self.id_by_korean(name)
+                if food_id:
+                    return food_id
+        return None
+
+    def safety_of(self, query: FoodId, default: Optional[str] = None) -> Optional[str]:
+        """안전도 (대문자, 예: "SAFE")"""
+        entry = self.find(query)
+        if not entry:
+            return default
+        return str(entry.get("safety", default or "")).upper() or default
+
+    def ids_by_safety(self, safety: str) -> List[str]:
+        """안전도별 번호 목록 (파일 순서)"""
+        self._ensure_loaded()
+        return list(self._by_safety.get(str(safety).upper(), []))
+
+    def english_names_by_safety(self) -> Dict[str, List[str]]:
+        """안전도 -> 영문명 목록 (food_safety.json 형식 호환용, 소문자 키)"""
+        self._ensure_loaded()
+        return {
+            level.lower(): [self._data[i].get("english_name", "") for i in ids]
+            for level, ids in self._by_safety.items()
+            if level
+        }
+
+
+_stores: Dict[Path, FoodDataStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_food_store(path: Optional[Union[str, Path]] = None) -> FoodDataStore:
+    """프로세스 공용 저장소 (경로별 1개)"""
+    resolved = Path(path) if path else default_food_data_path()
+    with _stores_lock:
+        store = _stores.get(resolved)
+        if store is None:
+            store = FoodDataStore(resolved)
+            _stores[resolved] = store
+        return store
+
+
+def load_food_data(path: Optional[Union[str, Path]] = None) -> Dict[str, Dict]:
+    """기존 load_food_data() 대체 (공용 캐시, 파일 없으면 빈 dict)"""
+    return get_food_store(path).data
@@ -0,0 +1,403 @@
+#!/usr/bin/env python3
+"""
+image_hash_index.py - 지각 해시(pHash/dHash) 이미지 인덱스
+
+파일 MD5 는 리사이즈/재인코딩/텍스트 오버레이 후 일치하지 않으므로,
+유사 이미지 검출은 지각 해시 + 해밍 거리로 판정:
+- dHash: 9x8 그레이 인접 픽셀 밝기 차이 (64bit)
+- pHash: 32x32 그레이 DCT 저주파 8x8 중앙값 비교 (64bit)
+
+인덱스는 JSON 으로 저장하고 (경로, mtime, 크기) 가 바뀐 파일만 재해시.
+반경 질의는 BK-tree (해밍 거리 삼각 부등식) 로 전체 비교 없이 처리.
+
+사용법:
+    from image_hash_index import ImageHashIndex
+
+    index = ImageHashIndex.for_pool("contents", [PROJECT_ROOT / "01_contents"])
+    index.update()                         # 변경분만 해시
+    index.query("new_cta.jpg", radius=8)   # [(거리, 경로), ...]
+    index.duplicate_groups(radius=4)       # [[경로, 경로], ...]
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+from PIL import Image
+
+PROJECT_ROOT = Path(__file__).parent.parent
+DEFAULT_INDEX_DIR = PROJECT_ROOT / ".cache" / "image_index"
+
+# 인덱스 형식이 바뀌면 올려서 기존 인덱스 재생성
+INDEX_VERSION = 1
+
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".webp")
+HASH_KINDS = ("phash", "dhash")
+
+# 기본 인덱스 대상 (로컬에 존재하는 폴더만 사용)
+DEFAULT_ROOTS = (
+    PROJECT_ROOT / "01_contents",
+    PROJECT_ROOT / "contents",
+    PROJECT_ROOT / "content" / "images" / "sunshine" / "cta_source",
+    PROJECT_ROOT / "04_pipeline" / "content" / "images" / "sunshine" / "cta_source",
+)
+
+# 64bit 해시 기준 권장 반경
+NEAR_DUPLICATE_RADIUS = 6   # 리사이즈/재압축/크롭 소폭
+OVERLAY_MATCH_RADIUS = 12   # 하단 텍스트 오버레이 후 원본 추적
+
+
+# ============================================
+# 지각 해시
+# ============================================
+
+def _gray_thumbnail(image: Union[Image.Image, str, Path], size: Tuple[int, int]) -> np.ndarray:
+    """축소 그레이 배열 (JPEG 은 draft 로 축소 디코드)"""
+    if isinstance(image, Image.Image):
+        img = image
+    else:
+        img = Image.open(image)
+        img.draft("L", (size[0] * 4, size[1] * 4))
+    gray = img.convert("L").resize(size, Image.Resampling.LANCZOS)
+    return np.asarray(gray, dtype=np.float64)
+
+
+def _bits_to_int(bits: np.ndarray) -> int:
+    return int.from_bytes(np.packbits(bits.astype(np.uint8).ravel()).tobytes(), "big")
+
+
+def dhash(image: Union[Image.Image, str, Path], hash_size: int = 8) -> int:
+    """dHash: 가로 인접 픽셀 밝기 증가 여부"""
+    pixels = _gray_thumbnail(image, (hash_size + 1, hash_size))
+    return _bits_to_int(pixels[:, 1:] > pixels[:, :-1])
+
+
+_DCT_CACHE: Dict[int, np.ndarray] = {}
+
+
+def _dct_matrix(n: int) -> np.ndarray:
+    """DCT-II 직교 행렬 (n x n)"""
+    if n not in _DCT_CACHE:
+        k = np.arange(n)[:, None]
+        i = np.arange(n)[None, :]
+        matrix = np.cos(np.pi * (2 * i + 1) * k / (2 * n)) * np.sqrt(2.0 / n)
+        matrix[0] /= np.sqrt(2.0)
+        _DCT_CACHE[n] = matrix
+    return _DCT_CACHE[n]
+
+
+def phash(image: Union[Image.Image, str, Path], hash_size: int = 8, highfreq_factor: int = 4) -> int:
+    """pHash: 저주파 DCT 계수의 중앙값 대비 크기"""
+    n = hash_size * highfreq_factor
+    pixels = _gray_thumbnail(image, (n, n))
+    dct = _dct_matrix(n)
+    low = (dct @ pixels @ dct.T)[:hash_size, :hash_size]
+    return _bits_to_int(low > np.median(low))
+
+
+def image_hashes(image: Union[Image.Image, str, Path]) -> Dict[str, int]:
+    """pHash + dHash (파일은 1회 디코드)"""
+    if not isinstance(image, Image.Image):
+        with Image.open(image) as img:
+            img.draft("L", (128, 128))
+            img = img.convert("L")
+            return {"phash": phash(img), "dhash": dhash(img)}
+    return {"phash": phash(image), "dhash": dhash(image)}
+
+
+def hamming(a: int, b: int) -> int:
+    """해밍 거리"""
+    return bin(a ^ b).count("1")
+
+
+# ============================================
+# BK-tree
+# ============================================
+
+class BKTree:
+    """
+    해밍 거리 BK-tree
+
+    노드 = [해시, 값 목록, {거리: 자식 노드}]
+    질의 시 |d - r| ~ d + r 범위 자식만 탐색.
+    """
+
+    def __init__(self):
+        self._root: Optional[list] = None
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, key: int, value):
+        self._size += 1
+        if self._root is None:
+            self._root = [key, [value], {}]
+            return
+        node = self._root
+        while True:
+            distance = hamming(key, node[0])
+            if distance == 0:
+                node[1].append(value)
+                return
+            child = node[2].get(distance)
+            if child is None:
+                node[2][distance] = [key, [value], {}]
+                return
+            node = child
+
+    def query(self, key: int, radius: int) -> List[Tuple[int, object]]:
+        """반경 이내 (거리, 값) 목록 (거리 오름차순)"""
+        if self._root is None:
+            return []
+        found = []
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            distance = hamming(key, node[0])
+            if distance <= radius:
+                found.extend((distance, value) for value in node[1])
+            low, high = distance - radius, distance + radius
+            for child_distance, child in node[2].items():
+                if low <= child_distance <= high:
+                    stack.append(child)
+        found.sort(key=lambda item: (item[0], str(item[1])))
+        return found
+
+
+# ============================================
+# 영속 인덱스
+# ============================================
+
+class ImageHashIndex:
+    """
+    폴더 묶음(풀) 단위 지각 해시 인덱스
+
+    - 저장: <index_dir>/<풀 이름>.json
+    - 증분 갱신: (mtime_ns, 크기) 동일 파일은 재해시 생략, 삭제 파일 제거
+    - 질의: 해시 종류(phash/dhash)별 BK-tree (갱신 후 지연 재구축)
+    """
+
+    def __init__(
+        self,
+        index_path: Union[str, Path],
+        roots: Iterable[Union[str, Path]] = (),
+        kind: str = "phash",
+        extensions: Tuple[str, ...] = IMAGE_EXTENSIONS,
+    ):
+        if kind not in HASH_KINDS:
+            raise ValueError(f"Unknown hash kind: {kind} (허용: {', '.join(HASH_KINDS)})")
+        self.index_path = Path(index_path)
+        self.roots = [Path(r) for r in roots]
+        self.kind = kind
+        self.extensions = tuple(e.lower() for e in extensions)
+        self.entries: Dict[str, Dict] = {}
+        self._trees: Dict[str, BKTree] = {}
+        self._dirty = False
+        self.load()
+
+    @classmethod
+    def for_pool(cls, name: str, roots: Iterable[Union[str, Path]], **kwargs) -> "ImageHashIndex":
+        """이름 있는 풀 인덱스 (기본 위치 .cache/image_index/<name>.json)"""
+        index_dir = Path(os.getenv("IMAGE_INDEX_DIR") or DEFAULT_INDEX_DIR)
+        return cls(index_dir / f"{name}.json", roots, **kwargs)
+
+    # ---------- 저장/로드 ----------
+
+    def load(self):
+        if not self.index_path.exists():
+            return
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("version") != INDEX_VERSION:
+            return
+        self.entries = {
+            path: {**entry, "phash": int(entry["phash"], 16), "dhash": int(entry["dhash"], 16)}
+            for path, entry in data.get("entries", {}).items()
+        }
+
+    def save(self):
+        """변경 시에만 원자적 저장"""
+        if not self._dirty:
+            return
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "version": INDEX_VERSION,
+            "entries": {
+                path: {**entry, "phash": f"{entry['phash']:016x}", "dhash": f"{entry['dhash']:016x}"}
+                for path, entry in sorted(self.entries.items())
+            },
+        }
+        tmp_path = self.index_path.with_suffix(".json.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, self.index_path)
+        self._dirty = False
+
+    # ---------- 갱신 ----------
+
+    def _scan(self, roots: List[Path]):
+        for root in roots:
+            if root.is_file():
+                yield root
+                continue
+            if not root.is_dir():
+                continue
+            for dirpath, _, filenames in os.walk(root):
+                for filename in filenames:
+                    if filename.lower().endswith(self.extensions) and not filename.startswith("."):
+                        yield Path(dirpath) / filename
+
+    def update(self, roots: Optional[Iterable[Union[str, Path]]] = None, save: bool = True) -> Dict[str, int]:
+        """
+        변경분 증분 갱신
+
+        Returns:
+            {"added", "updated", "removed", "unchanged", "failed"} 건수
+        """
+        scan_roots = [Path(r) for r in roots] if roots is not None else self.roots
+        stats = {"added": 0, "updated": 0, "removed": 0, "unchanged": 0, "failed": 0}
+        seen = set()
+
+        for path in self._scan(scan_roots):
+            key = str(path.resolve())
+            seen.add(key)
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            entry = self.entries.get(key)
+            if entry and entry["mtime_ns"] == st.st_mtime_ns and entry["size"] == st.st_size:
+                stats["unchanged"] += 1
+                continue
+            try:
+                hashes = image_hashes(path)
+            except Exception:
+                stats["failed"] += 1
+                continue
+            stats["updated" if entry else "added"] += 1
+            self.entries[key] = {"mtime_ns": st.st_mtime_ns, "size": st.st_size, **hashes}
+            self._dirty = True
+
+        # 스캔 대상 루트 아래에서 사라진 파일 제거
+        resolved_roots = [str(r.resolve()) for r in scan_roots]
+        for key in list(self.entries):
+            if key in seen:
+                continue
+            if any(key == r or key.startswith(r + os.sep) for r in resolved_roots):
+                del self.entries[key]
+                stats["removed"] += 1
+                self._dirty = True
+
+        if self._dirty:
+            self._trees = {}
+        if save:
+            self.save()
+        return stats
+
+    # ---------- 질의 ----------
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def _tree(self, kind: str) -> BKTree:
+        if kind not in self._trees:
+            tree = BKTree()
+            for path, entry in self.entries.items():
+                tree.add(entry[kind], path)
+            self._trees[kind] = tree
+        return self._trees[kind]
+
+    def hashes(self, kind: Optional[str] = None) -> set:
+        """등록된 해시 집합"""
+        kind = kind or self.kind
+        return {entry[kind] for entry in self.entries.values()}
+
+    def hash_of(self, image: Union[Image.Image, str, Path], kind: Optional[str] = None) -> int:
+        """인덱스 항목이 있으면 재사용, 없으면 계산"""
+        kind = kind or self.kind
+        if not isinstance(image, Image.Image):
+            entry = self.entries.get(str(Path(image).resolve()))
+            if entry:
+                st = Path(image).stat()
+                if entry["mtime_ns"] == st.st_mtime_ns and entry["size"] == st.st_size:
+                    return entry[kind]
+        return image_hashes(image)[kind]
+
+    def query(
+        self,
+        image: Union[Image.Image, str, Path, int],
+        radius: int = NEAR_DUPLICATE_RADIUS,
+        kind: Optional[str] = None,
+    ) -> List[Tuple[int, str]]:
+        """반경 이내 유사 이미지 [(거리, 경로)] (정수 입력 시 해시로 간주)"""
+        kind = kind or self.kind
+        key = image if isinstance(image, int) else self.hash_of(image, kind)
+        return self._tree(kind).query(key, radius)
+
+    def duplicate_groups(self, radius: int = NEAR_DUPLICATE_RADIUS, kind: Optional[str] = None) -> List[List[str]]:
+        """
+        유사 이미지 그룹 (반경 이내 연결 요소, 2개 이상만)
+
+        그룹/그룹 내 경로는 이름순 정렬.
+        """
+        kind = kind or self.kind
+        tree = self._tree(kind)
+        parent = {path: path for path in self.entries}
+
+        def find(path):
+            while parent[path] != path:
+                parent[path] = parent[parent[path]]
+                path = parent[path]
+            return path
+
+        for path, entry in self.entries.items():
+            for _, other in tree.query(entry[kind], radius):
+                root_a, root_b = find(path), find(other)
+                if root_a != root_b:
+                    parent[max(root_a, root_b)] = min(root_a, root_b)
+
+        groups: Dict[str, List[str]] = {}
+        for path in self.entries:
+            groups.setdefault(find(path), []).append(path)
+        return sorted(sorted(g) for g in groups.values() if len(g) > 1)
+
+
+def default_index() -> ImageHashIndex:
+    """콘텐츠 + CTA 풀 전체 인덱스"""
+    return ImageHashIndex.for_pool("library", DEFAULT_ROOTS)
+
+
+def main():
+    """CLI: 인덱스 갱신 + 유사 그룹 출력"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="지각 해시 이미지 인덱스")
+    parser.add_argument("roots", nargs="*", help="대상 폴더 (기본: 01_contents, contents, CTA 풀)")
+    parser.add_argument("--pool", default="library", help="인덱스 이름")
+    parser.add_argument("--radius", type=int, default=NEAR_DUPLICATE_RADIUS, help="해밍 반경")
+    parser.add_argument("--kind", choices=HASH_KINDS, default="phash")
+    args = parser.parse_args()
+
+    roots = [Path(r) for r in args.roots] or list(DEFAULT_ROOTS)
+    index = ImageHashIndex.for_pool(args.pool, roots, kind=args.kind)
+    stats = index.update()
+    print(f"인덱스: {index.index_path} ({len(index)}건)")
+    print(f"  추가 {stats['added']} / 갱신 {stats['updated']} / 삭제 {stats['removed']} "
+          f"/ 유지 {stats['unchanged']} / 실패 {stats['failed']}")
+
+    groups = index.duplicate_groups(args.radius)
+    print(f"유사 그룹 (반경 {args.radius}): {len(groups)}개")
+    for group in groups:
+        print("-" * 60)
+        for path in group:
+            print(f"  {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -20,12 +20,16 @@ from retry_utils import retry
 import firebase_uploader
 import leonardo_ai
 import stability_ai
+from core.generation_cache import get_generation_cache
 
 # .env 로드
 load_dotenv()
 PROJECT_ID = os.getenv("GOOGLE_CLOUD_PROJECT")
 LOCATION = "us-central1"
 
+FLUX_PRO_MODEL = "black-forest-labs/flux-1.1-pro"
+IMAGEN_MODEL = "imagegeneration@006"
+
 def encode_image_to_base64(image_path):
     with open(image_path, "rb") as image_file:
         return base64.b64encode(image_file.read()).decode('utf-8')
@@ -146,7 +150,7 @@ def generate_imagen_landscape(prompt):
     """[구글] 풍경/사물 생성"""
     try:
         vertexai.init(project=PROJECT_ID, location=LOCATION)
-        model = ImageGenerationModel.from_pretrained("imagegeneration@006")
+        model = ImageGenerationModel.from_pretrained(IMAGEN_MODEL)
         images = model.generate_images(prompt=prompt, number_of_images=1, aspect_ratio="16:9", safety_filter_level="block_some", person_generation="allow_adult")
         if not os.path.exists("images"): os.makedirs("images")
         filename = f"images/google_{datetime.now().strftime('%H%M%S')}_{random.randint(1,99)}.png"
@@ -210,6 +214,67 @@ def generate_sd3(prompt, model="sd3.5-large"):
         print(f"   ❌ [SD3] 실패: {e}")
         raise
 
+# =========================================================
+# [1-1] 생성 캐시 (같은 프롬프트/seed 재생성 방지)
+# =========================================================
+
+def _cached_generate(provider, model, prompt, size, generate, prefix, ext):
+    """
+    생성 캐시 확인 후 없으면 generate(seed) 호출
+    - 키: (provider, model, 정규화 프롬프트, size, seed) / seed 는 프롬프트 기반 결정적 값
+    - 적중 시 images/ 에 새 파일로 복사 (API 호출, Firebase 업로드 생략)
+    """
+    cache = get_generation_cache()
+    if cache is None:
+        return generate(None)
+    if not os.path.exists("images"): os.makedirs("images")
+    destination = f"images/{prefix}_{datetime.now().strftime('%H%M%S')}_{random.randint(1,999)}{ext}"
+    filename, cached = cache.fetch_or_generate(provider, model, prompt, size, generate, destination=destination)
+    if cached:
+        print(f"      ♻️ 생성 캐시 재사용: {filename}")
+    return filename
+
+
+def _run_flux_pro(prompt, quality, seed, prefix):
+    """[FLUX 1.1 Pro] 생성 후 images/ 저장 + Firebase 업로드 (실패 시 예외)"""
+    flux_input = {
+        "prompt": prompt,
+        "aspect_ratio": "16:9",
+        "output_format": "jpg",
+        "output_quality": quality,
+        "safety_tolerance": 2
+    }
+    if seed is not None:
+        flux_input["seed"] = seed
+    output = replicate.run(FLUX_PRO_MODEL, input=flux_input)
+    image_url = str(output)
+    resp = requests.get(image_url)
+    if resp.status_code != 200:
+        return None
+    if not os.path.exists("images"): os.makedirs("images")
+    filename = f"images/{prefix}_{datetime.now().strftime('%H%M%S')}_{random.randint(1,999)}.jpg"
+    with open(filename, "wb") as f: f.write(resp.content)
+    firebase_uploader.upload_file(filename, f"flux/{os.path.basename(filename)}")
+    return filename
+
+
+def generate_flux_pro_cached(prompt, quality=90, prefix="flux"):
+    """[FLUX 1.1 Pro] 캐시 경유 생성 (실패 시 예외 → 호출부에서 Imagen 폴백)"""
+    return _cached_generate(
+        "replicate", FLUX_PRO_MODEL, prompt, "16:9",
+        lambda seed: _run_flux_pro(prompt, quality, seed, prefix),
+        prefix=prefix, ext=".jpg",
+    )
+
+
+def generate_imagen_cached(prompt):
+    """[구글 Imagen] 캐시 경유 생성"""
+    return _cached_generate(
+        "vertex", IMAGEN_MODEL, prompt, "16:9",
+        lambda seed: generate_imagen_landscape(prompt),
+        prefix="google", ext=".png",
+    )
+
 # =========================================================
 # [2] 템플릿 기반 이미지 생성 (안정적인 고정 프롬프트)
 # =========================================================
@@ -282,29 +347,13 @@ def generate_images_from_template(food_name, callback=None):
         if use_flux:
             print(f"      ✨ Using FLUX 1.1 Pro")
             try:
-                output = replicate.run(
-                    "black-forest-labs/flux-1.1-pro",
-                    input={
-                        "prompt": prompt,
-                        "aspect_ratio": "16:9",
-                        "output_format": "jpg",
-                        "output_quality": config["quality"],
-                        "safety_tolerance": 2
-                    }
-                )
-                image_url = str(output)
-                resp = requests.get(image_url)
-                if resp.status_code == 200:
-                    if not os.path.exists("images"): os.makedirs("images")
-                    filename = f"images/flux_{prompt_type}_{datetime.now().strftime('%H%M%S')}_{random.randint(1,999)}.jpg"
-                    with open(filename, "wb") as f: f.write(resp.content)
-                    firebase_uploader.upload_file(filename, f"flux/{os.path.basename(filename)}")
+                filename = generate_flux_pro_cached(prompt, config["quality"], prefix=f"flux_{prompt_type}")
             except Exception as e:
                 print(f"      ❌ Flux failed: {e}. Fallback to Imagen.")
-                filename = generate_imagen_landscape(prompt)
+                filename = generate_imagen_cached(prompt)
         else:
             print(f"      🔹 Using Google Imagen 3")
-            filename = generate_imagen_landscape(prompt)
+            filename = generate_imagen_cached(prompt)
         
         return index, filename
     
@@ -355,35 +404,17 @@ def generate_images_hybrid(prompts, callback=None):
             full_prompt = f"A high-end commercial photography of {clean_prompt}. 8k resolution, highly detailed, professional lighting, shot on Phase One XF IQ4 150MP. -fake -illustration"
             
             try:
-                output = replicate.run(
-                    "black-forest-labs/flux-1.1-pro",
-                    input={
-                        "prompt": full_prompt,
-                        "aspect_ratio": "16:9",
-                        "output_format": "jpg",
-                        "output_quality": 90,
-                        "safety_tolerance": 2
-                    }
-                )
-                image_url = str(output)
-                resp = requests.get(image_url)
-                if resp.status_code == 200:
-                    if not os.path.exists("images"): os.makedirs("images")
-                    filename = f"images/flux_{datetime.now().strftime('%H%M%S')}_{random.randint(1,999)}.jpg"
-                    with open(filename, "wb") as f: f.write(resp.content)
-                    
-                    # Firebase Upload
-                    firebase_uploader.upload_file(filename, f"flux/{os.path.basename(filename)}")
+                filename = generate_flux_pro_cached(full_prompt, 90)
             except Exception as e:
                 print(f"      ❌ [Img {index+1}] Flux failed: {e}")
                 # Fallback to Imagen
-                filename = generate_imagen_landscape(clean_prompt)
+                filename = generate_imagen_cached(clean_prompt)
 
         else:
             # Use Google Imagen 3 (Standard Quality)
             print(f"      🔹 [Img {index+1}] Using Google Imagen 3")
             full_prompt = f"A high-quality photography of {clean_prompt}. Realistic, detailed, natural light. -text -watermark"
-            filename = generate_imagen_landscape(full_prompt)
+            filename = generate_imagen_cached(full_prompt)
             
         return index, filename
 
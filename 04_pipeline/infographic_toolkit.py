@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+infographic_toolkit.py - 인포그래픽 공용 그리기 도구
+
+infographic_generator / golden_slide_generator / blog_infographic_generator /
+blog_safe_renderer / blog_forbidden_renderer 공용:
+- 폰트 핸들 캐시: (경로, 크기, index)별 1회 로드 (TTC 재오픈 방지, 실패도 1회만 기록)
+- 그라데이션: 1px 색상 열을 bytes 로 만들어 NEAREST 확대 → (크기, 색상, 방향)별 캐시
+  (기존 putpixel / 행별 draw.line 루프와 같은 식으로 색 계산)
+- 사전 렌더 컴포넌트: 배지 / 원형 마크 / 이모지를 스타일 키별 RGBA 스탬프로 캐시,
+  붙일 때는 paste 1회
+
+사용법:
+    from infographic_toolkit import load_font, paste_gradient, paste_component, circle_badge
+
+    font = load_font("/System/Library/Fonts/AppleSDGothicNeo.ttc", 22, index=6)
+    paste_gradient(img, (0, 0, 1080, 130), (76, 175, 80), (129, 199, 132))
+    paste_component(img, circle_badge(14, "#4CAF50", "V", font, "#FFFFFF", (-6, -10)), (x, y))
+
+주의: 캐시된 Image 는 공유 객체 - 수정하지 말고 paste 용으로만 사용
+"""
+
+import math
+from functools import lru_cache
+from typing import Optional, Sequence, Tuple, Union
+
+from PIL import Image, ImageColor, ImageDraw, ImageFont
+
+Color = Union[str, Tuple[int, ...]]
+# (RGBA 스탬프, 기준점 대비 좌상단 오프셋)
+Component = Tuple[Image.Image, Tuple[int, int]]
+
+FONT_CACHE_SIZE = 64
+GRADIENT_CACHE_SIZE = 16
+COMPONENT_CACHE_SIZE = 512
+EMOJI_CACHE_SIZE = 64
+
+
+# ============================================
+# 폰트
+# ============================================
+
+@lru_cache(maxsize=FONT_CACHE_SIZE)
+def _truetype(path: str, size: int, index: int) -> Optional[ImageFont.FreeTypeFont]:
+    try:
+        return ImageFont.truetype(path, size, index=index)
+    except OSError as e:
+        print(f"폰트 로드 실패: {path} ({e})")
+        return None
+
+
+@lru_cache(maxsize=1)
+def _default_font() -> ImageFont.ImageFont:
+    return ImageFont.load_default()
+
+
+def load_font(path, size: int, index: int = 0,
+              fallback: bool = True) -> Optional[ImageFont.ImageFont]:
+    """
+    폰트 핸들 (캐시)
+
+    Args:
+        fallback: 로드 실패 시 기본 폰트 (False 면 None)
+    """
+    font = _truetype(str(path), size, index)
+    if font is None and fallback:
+        return _default_font()
+    return font
+
+
+# ============================================
+# 그라데이션
+# ============================================
+
+def _rgb(color: Color) -> Tuple[int, int, int]:
+    if isinstance(color, str):
+        return ImageColor.getrgb(color)[:3]
+    return tuple(color[:3])
+
+
+@lru_cache(maxsize=GRADIENT_CACHE_SIZE)
+def _gradient(size: Tuple[int, int], start: Tuple[int, int, int], end: Tuple[int, int, int],
+              direction: str) -> Image.Image:
+    width, height = size
+    steps = height if direction == "vertical" else width
+    line = bytearray()
+    for i in range(steps):
+        ratio = i / steps
+        line += bytes(int(start[c] + (end[c] - start[c]) * ratio) for c in range(3))
+    if direction == "vertical":
+        return Image.frombytes("RGB", (1, steps), bytes(line)).resize(size, Image.NEAREST)
+    return Image.frombytes("RGB", (steps, 1), bytes(line)).resize(size, Image.NEAREST)
+
+
+def gradient(size: Tuple[int, int], start: Color, end: Color,
+             direction: str = "vertical") -> Image.Image:
+    """선형 그라데이션 이미지 (캐시, 읽기 전용)"""
+    if direction not in ("vertical", "horizontal"):
+        raise ValueError(f"지원하지 않는 방향: {direction}")
+    return _gradient((int(size[0]), int(size[1])), _rgb(start), _rgb(end), direction)
+
+
+def paste_gradient(img: Image.Image, box: Sequence[int], start: Color, end: Color,
+                   direction: str = "vertical"):
+    """box (x1, y1, x2, y2) 영역에 그라데이션 붙이기 (x2 / y2 미포함)"""
+    x1, y1, x2, y2 = (int(v) for v in box)
+    if x2 <= x1 or y2 <= y1:
+        return
+    img.paste(gradient((x2 - x1, y2 - y1), start, end, direction), (x1, y1))
+
+
+# ============================================
+# 사전 렌더 컴포넌트
+# ============================================
+
+def _render_component(shape: str, box: Tuple[int, int, int, int], radius: int, fill: Color,
+                      text: str, font, text_xy: Tuple[float, float], text_fill: Color) -> Component:
+    """기준점 (0, 0) 좌표계의 도형 + 텍스트 → 둘 다 담는 최소 RGBA 스탬프"""
+    left, top, right, bottom = box
+    if text:
+        tb = font.getbbox(text)
+        left = min(left, math.floor(text_xy[0] + tb[0]))
+        top = min(top, math.floor(text_xy[1] + tb[1]))
+        right = max(right, math.ceil(text_xy[0] + tb[2]))
+        bottom = max(bottom, math.ceil(text_xy[1] + tb[3]))
+
+    stamp = Image.new("RGBA", (right - left + 1, bottom - top + 1), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(stamp)
+    shifted = [box[0] - left, box[1] - top, box[2] - left, box[3] - top]
+    if shape == "ellipse":
+        draw.ellipse(shifted, fill=fill)
+    else:
+        draw.rounded_rectangle(shifted, radius=radius, fill=fill)
+    if text:
+        draw.text((text_xy[0] - left, text_xy[1] - top), text, fill=text_fill, font=font)
+    return stamp, (left, top)
+
+
+@lru_cache(maxsize=COMPONENT_CACHE_SIZE)
+def circle_badge(radius: int, fill: Color, text: str = "", font=None, text_fill: Color = "#FFFFFF",
+                 text_offset: Tuple[float, float] = (0, 0)) -> Component:
+    """원형 배지 (기준점 = 원 중심, text_offset 은 중심 대비 텍스트 좌상단)"""
+    return _render_component("ellipse", (-radius, -radius, radius, radius), 0, fill,
+                             text, font, text_offset, text_fill)
+
+
+@lru_cache(maxsize=COMPONENT_CACHE_SIZE)
+def rounded_badge(size: Tuple[int, int], radius: int, fill: Color, text: str = "", font=None,
+                  text_fill: Color = "#FFFFFF", text_xy: Tuple[float, float] = (0, 0)) -> Component:
+    """둥근 사각형 배지 (기준점 = 좌상단, size = (폭, 높이), text_xy 는 좌상단 기준)"""
+    return _render_component("rounded", (0, 0, size[0], size[1]), radius, fill,
+                             text, font, text_xy, text_fill)
+
+
+def paste_component(img: Image.Image, component: Component, position: Tuple[float, float]):
+    """스탬프를 기준점 position 에 붙이기"""
+    stamp, (dx, dy) = component
+    img.paste(stamp, (int(position[0]) + dx, int(position[1]) + dy), stamp)
+
+
+@lru_cache(maxsize=EMOJI_CACHE_SIZE)
+def emoji_image(emoji_char: str, target_size: int, emoji_font) -> Optional[Image.Image]:
+    """컬러 이모지 → 정사각형 RGBA (캐시, 실패 시 None)"""
+    if emoji_font is None:
+        return None
+    try:
+        canvas = Image.new('RGBA', (150, 150), (0, 0, 0, 0))
+        ImageDraw.Draw(canvas).text((0, 0), emoji_char, font=emoji_font, embedded_color=True)
+        bbox = canvas.getbbox()
+        if bbox:
+            return canvas.crop(bbox).resize((target_size, target_size), Image.LANCZOS)
+    except Exception:
+        pass
+    return None
+
+
+def cache_info() -> dict:
+    """캐시 적중 통계 (벤치마크 / 디버깅용)"""
+    return {
+        "fonts": _truetype.cache_info()._asdict(),
+        "gradients": _gradient.cache_info()._asdict(),
+        "circle_badges": circle_badge.cache_info()._asdict(),
+        "rounded_badges": rounded_badge.cache_info()._asdict(),
+        "emoji": emoji_image.cache_info()._asdict(),
+    }
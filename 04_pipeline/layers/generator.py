@@ -24,6 +24,9 @@ from typing import Dict, Optional, List, Tuple
 import sys
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(PROJECT_ROOT / "04_pipeline"))
+
+from food_data_store import default_food_data_path, get_food_store
 
 from pipeline.interfaces.layer_contract import (
     GeneratedContent,
@@ -58,20 +61,13 @@ class Generator:
     LAYER_NAME = "generator"
 
     def __init__(self):
-        self.food_data_path = PROJECT_ROOT / "config" / "food_data.json"
+        self.food_data_path = default_food_data_path()
         self.templates_path = PROJECT_ROOT / "config" / "templates"
-        self._food_data = None
 
     @property
     def food_data(self) -> Dict:
-        """food_data.json 로드 (캐싱)"""
-        if self._food_data is None:
-            if self.food_data_path.exists():
-                with open(self.food_data_path, "r", encoding="utf-8") as f:
-                    self._food_data = json.load(f)
-            else:
-                self._food_data = {}
-        return self._food_data
+        """food_data.json 로드 (공용 캐시, 파일 없으면 빈 dict)"""
+        return get_food_store(self.food_data_path).data
 
     def generate_caption(
         self,
@@ -15,7 +15,6 @@ WO-LIGHTWEIGHT-SEPARATION
 - 금지 코드 우회 불가
 """
 
-import re
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
@@ -23,6 +22,9 @@ from typing import Dict, List, Optional, Tuple
 import sys
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from caption_rules import get_caption_rules
 
 from pipeline.interfaces.layer_contract import (
     GeneratedContent,
@@ -52,16 +54,9 @@ class Validator:
     PASS_EACH_MIN = 3
     MAX_SCORE = 20
 
-    # FORBIDDEN 금지 키워드 (§22.12)
-    FORBIDDEN_POSITIVE_KEYWORDS = [
-        "건강에 좋", "영양 가득", "맛있어요", "좋아요",
-        "급여 방법", "조리 방법", "권장량", "드셔도 됩니다", "먹여도 됩니다",
-        "체중별 급여량", "소형견 급여량", "중형견 급여량", "대형견 급여량",
-        "영양 정보", "영양정보", "영양소"
-    ]
-
-    # FORBIDDEN 필수 경고 마커
-    FORBIDDEN_WARNING_MARKERS = ["절대", "위험", "금지", "독성", "응급", "치명"]
+    # FORBIDDEN 금지 키워드 (§22.12) / 필수 경고 마커 - 02_config/caption_rules.json
+    FORBIDDEN_POSITIVE_KEYWORDS = get_caption_rules().keywords("forbidden_positive")
+    FORBIDDEN_WARNING_MARKERS = get_caption_rules().keywords("forbidden_warning")
 
     def __init__(self):
         pass
@@ -185,9 +180,7 @@ class Validator:
     def _score_structure(self, caption: str) -> int:
         """구조 일치 점수 (5점)"""
         # 슬라이드 헤더 카운트
-        slide_pattern = r"\[이미지 \d+번:"
-        slides = re.findall(slide_pattern, caption)
-        slide_count = len(slides)
+        slide_count = len(get_caption_rules().scan(caption).findall("slide_header"))
 
         if slide_count >= 8:
             return 5
@@ -204,20 +197,14 @@ class Validator:
 
     def _score_tone(self, caption: str, safety: str) -> int:
         """톤앤매너 점수 (5점)"""
+        scan = get_caption_rules().scan(caption)
         # 햇살이 엄마 말투 마커 (실제 어미 패턴)
-        friendly_patterns = ["요.", "요!", "요?", "요\n", "해요", "세요", "이에요", "인데요", "드릴게요", "거예요"]
-        friendly_count = sum(1 for m in friendly_patterns if m in caption)
+        friendly_count = len(scan.matched("friendly_tone"))
 
         # FORBIDDEN: 경고 톤 필수
         if safety == "FORBIDDEN":
-            warning_count = sum(
-                1 for m in self.FORBIDDEN_WARNING_MARKERS
-                if m in caption
-            )
-            positive_count = sum(
-                1 for kw in self.FORBIDDEN_POSITIVE_KEYWORDS
-                if kw in caption
-            )
+            warning_count = len(scan.matched("forbidden_warning"))
+            positive_count = len(scan.matched("forbidden_positive"))
 
             # 긍정 표현 있으면 감점
             if positive_count > 0:
@@ -254,21 +241,13 @@ class Validator:
         """정보 정확성 점수 (5점)"""
         issues = []
 
-        # FORBIDDEN에서 긍정 표현 금지 (§22.12)
+        # FORBIDDEN에서 긍정 표현 / 금지 헤더 패턴 금지 (§22.12)
         if safety == "FORBIDDEN":
-            for kw in self.FORBIDDEN_POSITIVE_KEYWORDS:
-                if kw in caption:
-                    issues.append(f"FORBIDDEN_POSITIVE: {kw}")
-
-            # 금지 헤더 패턴
-            forbidden_headers = [
-                "[이미지 3번: 영양 정보]",
-                "[이미지 4번: 급여 방법]",
-                "[이미지 6번: 조리 방법]",
-            ]
-            for header in forbidden_headers:
-                if header in caption:
-                    issues.append(f"FORBIDDEN_HEADER: {header}")
+            scan = get_caption_rules().scan(caption)
+            for kw in scan.matched("forbidden_positive"):
+                issues.append(f"FORBIDDEN_POSITIVE: {kw}")
+            for header in scan.matched("forbidden_score_header"):
+                issues.append(f"FORBIDDEN_HEADER: {header}")
 
             if issues:
                 issues.append("SAFETY_MISMATCH")
@@ -287,6 +266,7 @@ class Validator:
     def _score_naturalness(self, caption: str) -> int:
         """자연스러움 점수 (5점)"""
         issues = 0
+        scan = get_caption_rules().scan(caption)
 
         # 너무 긴 문장
         lines = caption.split("\n")
@@ -295,15 +275,12 @@ class Validator:
             issues += 1
 
         # 연속 빈 줄
-        if "\n\n\n\n" in caption:
+        if scan.has("blank_lines"):
             issues += 1
 
         # 어색한 조사
-        awkward_patterns = ["을를", "이가", "은는", "의의"]
-        for p in awkward_patterns:
-            if p in caption:
-                issues += 1
-                break
+        if scan.has("awkward_particle"):
+            issues += 1
 
         if issues == 0:
             return 5
@@ -7,6 +7,10 @@ v3.1 → v3.2 주요 변경:
   - 인스타: 01 표지만 오버레이, 02~09 원본 유지
   - 블로그: 전체 슬라이드 오버레이 적용
 - render_slide_platform() 함수 추가
+- render_batch(): manifest 단위 병렬 오버레이 (프로세스 풀, 원자적 저장)
+- 렌더 캐시: 입력(이미지+텍스트+디자인 지문) 동일 시 재렌더 생략 (render_cache)
+- 글리프 런 텍스트 엔진: 폰트 핸들 LRU 캐시 + 글리프 advance 메모,
+  텍스트 1회 래스터화 후 채움/그림자 레이어에 재사용
 
 v1.0 → v3.1 주요 변경:
 - Cover: 114px/#FFFFFF/y=100, 2단 그림자(L1 blur=10, L2 blur=4), 상단 그라데이션
@@ -24,11 +28,24 @@ v1.0 → v3.1 주요 변경:
 규칙 출처: DESIGN_PARAMS_V31 (validators_strict.py)
 """
 
+import os
 import re
+import shutil
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Tuple, Dict, Any
+from typing import Optional, Tuple, Dict, Any, List
 
-from PIL import Image, ImageDraw, ImageFont, ImageFilter
+from PIL import Image, ImageChops, ImageDraw, ImageFont, ImageFilter
+
+# 숫자 폴더명 import 지원 (04_pipeline 형제 모듈)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from render_cache import design_fingerprint, file_digest, get_render_cache, make_key, write_atomic
+from validators_strict import DESIGN_PARAMS_V31, LOCKED_CONFIG
 
 # ============================================
 # 프로젝트 설정
@@ -90,17 +107,28 @@ SHADOW_ALPHA = 120
 # Letter spacing
 LETTER_SPACING = -0.02
 
+# 텍스트 엔진 캐시 크기
+FONT_CACHE_SIZE = 32
+GLYPH_CACHE_SIZE = 4096
+GRADIENT_CACHE_SIZE = 8
+
 
 # ============================================
 # 유틸리티 함수
 # ============================================
 
+@lru_cache(maxsize=FONT_CACHE_SIZE)
+def _load_font(font_path: str, size: int) -> ImageFont.FreeTypeFont:
+    """폰트 핸들 캐시 ((경로, 크기)별 1회 로드)"""
+    return ImageFont.truetype(font_path, size)
+
+
 def get_font(weight: str = "black", size: int = 88) -> ImageFont.FreeTypeFont:
-    """폰트 로드 (한글 지원 확정)"""
+    """폰트 로드 (한글 지원 확정, 핸들 캐시 재사용)"""
     font_path = FONT_FILES.get(weight, FONT_FILES["black"])
     if not font_path.exists():
         raise FileNotFoundError(f"폰트 파일 없음: {font_path}")
-    return ImageFont.truetype(str(font_path), size)
+    return _load_font(str(font_path), size)
 
 
 def hex_to_rgba(hex_color: str, alpha: int = 255) -> Tuple[int, int, int, int]:
@@ -118,31 +146,177 @@ def get_safety_color(safety: str) -> str:
 
 
 # ============================================
-# 레터 스페이싱 텍스트 렌더링
+# 글리프 런 텍스트 엔진
+# - 폰트 핸들: (경로, 크기) LRU 캐시
+# - 글리프: (폰트, 문자)별 advance + 마스크 메모
+# - 텍스트: 1회 래스터화한 런 마스크를 채움/그림자에 재사용
 # ============================================
 
-def _draw_text_spaced(
-    draw: ImageDraw.Draw,
+class _Glyph:
+    """단일 글리프(또는 문자열) 래스터 결과"""
+
+    __slots__ = ("advance", "mask", "offset")
+
+    def __init__(self, advance: float, mask: Optional[Image.Image], offset: Tuple[int, int]):
+        self.advance = advance
+        self.mask = mask
+        self.offset = offset
+
+
+class GlyphRun:
+    """
+    레터 스페이싱 적용 텍스트를 1회 래스터화한 타이트 마스크 (L 모드)
+
+    글리프 잉크가 겹치면 병합 마스크 블렌딩이 글자별 draw.text와 1 LSB 달라지므로
+    parts에 글리프별 (dx, dy, 마스크)를 보관해 순서대로 그린다.
+    """
+
+    __slots__ = ("mask", "origin", "parts")
+
+    def __init__(
+        self,
+        mask: Image.Image,
+        origin: Tuple[int, int],
+        parts: Optional[List[Tuple[int, int, Image.Image]]] = None,
+    ):
+        self.mask = mask
+        self.origin = origin
+        self.parts = parts
+
+    @property
+    def box(self) -> Tuple[int, int, int, int]:
+        """마스크 절대 좌표 (left, top, right, bottom)"""
+        x0, y0 = self.origin
+        return (x0, y0, x0 + self.mask.width, y0 + self.mask.height)
+
+
+def _rasterize(font: ImageFont.FreeTypeFont, text: str) -> _Glyph:
+    """텍스트를 draw.text와 동일한 마스크로 래스터화"""
+    advance = font.getlength(text, "L")
+    left, top, right, bottom = font.getbbox(text, "L")
+    if right <= left or bottom <= top:
+        return _Glyph(advance, None, (0, 0))
+    mask = Image.new("L", (right - left, bottom - top), 0)
+    ImageDraw.Draw(mask).text((-left, -top), text, font=font, fill=255)
+    return _Glyph(advance, mask, (left, top))
+
+
+@lru_cache(maxsize=GLYPH_CACHE_SIZE)
+def _cached_glyph(font_path: str, size: int, text: str) -> _Glyph:
+    """(폰트, 문자)별 글리프 메모"""
+    return _rasterize(_load_font(font_path, size), text)
+
+
+def _get_glyph(font: ImageFont.FreeTypeFont, text: str) -> _Glyph:
+    """글리프 조회 (경로 없는 폰트는 캐시 없이 래스터화)"""
+    font_path = getattr(font, "path", None)
+    if not isinstance(font_path, str):
+        return _rasterize(font, text)
+    return _cached_glyph(font_path, font.size, text)
+
+
+def rasterize_text(
     x: float,
     y: int,
     text: str,
     font: ImageFont.FreeTypeFont,
-    fill,
     spacing_em: float = LETTER_SPACING,
-):
-    """레터 스페이싱(-0.02em) 적용 텍스트 그리기"""
+) -> Optional[GlyphRun]:
+    """
+    레터 스페이싱 적용 텍스트를 (x, y) 기준 런 마스크로 1회 래스터화
+
+    글자 배치는 기존 글자별 draw.text 루프와 동일 (round(cx) 위치).
+    빈 텍스트/공백만 있는 경우 None.
+    """
     if not text:
-        return
+        return None
+
+    y = int(y)
     if spacing_em == 0:
-        draw.text((int(x), y), text, font=font, fill=fill)
-        return
+        glyph = _get_glyph(font, text)
+        if glyph.mask is None:
+            return None
+        ox, oy = glyph.offset
+        return GlyphRun(glyph.mask, (int(x) + ox, y + oy))
 
     spacing_px = font.size * spacing_em
+    placements: List[Tuple[int, int, Image.Image]] = []
     cx = float(x)
+    last = len(text) - 1
     for i, ch in enumerate(text):
-        draw.text((int(round(cx)), y), ch, font=font, fill=fill)
-        if i < len(text) - 1:
-            cx += draw.textlength(ch, font=font) + spacing_px
+        glyph = _get_glyph(font, ch)
+        if glyph.mask is not None:
+            ox, oy = glyph.offset
+            placements.append((int(round(cx)) + ox, y + oy, glyph.mask))
+        if i < last:
+            cx += glyph.advance + spacing_px
+
+    if not placements:
+        return None
+
+    left = min(px for px, _, _ in placements)
+    top = min(py for _, py, _ in placements)
+    right = max(px + m.width for px, _, m in placements)
+    bottom = max(py + m.height for _, py, m in placements)
+
+    if len(placements) == 1:
+        return GlyphRun(placements[0][2], (left, top))
+
+    mask = Image.new("L", (right - left, bottom - top), 0)
+    for px, py, glyph_mask in placements:
+        mask.paste(255, (px - left, py - top), glyph_mask)
+
+    parts = None
+    if _inks_overlap(placements):
+        parts = [(px - left, py - top, m) for px, py, m in placements]
+    return GlyphRun(mask, (left, top), parts)
+
+
+def _inks_overlap(placements: List[Tuple[int, int, Image.Image]]) -> bool:
+    """배치된 글리프 중 잉크(마스크 > 0)가 겹치는 쌍이 있는지"""
+    for i, (ax, ay, a) in enumerate(placements):
+        for bx, by, b in placements[i + 1:]:
+            left, top = max(ax, bx), max(ay, by)
+            right = min(ax + a.width, bx + b.width)
+            bottom = min(ay + a.height, by + b.height)
+            if right <= left or bottom <= top:
+                continue
+            box = (left, top, right, bottom)
+            a_crop = a.crop((box[0] - ax, box[1] - ay, box[2] - ax, box[3] - ay))
+            b_crop = b.crop((box[0] - bx, box[1] - by, box[2] - bx, box[3] - by))
+            if ImageChops.darker(a_crop, b_crop).getbbox() is not None:
+                return True
+    return False
+
+
+def _draw_run(
+    draw: ImageDraw.ImageDraw,
+    run: Optional[GlyphRun],
+    fill,
+    offset: Tuple[int, int] = (0, 0),
+):
+    """런 마스크를 지정 색상으로 그리기 (draw.text와 동일한 블렌딩)"""
+    if run is None:
+        return
+    x0, y0 = run.origin[0] + offset[0], run.origin[1] + offset[1]
+    if run.parts is None:
+        draw.bitmap((x0, y0), run.mask, fill=fill)
+        return
+    for dx, dy, glyph_mask in run.parts:
+        draw.bitmap((x0 + dx, y0 + dy), glyph_mask, fill=fill)
+
+
+def _draw_text_spaced(
+    draw: ImageDraw.Draw,
+    x: float,
+    y: int,
+    text: str,
+    font: ImageFont.FreeTypeFont,
+    fill,
+    spacing_em: float = LETTER_SPACING,
+):
+    """레터 스페이싱(-0.02em) 적용 텍스트 그리기"""
+    _draw_run(draw, rasterize_text(x, y, text, font, spacing_em), fill)
 
 
 def _measure_text(
@@ -164,95 +338,128 @@ def _measure_text(
     spacing_px = font.size * spacing_em
     total_w = 0.0
     for i, ch in enumerate(text):
-        total_w += draw.textlength(ch, font=font)
+        total_w += _get_glyph(font, ch).advance
         if i < len(text) - 1:
             total_w += spacing_px
     return total_w, height
 
 
+def clear_text_caches():
+    """폰트/글리프 캐시 초기화 (폰트 파일 교체 시)"""
+    _load_font.cache_clear()
+    _cached_glyph.cache_clear()
+
+
 # ============================================
 # 그라데이션 오버레이
 # ============================================
 
+@lru_cache(maxsize=GRADIENT_CACHE_SIZE)
+def _gradient_strip(
+    width: int,
+    height: int,
+    ratio: float,
+    alpha: int,
+    position: str,
+) -> Tuple[int, Optional[Image.Image]]:
+    """
+    그라데이션 알파 램프 캐시 -> (시작 y, RGBA 스트립)
+
+    행별 알파 값은 기존 draw_ov.line 루프와 동일한 식으로 계산.
+    """
+    if position == "bottom":
+        start = int(height * (1 - ratio))
+        span = max(height - start, 1)
+        ramp = [int(alpha * ((y - start) / span)) for y in range(start, height)]
+    else:  # top
+        start = 0
+        end = int(height * ratio)
+        ramp = [int(alpha * (1.0 - y / max(end, 1))) for y in range(0, end)]
+
+    if not ramp:
+        return start, None
+
+    column = Image.frombytes('L', (1, len(ramp)), bytes(ramp))
+    strip = Image.new('RGBA', (width, len(ramp)), (0, 0, 0, 0))
+    strip.putalpha(column.resize((width, len(ramp)), Image.NEAREST))
+    return start, strip
+
+
 def _apply_gradient(
     img: Image.Image,
     ratio: float,
     alpha: int,
     position: str = "bottom",
 ) -> Image.Image:
-    """반투명 검정 그라데이션 합성"""
-    if img.mode != 'RGBA':
-        img = img.convert('RGBA')
+    """반투명 검정 그라데이션 합성 (캐시된 램프 스트립만 합성)"""
+    img = img.convert('RGBA') if img.mode != 'RGBA' else img.copy()
 
-    overlay = Image.new('RGBA', img.size, (0, 0, 0, 0))
-    draw_ov = ImageDraw.Draw(overlay)
-    h, w = img.height, img.width
-
-    if position == "bottom":
-        start = int(h * (1 - ratio))
-        span = max(h - start, 1)
-        for y in range(start, h):
-            progress = (y - start) / span
-            a = int(alpha * progress)
-            draw_ov.line([(0, y), (w, y)], fill=(0, 0, 0, a))
-    else:  # top
-        end = int(h * ratio)
-        for y in range(0, end):
-            progress = 1.0 - y / max(end, 1)
-            a = int(alpha * progress)
-            draw_ov.line([(0, y), (w, y)], fill=(0, 0, 0, a))
-
-    return Image.alpha_composite(img, overlay)
+    start, strip = _gradient_strip(img.width, img.height, ratio, alpha, position)
+    if strip is not None:
+        img.alpha_composite(strip, dest=(0, start))
+    return img
 
 
 # ============================================
 # 그림자 렌더링
+# - 텍스트 bbox + 블러 반경만 잘라서 블러/합성
 # ============================================
 
+def _blur_padding(blur: int) -> int:
+    """GaussianBlur(3-pass box blur)가 번지는 최대 픽셀 수 (여유 포함)"""
+    return 3 * (int(blur) + 2) if blur > 0 else 0
+
+
 def _shadow_standard(
     img: Image.Image,
-    x: float,
-    y: int,
-    text: str,
-    font: ImageFont.FreeTypeFont,
+    run: Optional[GlyphRun],
     blur: int = SHADOW_BLUR,
     alpha: int = SHADOW_ALPHA,
     offset: Tuple[int, int] = SHADOW_OFFSET,
 ) -> Image.Image:
-    """표준 1단 그림자 (body/CTA 용)"""
-    layer = Image.new('RGBA', img.size, (0, 0, 0, 0))
-    ld = ImageDraw.Draw(layer)
-    sx, sy = x + offset[0], y + offset[1]
-    _draw_text_spaced(ld, sx, sy, text, font, (0, 0, 0, alpha))
+    """
+    표준 1단 그림자 (body/CTA 용)
+
+    전체 캔버스 대신 텍스트 영역 + 블러 패딩만 할당/블러 후 제자리 합성.
+    영역 밖 픽셀은 전체 캔버스 방식에서도 알파 0 이므로 결과 동일.
+    """
+    if run is None:
+        return img
+
+    pad = _blur_padding(blur)
+    x0, y0, x1, y1 = run.box
+    left = max(x0 + offset[0] - pad, 0)
+    top = max(y0 + offset[1] - pad, 0)
+    right = min(x1 + offset[0] + pad, img.width)
+    bottom = min(y1 + offset[1] + pad, img.height)
+    if right <= left or bottom <= top:
+        return img
+
+    layer = Image.new('RGBA', (right - left, bottom - top), (0, 0, 0, 0))
+    _draw_run(ImageDraw.Draw(layer), run, (0, 0, 0, alpha), (offset[0] - left, offset[1] - top))
     if blur > 0:
         layer = layer.filter(ImageFilter.GaussianBlur(radius=blur))
-    return Image.alpha_composite(img, layer)
+    img.alpha_composite(layer, dest=(left, top))
+    return img
 
 
 def _shadow_cover_2layer(
     img: Image.Image,
-    x: float,
-    y: int,
-    text: str,
-    font: ImageFont.FreeTypeFont,
+    run: Optional[GlyphRun],
 ) -> Image.Image:
     """커버 2단 그림자 (L1 넓은 글로우 + L2 선명 윤곽)"""
+    if run is None:
+        return img
+
     # Layer 1: 넓은 블러 - 부드러운 글로우
-    l1 = Image.new('RGBA', img.size, (0, 0, 0, 0))
-    d1 = ImageDraw.Draw(l1)
-    _draw_text_spaced(d1, x, y, text, font, (0, 0, 0, COVER_SHADOW_L1_ALPHA))
-    l1 = l1.filter(ImageFilter.GaussianBlur(radius=COVER_SHADOW_L1_BLUR))
-    img = Image.alpha_composite(img, l1)
+    img = _shadow_standard(
+        img, run, COVER_SHADOW_L1_BLUR, COVER_SHADOW_L1_ALPHA, (0, 0),
+    )
 
     # Layer 2: 좁은 블러 - 선명한 윤곽
-    l2 = Image.new('RGBA', img.size, (0, 0, 0, 0))
-    d2 = ImageDraw.Draw(l2)
-    _draw_text_spaced(
-        d2, x + SHADOW_OFFSET[0], y + SHADOW_OFFSET[1],
-        text, font, (0, 0, 0, COVER_SHADOW_L2_ALPHA),
+    img = _shadow_standard(
+        img, run, COVER_SHADOW_L2_BLUR, COVER_SHADOW_L2_ALPHA, SHADOW_OFFSET,
     )
-    l2 = l2.filter(ImageFilter.GaussianBlur(radius=COVER_SHADOW_L2_BLUR))
-    img = Image.alpha_composite(img, l2)
 
     return img
 
@@ -311,6 +518,32 @@ def build_validation_config(slide_type: str, safety: str = "safe") -> Dict[str,
     return cfg
 
 
+# ============================================
+# 렌더 캐시 (입력 해시 -> 결과 재사용)
+# 키: 베이스 이미지 바이트 + 텍스트 + 안전도 + 디자인 지문
+# ============================================
+
+def _design_constants() -> Dict[str, Any]:
+    """렌더 결과에 영향을 주는 디자인 상수 스냅샷"""
+    return {
+        "module": {
+            name: value for name, value in globals().items()
+            if name.isupper() and name.startswith((
+                "SAFETY_", "COVER_", "BODY_", "CTA_", "GAP_", "BOTTOM_",
+                "GRADIENT_", "SHADOW_", "LETTER_",
+            ))
+        },
+        "DESIGN_PARAMS_V31": DESIGN_PARAMS_V31,
+        "LOCKED_CONFIG": {k: v for k, v in vars(LOCKED_CONFIG).items() if k.isupper()},
+    }
+
+
+DESIGN_FINGERPRINT = design_fingerprint(
+    _design_constants(),
+    files=[Path(__file__), *FONT_FILES.values()],
+)
+
+
 # ============================================
 # 렌더링 함수 (핵심)
 # ============================================
@@ -342,12 +575,14 @@ def render_cover(img: Image.Image, title: str) -> Image.Image:
     x = (img.width - tw) / 2
     y = COVER_TITLE_Y
 
+    # 1회 래스터화 -> 그림자 2단 + 메인 텍스트 공용
+    run = rasterize_text(x, y, title, font)
+
     # 2단 그림자
-    img = _shadow_cover_2layer(img, x, y, title, font)
+    img = _shadow_cover_2layer(img, run)
 
     # 메인 텍스트 (흰색)
-    draw = ImageDraw.Draw(img)
-    _draw_text_spaced(draw, x, y, title, font, COVER_TITLE_COLOR)
+    _draw_run(ImageDraw.Draw(img), run, COVER_TITLE_COLOR)
 
     print(f"  [COVER v3.1] {COVER_TITLE_SIZE}px {COVER_TITLE_COLOR} y={COVER_TITLE_Y} 2-layer shadow")
     return img
@@ -390,17 +625,17 @@ def render_body(
     # 제목 (안전도 색상)
     tx = (img.width - tw) / 2
     ty = block_y
-    img = _shadow_standard(img, tx, ty, title, title_font)
-    draw = ImageDraw.Draw(img)
-    _draw_text_spaced(draw, tx, ty, title, title_font, title_color)
+    run = rasterize_text(tx, ty, title, title_font)
+    img = _shadow_standard(img, run)
+    _draw_run(ImageDraw.Draw(img), run, title_color)
 
     # 부제목 (흰색)
     if subtitle:
         sx = (img.width - sw) / 2
         sy = ty + th + GAP_TITLE_SUB
-        img = _shadow_standard(img, sx, sy, subtitle, sub_font, blur=3, alpha=100, offset=(2, 2))
-        draw = ImageDraw.Draw(img)
-        _draw_text_spaced(draw, sx, sy, subtitle, sub_font, "#FFFFFF")
+        sub_run = rasterize_text(sx, sy, subtitle, sub_font)
+        img = _shadow_standard(img, sub_run, blur=3, alpha=100, offset=(2, 2))
+        _draw_run(ImageDraw.Draw(img), sub_run, "#FFFFFF")
 
     print(f"  [BODY v3.1] 제목({title_color}, {BODY_TITLE_SIZE}px) + 부제목(#FFF, {BODY_SUB_SIZE}px) gap={GAP_TITLE_SUB}")
     return img
@@ -441,17 +676,17 @@ def render_cta(
     # 제목 (노랑)
     tx = (img.width - tw) / 2
     ty = block_y
-    img = _shadow_standard(img, tx, ty, title, title_font)
-    draw = ImageDraw.Draw(img)
-    _draw_text_spaced(draw, tx, ty, title, title_font, CTA_TITLE_COLOR)
+    run = rasterize_text(tx, ty, title, title_font)
+    img = _shadow_standard(img, run)
+    _draw_run(ImageDraw.Draw(img), run, CTA_TITLE_COLOR)
 
     # 부제목 (흰색)
     if subtitle:
         sx = (img.width - sw) / 2
         sy = ty + th + GAP_TITLE_SUB
-        img = _shadow_standard(img, sx, sy, subtitle, sub_font, blur=3, alpha=100, offset=(2, 2))
-        draw = ImageDraw.Draw(img)
-        _draw_text_spaced(draw, sx, sy, subtitle, sub_font, "#FFFFFF")
+        sub_run = rasterize_text(sx, sy, subtitle, sub_font)
+        img = _shadow_standard(img, sub_run, blur=3, alpha=100, offset=(2, 2))
+        _draw_run(ImageDraw.Draw(img), sub_run, "#FFFFFF")
 
     print(f"  [CTA v3.1] 제목({CTA_TITLE_COLOR}, {CTA_TITLE_SIZE}px) + 부제목(#FFF, {CTA_SUB_SIZE}px)")
     return img
@@ -497,21 +732,9 @@ def render_slide_platform(
 
     # 블로그 또는 인스타 01 표지: 오버레이 적용
     try:
-        img = Image.open(image_path)
-
-        if slide_type == "cover" or slide_number == 1:
-            result = render_cover(img, title)
-        elif slide_type == "cta":
-            result = render_cta(img, title, subtitle)
-        else:
-            result = render_body(img, title, subtitle, safety)
-
-        # 저장
         output_path = image_path
-        if image_path.endswith('.png'):
-            result.save(output_path, 'PNG')
-        else:
-            result.convert('RGB').save(output_path, 'JPEG', quality=95)
+        kind = _slide_kind(slide_number, slide_type)
+        _render_file(image_path, output_path, kind, title, subtitle, safety)
 
         print(f"  [OK v3.2] {platform} slide {slide_number:02d} - 오버레이 적용")
         return output_path
@@ -538,6 +761,278 @@ def should_apply_overlay(platform: str, slide_number: int) -> bool:
     return True  # 블로그는 전체 적용
 
 
+def _slide_kind(slide_number: int, slide_type: str) -> str:
+    """슬라이드 번호/유형 -> 렌더 종류 (cover/body/cta)"""
+    if slide_type == "cover" or slide_number == 1:
+        return "cover"
+    if slide_type == "cta":
+        return "cta"
+    return "body"
+
+
+def _render_kind(
+    img: Image.Image,
+    kind: str,
+    title: str,
+    subtitle: str = "",
+    safety: str = "safe",
+) -> Image.Image:
+    """렌더 종류별 렌더 함수 선택"""
+    if kind == "cover":
+        return render_cover(img, title)
+    if kind == "cta":
+        return render_cta(img, title, subtitle)
+    return render_body(img, title, subtitle, safety)
+
+
+def _render_file(
+    image_path,
+    output_path,
+    kind: str,
+    title: str,
+    subtitle: str = "",
+    safety: str = "safe",
+) -> bool:
+    """
+    파일 -> 파일 렌더 (렌더 캐시 경유)
+
+    키: 베이스 파일 해시 + 종류/텍스트/안전도 + 출력 포맷 + 디자인 지문.
+    적중 시 디코드/렌더/인코드 없이 캐시된 출력 바이트를 그대로 기록.
+
+    Returns:
+        True: 캐시 적중, False: 새로 렌더
+    """
+    # 결과에 영향 없는 인자는 키에서 정규화 (표지: 부제목/안전도 미사용)
+    if kind == "cover":
+        subtitle, safety = "", ""
+    elif kind == "cta":
+        safety = ""
+
+    cache = get_render_cache()
+    key = None
+    if cache.enabled:
+        key = make_key(
+            "overlay.slide", DESIGN_FINGERPRINT, file_digest(image_path),
+            kind, title, subtitle, safety.lower(), _output_format(output_path),
+        )
+        data = cache.get(key)
+        if data is not None:
+            write_atomic(output_path, data)
+            return True
+
+    with Image.open(image_path) as img:
+        result = _render_kind(img, kind, title, subtitle, safety)
+    _save_atomic(result, output_path)
+
+    if key is not None:
+        cache.put(key, Path(output_path).read_bytes())
+    return False
+
+
+def _output_format(output_path) -> str:
+    """출력 확장자 -> 저장 포맷 (.png 외에는 JPEG q95)"""
+    return 'PNG' if str(output_path).lower().endswith('.png') else 'JPEG'
+
+
+def _save_atomic(img: Image.Image, output_path: str):
+    """임시 파일에 저장 후 os.replace (중단 시 반쪽 파일 방지)"""
+    output_path = str(output_path)
+    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(
+        prefix=".overlay_", suffix=Path(output_path).suffix, dir=str(Path(output_path).parent)
+    )
+    os.close(fd)
+    try:
+        if _output_format(output_path) == 'PNG':
+            img.save(tmp_path, 'PNG')
+        else:
+            img.convert('RGB').save(tmp_path, 'JPEG', quality=95)
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+# ============================================
+# 배치 오버레이 엔진 (프로세스 풀)
+# - manifest: 콘텐츠 N개 x 슬라이드 4~9장 x instagram/blog
+# - 워커별 폰트 캐시 예열, 원자적 저장, 슬라이드별 소요시간
+# ============================================
+
+# 워커 예열 대상 (weight, size)
+WARM_FONTS = (
+    ("black", COVER_TITLE_SIZE),
+    ("black", BODY_TITLE_SIZE),
+    ("medium", BODY_SUB_SIZE),
+    ("bold", CTA_TITLE_SIZE),
+    ("medium", CTA_SUB_SIZE),
+)
+
+# 콘텐츠 항목에서 슬라이드로 상속되는 키
+_INHERITED_KEYS = ("content_id", "platform", "safety", "output_dir")
+
+
+def _warm_font_cache():
+    """프로세스 풀 initializer: 폰트 핸들 캐시 예열"""
+    for weight, size in WARM_FONTS:
+        try:
+            get_font(weight, size)
+        except FileNotFoundError:
+            pass
+
+
+def expand_manifest(manifest: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    콘텐츠 단위 manifest -> 슬라이드 단위 job 목록
+
+    콘텐츠 항목 예:
+        {
+            "content_id": "044_Almonds",
+            "safety": "safe",
+            "platforms": ["instagram", "blog"],   # 또는 "platform": "blog"
+            "output_dir": "out/044_Almonds",      # 선택 (없으면 제자리 저장)
+            "slides": [
+                {"image_path": ".../01_bg.png", "slide_number": 1,
+                 "slide_type": "cover", "title": "아몬드"},
+                ...
+            ],
+        }
+
+    "slides" 키가 없는 항목은 이미 슬라이드 단위 job 으로 취급.
+    """
+    jobs: List[Dict[str, Any]] = []
+    for entry in manifest:
+        if "slides" not in entry:
+            jobs.append(dict(entry))
+            continue
+
+        platforms = entry.get("platforms") or [entry.get("platform", "blog")]
+        for platform in platforms:
+            for slide in entry["slides"]:
+                job = {k: entry[k] for k in _INHERITED_KEYS if k in entry}
+                job["platform"] = platform
+                job.update(slide)
+                if len(platforms) > 1 and job.get("output_dir"):
+                    job["output_dir"] = str(Path(job["output_dir"]) / platform)
+                jobs.append(job)
+    return jobs
+
+
+def _job_output_path(job: Dict[str, Any]) -> str:
+    """job 출력 경로 (output_path > output_dir/파일명 > 제자리)"""
+    if job.get("output_path"):
+        return str(job["output_path"])
+    if job.get("output_dir"):
+        return str(Path(job["output_dir"]) / Path(job["image_path"]).name)
+    return str(job["image_path"])
+
+
+def _render_batch_job(job: Dict[str, Any]) -> Dict[str, Any]:
+    """배치 워커: 슬라이드 1장 렌더 + 원자적 저장 (프로세스 풀에서 실행)"""
+    started = time.perf_counter()
+    cache = get_render_cache()
+    counters_before = cache.counters()
+    image_path = str(job["image_path"])
+    output_path = _job_output_path(job)
+    platform = job.get("platform", "blog")
+    slide_number = int(job.get("slide_number", 1))
+
+    result = {
+        "content_id": job.get("content_id"),
+        "image_path": image_path,
+        "output_path": output_path,
+        "platform": platform,
+        "slide_number": slide_number,
+        "status": "rendered",
+        "error": None,
+        "cache_hit": False,
+    }
+
+    try:
+        if not should_apply_overlay(platform, slide_number):
+            # 인스타 02~09: 원본 유지 (출력 경로가 다르면 원본 복사)
+            result["status"] = "skipped"
+            if output_path != image_path:
+                Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = output_path + ".tmp"
+                shutil.copyfile(image_path, tmp_path)
+                os.replace(tmp_path, output_path)
+        else:
+            result["cache_hit"] = _render_file(
+                image_path,
+                output_path,
+                _slide_kind(slide_number, job.get("slide_type", "body")),
+                job.get("title", ""),
+                job.get("subtitle", ""),
+                job.get("safety", "safe"),
+            )
+    except Exception as e:
+        result["status"] = "error"
+        result["error"] = f"{type(e).__name__}: {e}"
+
+    counters_after = cache.counters()
+    result["cache_stats"] = {k: counters_after[k] - counters_before[k] for k in counters_after}
+    result["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 1)
+    return result
+
+
+def render_batch(
+    manifest: List[Dict[str, Any]],
+    max_workers: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    manifest 전체를 프로세스 풀로 병렬 오버레이 (v3.2)
+
+    Args:
+        manifest: 콘텐츠 단위 또는 슬라이드 단위 항목 목록 (expand_manifest 참고)
+        max_workers: 워커 수 (기본: CPU 코어 수, 1이면 현재 프로세스에서 순차 처리)
+
+    Returns:
+        슬라이드별 결과 목록 (manifest 순서 유지)
+        {content_id, image_path, output_path, platform, slide_number,
+         status: rendered|skipped|error, error, cache_hit, cache_stats, elapsed_ms}
+
+    워커 프로세스의 렌더 캐시 카운터(cache_stats)는 현재 프로세스의
+    get_render_cache() 에 합산되므로 배치 후 stats() 로 전체 적중률 확인 가능.
+    """
+    jobs = expand_manifest(manifest)
+    if not jobs:
+        return []
+
+    workers = max_workers or os.cpu_count() or 1
+    workers = max(1, min(workers, len(jobs)))
+
+    if workers == 1:
+        _warm_font_cache()
+        return [_render_batch_job(job) for job in jobs]
+
+    chunksize = max(1, len(jobs) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_warm_font_cache) as pool:
+        results = list(pool.map(_render_batch_job, jobs, chunksize=chunksize))
+
+    cache = get_render_cache()
+    for result in results:
+        cache.merge_stats(result["cache_stats"])
+    return results
+
+
+def summarize_batch(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """배치 결과 요약 (상태별 건수, 슬라이드 소요시간 통계)"""
+    elapsed = sorted(r["elapsed_ms"] for r in results if r["status"] == "rendered")
+    summary: Dict[str, Any] = {
+        "total": len(results),
+        "rendered": sum(1 for r in results if r["status"] == "rendered"),
+        "skipped": sum(1 for r in results if r["status"] == "skipped"),
+        "errors": sum(1 for r in results if r["status"] == "error"),
+        "cache_hits": sum(1 for r in results if r.get("cache_hit")),
+        "render_ms_total": round(sum(elapsed), 1),
+        "render_ms_avg": round(sum(elapsed) / len(elapsed), 1) if elapsed else 0.0,
+        "render_ms_p95": elapsed[min(len(elapsed) - 1, int(len(elapsed) * 0.95))] if elapsed else 0.0,
+    }
+    return summary
+
+
 # ============================================
 # 클린 이미지 검증 (v1.0 호환)
 # ============================================
@@ -605,8 +1100,6 @@ def overlay_from_config(
         if not skip_validation:
             validate_base_image(str(image_path), strict=True)
 
-        img = Image.open(image_path)
-
         slides = text_config.get("slides", [])
         if slide_index < len(slides):
             title = slides[slide_index].get("title", "")
@@ -618,17 +1111,13 @@ def overlay_from_config(
             return True
 
         if slide_index == 0:
-            result = render_cover(img, title)
+            kind = "cover"
         elif slide_index == 3 or "저장" in title or "공유" in title:
-            result = render_cta(img, title, subtitle, str(image_path))
-        else:
-            result = render_body(img, title, subtitle, safety=safety)
-
-        if image_path.suffix.lower() == '.png':
-            result.save(image_path, 'PNG')
+            kind = "cta"
         else:
-            result.convert('RGB').save(image_path, 'JPEG', quality=95)
+            kind = "body"
 
+        _render_file(image_path, image_path, kind, title, subtitle, safety)
         return True
     except Exception as e:
         print(f"[ERROR] overlay_from_config: {e}")
@@ -656,12 +1145,7 @@ def create_cover(base_path: str, title: str, output_path: str) -> bool:
     """표지 생성 (v1.0 API 호환)"""
     validate_base_image(base_path, strict=True)
     try:
-        img = Image.open(base_path)
-        result = render_cover(img, title)
-        fmt = 'PNG' if output_path.endswith('.png') else 'JPEG'
-        if fmt == 'JPEG':
-            result = result.convert('RGB')
-        result.save(output_path, fmt, quality=95)
+        _render_file(base_path, output_path, "cover", title)
         print(f"[OK] create_cover: {Path(output_path).name}")
         return True
     except Exception as e:
@@ -674,12 +1158,7 @@ def create_body(base_path: str, title: str, subtitle: str,
     """본문 생성 (v1.0 API 호환)"""
     validate_base_image(base_path, strict=True)
     try:
-        img = Image.open(base_path)
-        result = render_body(img, title, subtitle, safety)
-        fmt = 'PNG' if output_path.endswith('.png') else 'JPEG'
-        if fmt == 'JPEG':
-            result = result.convert('RGB')
-        result.save(output_path, fmt, quality=95)
+        _render_file(base_path, output_path, "body", title, subtitle, safety)
         print(f"[OK] create_body: {Path(output_path).name}")
         return True
     except Exception as e:
@@ -693,12 +1172,7 @@ def create_cta(base_path: str, output_path: str,
     """CTA 생성 (v1.0 API 호환)"""
     validate_base_image(base_path, strict=True)
     try:
-        img = Image.open(base_path)
-        result = render_cta(img, title, subtitle, base_path)
-        fmt = 'PNG' if output_path.endswith('.png') else 'JPEG'
-        if fmt == 'JPEG':
-            result = result.convert('RGB')
-        result.save(output_path, fmt, quality=95)
+        _render_file(base_path, output_path, "cta", title, subtitle)
         print(f"[OK] create_cta: {Path(output_path).name}")
         return True
     except Exception as e:
@@ -23,8 +23,10 @@ from enum import Enum
 
 PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(PROJECT_ROOT / "04_pipeline"))
 
 from pipeline.enums.safety import Safety, get_safety
+from food_data_store import default_food_data_path, get_food_store
 
 # =============================================================================
 # 상수 및 설정
@@ -32,7 +34,7 @@ from pipeline.enums.safety import Safety, get_safety
 
 SCORING_CRITERIA_PATH = PROJECT_ROOT / "config" / "scoring_criteria.json"
 TOXICITY_MAPPING_PATH = PROJECT_ROOT / "config" / "toxicity_mapping.json"
-FOOD_DATA_PATH = PROJECT_ROOT / "config" / "food_data.json"
+FOOD_DATA_PATH = default_food_data_path()
 CONTENTS_DIR = PROJECT_ROOT / "contents"
 STATUS_DIRS = ["1_cover_only", "2_body_ready", "3_approved", "4_posted"]
 
@@ -119,7 +121,7 @@ class QualityScorer:
 
     def __init__(self):
         self.criteria = load_json(SCORING_CRITERIA_PATH)
-        self.food_data = load_json(FOOD_DATA_PATH)
+        self.food_data = get_food_store(FOOD_DATA_PATH).require()
 
         if TOXICITY_MAPPING_PATH.exists():
             self.toxicity = load_json(TOXICITY_MAPPING_PATH)
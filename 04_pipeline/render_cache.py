@@ -0,0 +1,358 @@
+#!/usr/bin/env python3
+"""
+render_cache.py - 콘텐츠 주소 기반 렌더 캐시
+
+오버레이/인포그래픽 출력은 입력의 순수 함수:
+    베이스 이미지 바이트 + 제목/부제목 + 안전도 + 디자인 상수
+    (DESIGN_PARAMS_V31 / LOCKED_CONFIG / 모듈 상수)
+
+입력 해시를 키로 인코딩된 결과(PNG 바이트)를 로컬 디스크에 저장하고,
+용량 상한 초과 시 가장 오래 사용되지 않은 항목부터 삭제 (LRU).
+
+사용법:
+    from render_cache import cached_render, get_render_cache
+
+    @cached_render("infographic.do_dont", INFOGRAPHIC_FINGERPRINT, output_arg="output_path")
+    def generate_do_dont(food_name, do_items, dont_items, safety_str, output_path=None): ...
+
+    get_render_cache().stats()  # {"hits": 12, "misses": 3, ...}
+
+환경 변수:
+    RENDER_CACHE=off              캐시 비활성화
+    RENDER_CACHE_DIR=<경로>        저장 위치 (기본: <프로젝트>/.cache/render)
+    RENDER_CACHE_MAX_MB=<MB>      용량 상한 (기본: 2048)
+"""
+
+import functools
+import hashlib
+import inspect
+import io
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Optional
+
+import PIL
+from PIL import Image
+
+PROJECT_ROOT = Path(__file__).parent.parent
+DEFAULT_CACHE_DIR = PROJECT_ROOT / ".cache" / "render"
+DEFAULT_MAX_MB = 2048
+
+# 키 스키마가 바뀌면 올려서 기존 캐시 무효화
+CACHE_SCHEMA_VERSION = 1
+
+# stats() 집계 대상 카운터
+_COUNTERS = ("hits", "misses", "stores", "evictions")
+
+
+# ============================================
+# 키 생성
+# ============================================
+
+def _update_hash(hasher, value: Any):
+    """값 종류별 해시 갱신 (이미지/바이트는 내용, 나머지는 정규화 JSON)"""
+    if isinstance(value, Image.Image):
+        hasher.update(f"img:{value.mode}:{value.size}:".encode())
+        hasher.update(value.tobytes())
+    elif isinstance(value, (bytes, bytearray)):
+        hasher.update(b"bytes:")
+        hasher.update(value)
+    else:
+        hasher.update(b"json:")
+        hasher.update(json.dumps(value, sort_keys=True, ensure_ascii=False, default=str).encode("utf-8"))
+    hasher.update(b"\x00")
+
+
+def make_key(namespace: str, *parts: Any) -> str:
+    """네임스페이스 + 입력값 -> SHA-256 키"""
+    hasher = hashlib.sha256()
+    hasher.update(f"render-cache:v{CACHE_SCHEMA_VERSION}:{namespace}\x00".encode())
+    for part in parts:
+        _update_hash(hasher, part)
+    return hasher.hexdigest()
+
+
+def file_digest(path) -> str:
+    """파일 내용 SHA-256"""
+    hasher = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def design_fingerprint(constants: Dict[str, Any], files: Iterable = ()) -> str:
+    """
+    디자인 상수 + 관련 파일(모듈 소스/폰트) -> 지문
+
+    파일은 (이름, 크기, mtime)만 사용 (폰트 수십 MB 재해시 방지).
+    """
+    file_stats = []
+    for path in files:
+        path = Path(path)
+        try:
+            st = path.stat()
+            file_stats.append((path.name, st.st_size, int(st.st_mtime)))
+        except OSError:
+            file_stats.append((path.name, None, None))
+    return make_key("fingerprint", constants, file_stats, PIL.__version__)
+
+
+# ============================================
+# 디스크 캐시
+# ============================================
+
+class RenderCache:
+    """
+    디스크 기반 콘텐츠 주소 캐시 (용량 상한 LRU)
+
+    - 항목: <cache_dir>/<key[:2]>/<key>.bin
+    - 사용 시각: 파일 mtime (적중 시 갱신)
+    - 쓰기: 임시 파일 + os.replace (프로세스 간 안전)
+    """
+
+    def __init__(self, cache_dir=None, max_bytes: Optional[int] = None, enabled: bool = True):
+        self.cache_dir = Path(cache_dir or os.getenv("RENDER_CACHE_DIR") or DEFAULT_CACHE_DIR)
+        if max_bytes is None:
+            max_bytes = int(float(os.getenv("RENDER_CACHE_MAX_MB", DEFAULT_MAX_MB)) * 1024 * 1024)
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+        self._total_bytes: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.bin"
+
+    def get(self, key: str) -> Optional[bytes]:
+        """캐시 조회 (적중 시 사용 시각 갱신)"""
+        if not self.enabled:
+            return None
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+        except OSError:
+            with self._lock:
+                self.misses += 1
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        with self._lock:
+            self.hits += 1
+        return data
+
+    def put(self, key: str, data: bytes):
+        """캐시 저장 + 용량 초과 시 LRU 삭제"""
+        if not self.enabled:
+            return
+        write_atomic(self._path(key), data)
+
+        with self._lock:
+            self.stores += 1
+            if self._total_bytes is not None:
+                self._total_bytes += len(data)
+        self._evict_if_needed()
+
+    def get_image(self, key: str) -> Optional[Image.Image]:
+        """캐시된 이미지 조회 (디코드 완료 상태)"""
+        data = self.get(key)
+        if data is None:
+            return None
+        img = Image.open(io.BytesIO(data))
+        img.load()
+        return img
+
+    def put_image(self, key: str, img: Image.Image):
+        """이미지를 PNG(무손실, 빠른 압축)로 저장"""
+        if not self.enabled:
+            return
+        buf = io.BytesIO()
+        img.save(buf, "PNG", compress_level=1)
+        self.put(key, buf.getvalue())
+
+    def _entries(self):
+        if not self.cache_dir.exists():
+            return []
+        entries = []
+        for sub in os.scandir(self.cache_dir):
+            if not sub.is_dir():
+                continue
+            for entry in os.scandir(sub.path):
+                if entry.name.endswith(".bin"):
+                    st = entry.stat()
+                    entries.append((st.st_mtime, st.st_size, entry.path))
+        return entries
+
+    def _evict_if_needed(self):
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = sum(size for _, size, _ in self._entries())
+            if self._total_bytes <= self.max_bytes:
+                return
+
+            # 다른 프로세스 쓰기 반영을 위해 디스크 기준으로 재계산
+            entries = sorted(self._entries())
+            total = sum(size for _, size, _ in entries)
+            target = int(self.max_bytes * 0.9)
+            for _, size, path in entries:
+                if total <= target:
+                    break
+                try:
+                    os.remove(path)
+                    total -= size
+                    self.evictions += 1
+                except OSError:
+                    pass
+            self._total_bytes = total
+
+    def stats(self) -> Dict[str, Any]:
+        """적중/미스 카운터 (배치 보고서용)"""
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "hits": self.hits,
+            "misses": self.misses,
+            "stores": self.stores,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+        }
+
+    def counters(self) -> Dict[str, int]:
+        """원시 카운터 스냅샷 (워커 프로세스 -> 부모 집계용)"""
+        with self._lock:
+            return {name: getattr(self, name) for name in _COUNTERS}
+
+    def merge_stats(self, counters: Dict[str, int]):
+        """다른 프로세스에서 수집한 카운터를 합산"""
+        with self._lock:
+            for name in _COUNTERS:
+                setattr(self, name, getattr(self, name) + int(counters.get(name, 0)))
+
+    def reset_stats(self):
+        with self._lock:
+            self.hits = self.misses = self.stores = self.evictions = 0
+
+    def clear(self):
+        """캐시 전체 삭제"""
+        for _, _, path in self._entries():
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        self._total_bytes = 0
+
+
+_default_cache: Optional[RenderCache] = None
+
+
+def get_render_cache() -> RenderCache:
+    """프로세스 공용 캐시 인스턴스"""
+    global _default_cache
+    if _default_cache is None:
+        enabled = os.getenv("RENDER_CACHE", "on").lower() not in ("0", "off", "false", "no")
+        _default_cache = RenderCache(enabled=enabled)
+    return _default_cache
+
+
+def set_render_cache(cache: Optional[RenderCache]):
+    """공용 캐시 교체 (테스트/배치 스크립트용, None이면 기본값 재생성)"""
+    global _default_cache
+    _default_cache = cache
+
+
+def format_stats(stats: Dict[str, Any]) -> str:
+    """보고서 한 줄 요약"""
+    if not stats.get("enabled", True):
+        return "렌더 캐시: 비활성"
+    return (
+        f"렌더 캐시: 적중 {stats['hits']}건 / 미스 {stats['misses']}건 "
+        f"(적중률 {stats['hit_rate'] * 100:.0f}%, 삭제 {stats['evictions']}건)"
+    )
+
+
+# ============================================
+# 데코레이터
+# ============================================
+
+def cached_render(
+    namespace: str,
+    fingerprint: str,
+    output_arg: Optional[str] = None,
+    ignore: Iterable[str] = (),
+) -> Callable:
+    """
+    렌더 함수 캐시 데코레이터
+
+    Args:
+        namespace: 함수 구분자 (예: "overlay.cover", "infographic.do_dont")
+        fingerprint: 디자인 상수 지문 (design_fingerprint)
+        output_arg: 출력 경로 인자 이름 (있으면 키에서 제외,
+                    적중 시 캐시 바이트를 그대로 해당 경로에 기록)
+        ignore: 결과에 영향 없는 인자 이름 (키에서 제외)
+
+    반환값은 항상 PIL 이미지 (적중 시 지연 디코드).
+    출력 파일은 원본 함수가 쓴 바이트 그대로 캐시.
+    """
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+        ignored = set(ignore)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            cache = get_render_cache()
+            if not cache.enabled:
+                return func(*args, **kwargs)
+
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            arguments = dict(bound.arguments)
+            output_path = arguments.pop(output_arg, None) if output_arg else None
+
+            parts = []
+            for name in sorted(arguments):
+                if name not in ignored:
+                    parts.extend((name, arguments[name]))
+            key = make_key(namespace, fingerprint, *parts)
+
+            data = cache.get(key)
+            if data is not None:
+                if output_path:
+                    write_atomic(output_path, data)
+                    print(f"   [CACHE] 재사용: {output_path}")
+                return Image.open(io.BytesIO(data))
+
+            result = func(*args, **kwargs)
+
+            if output_path and Path(output_path).exists():
+                cache.put(key, Path(output_path).read_bytes())
+            elif isinstance(result, Image.Image):
+                cache.put_image(key, result)
+            return result
+
+        wrapper.uncached = func
+        return wrapper
+
+    return decorator
+
+
+def write_atomic(output_path, data: bytes):
+    """임시 파일 + os.replace 로 바이트 기록"""
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(prefix=".tmp_", suffix=output_path.suffix, dir=str(output_path.parent))
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
@@ -0,0 +1,178 @@
+"""
+재개 가능한 병렬 배치 실행기 단위 테스트
+
+테스트 대상:
+- 워커 풀 동시 처리 (batch_executor)
+- 항목별 재시도 (예외 / 실패 반환)
+- 저널 기반 --resume: 완료 항목 건너뜀, 잘린 마지막 줄 무시
+- 진행 콜백 처리량 / ETA
+- 중단(Ctrl+C) 시 대기 항목 취소 + 끝난 항목만 저널 기록
+- night_batch.print_status 진행 표시
+"""
+
+import importlib.util
+import json
+import threading
+import time
+import pytest
+from pathlib import Path
+import sys
+
+# 04_pipeline 경로 추가
+ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(ROOT))
+
+
+# ==============================================================================
+# Fixtures
+# ==============================================================================
+
+def _executor(tmp_path, **kwargs):
+    from batch_executor import BatchExecutor
+
+    kwargs.setdefault("retry_delay", 0)
+    return BatchExecutor(tmp_path / "journal.jsonl", log=lambda msg: None, **kwargs)
+
+
+class FlakyTask:
+    """항목별 처음 fail_times[key] 회는 예외, 이후 성공 (호출 기록)"""
+
+    def __init__(self, fail_times=None, delay=0.0):
+        self.fail_times = dict(fail_times or {})
+        self.delay = delay
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def __call__(self, item):
+        with self._lock:
+            self.calls.append(item)
+            remaining = self.fail_times.get(item, 0)
+            self.fail_times[item] = remaining - 1
+        time.sleep(self.delay)
+        if remaining > 0:
+            raise RuntimeError(f"{item} boom")
+        return item.upper()
+
+
+# ==============================================================================
+# Batch Executor Tests
+# ==============================================================================
+
+class TestBatchExecutor:
+    """동시 처리 / 재시도 / 재개 / 진행 테스트"""
+
+    def test_items_run_concurrently(self, tmp_path):
+        """0.2초 항목 4개, 워커 4개 → 합계가 아니라 가장 느린 항목 시간"""
+        task = FlakyTask(delay=0.2)
+        results = {}
+
+        started = time.monotonic()
+        report = _executor(tmp_path, workers=4).run(
+            ["a", "b", "c", "d"], key=str, func=task,
+            on_result=lambda item, result: results.__setitem__(item, result))
+
+        assert time.monotonic() - started < 0.6
+        assert sorted(report.done) == ["a", "b", "c", "d"] and not report.failed
+        assert results == {"a": "A", "b": "B", "c": "C", "d": "D"}
+
+    def test_retries_per_item(self, tmp_path):
+        """1회 실패 항목은 재시도로 성공, 계속 실패하는 항목만 failed"""
+        task = FlakyTask(fail_times={"b": 1, "c": 5})
+        executor = _executor(tmp_path, workers=2, retries=1)
+
+        report = executor.run(["a", "b", "c"], key=str, func=task)
+
+        assert sorted(report.done) == ["a", "b"]
+        assert list(report.failed) == ["c"] and "c boom" in report.failed["c"]
+        assert report.retried == 2
+        assert sorted(task.calls) == ["a", "b", "b", "c", "c"]
+
+        journal = executor.journal.load()
+        assert journal["b"]["status"] == "done" and journal["b"]["attempts"] == 2
+        assert journal["c"]["status"] == "failed"
+
+    def test_resume_skips_completed_items(self, tmp_path):
+        """--resume: 저널의 done 항목 건너뛰고 실패/미처리만, 잘린 줄은 무시"""
+        _executor(tmp_path, retries=0).run(["a", "b", "c"], key=str,
+                                           func=FlakyTask(fail_times={"c": 1}))
+        journal_path = tmp_path / "journal.jsonl"
+        with open(journal_path, "a", encoding="utf-8") as f:
+            f.write('{"key": "d", "status": "do')  # 기록 중 종료
+
+        task = FlakyTask()
+        report = _executor(tmp_path).run(["a", "b", "c", "d"], key=str, func=task, resume=True)
+
+        assert sorted(report.skipped) == ["a", "b"]
+        assert sorted(task.calls) == ["c", "d"] and sorted(report.done) == ["c", "d"]
+
+        # resume 없이 실행 → 새 저널 (이전 저널은 .prev 보관)
+        task = FlakyTask()
+        _executor(tmp_path).run(["a"], key=str, func=task)
+        assert task.calls == ["a"]
+        assert [json.loads(line)["key"] for line in journal_path.read_text().splitlines()] == ["a"]
+        assert journal_path.with_suffix(".jsonl.prev").exists()
+
+    def test_progress_reports_throughput_and_eta(self, tmp_path):
+        """진행 콜백: 건너뛴 항목 포함 위치, 처리량 / ETA, succeeded 판정"""
+        from batch_executor import BatchProgress, format_eta
+
+        progress = BatchProgress(total=10, done=3, failed=1, skipped=2, elapsed=8.0)
+        assert progress.current == 6
+        assert progress.throughput == 30.0
+        assert progress.eta == 8.0
+        assert BatchProgress(total=5).eta is None
+        assert (format_eta(None), format_eta(8), format_eta(200), format_eta(3900)) == \
+            ("계산 중", "8초", "3분 20초", "1시간 05분")
+
+        seen = []
+        report = _executor(tmp_path, workers=1, retries=0).run(
+            [1, 2, 3], key=str, func=lambda n: n, succeeded=lambda n: n != 2,
+            on_progress=lambda p: seen.append((p.current, p.key, p.status)))
+
+        assert seen == [(1, "1", "done"), (2, "2", "failed"), (3, "3", "done")]
+        assert list(report.failed) == ["2"]
+
+    def test_interrupt_cancels_queue_and_journals_finished(self, tmp_path):
+        """중단 시 대기 항목은 실행하지 않고, 끝난 항목만 저널에 남아 resume 으로 이어감"""
+        task = FlakyTask(delay=0.05)
+
+        def interrupt(progress):
+            raise KeyboardInterrupt
+
+        with pytest.raises(KeyboardInterrupt):
+            _executor(tmp_path, workers=1).run(list("abcdef"), key=str, func=task,
+                                               on_progress=interrupt)
+        time.sleep(0.2)  # 중단 시점에 실행 중이던 항목 종료 대기
+
+        assert task.calls[0] == "a" and len(task.calls) <= 2
+        from batch_executor import BatchJournal
+        assert BatchJournal(tmp_path / "journal.jsonl").completed() == {"a"}
+
+        resumed = _executor(tmp_path, workers=1).run(list("abcdef"), key=str, func=FlakyTask(),
+                                                     resume=True)
+        assert resumed.skipped == ["a"] and sorted(resumed.done) == list("bcdef")
+
+
+# ==============================================================================
+# Night Batch Tests
+# ==============================================================================
+
+class TestNightBatchStatus:
+    """night_batch 진행 표시 테스트"""
+
+    def test_print_status_with_progress(self, capsys):
+        """BatchProgress 전달 시 진행바 + 처리량 / ETA 표시"""
+        pytest.importorskip("dotenv")
+        from batch_executor import BatchProgress
+
+        path = ROOT.parent / "03_scripts" / "night_batch.py"
+        spec = importlib.util.spec_from_file_location("night_batch", path)
+        night_batch = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(night_batch)
+
+        progress = BatchProgress(total=10, done=2, skipped=1, elapsed=60.0)
+        night_batch.print_status(3, 10, "apple", "done", night_batch.BatchResult(), progress)
+
+        out = capsys.readouterr().out
+        assert "█" * 12 + "░" * 28 in out
+        assert "처리량: 2.0건/분" in out and "남은 시간: 3분 30초" in out
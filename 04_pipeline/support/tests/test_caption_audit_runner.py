@@ -0,0 +1,161 @@
+"""
+증분 캡션 전수 검수 실행기 단위 테스트
+
+테스트 대상:
+- 콘텐츠 트리 1회 순회: 새 경로 > 플랫 구조 > OLD 파일명 (caption_audit_runner)
+- (캡션 해시, 검사 함수 지문) 결과 캐시: 바뀐 캡션만 재검사
+- 프로세스 풀 검사 = 현재 프로세스 검사
+- JSONL + 요약 리포트
+"""
+
+import json
+import os
+from pathlib import Path
+import sys
+
+import pytest
+
+# 04_pipeline 경로 추가
+ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(ROOT))
+
+
+# ==============================================================================
+# Fixtures
+# ==============================================================================
+
+FOOD_DATA = {
+    "1": {"name": "호박", "english_name": "Pumpkin", "safety": "SAFE"},
+    "2": {"name": "포도", "english_name": "Grape", "safety": "FORBIDDEN"},
+    "3": {"name": "당근", "english_name": "Carrot", "safety": "CAUTION"},
+}
+
+
+def _write(path: Path, text: str) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+def length_check(text, platform, food):
+    """rules_check 와 다른 검사 함수 (같은 캐시 파일 공유 확인용)"""
+    return {"failed": [] if len(text) < 100 else ["too_long"], "details": {}}
+
+
+@pytest.fixture
+def contents(tmp_path):
+    """새 경로 / 플랫 구조 / OLD 파일명이 섞인 콘텐츠 트리"""
+    root = tmp_path / "01_contents"
+    _write(root / "001_Pumpkin" / "insta" / "caption.txt", "🟢 호박 #강아지")
+    _write(root / "001_Pumpkin" / "01_Insta&Thread" / "Pumpkin_SAFE_Insta_Caption.txt", "OLD")
+    _write(root / "001_Pumpkin" / "01_Insta&Thread" / "Pumpkin_SAFE_Threads_Caption.txt", "Pumpkin ✨AI")
+    _write(root / "002_Grape" / "01_Insta&Thread" / "caption.txt", "⛔ 포도 금지")
+    _write(root / "002_Grape" / "01_Insta&Thread" / "thread_caption.txt", "Grape ✨AI")
+    _write(root / "002_Grape" / "02_Blog" / "Grape_FORBIDDEN_Blog_Caption.txt", "포도 블로그")
+    _write(root / "003_Carrot" / "02_Blog" / "caption.txt", "당근 블로그")
+    (root / "notes").mkdir()
+    _write(root / "README.txt", "not a folder")
+    return root
+
+
+# ==============================================================================
+# Caption Audit Runner Tests
+# ==============================================================================
+
+class TestCaptionAuditRunner:
+    """트리 순회 / 증분 캐시 / 프로세스 풀 / 리포트 테스트"""
+
+    def test_scan_contents_resolves_layouts_once(self, contents):
+        """새 경로 우선, 플랫 구조 다음, OLD 파일명 마지막 / 콘텐츠 폴더만 번호순"""
+        from caption_audit_runner import scan_contents
+
+        folders = scan_contents(contents)
+
+        assert [f.name for f in folders] == ["001_Pumpkin", "002_Grape", "003_Carrot"]
+        pumpkin, grape, carrot = (f.captions for f in folders)
+        assert pumpkin["instagram"] == contents / "001_Pumpkin" / "insta" / "caption.txt"
+        assert pumpkin["threads"].name == "Pumpkin_SAFE_Threads_Caption.txt"
+        assert "blog" not in pumpkin
+        assert grape["threads"].name == "thread_caption.txt"
+        assert grape["blog"].name == "Grape_FORBIDDEN_Blog_Caption.txt"
+        assert set(carrot) == {"blog"}
+        assert [f.num for f in scan_contents(contents, num_range=(2, 3))] == [2, 3]
+
+    def test_rerun_checks_only_changed_captions(self, contents, tmp_path):
+        """재실행은 전부 캐시, 수정한 캡션 / 바뀐 음식 정보만 다시 검사"""
+        from caption_audit_runner import CaptionAuditRunner
+
+        def runner(food_data=FOOD_DATA):
+            return CaptionAuditRunner(food_data, contents_dir=contents, cache_path=tmp_path / "cache.json",
+                                      workers=1, log=lambda msg: None)
+
+        first = runner().run()
+        assert first.summary["checked"] == first.summary["total"] == 6
+        assert runner().run().summary["cached"] == 6
+
+        edited = contents / "002_Grape" / "01_Insta&Thread" / "caption.txt"
+        _write(edited, "⛔ 포도 수정")
+        os.utime(edited, ns=(1, 1))
+        report = runner().run()
+        assert report.summary["checked"] == 1
+        assert [r.path for r in report.records if not r.cached] == [str(edited)]
+
+        changed = dict(FOOD_DATA, **{"3": dict(FOOD_DATA["3"], safety="DANGER")})
+        report = runner(changed).run()
+        assert [r.folder for r in report.records if not r.cached] == ["003_Carrot"]
+
+    def test_checkers_sharing_cache_keep_own_results(self, contents, tmp_path):
+        """같은 캐시 파일을 쓰는 검사 함수끼리 결과를 덮어쓰지 않음"""
+        from caption_audit_runner import CaptionAuditRunner, rules_check
+
+        def runner(checker):
+            return CaptionAuditRunner(FOOD_DATA, checker=checker, contents_dir=contents,
+                                      cache_path=tmp_path / "cache.json", workers=1, log=lambda msg: None)
+
+        first = {}
+        for checker in (rules_check, length_check):
+            report = runner(checker).run()
+            assert report.summary["checked"] == 6
+            first[checker] = [r.result for r in report.records]
+
+        for checker in (rules_check, length_check):
+            report = runner(checker).run()
+            assert report.summary["cached"] == 6
+            assert [r.result for r in report.records] == first[checker]
+        assert first[rules_check] != first[length_check]
+
+    def test_process_pool_matches_inline(self, contents, tmp_path):
+        """프로세스 풀 결과 = 현재 프로세스 결과 (입력 순서 유지), 모르는 안전도는 skip"""
+        from caption_audit_runner import CaptionAuditRunner, rules_check
+
+        food_data = dict(FOOD_DATA)
+        del food_data["3"]
+        inline = CaptionAuditRunner(food_data, contents_dir=contents, cache_path=False, workers=1,
+                                    log=lambda msg: None).run()
+        pooled = CaptionAuditRunner(food_data, contents_dir=contents, cache_path=False, workers=2,
+                                    inline_threshold=0, log=lambda msg: None).run()
+
+        assert [r.to_dict() for r in pooled.records] == [r.to_dict() for r in inline.records]
+        assert [r.status for r in inline.records if r.folder == "003_Carrot"] == ["skip"]
+        grape = next(r for r in inline.records if r.folder == "002_Grape" and r.platform == "instagram")
+        expected = rules_check("⛔ 포도 금지", "instagram", {"safety": "FORBIDDEN"})
+        assert grape.failed == expected["failed"] and grape.status == "fail"
+
+    def test_report_written_as_jsonl_and_summary(self, contents, tmp_path):
+        """항목별 JSONL 한 줄씩 + 플랫폼별 / 항목별 집계 요약"""
+        from caption_audit_runner import CaptionAuditRunner
+
+        runner = CaptionAuditRunner(FOOD_DATA, contents_dir=contents, cache_path=False, workers=1,
+                                    log=lambda msg: None)
+        report = runner.run(platforms=["threads", "blog"])
+        records_path, summary_path = runner.write_report(report, tmp_path / "report")
+
+        lines = [json.loads(line) for line in records_path.read_text(encoding="utf-8").splitlines()]
+        summary = json.loads(summary_path.read_text(encoding="utf-8"))
+        assert [(r["folder"], r["platform"]) for r in lines] == [
+            ("001_Pumpkin", "threads"), ("002_Grape", "blog"), ("002_Grape", "threads"), ("003_Carrot", "blog")]
+        assert summary["total"] == 4
+        assert summary["pass"] + summary["fail"] == 4
+        assert set(summary["by_platform"]) == {"threads", "blog"}
+        assert sum(summary["fail_by_check"].values()) == sum(len(r["failed"]) for r in lines)
+        assert summary["rules_version"]
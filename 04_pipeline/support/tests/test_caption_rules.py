@@ -0,0 +1,135 @@
+"""
+캡션 규칙 엔진 단위 테스트
+
+테스트 대상:
+- Aho-Corasick 다중 패턴 매칭 = 키워드별 부분 문자열 검색 (caption_rules)
+- 그룹 스캔: 대소문자 구분 / 무시, 설정 순서, 출현 수, 독성 카테고리
+- 선언형 규칙 평가 → Finding, 규칙 파일 변경 시 version 변경
+- caption_validator 가 엔진 위의 얇은 뷰로 동작
+"""
+
+import json
+import random
+from pathlib import Path
+import sys
+
+import pytest
+
+# 04_pipeline 경로 추가
+ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(ROOT))
+
+
+# ==============================================================================
+# Fixtures
+# ==============================================================================
+
+@pytest.fixture
+def rules():
+    from caption_rules import get_caption_rules
+
+    return get_caption_rules()
+
+
+def _naive_matches(patterns, text):
+    """키워드마다 전체 텍스트를 다시 훑는 기존 방식 (겹침 포함)"""
+    found = set()
+    for pid, pattern in enumerate(patterns):
+        start = text.find(pattern)
+        while start != -1:
+            found.add((start, pid))
+            start = text.find(pattern, start + 1)
+    return found
+
+
+CAPTION = """🐕 강아지 포도, 줘도 되나요?
+
+⛔ 절대 금지! 포도는 강아지에게 치명적이에요.
+• 급성 신부전 위험
+• 구토 증상
+• 소량도 위험
+
+💡 "몰랐다면 괜찮아요, 지금 알았으니까"
+저장해두고 공유해 주세요 💾
+수의사 상담 필수 (Vet)
+
+AI로 생성된 콘텐츠입니다.
+#강아지포도 #반려견 #강아지간식 #펫푸드 #강아지음식 #반려견음식
+#강아지건강 #포도 #금지음식 #강아지먹어도되나요 #햇살이 #dogfood
+"""
+
+
+# ==============================================================================
+# Caption Rules Tests
+# ==============================================================================
+
+class TestCaptionRules:
+    """오토마톤 / 스캔 / 규칙 평가 / 검증기 뷰 테스트"""
+
+    def test_automaton_matches_naive_search(self):
+        """무작위 패턴·텍스트: 1회 순회 결과 = 패턴별 find 반복 결과"""
+        from caption_rules import KeywordAutomaton
+
+        rng = random.Random(7)
+        alphabet = "ab가나🐕"
+        for _ in range(50):
+            patterns = list(dict.fromkeys(
+                "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 4))) for _ in range(8)))
+            text = "".join(rng.choice(alphabet) for _ in range(60))
+            automaton = KeywordAutomaton(patterns)
+            assert set(automaton.iter_matches(text)) == _naive_matches(patterns, text)
+
+    def test_scan_groups(self, rules):
+        """대소문자 구분 그룹 / 무시 그룹, 설정 순서 matched, 출현 수, 독성 카테고리"""
+        scan = rules.scan(CAPTION)
+
+        assert scan.count("hashtag") == 12 and scan.count("bullet") == 3
+        assert scan.matched("forbidden_marker") == ["금지", "절대"]
+        assert scan.has("vet") and scan.has("hook_ko:FORBIDDEN")
+        assert scan.has("ai_mark") and not rules.scan(CAPTION.replace("AI", "ai")).has("ai_mark")
+        assert rules.scan("ER visit").has("threads_hook:DANGER") and rules.scan("er").has("threads_hook:DANGER")
+        assert scan.toxicity_categories() == ["GRAPE_TOXIN", "PERSIN", "CITRUS_TOXIN"]
+        assert scan.first("key_message") == CAPTION.index("💡")
+        assert rules.scan(CAPTION) is scan  # 같은 텍스트 재스캔 없음
+
+        from caption_rules import CaptionRuleError
+        with pytest.raises(CaptionRuleError):
+            scan.has("no_such_group")
+
+    def test_evaluate_rules_and_version(self, rules, tmp_path):
+        """플랫폼/안전도별 규칙 → Finding, 규칙 파일 변경 → 결과와 version 변경"""
+        from caption_rules import CaptionRules
+
+        findings = rules.evaluate(CAPTION, "instagram", "FORBIDDEN")
+        assert [f.rule for f in findings] == ["IG4", "TOX"]
+        assert findings[1].severity == "info" and findings[1].matches == ["GRAPE_TOXIN", "PERSIN", "CITRUS_TOXIN"]
+
+        blocked = rules.evaluate("포도 맛있어요 좋아요", "blog", "FORBIDDEN")
+        assert blocked[0].rule == "FB1" and blocked[0].matches == ["좋아요", "맛있어요"]
+        assert rules.evaluate("포도 맛있어요", "blog", "SAFE") == []
+        assert rules.evaluate(CAPTION, "instagram", "UNKNOWN")[0].message == "1. 안전도 이모지 누락 (필요: ())"
+
+        config = json.loads(Path(rules.path).read_text(encoding="utf-8"))
+        config["toxicity_source"] = None
+        config["hashtag_bounds"]["instagram"] = [15, 20]
+        custom_path = tmp_path / "caption_rules.json"
+        custom_path.write_text(json.dumps(config, ensure_ascii=False), encoding="utf-8")
+        custom = CaptionRules(custom_path)
+
+        assert custom.version != rules.version
+        assert [f.rule for f in custom.evaluate(CAPTION, "instagram", "FORBIDDEN")] == ["IG4", "IG8"]
+        assert custom.evaluate(CAPTION, "instagram", "FORBIDDEN")[1].message == "8. 해시태그 12개 (필요: 15~20개)"
+
+    def test_caption_validator_is_view_over_engine(self):
+        """caption_validator: 엔진 Finding → 기존 errors / score / details 형식"""
+        sys.path.insert(0, str(ROOT.parent / "00_rules" / "validators"))
+        from caption_validator import validate_instagram_caption, validate_threads_caption
+
+        result = validate_instagram_caption(CAPTION, "forbidden")
+        assert result["errors"] == ["4. 급여량 정보 누락 (소/중/대형견)"]
+        assert result["score"] == "7/8" and not result["valid"]
+        assert result["details"]["bullet_count"] == 3 and result["details"]["has_forbidden"] is True
+
+        threads = validate_threads_caption(CAPTION)
+        assert threads["errors"] == ["해시태그 과다 (12개, 권장: 3개 이하)"]
+        assert threads["details"]["has_ai_notice"] is True
@@ -0,0 +1,210 @@
+"""
+캐러셀 게시 엔진 단위 테스트
+
+테스트 대상:
+- 자식 컨테이너 병렬 생성 / 순서 유지 (core.carousel_publisher)
+- 지수 백오프 상태 폴링 / 엔드포인트별 요청 제한
+- Instagram + Threads 동시 게시
+"""
+
+import asyncio
+import time
+import pytest
+from pathlib import Path
+import sys
+
+# 04_pipeline 경로 추가
+ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(ROOT))
+
+
+# ==============================================================================
+# Fixtures
+# ==============================================================================
+
+class FakeResponse:
+    def __init__(self, payload):
+        self.payload = payload
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def json(self):
+        return self.payload
+
+
+class FakeGraphSession:
+    """Graph API 대역 (컨테이너 id 발급, N번째 조회부터 FINISHED)"""
+
+    def __init__(self, delay: float = 0.02, ready_after: int = 2):
+        self.delay = delay
+        self.ready_after = ready_after
+        self.requests = []
+        self.status_polls = {}
+        self.active = 0
+        self.peak = 0
+        self._next_id = 100
+
+    def _respond(self, method, url, payload):
+        self.requests.append((method, url, dict(payload)))
+        path = url.split("/", 4)[-1]
+        if method == "GET":
+            if "fields" in payload and "permalink" in payload["fields"]:
+                return {"id": path, "permalink": f"https://instagram.com/p/{path}"}
+            polls = self.status_polls[path] = self.status_polls.get(path, 0) + 1
+            status = "FINISHED" if polls >= self.ready_after else "IN_PROGRESS"
+            return {payload["fields"]: status}
+        self._next_id += 1
+        return {"id": str(self._next_id)}
+
+    def _call(self, method, url, payload):
+        session = self
+
+        class _Request:
+            async def __aenter__(self):
+                session.active += 1
+                session.peak = max(session.peak, session.active)
+                await asyncio.sleep(session.delay)
+                session.active -= 1
+                return FakeResponse(session._respond(method, url, payload))
+
+            async def __aexit__(self, *exc):
+                return False
+
+        return _Request()
+
+    def get(self, url, params=None):
+        return self._call("GET", url, params or {})
+
+    def post(self, url, data=None):
+        return self._call("POST", url, data or {})
+
+
+def _engine(session, limits=None):
+    """테스트용 엔진 (간격 제한 없음, 짧은 백오프)"""
+    from core.carousel_publisher import Backoff, CarouselPublisher, RateLimit
+
+    limits = dict({"container": RateLimit(4), "publish": RateLimit(1)}, **(limits or {}))
+    return CarouselPublisher(session=session, limits=limits, log=lambda msg: None,
+                             backoff=Backoff(initial=0.01, max_interval=0.05, timeout=1.0))
+
+
+URLS = [f"https://res.cloudinary.com/test/img_{i}.png" for i in range(4)]
+
+
+# ==============================================================================
+# Engine Tests
+# ==============================================================================
+
+class TestCarouselPublisher:
+    """캐러셀 게시 흐름 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_children_created_concurrently_in_order(self):
+        """자식 컨테이너 동시 생성, 캐러셀 children 은 이미지 순서"""
+        from core.carousel_publisher import RateLimit, instagram_platform
+
+        session = FakeGraphSession()
+        engine = _engine(session, limits={"container": RateLimit(max_concurrent=4)})
+
+        outcome = await engine.publish_carousel(instagram_platform("ig", "token"), URLS, "캡션")
+
+        assert outcome.success and outcome.container_count == 4
+        assert session.peak > 1
+        children = [r for r in session.requests if r[2].get("is_carousel_item")]
+        carousel = next(r for r in session.requests if r[2].get("media_type") == "CAROUSEL")
+        id_by_url = {r[2]["image_url"]: str(101 + i) for i, r in enumerate(children)}
+        assert carousel[2]["children"].split(",") == [id_by_url[url] for url in URLS]
+        assert carousel[2]["caption"] == "캡션"
+        assert "publish" in outcome.timings
+
+    @pytest.mark.asyncio
+    async def test_threads_waits_for_children(self):
+        """Threads: 자식 FINISHED 확인 후 캐러셀 생성, text 필드 사용"""
+        from core.carousel_publisher import threads_platform
+
+        session = FakeGraphSession(ready_after=3)
+        outcome = await _engine(session).publish_carousel(threads_platform("th", "token"), URLS, "본문")
+
+        carousel_index = next(i for i, r in enumerate(session.requests) if r[2].get("media_type") == "CAROUSEL")
+        child_polls = [r for r in session.requests[:carousel_index] if r[0] == "GET"]
+
+        assert outcome.success
+        assert outcome.post_url.endswith(outcome.post_id)
+        assert len(child_polls) == 4 * 3
+        assert session.requests[carousel_index][2]["text"] == "본문"
+
+    @pytest.mark.asyncio
+    async def test_failed_children_and_status_error(self):
+        """min_children 미달 / 상태 ERROR 시 게시하지 않음"""
+        from core.carousel_publisher import instagram_platform
+
+        class FailingSession(FakeGraphSession):
+            def _respond(self, method, url, payload):
+                if payload.get("image_url", "").endswith(("_1.png", "_2.png", "_3.png")):
+                    self.requests.append((method, url, dict(payload)))
+                    return {"error": {"message": "bad image", "code": 9004}}
+                if method == "GET":
+                    self.requests.append((method, url, dict(payload)))
+                    return {"status_code": "ERROR"}
+                return super()._respond(method, url, payload)
+
+        platform = instagram_platform("ig", "token")
+        outcome = await _engine(FailingSession()).publish_carousel(platform, URLS, "", min_children=2)
+        assert not outcome.success and "1/4" in outcome.error
+
+        session = FailingSession()
+        outcome = await _engine(session).publish_carousel(platform, URLS[:1] + URLS[:1], "", min_children=2)
+        assert not outcome.success and "오류" in outcome.error
+        assert not any(url.endswith("media_publish") for _, url, _ in session.requests)
+
+    @pytest.mark.asyncio
+    async def test_publish_many_runs_platforms_in_parallel(self):
+        """Instagram + Threads 동시 게시 (합계보다 짧은 시간)"""
+        from core.carousel_publisher import instagram_platform, threads_platform
+
+        session = FakeGraphSession(delay=0.05, ready_after=1)
+        engine = _engine(session)
+        jobs = [(instagram_platform("ig", "t"), URLS, "a"), (threads_platform("th", "t"), URLS, "b")]
+
+        started = time.monotonic()
+        ig, th = await engine.publish_many(jobs)
+        elapsed = time.monotonic() - started
+
+        assert ig.platform == "instagram" and th.platform == "threads"
+        assert ig.success and th.success
+        assert elapsed < ig.timings["publish"] + th.timings["publish"]
+
+
+# ==============================================================================
+# Rate Limit / Backoff Tests
+# ==============================================================================
+
+class TestPacing:
+    """요청 제한 / 백오프 테스트"""
+
+    def test_backoff_intervals_grow_and_cap(self):
+        """간격은 factor 배로 증가, max_interval 로 제한, 합계 = timeout"""
+        from core.carousel_publisher import Backoff
+
+        intervals = list(Backoff(initial=1.0, factor=2.0, max_interval=5.0, timeout=20.0).intervals())
+
+        assert intervals[:4] == [1.0, 2.0, 4.0, 5.0]
+        assert max(intervals) == 5.0
+        assert sum(intervals) == pytest.approx(20.0)
+
+    @pytest.mark.asyncio
+    async def test_min_interval_spaces_request_starts(self):
+        """최소 간격: 같은 엔드포인트 요청 시작이 간격 이상 벌어짐"""
+        from core.carousel_publisher import RateLimit, instagram_platform
+
+        session = FakeGraphSession(delay=0)
+        engine = _engine(session, limits={"container": RateLimit(max_concurrent=4, min_interval=0.05)})
+
+        started = time.monotonic()
+        await engine.create_children(instagram_platform("ig", "t"), URLS)
+
+        assert time.monotonic() - started >= 0.05 * 3
@@ -0,0 +1,142 @@
+"""
+Cloudinary 업로드 단계 단위 테스트
+
+테스트 대상:
+- 병렬 업로드 / 입력 순서 유지 (core.cloudinary_upload)
+- SHA-256 기록 / 해시 일치 시 업로드 생략
+- prepare_cloudinary 재준비 판정
+"""
+
+import asyncio
+import threading
+import time
+import pytest
+from types import SimpleNamespace
+from pathlib import Path
+import sys
+
+# 04_pipeline 경로 추가
+ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(ROOT))
+
+
+# ==============================================================================
+# Fixtures
+# ==============================================================================
+
+class FakeUploader:
+    """cloudinary.uploader.upload 대역 (호출 기록 + 동시 실행 수 측정)"""
+
+    def __init__(self, delay: float = 0.05):
+        self.delay = delay
+        self.calls = []
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, path, folder, public_id, **options):
+        with self._lock:
+            self.calls.append(public_id)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        return {
+            "public_id": f"{folder}/{public_id}",
+            "secure_url": f"https://res.cloudinary.com/test/{folder}/{public_id}.png",
+        }
+
+
+@pytest.fixture
+def image_folder(tmp_path):
+    """이미지 4장 폴더 (내용은 서로 다른 바이트)"""
+    folder = tmp_path / "apple"
+    folder.mkdir()
+    for i in range(4):
+        (folder / f"apple_{i:02d}.png").write_bytes(f"image-{i}".encode())
+    return folder
+
+
+def _jobs(folder):
+    from core.cloudinary_upload import UploadJob
+
+    return [UploadJob(p, "project_sunshine/apple", p.stem) for p in sorted(folder.glob("*.png"))]
+
+
+# ==============================================================================
+# Upload Stage Tests
+# ==============================================================================
+
+class TestUploadStage:
+    """병렬 업로드 / 해시 생략 테스트"""
+
+    def test_concurrent_upload_keeps_order(self, image_folder):
+        """동시 업로드하되 결과는 입력 순서"""
+        from core.cloudinary_upload import CloudinaryUploadStage
+
+        uploader = FakeUploader()
+        results = CloudinaryUploadStage(uploader, max_workers=4).upload(_jobs(image_folder))
+
+        assert uploader.peak > 1
+        assert [r.index for r in results] == [0, 1, 2, 3]
+        assert [r.secure_url.rsplit("/", 1)[1] for r in results] == [f"apple_{i:02d}.png" for i in range(4)]
+        assert all(r.ok and len(r.sha256) == 64 for r in results)
+
+    def test_skips_unchanged_and_reuploads_changed(self, image_folder):
+        """기록된 해시와 같으면 생략, 바뀐 파일만 재업로드"""
+        from core.cloudinary_upload import CloudinaryUploadStage, known_assets, record_assets
+
+        uploader = FakeUploader(delay=0)
+        stage = CloudinaryUploadStage(uploader)
+        metadata = record_assets({}, stage.upload(_jobs(image_folder)))
+
+        (image_folder / "apple_02.png").write_bytes(b"edited")
+        results = stage.upload(_jobs(image_folder), known_assets(metadata))
+
+        assert [r.skipped for r in results] == [True, True, False, True]
+        assert uploader.calls.count("apple_02") == 2
+        assert len(uploader.calls) == 5
+
+    def test_async_upload_and_errors(self, image_folder):
+        """async 호출 + 개별 실패는 result.error 로 반환"""
+        from core.cloudinary_upload import CloudinaryUploadStage
+
+        def flaky(path, folder, public_id, **options):
+            if public_id == "apple_01":
+                raise ConnectionError("timeout")
+            return {"secure_url": f"https://x/{public_id}.png"}
+
+        results = asyncio.run(CloudinaryUploadStage(flaky).upload_async(_jobs(image_folder)))
+
+        assert [r.ok for r in results] == [True, False, True, True]
+        assert results[1].error == "timeout"
+
+
+# ==============================================================================
+# prepare_cloudinary Tests
+# ==============================================================================
+
+class TestPrepareCloudinary:
+    """metadata.json 기록 / 재준비 판정 테스트"""
+
+    def test_prepare_records_hashes_and_detects_changes(self, image_folder, monkeypatch):
+        """해시 기록 후 재호출은 생략, 이미지 변경 시 해당 파일만 재업로드"""
+        from core import cloudinary_prepare as cp
+        from core.cloudinary_upload import read_metadata
+
+        uploader = FakeUploader(delay=0)
+        monkeypatch.setattr(cp, "CLOUDINARY_AVAILABLE", True)
+        monkeypatch.setattr(cp, "configure_cloudinary", lambda: True)
+        monkeypatch.setattr(cp, "cloudinary", SimpleNamespace(uploader=SimpleNamespace(upload=uploader)), raising=False)
+
+        assert cp.prepare_cloudinary(image_folder, "apple")[0]
+        metadata = read_metadata(image_folder / "metadata.json")
+        assert len(metadata["image_urls"]) == 4
+        assert set(metadata["cloudinary_assets"]) == {f"apple_{i:02d}.png" for i in range(4)}
+
+        assert cp.prepare_cloudinary(image_folder, "apple") == (True, "이미 준비됨")
+
+        (image_folder / "apple_03.png").write_bytes(b"edited")
+        assert cp.prepare_cloudinary(image_folder, "apple")[0]
+        assert len(uploader.calls) == 5
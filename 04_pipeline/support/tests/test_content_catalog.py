@@ -0,0 +1,117 @@
+"""
+콘텐츠 카탈로그 단위 테스트
+
+테스트 대상:
+- food_id / 폴더명 조각 인덱스, 위치 우선순위 (core.content_catalog)
+- mtime 기반 증분 갱신 (바뀐 폴더만 다시 읽기)
+- 스냅샷 재사용 / invalidate 후 즉시 반영
+"""
+
+import json
+import shutil
+import pytest
+from pathlib import Path
+import sys
+
+# 04_pipeline 경로 추가
+ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(ROOT))
+
+
+# ==============================================================================
+# Fixtures
+# ==============================================================================
+
+def _make_folder(parent: Path, name: str, food_id: str, images=4, **metadata) -> Path:
+    folder = parent / name
+    folder.mkdir(parents=True)
+    for i in range(images):
+        (folder / f"{food_id}_{i:02d}.png").write_bytes(b"png")
+    (folder / "metadata.json").write_text(
+        json.dumps({"food_id": food_id, **metadata}, ensure_ascii=False), encoding="utf-8")
+    return folder
+
+
+@pytest.fixture
+def contents(tmp_path):
+    root = tmp_path / "contents"
+    _make_folder(root / "1_cover_only", "003_blackberry2_블랙베리", "blackberry2", images=1)
+    _make_folder(root / "2_body_ready", "001_apple_사과", "apple")
+    _make_folder(root / "3_approved", "002_banana_바나나", "banana", pd_approved=True)
+    _make_folder(root / "4_posted" / "2026-02", "004_kiwi_키위", "kiwi", instagram_media_id="1")
+    _make_folder(root, "005_pear_배", "pear", images=0)
+    return root
+
+
+def _catalog(contents, tmp_path):
+    from core.content_catalog import ContentCatalog
+
+    return ContentCatalog(contents, snapshot_path=tmp_path / "snapshot.json", refresh_interval=0)
+
+
+# ==============================================================================
+# Content Catalog Tests
+# ==============================================================================
+
+class TestContentCatalog:
+    """인덱스 / 증분 갱신 / 스냅샷 테스트"""
+
+    def test_index_lookup_and_status(self, contents, tmp_path):
+        """food_id · 숫자 접미사 제거 조각 조회, 위치 우선순위, 상태 판별"""
+        catalog = _catalog(contents, tmp_path)
+
+        assert catalog.find("apple").name == "001_apple_사과"
+        assert catalog.find("blackberry").food_id == "blackberry2"
+        assert catalog.find("banana", locations=["2_body_ready", "1_cover_only"]) is None
+        assert catalog.find("kiwi", locations=["4_posted"]).location == "4_posted/2026-02"
+        assert {s: [e.food_id for e in items] for s, items in catalog.by_status().items()} == {
+            "cover_only": ["blackberry2", "pear"], "body_ready": ["apple"],
+            "approved": ["banana"], "posted": ["kiwi"],
+        }
+        assert [e.food_id for e in catalog.entries([""])] == ["pear"]
+
+    def test_refresh_rereads_only_changed_folders(self, contents, tmp_path):
+        """metadata 수정 / 폴더 추가·삭제만 다시 읽기"""
+        catalog = _catalog(contents, tmp_path)
+        catalog.refresh()
+        reparsed = catalog.stats["reparsed"]
+
+        apple = contents / "2_body_ready" / "001_apple_사과"
+        (apple / "metadata.json").write_text(json.dumps({"food_id": "apple", "pd_approved": True}),
+                                             encoding="utf-8")
+        _make_folder(contents / "2_body_ready", "006_grape_포도", "grape")
+        shutil.rmtree(contents / "1_cover_only" / "003_blackberry2_블랙베리")
+        catalog.invalidate(apple / "metadata.json")
+        catalog.invalidate(contents / "2_body_ready" / "006_grape_포도")
+        catalog.invalidate(contents / "1_cover_only" / "003_blackberry2_블랙베리")
+
+        assert catalog.find("apple").status == "approved"
+        assert catalog.find("grape").location == "2_body_ready"
+        assert catalog.find("blackberry") is None
+        assert catalog.stats["reparsed"] - reparsed == 2
+        assert catalog.stats["full_scans"] == 1
+
+    def test_snapshot_reused_on_restart(self, contents, tmp_path):
+        """새 인스턴스는 스냅샷 로드 후 mtime 확인만 (전체 스캔 없음)"""
+        _catalog(contents, tmp_path).refresh()
+
+        restarted = _catalog(contents, tmp_path)
+        assert restarted.find("pear").folder == str((contents / "005_pear_배").resolve())
+        assert restarted.stats["full_scans"] == 0
+        assert restarted.stats["reparsed"] == 0
+
+    def test_invalidate_after_move(self, contents, tmp_path):
+        """폴더 이동 직후 invalidate → 새 위치로 조회"""
+        catalog = _catalog(contents, tmp_path)
+        catalog.refresh_interval = 3600
+        src = contents / "2_body_ready" / "001_apple_사과"
+        assert catalog.entry_for(src) is not None
+
+        dest = contents / "3_approved" / src.name
+        shutil.move(str(src), str(dest))
+        assert catalog.find("apple").location == "2_body_ready"  # 갱신 간격 안 → 이전 인덱스
+
+        catalog.invalidate(src)
+        catalog.invalidate(dest)
+        assert catalog.find("apple").location == "3_approved"
+        assert catalog.entry_for(src) is None
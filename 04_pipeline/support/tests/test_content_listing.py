@@ -0,0 +1,100 @@
+"""
+Content Manager 콘텐츠 목록 캐시 단위 테스트
+
+테스트 대상:
+- history / schedule / tags JSON 은 변경 시에만 파싱 (dashboard.content_listing)
+- 바뀐 폴더만 다시 스캔, images 지연 생성
+- 페이지 나누기
+"""
+
+import json
+import os
+import pytest
+from pathlib import Path
+import sys
+
+# 05_services/dashboard 경로 추가
+ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(ROOT.parent / "05_services" / "dashboard"))
+
+
+# ==============================================================================
+# Fixtures
+# ==============================================================================
+
+@pytest.fixture
+def listing(tmp_path):
+    from content_listing import ContentListing
+
+    images_dir = tmp_path / "images"
+    for i in range(5):
+        folder = images_dir / f"{i:03d}_food{i}"
+        folder.mkdir(parents=True)
+        for slide in range(3):
+            (folder / f"food{i}_{slide:02d}.png").write_bytes(b"png")
+    (images_dir / "reference").mkdir()
+    (images_dir / "reference" / "ref.png").write_bytes(b"png")
+    (images_dir / "999_empty").mkdir()
+
+    (tmp_path / "history.json").write_text(json.dumps({"000_food0": {}}), encoding="utf-8")
+    (tmp_path / "schedule.json").write_text(json.dumps({"000_food0": {}, "001_food1": {}}), encoding="utf-8")
+    (tmp_path / "tags.json").write_text(json.dumps({"002_food2": ["pet"]}), encoding="utf-8")
+    return ContentListing(images_dir, tmp_path / "history.json", tmp_path / "schedule.json",
+                          tmp_path / "tags.json", tmp_path / "metadata.json")
+
+
+# ==============================================================================
+# Content Listing Tests
+# ==============================================================================
+
+class TestContentListing:
+    """목록 캐시 / 무효화 / 페이지 테스트"""
+
+    def test_rows_match_legacy_shape(self, listing):
+        """상태 우선순위, 태그, 썸네일, reference/빈 폴더 제외"""
+        rows = listing.rows()
+
+        assert [r["name"] for r in rows] == [f"{i:03d}_food{i}" for i in range(5)]
+        assert [r["status"] for r in rows[:3]] == ["published", "scheduled", "draft"]
+        assert rows[2]["tags"] == ["pet"] and rows[3]["tags"] == []
+        assert rows[0]["display_name"] == "FOOD0" and rows[0]["image_count"] == 3
+        assert rows[0]["thumbnail"].endswith("food0_00.png")
+        assert "images" not in dict.keys(rows[0])
+        assert rows[0]["images"] == [str(Path(rows[0]["path"]) / f"food0_{s:02d}.png") for s in range(3)]
+
+    def test_unchanged_refresh_reuses_rows(self, listing):
+        """변경 없으면 JSON 파싱 / 폴더 스캔 없이 같은 행 재사용"""
+        first = listing.rows()
+        stats = dict(listing.stats)
+
+        second = listing.rows()
+        assert second[0] is first[0]
+        assert listing.stats["json_loads"] == stats["json_loads"]
+        assert listing.stats["folder_scans"] == stats["folder_scans"]
+        assert listing.stats["rebuilds"] == 1
+
+    def test_only_changed_inputs_reloaded(self, listing, tmp_path):
+        """history 수정 → JSON 1개만, 슬라이드 추가 → 폴더 1개만 다시 읽기"""
+        listing.rows()
+        stats = dict(listing.stats)
+
+        (tmp_path / "history.json").write_text(json.dumps({"000_food0": {}, "003_food3": {}}), encoding="utf-8")
+        folder = tmp_path / "images" / "004_food4"
+        (folder / "food4_03.png").write_bytes(b"png")
+        os.utime(folder, ns=(1, 1))
+
+        rows = {r["name"]: r for r in listing.rows()}
+        assert rows["003_food3"]["status"] == "published"
+        assert rows["004_food4"]["image_count"] == 4
+        assert listing.stats["json_loads"] - stats["json_loads"] == 1
+        assert listing.stats["folder_scans"] - stats["folder_scans"] == 1
+
+    def test_paginate(self):
+        """페이지 범위 보정 / 전체 페이지 수"""
+        from content_listing import paginate
+
+        rows = list(range(100))
+        assert paginate(rows, 1, 48) == (rows[:48], 3)
+        assert paginate(rows, 3, 48) == (rows[96:], 3)
+        assert paginate(rows, 9, 48)[0] == rows[96:]
+        assert paginate([], 1, 48) == ([], 1)
@@ -0,0 +1,158 @@
+"""
+fal.ai 병렬 생성 단계 단위 테스트
+
+테스트 대상:
+- 전체 프롬프트 동시 제출 / 동시 생성 수 제한 (core.fal_generation)
+- 공유 클라이언트 다운로드 + 워커 스레드 디코드/리사이즈
+- 이미지별 소요 시간 / 실패 분류
+"""
+
+import io
+import threading
+import time
+import pytest
+from pathlib import Path
+import sys
+
+from PIL import Image
+
+# 04_pipeline 경로 추가
+ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(ROOT))
+
+
+# ==============================================================================
+# Fixtures
+# ==============================================================================
+
+def _png_bytes(size=(64, 64)) -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", size, (255, 200, 0)).save(buffer, "PNG")
+    return buffer.getvalue()
+
+
+class FakeSubscribe:
+    """fal_client.subscribe 대역 (동시 실행 수 측정)"""
+
+    def __init__(self, delay: float = 0.05):
+        self.delay = delay
+        self.calls = []
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, model, arguments):
+        with self._lock:
+            self.calls.append(arguments["prompt"])
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        if "broken" in arguments["prompt"]:
+            return {"images": []}
+        return {"images": [{"url": f"https://fal.media/{arguments['prompt']}.png"}]}
+
+
+class FakeResponse:
+    def __init__(self, content):
+        self.content = content
+
+    def raise_for_status(self):
+        pass
+
+
+class FakeClient:
+    """공유 httpx.AsyncClient 대역 (GET 횟수 기록)"""
+
+    def __init__(self):
+        self.gets = []
+        self.content = _png_bytes()
+
+    async def get(self, url):
+        self.gets.append(url)
+        return FakeResponse(self.content)
+
+
+def _jobs(tmp_path, prompts):
+    from core.fal_generation import FalImageJob
+
+    return [FalImageJob(index=i + 1, prompt=p, path=tmp_path / f"apple_{i + 1:02d}.png")
+            for i, p in enumerate(prompts)]
+
+
+# ==============================================================================
+# Generation Stage Tests
+# ==============================================================================
+
+class TestFalGenerationStage:
+    """병렬 생성 / 디코드 / 실패 처리 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_generation_with_cap(self, tmp_path):
+        """동시 제출, max_concurrency 이하, 전체 시간 ≈ 가장 느린 묶음"""
+        from core.fal_generation import FalGenerationStage
+
+        subscribe, client = FakeSubscribe(delay=0.2), FakeClient()
+        stage = FalGenerationStage(subscribe=subscribe, client=client, max_concurrency=3,
+                                   size=(64, 64), log=lambda msg: None)
+
+        started = time.monotonic()
+        results = await stage.generate(_jobs(tmp_path, [f"slide{i}" for i in range(6)]))
+        elapsed = time.monotonic() - started
+
+        assert subscribe.peak == 3
+        # 순차였다면 생성 시간 합계(약 1.2초) 이상
+        assert elapsed < sum(r.latency["generate"] for r in results) * 0.75
+        assert [r.index for r in results] == [1, 2, 3, 4, 5, 6]
+        assert len(client.gets) == 6
+
+    @pytest.mark.asyncio
+    async def test_decode_resizes_and_reports_latency(self, tmp_path):
+        """저장 이미지는 1080x1080, 결과 dict 에 단계별 latency"""
+        from core.fal_generation import FalGenerationStage
+
+        stage = FalGenerationStage(subscribe=FakeSubscribe(delay=0), client=FakeClient(),
+                                   log=lambda msg: None)
+        async with stage:
+            (result,) = await stage.generate(_jobs(tmp_path, ["cover"]))
+
+        with Image.open(result.path) as img:
+            assert img.size == (1080, 1080)
+        info = result.to_dict()
+        assert info["exists"] and info["provider"] == "fal-flux-2-pro"
+        assert set(info["latency"]) == {"generate", "download", "encode", "total"}
+        assert not list(tmp_path.glob("*.tmp"))
+
+    @pytest.mark.asyncio
+    async def test_failures_are_per_image(self, tmp_path):
+        """한 장 실패는 해당 결과만 error, 나머지는 정상"""
+        from core.fal_generation import FalGenerationStage
+
+        client = FakeClient()
+        stage = FalGenerationStage(subscribe=FakeSubscribe(delay=0), client=client, log=lambda msg: None)
+        results = await stage.generate(_jobs(tmp_path, ["ok", "broken", "ok2"]))
+
+        assert [r.ok for r in results] == [True, False, True]
+        assert results[1].error_type == "indexerror"
+        assert results[1].to_dict()["exists"] is False
+        assert len(client.gets) == 2
+
+    @pytest.mark.asyncio
+    async def test_cache_reuses_unchanged_prompts(self, tmp_path):
+        """재실행 시 프롬프트가 바뀐 슬라이드만 fal 호출, seed 는 프롬프트 기반"""
+        from core.fal_generation import FalGenerationStage
+        from core.generation_cache import GenerationCache, deterministic_seed
+
+        cache = GenerationCache(tmp_path / "cache", ttl_seconds=None, max_bytes=0)
+        subscribe = FakeSubscribe(delay=0)
+        stage = FalGenerationStage(subscribe=subscribe, client=FakeClient(), cache=cache,
+                                   log=lambda msg: None)
+
+        first = await stage.generate(_jobs(tmp_path, ["cover", "body", "cta"]))
+        second = await stage.generate(_jobs(tmp_path, ["cover", "body v2", "cta"]))
+
+        assert subscribe.calls == ["cover", "body", "cta", "body v2"]
+        assert [r.cached for r in first] == [False, False, False]
+        assert [r.cached for r in second] == [True, False, True]
+        assert second[0].path.exists() and second[0].seed == deterministic_seed("cover")
@@ -0,0 +1,133 @@
+"""
+FoodDataStore 단위 테스트
+
+테스트 대상:
+- 번호/영문명/한글명/안전도 인덱스 (food_data_store)
+- mtime 검증 캐시 / pickle 스냅샷
+"""
+
+import json
+import os
+import pytest
+from pathlib import Path
+import sys
+
+# 04_pipeline 경로 추가
+ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(ROOT))
+
+
+# ==============================================================================
+# Fixtures
+# ==============================================================================
+
+SAMPLE_FOODS = {
+    "5": {"name": "고구마", "english_name": "sweet_potato", "safety": "SAFE"},
+    "44": {"name": "아몬드", "english_name": "Almonds", "safety": "FORBIDDEN"},
+    "140": {"name": "새우", "english_name": "shrimp", "safety": "CAUTION"},
+}
+
+
+@pytest.fixture
+def food_file(tmp_path):
+    """테스트용 food_data.json"""
+    path = tmp_path / "food_data.json"
+    path.write_text(json.dumps(SAMPLE_FOODS, ensure_ascii=False), encoding="utf-8")
+    return path
+
+
+# ==============================================================================
+# Lookup Tests
+# ==============================================================================
+
+class TestLookup:
+    """인덱스 조회 테스트"""
+
+    def test_lookup_by_id_english_korean(self, food_file):
+        """번호 (0 패딩 허용) / 영문명 (구분자 무시) / 한글명"""
+        from food_data_store import FoodDataStore
+
+        store = FoodDataStore(food_file)
+
+        assert store.get("044")["name"] == "아몬드"
+        assert store.by_english("Sweet Potato")["name"] == "고구마"
+        assert store.by_korean("새 우")["english_name"] == "shrimp"
+        assert store.find("almonds") is store.get(44)
+        assert store.find("없는음식") is None
+
+    def test_safety_index_and_folder_resolution(self, food_file):
+        """안전도별 목록 / 콘텐츠 폴더명 해석"""
+        from food_data_store import FoodDataStore
+
+        store = FoodDataStore(food_file)
+
+        assert store.ids_by_safety("forbidden") == ["44"]
+        assert store.safety_of("고구마") == "SAFE"
+        assert store.resolve_folder("044_Almonds") == "44"
+        assert store.resolve_folder("140_shrimp_새우") == "140"
+        assert store.resolve_folder("sweet_potato_final") == "5"
+
+    def test_missing_file_is_empty(self, tmp_path):
+        """파일 없으면 빈 데이터"""
+        from food_data_store import FoodDataStore
+
+        store = FoodDataStore(tmp_path / "none.json")
+
+        assert not store.exists()
+        assert store.data == {}
+        assert store.get(1) is None
+
+
+# ==============================================================================
+# Cache Tests
+# ==============================================================================
+
+class TestCache:
+    """mtime 검증 캐시 / 스냅샷 테스트"""
+
+    def test_reloads_only_when_file_changes(self, food_file):
+        """동일 파일은 1회 로드, 변경 시 재로드"""
+        from food_data_store import FoodDataStore
+
+        store = FoodDataStore(food_file)
+        store.get(5)
+        store.find("shrimp")
+        assert store.loads == 1
+
+        updated = dict(SAMPLE_FOODS, **{"200": {"name": "오리", "english_name": "duck", "safety": "SAFE"}})
+        food_file.write_text(json.dumps(updated, ensure_ascii=False), encoding="utf-8")
+        os.utime(food_file, ns=(1, 1))
+
+        assert store.by_english("duck")["name"] == "오리"
+        assert store.loads == 2
+
+    def test_snapshot_round_trip(self, food_file, tmp_path, monkeypatch):
+        """스냅샷: 원본 미변경 시 재사용, 스키마/서명 검증"""
+        import food_data_store as fds
+
+        monkeypatch.setattr(fds, "SNAPSHOT_DIR", tmp_path / "snap")
+
+        first = fds.FoodDataStore(food_file, snapshot=True)
+        assert len(first) == 3
+        assert list((tmp_path / "snap").glob("*.pkl"))
+
+        monkeypatch.setattr(fds.json, "load", lambda f: pytest.fail("snapshot not used"))
+        second = fds.FoodDataStore(food_file, snapshot=True)
+
+        assert second.data == SAMPLE_FOODS
+        assert second.id_by_korean("아몬드") == "44"
+
+    def test_shared_instance_per_path(self, food_file):
+        """get_food_store: 경로별 공용 인스턴스"""
+        from food_data_store import get_food_store, load_food_data
+
+        assert get_food_store(food_file) is get_food_store(food_file)
+        assert load_food_data(food_file) is get_food_store(food_file).data
+
+    def test_require_raises_when_missing(self, tmp_path, food_file):
+        """require: 기존 open() 로더처럼 파일 없으면 FileNotFoundError"""
+        from food_data_store import FoodDataStore
+
+        assert FoodDataStore(food_file).require() == SAMPLE_FOODS
+        with pytest.raises(FileNotFoundError):
+            FoodDataStore(tmp_path / "missing.json").require()
@@ -0,0 +1,160 @@
+"""
+이미지 생성 캐시 단위 테스트
+
+테스트 대상:
+- (provider, model, 정규화 프롬프트, 크기, seed) 키 / 결정적 seed (core.generation_cache)
+- fetch_or_generate 적중/미스
+- TTL 만료 / 용량 초과 정리
+"""
+
+import time
+import pytest
+from pathlib import Path
+import sys
+
+# 04_pipeline 경로 추가
+ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(ROOT))
+
+
+# ==============================================================================
+# Fixtures
+# ==============================================================================
+
+@pytest.fixture
+def cache(tmp_path):
+    from core.generation_cache import GenerationCache
+
+    return GenerationCache(tmp_path / "cache", ttl_seconds=3600, max_bytes=10_000)
+
+
+class CountingGenerator:
+    """generate(seed) 대역 (호출 seed 기록, 파일 생성)"""
+
+    def __init__(self, folder: Path, size: int = 100):
+        self.folder = folder
+        self.size = size
+        self.seeds = []
+
+    def __call__(self, seed):
+        self.seeds.append(seed)
+        path = self.folder / f"gen_{len(self.seeds)}.png"
+        path.write_bytes(bytes([len(self.seeds)]) * self.size)
+        return str(path)
+
+
+# ==============================================================================
+# Key / Seed Tests
+# ==============================================================================
+
+class TestCacheKey:
+    """키 정규화 / 결정적 seed 테스트"""
+
+    def test_key_normalizes_whitespace_only(self):
+        """공백 차이는 같은 키, provider/모델/크기/seed 차이는 다른 키"""
+        from core.generation_cache import cache_key
+
+        base = cache_key("fal", "flux", "golden  retriever\n eating apple ", (1080, 1080), 7)
+        assert base == cache_key("fal", "flux", "golden retriever eating apple", "1080x1080", 7)
+        others = {
+            cache_key("replicate", "flux", "golden retriever eating apple", (1080, 1080), 7),
+            cache_key("fal", "flux-2", "golden retriever eating apple", (1080, 1080), 7),
+            cache_key("fal", "flux", "golden retriever eating pear", (1080, 1080), 7),
+            cache_key("fal", "flux", "golden retriever eating apple", "16:9", 7),
+            cache_key("fal", "flux", "golden retriever eating apple", (1080, 1080), 8),
+        }
+        assert base not in others and len(others) == 5
+
+    def test_deterministic_seed(self):
+        """같은 프롬프트는 같은 seed, offset 은 다른 seed"""
+        from core.generation_cache import deterministic_seed
+
+        assert deterministic_seed("apple  dog") == deterministic_seed("apple dog")
+        assert deterministic_seed("apple dog", 1) != deterministic_seed("apple dog")
+        assert 0 <= deterministic_seed("pear") < 2 ** 31
+
+
+# ==============================================================================
+# Store / Eviction Tests
+# ==============================================================================
+
+class TestGenerationCache:
+    """적중 / 만료 / 용량 정리 테스트"""
+
+    def test_fetch_or_generate_hits_after_first_call(self, cache, tmp_path):
+        """첫 호출만 생성, 이후 destination 으로 복사"""
+        generator = CountingGenerator(tmp_path)
+
+        first, hit1 = cache.fetch_or_generate("fal", "flux", "apple", (1080, 1080), generator)
+        dest = tmp_path / "out" / "apple_01.png"
+        second, hit2 = cache.fetch_or_generate("fal", "flux", " apple ", (1080, 1080), generator,
+                                               destination=dest)
+
+        assert (hit1, hit2) == (False, True)
+        assert len(generator.seeds) == 1
+        assert Path(second) == dest and dest.read_bytes() == Path(first).read_bytes()
+        assert cache.stats["hits"] == 1
+
+    def test_failed_generation_not_cached(self, cache):
+        """generate 가 None 이면 저장하지 않음"""
+        calls = []
+        for _ in range(2):
+            result, hit = cache.fetch_or_generate("fal", "flux", "pear", "16:9",
+                                                  lambda seed: calls.append(seed))
+            assert (result, hit) == (None, False)
+        assert len(calls) == 2
+
+    def test_ttl_expiry(self, tmp_path):
+        """ttl 지난 항목은 미스 + evict 로 삭제"""
+        from core.generation_cache import GenerationCache, cache_key
+
+        cache = GenerationCache(tmp_path / "cache", ttl_seconds=60, max_bytes=0)
+        generator = CountingGenerator(tmp_path)
+        cache.fetch_or_generate("fal", "flux", "apple", "1x1", generator, seed=1)
+
+        key = cache_key("fal", "flux", "apple", "1x1", 1)
+        meta = cache._read_meta(key)
+        meta["created_at"] = time.time() - 120
+        cache._write_meta(key, meta)
+
+        assert cache.get(key) is None
+        assert cache.evict() == 1
+        assert not list((tmp_path / "cache").glob("*/*"))
+
+    def test_size_limit_evicts_least_recently_used(self, cache, tmp_path):
+        """용량 초과 시 last_used 오래된 항목부터 삭제"""
+        from core.generation_cache import cache_key
+
+        generator = CountingGenerator(tmp_path, size=4_000)
+        for prompt in ("a", "b"):
+            cache.fetch_or_generate("fal", "flux", prompt, "1x1", generator, seed=0)
+            time.sleep(0.01)
+        cache.get(cache_key("fal", "flux", "a", "1x1", 0))  # a 를 최근 사용으로
+        cache.fetch_or_generate("fal", "flux", "c", "1x1", generator, seed=0)
+
+        assert cache.get(cache_key("fal", "flux", "b", "1x1", 0)) is None
+        assert cache.get(cache_key("fal", "flux", "a", "1x1", 0)) is not None
+        assert cache.get(cache_key("fal", "flux", "c", "1x1", 0)) is not None
+        assert cache.stats["evicted"] == 1
+
+    def test_put_skips_rescan_under_budget(self, cache, tmp_path, monkeypatch):
+        """용량 이하면 put 마다 메타 전체 재스캔 없음 (크기 증분 추적)"""
+        generator = CountingGenerator(tmp_path)
+        cache.fetch_or_generate("fal", "flux", "a", "1x1", generator, seed=0)
+
+        scans = []
+        original = cache._entries
+        monkeypatch.setattr(cache, "_entries", lambda: scans.append(1) or original())
+        for prompt in ("b", "c", "d"):
+            cache.fetch_or_generate("fal", "flux", prompt, "1x1", generator, seed=0)
+        cache.fetch_or_generate("fal", "flux", "d", "1x1", generator, seed=1)
+
+        assert scans == []
+        assert cache._total_bytes == 500
+
+    def test_env_disables_default_cache(self, monkeypatch):
+        """GENERATION_CACHE=off 면 공용 캐시 없음"""
+        from core import generation_cache
+
+        monkeypatch.setenv("GENERATION_CACHE", "off")
+        assert generation_cache.get_generation_cache() is None
@@ -0,0 +1,129 @@
+"""
+HealthChecker 동시 실행 / 캐시 단위 테스트
+
+테스트 대상:
+- 체크 동시 실행 (core.utils.health_check)
+- 체크별 타임아웃, TTL 캐시 / force
+- 백그라운드 갱신 스냅샷
+"""
+
+import asyncio
+import time
+from datetime import datetime
+from pathlib import Path
+import sys
+
+# 04_pipeline 경로 추가
+ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(ROOT))
+
+
+# ==============================================================================
+# Fixtures
+# ==============================================================================
+
+def _checker(checks, policy=None):
+    from core.utils.health_check import HealthChecker
+
+    checker = HealthChecker(policy=policy)
+    checker.checks = checks
+    return checker
+
+
+def _probe(name, delay=0.0, calls=None):
+    """delay 초 걸리는 (블로킹) 체크 함수"""
+    from core.utils.health_check import ComponentHealth, HealthStatus
+
+    def check():
+        if calls is not None:
+            calls.append(name)
+        time.sleep(delay)
+        return ComponentHealth(name=name, status=HealthStatus.HEALTHY, message="ok",
+                               last_check=datetime.now().isoformat())
+    return check
+
+
+# ==============================================================================
+# Health Checker Tests
+# ==============================================================================
+
+class TestHealthChecker:
+    """동시 실행 / 타임아웃 / 캐시 / 스냅샷 테스트"""
+
+    def test_checks_run_concurrently(self):
+        """0.2초 체크 4개 → 합계가 아니라 가장 느린 체크 시간"""
+        from core.utils.health_check import HealthStatus
+
+        checker = _checker({f"c{i}": _probe(f"c{i}", 0.2) for i in range(4)})
+
+        started = time.monotonic()
+        health = asyncio.run(checker.run_all_checks())
+
+        assert time.monotonic() - started < 0.6
+        assert health.overall_status == HealthStatus.HEALTHY
+        assert list(health.components) == ["c0", "c1", "c2", "c3"]
+
+    def test_slow_check_times_out_alone(self):
+        """타임아웃 넘긴 체크만 UNHEALTHY, 나머지는 정상"""
+        from core.utils.health_check import HealthStatus
+
+        checker = _checker({"fast": _probe("fast"), "slow": _probe("slow", 1.0)},
+                           policy={"slow": (0.1, 60.0)})
+
+        async def timed():
+            started = time.monotonic()
+            health = await checker.run_all_checks()
+            return health, time.monotonic() - started
+
+        # 타임아웃된 스레드는 asyncio.run 종료 시 기다리므로 루프 안에서 측정
+        health, elapsed = asyncio.run(timed())
+
+        assert elapsed < 0.8
+        assert health.components["fast"].status == HealthStatus.HEALTHY
+        assert health.components["slow"].status == HealthStatus.UNHEALTHY
+        assert "timed out" in health.components["slow"].message
+        assert health.overall_status == HealthStatus.UNHEALTHY
+
+    def test_results_cached_per_check_ttl(self):
+        """TTL 안에서는 재실행 안 함, TTL 0 체크와 force 는 다시 실행"""
+        calls = []
+        checker = _checker({"cached": _probe("cached", calls=calls), "live": _probe("live", calls=calls)},
+                           policy={"cached": (1.0, 60.0), "live": (1.0, 0.0)})
+
+        async def scenario():
+            await checker.run_all_checks()
+            await checker.run_all_checks()
+            await checker.run_all_checks(force=True)
+
+        asyncio.run(scenario())
+        assert sorted(calls) == ["cached", "cached", "live", "live", "live"]
+
+    def test_background_refresh_keeps_snapshot(self):
+        """백그라운드 갱신 → snapshot() 즉시 반환, 중지 후 get_health_status 는 체크 재실행"""
+        from core.utils import health_check
+
+        calls = []
+        checker = _checker({"c": _probe("c", calls=calls)}, policy={"c": (1.0, 0.0)})
+
+        async def scenario():
+            assert checker.snapshot() is None
+            checker.start_background_refresh(interval=0.05)
+            await asyncio.sleep(0.2)
+            snapshot = checker.snapshot()
+            assert snapshot is not None and checker.refreshing
+            await checker.stop_background_refresh()
+            assert not checker.refreshing
+            return snapshot
+
+        snapshot = asyncio.run(scenario())
+        assert snapshot.components["c"].message == "ok"
+        assert len(calls) >= 2
+
+        original = health_check._default_checker
+        health_check._default_checker = checker
+        try:
+            status = asyncio.run(health_check.get_health_status())
+        finally:
+            health_check._default_checker = original
+        assert status["overall_status"] == "healthy"
+        assert status["components"]["c"]["status"] == "healthy"
@@ -0,0 +1,120 @@
+"""
+이미지 분석 모듈 단위 테스트
+
+테스트 대상:
+- 픽셀 차이율 / 윈도우 SSIM (image_analysis, cover_inspector)
+- 영역 색상 카운트 (VisualGuard 텍스트 색상 검사)
+"""
+
+import pytest
+from pathlib import Path
+import sys
+
+from PIL import Image, ImageDraw
+
+# 04_pipeline 경로 추가
+ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(ROOT))
+
+
+# ==============================================================================
+# Fixtures
+# ==============================================================================
+
+@pytest.fixture
+def noise_image():
+    """텍스처가 있는 테스트 이미지 (SSIM 분산 확보)"""
+    return Image.effect_noise((120, 90), 40).convert("RGB")
+
+
+@pytest.fixture
+def content_image():
+    """하단에 안전도 색상 텍스트 블록이 있는 본문 이미지"""
+    img = Image.new("RGB", (300, 400), (30, 30, 30))
+    draw = ImageDraw.Draw(img)
+    draw.rectangle((20, 300, 200, 360), fill=(255, 217, 61))  # 노랑 #FFD93D
+    draw.rectangle((20, 370, 80, 390), fill=(255, 255, 255))
+    draw.rectangle((0, 0, 300, 40), fill=(255, 255, 255))
+    return img
+
+
+# ==============================================================================
+# Comparison Tests
+# ==============================================================================
+
+class TestComparison:
+    """픽셀 차이율 / SSIM 테스트"""
+
+    def test_pixel_diff_rate_counts_changed_pixels(self, noise_image):
+        """임계값 초과 채널이 있는 픽셀만 차이로 집계"""
+        import image_analysis as ia
+
+        changed = noise_image.copy()
+        ImageDraw.Draw(changed).rectangle((0, 0, 9, 8), fill=(255, 0, 255))
+        faint = noise_image.point(lambda v: min(255, v + 5))
+
+        expected = sum(
+            1 for a, b in zip(noise_image.getdata(), changed.getdata())
+            if any(abs(x - y) > 10 for x, y in zip(a, b))
+        ) / (120 * 90) * 100
+
+        assert ia.pixel_diff_rate(noise_image, changed) == pytest.approx(expected)
+        assert ia.pixel_diff_rate(noise_image, faint) == 0.0
+
+    def test_ssim_identity_and_degradation(self, noise_image):
+        """동일 이미지 1.0, 손상 정도에 따라 단조 감소"""
+        import cover_inspector as ci
+
+        small = noise_image.copy()
+        ImageDraw.Draw(small).rectangle((10, 10, 20, 20), fill="black")
+        large = noise_image.copy()
+        ImageDraw.Draw(large).rectangle((10, 10, 80, 70), fill="black")
+
+        assert ci.calculate_ssim(noise_image, noise_image) == 1.0
+        assert 1.0 > ci.calculate_ssim(noise_image, small) > ci.calculate_ssim(noise_image, large)
+
+    def test_ssim_resizes_second_image(self, noise_image):
+        """크기가 다르면 두 번째 이미지를 첫 번째 크기로 맞춤"""
+        import image_analysis as ia
+
+        resized = noise_image.resize((240, 180))
+        score = ia.ssim(noise_image, resized)
+
+        assert 0.0 < score <= 1.0
+
+
+# ==============================================================================
+# Color Region Tests
+# ==============================================================================
+
+class TestColorRegions:
+    """영역 색상 마스크 테스트"""
+
+    def test_counts_are_exclusive_in_order(self):
+        """먼저 걸린 범위에만 집계 (if/elif 판정과 동일)"""
+        import numpy as np
+        import image_analysis as ia
+
+        pixels = np.array([[[250, 250, 250], [250, 250, 60]]], dtype=np.uint8)
+        ranges = {
+            "bright": ((200, 255), (200, 255), (0, 255)),
+            "white": ((241, 255), (241, 255), (241, 255)),
+        }
+
+        assert ia.color_counts(pixels, ranges) == {"bright": 2, "white": 0}
+        assert ia.color_counts(pixels, ranges, exclusive=False) == {"bright": 2, "white": 1}
+
+    def test_safety_color_detection(self, content_image):
+        """VisualGuard: 하단 영역 노랑 텍스트 -> caution"""
+        from core.agents.visual_guard import VisualGuard
+        from image_analysis import ImageData
+
+        guard = VisualGuard()
+        data = ImageData(content_image)
+
+        ok, detected, details = guard._check_text_color_by_safety(data, "caution")
+
+        assert ok and detected == "caution"
+        assert details["color_counts"]["caution"] > details["color_counts"]["white"]
+        assert guard._check_text_is_white(data)
+        assert not guard._check_text_color_by_safety(content_image, "safe")[0]
@@ -0,0 +1,128 @@
+"""
+지각 해시 인덱스 단위 테스트
+
+테스트 대상:
+- pHash/dHash (image_hash_index)
+- BK-tree 반경 질의
+- 영속 인덱스 증분 갱신 / 유사 그룹
+"""
+
+import os
+import random
+import pytest
+from pathlib import Path
+import sys
+
+from PIL import Image, ImageDraw
+
+# 04_pipeline 경로 추가
+ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(ROOT))
+
+
+# ==============================================================================
+# Fixtures
+# ==============================================================================
+
+def _scene(seed: int) -> Image.Image:
+    """시드별로 다른 도형 배치 이미지"""
+    rng = random.Random(seed)
+    img = Image.new("RGB", (256, 256), tuple(rng.randrange(256) for _ in range(3)))
+    draw = ImageDraw.Draw(img)
+    for _ in range(12):
+        x, y = rng.randrange(200), rng.randrange(200)
+        draw.ellipse((x, y, x + rng.randrange(20, 120), y + rng.randrange(20, 120)),
+                     fill=tuple(rng.randrange(256) for _ in range(3)))
+    return img
+
+
+@pytest.fixture
+def library(tmp_path):
+    """원본 3장 + 리사이즈 사본 1장"""
+    folder = tmp_path / "photos"
+    folder.mkdir()
+    for seed in range(3):
+        _scene(seed).save(folder / f"photo_{seed}.png")
+    _scene(0).resize((180, 180)).save(folder / "photo_0_small.jpg", quality=85)
+    return folder
+
+
+# ==============================================================================
+# Hash Tests
+# ==============================================================================
+
+class TestPerceptualHash:
+    """지각 해시 테스트"""
+
+    def test_resize_and_recompress_stay_close(self):
+        """리사이즈/JPEG 재압축 사본은 가깝고, 다른 이미지는 멀다"""
+        import image_hash_index as hi
+
+        original = _scene(1)
+        copy = original.resize((120, 120))
+
+        for func in (hi.phash, hi.dhash):
+            assert hi.hamming(func(original), func(copy)) <= hi.NEAR_DUPLICATE_RADIUS
+            assert hi.hamming(func(original), func(_scene(2))) > hi.NEAR_DUPLICATE_RADIUS
+
+    def test_bk_tree_matches_linear_scan(self):
+        """BK-tree 반경 질의 = 전체 비교 결과"""
+        import image_hash_index as hi
+
+        rng = random.Random(7)
+        keys = [rng.getrandbits(64) for _ in range(300)]
+        tree = hi.BKTree()
+        for i, key in enumerate(keys):
+            tree.add(key, i)
+
+        probe = keys[10] ^ 0b1011
+        expected = sorted((hi.hamming(probe, k), i) for i, k in enumerate(keys) if hi.hamming(probe, k) <= 20)
+
+        assert len(tree) == 300
+        assert sorted(tree.query(probe, 20)) == expected
+
+
+# ==============================================================================
+# Index Tests
+# ==============================================================================
+
+class TestImageHashIndex:
+    """영속 인덱스 테스트"""
+
+    def test_incremental_update(self, library, tmp_path):
+        """mtime/크기 변경 파일만 재해시, 삭제 파일 제거, 재로드 시 유지"""
+        import image_hash_index as hi
+
+        index_path = tmp_path / "index" / "photos.json"
+        index = hi.ImageHashIndex(index_path, [library])
+
+        assert index.update()["added"] == 4
+        assert index.update()["unchanged"] == 4
+
+        _scene(9).save(library / "photo_2.png")
+        os.utime(library / "photo_2.png", ns=(1, 1))
+        (library / "photo_1.png").unlink()
+        stats = index.update()
+
+        assert (stats["updated"], stats["removed"], stats["unchanged"]) == (1, 1, 2)
+        assert len(hi.ImageHashIndex(index_path, [library])) == 3
+
+    def test_query_and_groups(self, library, tmp_path):
+        """유사 사본 질의 / 그룹 검출"""
+        import image_hash_index as hi
+
+        index = hi.ImageHashIndex(tmp_path / "photos.json", [library])
+        index.update()
+
+        matches = index.query(_scene(0).resize((300, 300)))
+        groups = index.duplicate_groups()
+
+        assert {Path(p).name for _, p in matches} == {"photo_0.png", "photo_0_small.jpg"}
+        assert [[Path(p).name for p in g] for g in groups] == [["photo_0.png", "photo_0_small.jpg"]]
+
+    def test_unknown_kind_rejected(self, tmp_path):
+        """지원하지 않는 해시 종류는 ValueError"""
+        import image_hash_index as hi
+
+        with pytest.raises(ValueError):
+            hi.ImageHashIndex(tmp_path / "x.json", kind="ahash")
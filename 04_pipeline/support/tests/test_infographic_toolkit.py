@@ -0,0 +1,98 @@
+"""
+인포그래픽 공용 그리기 도구 단위 테스트
+
+테스트 대상:
+- 그라데이션: 기존 행별 루프와 픽셀 동일 + (크기, 색상, 방향)별 캐시 (infographic_toolkit)
+- 폰트 핸들 캐시 / 로드 실패 fallback
+- 사전 렌더 배지 스탬프 = 직접 그리기 결과
+"""
+
+import glob
+import pytest
+from pathlib import Path
+import sys
+
+from PIL import Image, ImageChops, ImageDraw, ImageFont
+
+# 04_pipeline 경로 추가
+ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(ROOT))
+
+
+# ==============================================================================
+# Fixtures
+# ==============================================================================
+
+@pytest.fixture
+def font():
+    from infographic_toolkit import load_font
+
+    candidates = glob.glob("/usr/share/fonts/**/*.ttf", recursive=True)
+    if candidates:
+        return load_font(candidates[0], 22)
+    return ImageFont.load_default()
+
+
+def _legacy_gradient(img, height, start, end):
+    """기존 putpixel 방식"""
+    for y in range(height):
+        ratio = y / height
+        color = tuple(int(start[c] + (end[c] - start[c]) * ratio) for c in range(3))
+        for x in range(img.width):
+            img.putpixel((x, y), color)
+
+
+# ==============================================================================
+# Infographic Toolkit Tests
+# ==============================================================================
+
+class TestInfographicToolkit:
+    """그라데이션 / 폰트 / 컴포넌트 테스트"""
+
+    def test_gradient_matches_legacy_and_is_cached(self):
+        """putpixel 결과와 동일, 같은 키는 같은 이미지 재사용"""
+        from infographic_toolkit import gradient, paste_gradient
+
+        start, end = (235, 150, 130), (240, 180, 160)
+        legacy = Image.new("RGB", (200, 200), "#FFF8E7")
+        _legacy_gradient(legacy, 130, start, end)
+
+        img = Image.new("RGB", (200, 200), "#FFF8E7")
+        paste_gradient(img, (0, 0, 200, 130), start, end)
+
+        assert ImageChops.difference(legacy, img).getbbox() is None
+        assert gradient((200, 130), start, end) is gradient((200, 130), list(start), list(end))
+        horizontal = gradient((10, 2), "#000000", "#0A0A0A", "horizontal")
+        assert [horizontal.getpixel((x, 1))[0] for x in range(10)] == list(range(10))
+
+    def test_font_handles_cached_with_fallback(self, tmp_path):
+        """같은 (경로, 크기, index) 는 같은 핸들, 없는 파일은 기본 폰트 / None"""
+        from infographic_toolkit import load_font
+
+        missing = tmp_path / "missing.ttc"
+        assert load_font(missing, 20, fallback=False) is None
+        assert load_font(missing, 20) is load_font(missing, 30)
+
+        candidates = glob.glob("/usr/share/fonts/**/*.ttf", recursive=True)
+        if candidates:
+            assert load_font(candidates[0], 20) is load_font(Path(candidates[0]), 20)
+
+    def test_badge_stamps_match_direct_drawing(self, font):
+        """원형 / 둥근 배지 스탬프 붙이기 = 직접 그리기 (픽셀 동일)"""
+        from infographic_toolkit import circle_badge, paste_component, rounded_badge
+
+        direct = Image.new("RGB", (300, 300), "#FFF8E7")
+        draw = ImageDraw.Draw(direct)
+        draw.ellipse([75, 75, 125, 125], fill="#4CAF50")
+        draw.text((92, 85), "3", fill="#FFFFFF", font=font)
+        draw.rounded_rectangle([150, 200, 270, 232], radius=16, fill="#8BC34A")
+        draw.text((160, 205), "STEP 1", fill="#FFFFFF", font=font)
+
+        stamped = Image.new("RGB", (300, 300), "#FFF8E7")
+        paste_component(stamped, circle_badge(25, "#4CAF50", "3", font, "#FFFFFF", (-8, -15)), (100, 100))
+        paste_component(stamped, rounded_badge((120, 32), 16, "#8BC34A", "STEP 1", font, "#FFFFFF", (10, 5)),
+                        (150, 200))
+
+        assert ImageChops.difference(direct, stamped).getbbox() is None
+        assert circle_badge(25, "#4CAF50", "3", font, "#FFFFFF", (-8, -15))[0] is \
+            circle_badge(25, "#4CAF50", "3", font, "#FFFFFF", (-8, -15))[0]
@@ -0,0 +1,193 @@
+"""
+Instagram 인사이트 수집기 단위 테스트
+
+테스트 대상:
+- Graph API batch 묶음 (최대 50개) / 동시 전송 (core.insights_collector)
+- 게시 경과 시간별 필드 그룹 증분 갱신
+- 실패 요청은 이전 값 유지, 계정 인사이트 batch 1회 + 캐시
+- 기존 insights_cache.json 가져오기
+"""
+
+import json
+import threading
+import time
+import pytest
+from datetime import datetime, timedelta
+from pathlib import Path
+import sys
+
+# 04_pipeline 경로 추가
+ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(ROOT))
+
+
+# ==============================================================================
+# Fixtures
+# ==============================================================================
+
+class FakeGraph:
+    """Graph API batch 엔드포인트 대역 (relative_url 기록, 동시 batch 수 측정)"""
+
+    def __init__(self, delay: float = 0.0, fail=(), timestamps=None):
+        self.delay = delay
+        self.fail = set(fail)
+        self.timestamps = timestamps or {}
+        self.urls = []
+        self.batches = 0
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def _respond(self, url):
+        path, _, query = url.partition("?")
+        parts = path.split("/")
+        if any(f in url for f in self.fail):
+            return {"code": 400, "body": json.dumps({"error": {"message": "bad"}})}
+        if parts[-1] == "insights":
+            if "total_value" in query:
+                data = [{"name": n, "total_value": {"value": 7}}
+                        for n in ("profile_views", "accounts_engaged", "total_interactions")]
+            elif "period" in query:
+                data = [{"name": "reach", "values": [{"value": 1}, {"value": 500}]}]
+            else:
+                data = [{"name": "reach", "values": [{"value": 200}]},
+                        {"name": "saved", "values": [{"value": 10}]},
+                        {"name": "shares", "values": [{"value": 5}]}]
+            return {"code": 200, "body": json.dumps({"data": data})}
+        if "followers_count" in query:
+            return {"code": 200, "body": json.dumps({"username": "sunshine", "followers_count": 1200})}
+        body = {"like_count": 30, "comments_count": 5}
+        if "permalink" in query:
+            body.update(timestamp=self.timestamps.get(parts[-1], "2026-01-10T09:00:00+0000"),
+                        permalink=f"https://ig/{parts[-1]}",
+                        media_type="CAROUSEL_ALBUM")
+        return {"code": 200, "body": json.dumps(body)}
+
+    def __call__(self, data):
+        batch = json.loads(data["batch"])
+        assert len(batch) <= 50 and data["access_token"] == "token"
+        with self._lock:
+            self.batches += 1
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            self.urls.extend(item["relative_url"] for item in batch)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        return [self._respond(item["relative_url"]) for item in batch]
+
+
+@pytest.fixture
+def db(tmp_path):
+    from core.state_db import StateDB
+
+    db = StateDB(tmp_path / "state.db")
+    yield db
+    db.close()
+
+
+def _collector(db, graph, **kwargs):
+    from core.insights_collector import InsightsCollector
+
+    return InsightsCollector(access_token="token", user_id="42", db=db, post=graph,
+                             log=lambda msg: None, **kwargs)
+
+
+def _age_fetched(db, post_id, hours):
+    """수집 시각을 과거로 돌리기"""
+    past = (datetime.now() - timedelta(hours=hours)).isoformat()
+    db.execute("UPDATE instagram_insights SET fetched = ? WHERE post_id = ?",
+               (json.dumps({"meta": past, "counts": past, "insights": past}), post_id))
+
+
+# ==============================================================================
+# Insights Collector Tests
+# ==============================================================================
+
+class TestInsightsCollector:
+    """batch / 증분 갱신 / 실패 / 계정 테스트"""
+
+    def test_full_refresh_is_batched_and_concurrent(self, db):
+        """게시물 120개 = 요청 240건 → batch 5회 동시 전송, 결과는 입력 순서"""
+        graph = FakeGraph(delay=0.05)
+        collector = _collector(db, graph, max_workers=4)
+
+        result = collector.refresh_posts([f"p{i}" for i in range(120)])
+
+        assert (result["requests"], result["batches"], result["updated"]) == (240, 5, 120)
+        assert graph.peak > 1
+        first = result["posts"][0]
+        assert first["post_id"] == "p0" and first["permalink"] == "https://ig/p0"
+        assert (first["likes"], first["reach"], first["engagement"]) == (30, 200, 50)
+        assert first["engagement_rate"] == 25.0 and first["impressions"] == 200
+        assert [p["post_id"] for p in collector.cached(["p5", "p1"])] == ["p5", "p1"]
+
+    def test_incremental_refresh_by_post_age(self, db):
+        """새 게시물은 자주, 오래된 게시물은 드물게, meta 는 재수집 안 함"""
+        graph = FakeGraph(timestamps={"new": datetime.now().isoformat(),
+                                      "old": (datetime.now() - timedelta(days=60)).isoformat()})
+        collector = _collector(db, graph)
+        collector.refresh_posts(["new", "old"])
+
+        graph.urls.clear()
+        assert collector.refresh_posts(["new", "old"])["requests"] == 0
+
+        _age_fetched(db, "new", hours=2)   # counts(15분) / insights(1시간) 만료
+        _age_fetched(db, "old", hours=2)   # counts(24시간) / insights(7일) 유효
+        result = collector.refresh_posts(["new", "old"])
+
+        assert sorted(graph.urls) == ["v21.0/new/insights?metric=reach,saved,shares",
+                                      "v21.0/new?fields=like_count,comments_count"]
+        assert (result["updated"], result["skipped"]) == (1, 1)
+
+    def test_failed_requests_keep_previous_values(self, db):
+        """insights 요청 실패 → 이전 값 유지 + errors, batch 전체 예외도 격리"""
+        collector = _collector(db, FakeGraph())
+        collector.refresh_posts(["p1"])
+
+        failing = FakeGraph(fail={"/insights"})
+        result = _collector(db, failing).refresh_posts(["p1"], force=True)
+        assert result["errors"] == 1
+        assert result["posts"][0]["reach"] == 200
+
+        def broken(data):
+            raise ConnectionError("network down")
+
+        result = _collector(db, broken).refresh_posts(["p1", "p2"], force=True)
+        assert result["errors"] == 4 and result["updated"] == 0
+        assert [p["post_id"] for p in result["posts"]] == ["p1"]
+
+    def test_account_error_responses_keep_previous_values(self, db):
+        """계정 정보 400 → 저장 안 하고 이전 값, insights 만 실패하면 해당 메트릭 이전 값 유지"""
+        good = _collector(db, FakeGraph()).refresh_account("day")
+
+        expired = FakeGraph(fail={"followers_count"})
+        assert _collector(db, expired).refresh_account("day", force=True) == good
+        assert expired.batches == 1
+        assert _collector(db, FakeGraph()).cached_account("day") == good
+
+        account = _collector(db, FakeGraph(fail={"/insights"})).refresh_account("day", force=True)
+        assert (account["followers_count"], account["reach"], account["profile_views"]) == (1200, 500, 7)
+        assert account["fetched_at"] != good["fetched_at"]
+
+        assert _collector(db, FakeGraph(fail={"42"})).refresh_account("week") is None
+        assert _collector(db, FakeGraph()).cached_account("week") is None
+
+    def test_account_insights_single_batch_and_legacy_import(self, db, tmp_path):
+        """계정 인사이트 batch 1회 + max_age 캐시, 기존 JSON 캐시 1회 가져오기"""
+        graph = FakeGraph()
+        collector = _collector(db, graph)
+
+        account = collector.refresh_account("day")
+        assert graph.batches == 1 and len(graph.urls) == 3
+        assert (account["followers_count"], account["reach"], account["profile_views"]) == (1200, 500, 7)
+        assert collector.refresh_account("day") == account and graph.batches == 1
+
+        legacy = tmp_path / "insights_cache.json"
+        legacy.write_text(json.dumps({"posts": {"p9": {
+            "post_id": "p9", "likes": 3, "reach": 10, "fetched_at": datetime.now().isoformat(),
+            "timestamp": "2025-01-01T00:00:00+0000"}}}), encoding="utf-8")
+        assert collector.import_legacy_cache(legacy) == 1
+        assert collector.import_legacy_cache(legacy) == 0
+        assert collector.refresh_posts(["p9"])["requests"] == 0
+        assert collector.cached(["p9"])[0]["engagement_rate"] == 30.0
@@ -0,0 +1,162 @@
+"""
+Instagram 미디어 증분 동기화 단위 테스트
+
+테스트 대상:
+- /media paging.next 커서 끝까지 순회 (core.instagram_media_sync)
+- 증분 동기화: 이미 아는 미디어가 나온 페이지에서 중단
+- 중간 페이지 실패 시 인덱스 변경 없음
+- 전체 동기화 시 삭제된 게시물 제거, 캡션 → food_id 레코드
+- 캡션 음식명 단어 단위 일치 / posted 판정은 로컬 기록 media_id 일치만
+"""
+
+import pytest
+from pathlib import Path
+import sys
+
+# 04_pipeline 경로 추가
+ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(ROOT))
+
+
+# ==============================================================================
+# Fixtures
+# ==============================================================================
+
+class FakeMediaAPI:
+    """/media 엔드포인트 대역 (최신순 목록을 limit 단위 페이지 + paging.next 로)"""
+
+    def __init__(self, media, fail_offset=None):
+        self.media = list(media)
+        self.fail_offset = fail_offset
+        self.calls = []
+
+    def __call__(self, url, params):
+        if params is not None:
+            assert params["access_token"] == "token" and url.endswith("/42/media")
+            offset, limit = 0, params["limit"]
+        else:
+            offset, limit = (int(v) for v in url.rsplit("?", 1)[1].split(":"))
+        self.calls.append((offset, limit))
+        if offset == self.fail_offset:
+            return {"error": {"message": "rate limited"}}
+        data = {"data": self.media[offset:offset + limit]}
+        if offset + limit < len(self.media):
+            data["paging"] = {"next": f"https://graph/next?{offset + limit}:{limit}"}
+        return data
+
+
+def _media(i, caption=None):
+    return {"id": f"m{i:03d}", "caption": caption or f"post {i}",
+            "timestamp": f"2026-01-{1 + i // 24:02d}T{i % 24:02d}:00:00+0000",
+            "permalink": f"https://www.instagram.com/p/SC{i:03d}/", "media_type": "CAROUSEL_ALBUM"}
+
+
+def _feed(count):
+    """최신순 미디어 목록 (m{count-1} … m000)"""
+    return [_media(i) for i in reversed(range(count))]
+
+
+@pytest.fixture
+def db(tmp_path):
+    from core.state_db import StateDB
+
+    db = StateDB(tmp_path / "state.db")
+    yield db
+    db.close()
+
+
+def _sync(db, api):
+    from core.instagram_media_sync import MediaSync
+
+    return MediaSync(access_token="token", account_id="42", db=db, get=api, log=lambda msg: None)
+
+
+# ==============================================================================
+# Media Sync Tests
+# ==============================================================================
+
+class TestMediaSync:
+    """커서 순회 / 증분 / 실패 / 삭제 테스트"""
+
+    def test_full_sync_follows_cursor_beyond_first_page(self, db):
+        """게시물 230개 → 100개 페이지 3회, 인덱스는 최신순"""
+        api = FakeMediaAPI(_feed(230))
+        sync = _sync(db, api)
+
+        assert sync.needs_full_sync()
+        result = sync.sync()
+
+        assert (result["full"], result["pages"], result["new"], result["total"]) == (True, 3, 230, 230)
+        assert [limit for _, limit in api.calls] == [100, 100, 100]
+        assert [m["id"] for m in sync.media(limit=2)] == ["m229", "m228"]
+        assert sync.high_water_mark()["id"] == "m229"
+        assert not sync.needs_full_sync()
+
+    def test_incremental_sync_stops_at_known_page(self, db):
+        """새 게시물 3개 → 첫 페이지(25개)만 읽고 중단"""
+        api = FakeMediaAPI(_feed(230))
+        sync = _sync(db, api)
+        sync.sync()
+
+        api.media = _feed(233)
+        api.calls.clear()
+        result = sync.sync()
+
+        assert result["full"] is False and api.calls == [(0, 25)]
+        assert (result["new"], result["updated"], result["total"]) == (3, 22, 233)
+        assert sync.high_water_mark()["id"] == "m232"
+
+    def test_page_error_leaves_index_unchanged(self, db):
+        """두 번째 페이지 실패 → MediaSyncError, 첫 페이지도 기록 안 함"""
+        from core.instagram_media_sync import MediaSyncError
+
+        sync = _sync(db, FakeMediaAPI(_feed(150), fail_offset=100))
+
+        with pytest.raises(MediaSyncError):
+            sync.sync()
+        assert sync.media_ids() == set() and sync.last_synced() is None
+        assert sync.sync_safe() is None
+
+    def test_full_sync_removes_deleted_media_and_maps_food_ids(self, db):
+        """전체 동기화로 삭제 게시물 제거, 캡션 첫 줄 → food_id 레코드"""
+        feed = [_media(2, "🍌 바나나 먹어도 될까요?\n#dog"), _media(1, "Strawberry 🍓"), _media(0, "hello")]
+        api = FakeMediaAPI(feed)
+        sync = _sync(db, api)
+        sync.sync()
+
+        records = sync.posted_records()
+        assert [(r["media_id"], r["food_id"], r["posted_id"]) for r in records] == [
+            ("m002", "banana", "banana__SC002"), ("m001", "strawberry", "strawberry__SC001")]
+
+        api.media = feed[1:]
+        result = sync.sync(full=True)
+        assert result["removed"] == 1 and sync.media_ids() == {"m001", "m000"}
+
+    @pytest.mark.parametrize("caption,food_id", [
+        ("🥬 양배추 먹어도 될까요?", "unknown"),
+        ("배추는 괜찮을까요?", "unknown"),
+        ("건포도 절대 금지", "unknown"),
+        ("It appears dogs love this", "unknown"),
+        ("사과와 배 비교", "unknown"),
+        ("🍐 배는 먹어도 돼요?", "pear"),
+        ("애호박 🥒", "zucchini"),
+    ])
+    def test_caption_food_id_matches_whole_words(self, caption, food_id):
+        """부분 문자열(양배추 → 배, appears → pear) / 여러 음식은 식별 안 함"""
+        from core.instagram_media_sync import food_id_from_caption
+
+        assert food_id_from_caption(caption) == food_id
+
+    def test_posted_only_for_known_media_ids(self):
+        """캡션 추정이 아니라 로컬에 기록된 media_id 로만 posted 판정 (나머지는 로그)"""
+        from core.instagram_media_sync import match_known_media
+
+        media = [_media(3, "🥬 양배추 먹어도 될까요?"), _media(2, "🥬 알배추 (napa cabbage)"),
+                 _media(1, "🍐 배 먹어도 돼요?"), _media(0, "🥕 당근")]
+        logs = []
+
+        posted = match_known_media(media, {"m003": "cabbage", "m000": "Carrot"}, log=logs.append)
+
+        assert posted == {"cabbage", "carrot"}
+        assert "pear" not in posted
+        assert len(logs) == 1 and "2건" in logs[0] and "m001(pear?)" in logs[0]
@@ -0,0 +1,230 @@
+"""
+Pillow 오버레이 엔진 단위 테스트
+
+테스트 대상:
+- 글리프 런 텍스트 엔진 (pillow_overlay)
+- 영역 한정 그림자 / 캐시 그라데이션 합성
+"""
+
+import pytest
+from pathlib import Path
+import sys
+
+from PIL import Image, ImageDraw, ImageFilter, ImageFont
+
+# 04_pipeline 경로 추가
+ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(ROOT))
+
+
+# ==============================================================================
+# Fixtures
+# ==============================================================================
+
+@pytest.fixture
+def font():
+    """테스트용 기본 폰트 (프로젝트 폰트 없이 실행)"""
+    return ImageFont.load_default(size=40)
+
+
+@pytest.fixture
+def base_image():
+    """테스트용 배경 이미지"""
+    img = Image.linear_gradient("L").resize((400, 300)).convert("RGBA")
+    return img
+
+
+def _draw_per_char(img, x, y, text, font, fill, spacing_em):
+    """v3.1 글자별 draw.text 루프 (기준 구현)"""
+    draw = ImageDraw.Draw(img)
+    spacing_px = font.size * spacing_em
+    cx = float(x)
+    for i, ch in enumerate(text):
+        draw.text((int(round(cx)), y), ch, font=font, fill=fill)
+        if i < len(text) - 1:
+            cx += draw.textlength(ch, font=font) + spacing_px
+
+
+# ==============================================================================
+# Glyph Run Tests
+# ==============================================================================
+
+class TestGlyphRun:
+    """글리프 런 텍스트 엔진 테스트"""
+
+    def test_matches_per_char_rendering(self, font, base_image):
+        """런 마스크 렌더링 = 글자별 draw.text (겹침 없는 간격)"""
+        import pillow_overlay as po
+
+        expected = base_image.copy()
+        _draw_per_char(expected, 20.5, 30, "Sunshine", font, "#FFD93D", 0.1)
+
+        actual = base_image.copy()
+        run = po.rasterize_text(20.5, 30, "Sunshine", font, 0.1)
+        po._draw_run(ImageDraw.Draw(actual), run, "#FFD93D")
+
+        assert actual.tobytes() == expected.tobytes()
+
+    @pytest.mark.parametrize("text", ["WAVY AVATAR Tj", "LTAVWYAV", "저장 & 공유"])
+    @pytest.mark.parametrize("fill", ["#FFD93D", (0, 0, 0, 120)])
+    def test_matches_per_char_rendering_with_overlap(self, text, fill):
+        """기본 LETTER_SPACING(글리프 겹침)에서도 글자별 draw.text와 픽셀 동일"""
+        import pillow_overlay as po
+
+        font = ImageFont.load_default(size=88)
+        base_image = Image.linear_gradient("L").resize((900, 200)).convert("RGBA")
+        expected = base_image.copy()
+        _draw_per_char(expected, 20.5, 30, text, font, fill, po.LETTER_SPACING)
+
+        actual = base_image.copy()
+        run = po.rasterize_text(20.5, 30, text, font)
+        po._draw_run(ImageDraw.Draw(actual), run, fill)
+
+        assert actual.tobytes() == expected.tobytes()
+
+    def test_overlapping_glyphs_drawn_in_order(self, font):
+        """잉크가 겹치는 런만 글리프별 parts 보관"""
+        import pillow_overlay as po
+
+        assert po.rasterize_text(20.5, 30, "WAVY AVATAR Tj", font).parts is not None
+        assert po.rasterize_text(20.5, 30, "WAVY AVATAR Tj", font, 0.1).parts is None
+
+    def test_measure_uses_glyph_advances(self, font, base_image):
+        """측정 폭 = 글자별 textlength 합 + 간격"""
+        import pillow_overlay as po
+
+        draw = ImageDraw.Draw(base_image)
+        width, height = po._measure_text(draw, "Dog", font)
+        expected = sum(draw.textlength(ch, font=font) for ch in "Dog")
+        expected += 2 * font.size * po.LETTER_SPACING
+
+        assert width == pytest.approx(expected)
+        assert height > 0
+
+    def test_blank_text_returns_none(self, font):
+        """빈 텍스트/공백은 런 없음"""
+        import pillow_overlay as po
+
+        assert po.rasterize_text(0, 0, "", font) is None
+        assert po.rasterize_text(0, 0, "   ", font) is None
+
+    def test_shadow_offset_reuses_run(self, font, base_image):
+        """그림자는 동일 런을 정수 오프셋으로 재사용"""
+        import pillow_overlay as po
+
+        run = po.rasterize_text(10, 10, "AB", font)
+        shadowed = po._shadow_standard(base_image.copy(), run, blur=0, alpha=255, offset=(4, 4))
+
+        x0, y0, x1, y1 = run.box
+        region = shadowed.crop((x0 + 4, y0 + 4, x1 + 4, y1 + 4)).getchannel("R")
+        assert region.getextrema()[0] == 0
+
+
+# ==============================================================================
+# Compositing Tests
+# ==============================================================================
+
+class TestCroppedCompositing:
+    """영역 한정 그림자/그라데이션 = 전체 캔버스 방식 (바이트 동일)"""
+
+    @pytest.mark.parametrize("xy", [(40, 100), (-6, -8), (330, 270)])
+    def test_shadow_matches_full_canvas(self, font, base_image, xy):
+        """그림자: 전체 캔버스 블러와 동일 (가장자리 포함)"""
+        import pillow_overlay as po
+
+        run = po.rasterize_text(xy[0], xy[1], "Wavy", font)
+
+        layer = Image.new("RGBA", base_image.size, (0, 0, 0, 0))
+        po._draw_run(ImageDraw.Draw(layer), run, (0, 0, 0, 160), (4, 4))
+        layer = layer.filter(ImageFilter.GaussianBlur(radius=10))
+        expected = Image.alpha_composite(base_image, layer)
+
+        actual = po._shadow_standard(base_image.copy(), run, blur=10, alpha=160, offset=(4, 4))
+
+        assert actual.tobytes() == expected.tobytes()
+
+    @pytest.mark.parametrize("position,ratio,alpha", [("bottom", 0.38, 180), ("top", 0.35, 140)])
+    def test_gradient_matches_line_loop(self, base_image, position, ratio, alpha):
+        """그라데이션: 행별 line 루프와 동일, 원본 미변경"""
+        import pillow_overlay as po
+
+        overlay = Image.new("RGBA", base_image.size, (0, 0, 0, 0))
+        draw_ov = ImageDraw.Draw(overlay)
+        h, w = base_image.height, base_image.width
+        if position == "bottom":
+            start = int(h * (1 - ratio))
+            span = max(h - start, 1)
+            for y in range(start, h):
+                draw_ov.line([(0, y), (w, y)], fill=(0, 0, 0, int(alpha * ((y - start) / span))))
+        else:
+            end = int(h * ratio)
+            for y in range(0, end):
+                draw_ov.line([(0, y), (w, y)], fill=(0, 0, 0, int(alpha * (1.0 - y / max(end, 1)))))
+        expected = Image.alpha_composite(base_image, overlay)
+
+        before = base_image.tobytes()
+        actual = po._apply_gradient(base_image, ratio, alpha, position)
+
+        assert actual.tobytes() == expected.tobytes()
+        assert base_image.tobytes() == before
+
+
+# ==============================================================================
+# Batch Engine Tests
+# ==============================================================================
+
+class TestRenderBatch:
+    """배치 오버레이 엔진 테스트"""
+
+    def test_expand_manifest(self):
+        """콘텐츠 x 플랫폼 x 슬라이드 확장, 공통 키 상속"""
+        import pillow_overlay as po
+
+        manifest = [{
+            "content_id": "044_Almonds",
+            "safety": "forbidden",
+            "platforms": ["instagram", "blog"],
+            "output_dir": "out/044",
+            "slides": [
+                {"image_path": "a/01_bg.png", "slide_number": 1, "slide_type": "cover"},
+                {"image_path": "a/02_bg.png", "slide_number": 2},
+            ],
+        }]
+
+        jobs = po.expand_manifest(manifest)
+
+        assert len(jobs) == 4
+        assert {j["platform"] for j in jobs} == {"instagram", "blog"}
+        assert all(j["safety"] == "forbidden" for j in jobs)
+        assert po._job_output_path(jobs[0]) == str(Path("out/044/instagram/01_bg.png"))
+
+    def test_instagram_body_copied_unchanged(self, tmp_path, base_image):
+        """인스타 02~09: 오버레이 없이 원본 복사"""
+        import pillow_overlay as po
+
+        src = tmp_path / "02_bg.png"
+        base_image.save(src)
+        manifest = [{
+            "image_path": str(src),
+            "output_path": str(tmp_path / "out" / "02.png"),
+            "slide_number": 2,
+            "platform": "instagram",
+        }]
+
+        results = po.render_batch(manifest, max_workers=1)
+
+        assert results[0]["status"] == "skipped"
+        assert (tmp_path / "out" / "02.png").read_bytes() == src.read_bytes()
+
+    def test_errors_reported_per_slide(self, tmp_path):
+        """실패 슬라이드는 예외 대신 error 상태로 보고"""
+        import pillow_overlay as po
+
+        manifest = [{"image_path": str(tmp_path / "missing_bg.png"), "slide_number": 1}]
+
+        results = po.render_batch(manifest, max_workers=1)
+        summary = po.summarize_batch(results)
+
+        assert results[0]["status"] == "error"
+        assert "elapsed_ms" in results[0]
+        assert summary["errors"] == 1
@@ -0,0 +1,175 @@
+"""
+렌더 캐시 단위 테스트
+
+테스트 대상:
+- RenderCache (적중/미스, LRU 삭제)
+- cached_render 데코레이터
+- pillow_overlay 파일 렌더 캐시 경유
+"""
+
+import pytest
+from pathlib import Path
+import sys
+
+from PIL import Image
+
+# 04_pipeline 경로 추가
+ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(ROOT))
+
+
+# ==============================================================================
+# Fixtures
+# ==============================================================================
+
+@pytest.fixture
+def cache(tmp_path):
+    """임시 디렉토리 캐시 (공용 인스턴스 교체)"""
+    import render_cache
+
+    cache = render_cache.RenderCache(cache_dir=tmp_path / "cache", max_bytes=10_000)
+    render_cache.set_render_cache(cache)
+    yield cache
+    render_cache.set_render_cache(None)
+
+
+# ==============================================================================
+# RenderCache Tests
+# ==============================================================================
+
+class TestRenderCache:
+    """RenderCache 단위 테스트"""
+
+    def test_key_depends_on_image_content(self):
+        """이미지 내용/텍스트가 다르면 키도 다름"""
+        from render_cache import make_key
+
+        a = Image.new("RGB", (4, 4), "white")
+        b = Image.new("RGB", (4, 4), "black")
+
+        assert make_key("ns", a, "제목") == make_key("ns", a.copy(), "제목")
+        assert make_key("ns", a, "제목") != make_key("ns", b, "제목")
+        assert make_key("ns", a, "제목") != make_key("ns", a, "부제목")
+
+    def test_hit_and_miss_counters(self, cache):
+        """적중/미스 카운터"""
+        assert cache.get("ab" * 32) is None
+        cache.put("ab" * 32, b"data")
+
+        assert cache.get("ab" * 32) == b"data"
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["stores"] == 1
+
+    def test_lru_eviction(self, cache):
+        """용량 상한 초과 시 가장 오래된 항목 삭제"""
+        import os
+
+        keys = [f"{i:02d}" * 32 for i in range(4)]
+        for i, key in enumerate(keys):
+            cache.put(key, b"x" * 4000)
+            os.utime(cache._path(key), (1000 + i, 1000 + i))
+
+        assert cache.stats()["evictions"] >= 1
+        assert cache.get(keys[0]) is None
+        assert cache.get(keys[-1]) is not None
+
+
+# ==============================================================================
+# Decorator Tests
+# ==============================================================================
+
+class TestCachedRender:
+    """cached_render 데코레이터 테스트"""
+
+    def test_output_written_from_cache(self, cache, tmp_path):
+        """적중 시 원본 함수 호출 없이 출력 파일 기록"""
+        from render_cache import cached_render
+
+        calls = []
+
+        @cached_render("test.card", "fp", output_arg="output_path")
+        def make_card(text, output_path=None):
+            calls.append(text)
+            img = Image.new("RGB", (8, 8), "red")
+            if output_path:
+                img.save(output_path, "PNG")
+            return img
+
+        first = tmp_path / "a.png"
+        second = tmp_path / "b.png"
+        make_card("hello", output_path=str(first))
+        result = make_card("hello", output_path=str(second))
+
+        assert calls == ["hello"]
+        assert second.read_bytes() == first.read_bytes()
+        assert result.size == (8, 8)
+
+    def test_disabled_cache_passthrough(self, tmp_path):
+        """비활성 캐시는 항상 원본 호출"""
+        import render_cache
+
+        render_cache.set_render_cache(render_cache.RenderCache(cache_dir=tmp_path, enabled=False))
+        calls = []
+
+        @render_cache.cached_render("test.off", "fp")
+        def render(text):
+            calls.append(text)
+            return Image.new("L", (2, 2))
+
+        render("a")
+        render("a")
+        render_cache.set_render_cache(None)
+
+        assert calls == ["a", "a"]
+
+
+# ==============================================================================
+# Overlay Integration Tests
+# ==============================================================================
+
+class TestOverlayFileCache:
+    """pillow_overlay 파일 렌더 캐시 경유 테스트"""
+
+    def test_unchanged_slide_not_rerendered(self, cache, tmp_path, monkeypatch):
+        """입력 동일 시 렌더 생략, 입력 변경 시 재렌더"""
+        import pillow_overlay as po
+
+        calls = []
+
+        def fake_render(img, kind, title, subtitle="", safety="safe"):
+            calls.append(title)
+            return img.convert("RGBA")
+
+        monkeypatch.setattr(po, "_render_kind", fake_render)
+
+        src = tmp_path / "02_bg.png"
+        Image.new("RGB", (16, 16), "blue").save(src)
+
+        assert po._render_file(src, tmp_path / "o1.png", "body", "제목", "부제", "safe") is False
+        assert po._render_file(src, tmp_path / "o2.png", "body", "제목", "부제", "safe") is True
+        assert po._render_file(src, tmp_path / "o3.png", "body", "다른 제목", "부제", "safe") is False
+
+        assert calls == ["제목", "다른 제목"]
+        assert (tmp_path / "o2.png").read_bytes() == (tmp_path / "o1.png").read_bytes()
+
+    def test_batch_worker_stats_merged(self, cache, tmp_path, monkeypatch):
+        """프로세스 풀 워커의 적중/미스 카운터가 부모 stats()에 합산"""
+        import pillow_overlay as po
+
+        monkeypatch.setattr(po, "_render_kind", lambda img, *args: img.convert("RGBA"))
+
+        src = tmp_path / "02_bg.png"
+        Image.new("RGB", (16, 16), "blue").save(src)
+        job = {"image_path": str(src), "slide_number": 2, "platform": "blog", "title": "제목"}
+
+        po.render_batch([dict(job, output_path=str(tmp_path / "warm.png"))], max_workers=1)
+        cache.reset_stats()
+
+        manifest = [dict(job, output_path=str(tmp_path / f"o{i}.png")) for i in range(4)]
+        results = po.render_batch(manifest, max_workers=2)
+
+        assert all(r["cache_hit"] for r in results)
+        assert cache.stats()["hits"] == 4
+        assert cache.stats()["misses"] == 0
@@ -0,0 +1,118 @@
+"""
+상주 렌더 워커 클라이언트 단위 테스트
+
+테스트 대상:
+- 줄 단위 JSON 프로토콜 / 요청 여러 건에 프로세스 1개 재사용 (core.render_worker)
+- 슬라이드별 결과 / 소요 시간
+- 워커 비정상 종료 시 자동 재시작 + 재시도
+"""
+
+import sys
+import textwrap
+import pytest
+from pathlib import Path
+
+# 04_pipeline 경로 추가
+ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(ROOT))
+
+
+# ==============================================================================
+# Fixtures
+# ==============================================================================
+
+# render_server.js 와 같은 프로토콜의 대역 워커 (브라우저 대신 html 을 파일로 저장)
+FAKE_WORKER = textwrap.dedent('''
+    import json, os, sys
+
+    print(json.dumps({"ready": True, "pages": 2}), flush=True)
+    for line in sys.stdin:
+        request = json.loads(line)
+        if request["op"] == "shutdown":
+            print(json.dumps({"id": request["id"], "ok": True}), flush=True)
+            break
+        if request["op"] == "ping":
+            print(json.dumps({"id": request["id"], "ok": True, "pid": os.getpid()}), flush=True)
+            continue
+        results = []
+        for slide in request["slides"]:
+            marker = os.environ.get("CRASH_MARKER")
+            if slide["html"] == "crash" and marker and not os.path.exists(marker):
+                open(marker, "w").close()
+                sys.exit(3)
+            if slide["html"] == "bad":
+                results.append({"output": slide["output"], "ok": False, "ms": 1, "error": "navigation failed"})
+                continue
+            with open(slide["output"], "w", encoding="utf-8") as f:
+                f.write(slide["html"])
+            results.append({"output": slide["output"], "ok": True, "ms": 5})
+        print(json.dumps({"id": request["id"], "ok": all(r["ok"] for r in results),
+                          "ms": 10, "results": results}), flush=True)
+''')
+
+
+@pytest.fixture
+def worker(tmp_path):
+    from core.render_worker import RenderWorker
+
+    script = tmp_path / "fake_worker.py"
+    script.write_text(FAKE_WORKER, encoding="utf-8")
+    worker = RenderWorker(command=[sys.executable, str(script)], cwd=tmp_path,
+                          env={"CRASH_MARKER": str(tmp_path / "crashed")},
+                          request_timeout=10, start_timeout=10)
+    yield worker
+    worker.close()
+
+
+def _slides(tmp_path, htmls):
+    from core.render_worker import SlideJob
+
+    return [SlideJob(html=html, output=str(tmp_path / f"slide_{i:02d}.png")) for i, html in enumerate(htmls)]
+
+
+# ==============================================================================
+# Render Worker Tests
+# ==============================================================================
+
+class TestRenderWorker:
+    """프로세스 재사용 / 결과 / 재시작 테스트"""
+
+    def test_reuses_single_process_across_requests(self, worker, tmp_path):
+        """요청 여러 건을 프로세스 1개로 처리, 결과는 입력 순서"""
+        first = worker.render(_slides(tmp_path, ["<p>cover</p>", "<p>body</p>"]))
+        pid = worker.ping()["pid"]
+        second = worker.render(_slides(tmp_path, ["<p>cta</p>"]))
+
+        assert [Path(r.output).name for r in first] == ["slide_00.png", "slide_01.png"]
+        assert all(r.ok and r.ms == 5 for r in first + second)
+        assert (tmp_path / "slide_01.png").read_text(encoding="utf-8") == "<p>body</p>"
+        assert worker.ping()["pid"] == pid
+        assert worker.stats["starts"] == 1
+
+    def test_failed_slide_reported_per_slide(self, worker, tmp_path):
+        """실패 슬라이드만 ok=False + error"""
+        results = worker.render(_slides(tmp_path, ["<p>a</p>", "bad"]))
+
+        assert [r.ok for r in results] == [True, False]
+        assert results[1].error == "navigation failed"
+
+    def test_restarts_after_crash_and_retries(self, worker, tmp_path):
+        """워커가 죽으면 재시작 후 같은 요청 재시도"""
+        worker.render(_slides(tmp_path, ["<p>warm</p>"]))
+        results = worker.render(_slides(tmp_path, ["crash", "<p>after</p>"]))
+
+        assert [r.ok for r in results] == [True, True]
+        assert worker.stats["starts"] == 2
+        assert worker.restarts == 0  # 성공 후 초기화
+
+    @pytest.mark.asyncio
+    async def test_async_render_and_start_failure(self, worker, tmp_path):
+        """render_async 동작 + 실행 불가 명령은 RenderWorkerError"""
+        from core.render_worker import RenderWorker, RenderWorkerError
+
+        results = await worker.render_async(_slides(tmp_path, ["<p>async</p>"]))
+        assert results[0].ok
+
+        broken = RenderWorker(command=[str(tmp_path / "missing-node")], start_timeout=5)
+        with pytest.raises(RenderWorkerError):
+            broken.render(_slides(tmp_path, ["<p>x</p>"]))
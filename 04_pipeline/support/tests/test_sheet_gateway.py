@@ -0,0 +1,202 @@
+"""
+Google Sheets 게이트웨이 단위 테스트
+
+테스트 대상:
+- 스냅샷 캐시: TTL 안에서는 get_all_values 재호출 없음, 키 컬럼 인덱스 (sheet_gateway)
+- 쓰기 모으기: 여러 행 업데이트 → batch_update 1회, 행 추가 → append_rows 1회
+- 429 / 5xx 지수 백오프 재시도
+- batch() flush 실패 시 예약 버림 / 추가 예약 행 업데이트는 추가 값에 합침
+- ContentSheetManager.batch() / sync_from_local 호출 수
+"""
+
+from pathlib import Path
+import sys
+
+import pytest
+
+# 04_pipeline 경로 추가
+ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(ROOT))
+
+
+# ==============================================================================
+# Fixtures
+# ==============================================================================
+
+HEADER = ['번호', '영문명', '한글명', '폴더명', '안전도', '게시상태', '게시일', '인스타URL']
+
+
+class FakeAPIError(Exception):
+    """gspread APIError 흉내 (response.status_code)"""
+
+    def __init__(self, status):
+        super().__init__(f"HTTP {status}")
+        self.response = type("Response", (), {"status_code": status})()
+
+
+class FakeWorksheet:
+    """호출 수를 세는 가짜 워크시트"""
+
+    def __init__(self, rows):
+        self.values = [list(HEADER)] + [list(r) for r in rows]
+        self.calls = []
+        self.failures = []  # 다음 호출들에서 던질 예외
+
+    def _call(self, name):
+        self.calls.append(name)
+        if self.failures:
+            raise self.failures.pop(0)
+
+    def count(self, name):
+        return self.calls.count(name)
+
+    def get_all_values(self):
+        self._call("get_all_values")
+        return [list(r) for r in self.values]
+
+    def batch_update(self, data, value_input_option=None):
+        self._call("batch_update")
+        for item in data:
+            cell = item["range"]
+            col = ord(cell[0]) - 64
+            row = int(cell[1:])
+            self.values[row - 1][col - 1] = item["values"][0][0]
+
+    def append_rows(self, rows, value_input_option=None):
+        self._call("append_rows")
+        self.values.extend(list(r) for r in rows)
+
+
+@pytest.fixture
+def worksheet():
+    return FakeWorksheet([
+        ['001', 'Banana', '바나나', '001_Banana', 'SAFE', 'body_ready', '', ''],
+        ['002', 'Grape', '포도', '002_Grape', 'FORBIDDEN', 'body_ready', '', ''],
+        ['003', 'Carrot', '당근', '003_Carrot', 'CAUTION', 'cover_only', '', ''],
+    ])
+
+
+@pytest.fixture
+def manager(worksheet, tmp_path, monkeypatch):
+    """가짜 워크시트에 연결된 ContentSheetManager (로컬 CSV 는 tmp_path)"""
+    monkeypatch.setenv("SHEET_SNAPSHOT_TTL", "30")
+    from core.utils.google_sheets_manager import ContentSheetManager
+
+    manager = ContentSheetManager()
+    manager._worksheet = worksheet
+    manager.local_cache_path = tmp_path / "published_contents.csv"
+    return manager
+
+
+# ==============================================================================
+# Sheet Gateway Tests
+# ==============================================================================
+
+class TestSheetGateway:
+    """스냅샷 캐시 / 일괄 쓰기 / 재시도 테스트"""
+
+    def test_snapshot_cached_within_ttl(self, worksheet):
+        """TTL 안의 읽기는 캐시, TTL 지남 / invalidate 후에만 다시 읽기, 영문명 대소문자 무시"""
+        from core.utils.sheet_gateway import SheetGateway
+
+        now = [100.0]
+        gateway = SheetGateway(worksheet, ttl=30, clock=lambda: now[0], log=lambda msg: None)
+
+        assert gateway.row_of("grape") == 3
+        assert gateway.find("CARROT")["게시상태"] == "cover_only"
+        assert gateway.snapshot().column_values(6) == ["body_ready", "body_ready", "cover_only"]
+        assert worksheet.count("get_all_values") == 1
+
+        now[0] += 31
+        assert [r["영문명"] for r in gateway.records()] == ["Banana", "Grape", "Carrot"]
+        gateway.invalidate()
+        gateway.records()
+        assert worksheet.count("get_all_values") == 3
+        assert gateway.stats()["cache_hits"] == 2
+
+    def test_manager_batch_sends_one_write(self, manager, worksheet):
+        """batch() 안의 여러 행 업데이트 + 추가 → 읽기 1회, batch_update 1회, append_rows 1회"""
+        with manager.batch():
+            for topic in ("banana", "Grape", "carrot"):
+                assert manager.update_content(topic, {'게시상태': 'posted', '게시일': '2026-10-16'})
+            assert manager.add_content('004', 'Apple', '사과', 'SAFE', status='posted')
+            # 전송 전에도 같은 배치 안의 읽기에는 반영
+            assert manager.get_content("apple")["한글명"] == "사과"
+            assert manager.get_content("grape")["게시상태"] == "posted"
+            assert worksheet.count("batch_update") == worksheet.count("append_rows") == 0
+
+        assert worksheet.calls == ["get_all_values", "batch_update", "append_rows"]
+        assert [r[5] for r in worksheet.values[1:]] == ["posted"] * 4
+        assert worksheet.values[4][1] == "Apple"
+        assert manager.is_published("banana") is False  # 게시완료 아님 (posted)
+        assert manager.update_content("unknown", {'게시상태': 'posted'}) is False
+
+    def test_quota_errors_retried_with_backoff(self, worksheet):
+        """429 / 503 은 대기 2배씩 늘리며 재시도, 그 밖의 오류는 바로 예외 (예약 유지)"""
+        from core.utils.sheet_gateway import SheetGateway
+
+        sleeps = []
+        gateway = SheetGateway(worksheet, ttl=30, base_delay=1.0, sleep=sleeps.append,
+                               log=lambda msg: None)
+        worksheet.failures = [FakeAPIError(429), FakeAPIError(503)]
+
+        assert gateway.row_of("banana") == 2
+        assert worksheet.count("get_all_values") == 3
+        assert len(sleeps) == 2 and 1.0 <= sleeps[0] < 1.2 and 2.0 <= sleeps[1] < 2.4
+        assert gateway.stats()["retries"] == 2
+
+        gateway.stage_update(2, '게시상태', 'posted')
+        worksheet.failures = [FakeAPIError(400)]
+        with pytest.raises(FakeAPIError):
+            gateway.flush()
+        assert gateway.pending == 1 and len(sleeps) == 2
+        assert gateway.flush() == 1
+        assert worksheet.values[1][5] == "posted"
+
+    def test_failed_batch_flush_not_left_in_snapshot(self, worksheet):
+        """batch() flush 실패 → 보내지 못한 값이 다음 동기화의 스냅샷에 남지 않고 다시 전송"""
+        from core.utils.sheet_gateway import SheetGateway
+
+        gateway = SheetGateway(worksheet, ttl=0, log=lambda msg: None)  # 동기화마다 새로 읽기
+
+        def sync(failures=()):
+            with gateway.batch():
+                if gateway.find("grape")["게시상태"] != "posted":
+                    gateway.stage_update(gateway.row_of("grape"), '게시상태', 'posted')
+                worksheet.failures = list(failures)  # 블록 끝 flush 에서 발생
+
+        with pytest.raises(FakeAPIError):
+            sync([FakeAPIError(400)])
+        assert gateway.pending == 0
+        assert gateway.find("grape")["게시상태"] == "body_ready"
+
+        sync()
+        assert worksheet.values[2][5] == "posted"
+        assert worksheet.count("batch_update") == 2
+
+    def test_update_to_staged_append_row(self, manager, worksheet):
+        """같은 배치에서 추가한 행의 업데이트 → 추가 값에 합쳐 append_rows 만 전송"""
+        with manager.batch():
+            assert manager.add_content('004', 'Apple', '사과', 'SAFE', status='posted')
+            assert manager.update_content("apple", {'게시일': '2026-10-16'})
+            assert manager.update_content("banana", {'게시상태': 'posted'})
+
+        assert worksheet.calls == ["get_all_values", "batch_update", "append_rows"]
+        assert len(worksheet.values) == 5
+        assert worksheet.values[4][1] == "Apple" and worksheet.values[4][6] == "2026-10-16"
+        assert worksheet.values[1][5] == "posted"
+
+    def test_sync_from_local_appends_once(self, manager, worksheet):
+        """로컬 CSV 에만 있는 행 → append_rows 1회, 이미 있는 영문명은 건너뜀"""
+        manager.local_cache_path.write_text(
+            "번호,영문명,한글명,폴더명,안전도,게시상태,게시일,인스타URL\n"
+            "002,grape,포도,002_Grape,FORBIDDEN,게시완료,,\n"
+            + "".join(f"{n:03d},Food{n},음식{n},{n:03d}_Food{n},SAFE,게시완료,,\n" for n in range(10, 25)),
+            encoding="utf-8",
+        )
+
+        assert manager.sync_from_local() == 15
+        assert worksheet.calls == ["get_all_values", "append_rows"]
+        assert len(worksheet.values) == 1 + 3 + 15
+        assert manager.get_next_number() == "025"
+        assert worksheet.count("get_all_values") == 2  # 추가 후 스냅샷 새로 읽기
@@ -0,0 +1,208 @@
+"""
+SQLite 상태 저장소 단위 테스트
+
+테스트 대상:
+- WAL 모드 / 트랜잭션 / JSON 1회 가져오기 (core.state_db)
+- StateStore / MetricsCollector / ErrorAggregator / RetryManager / ABTestManager 이전
+- 여러 인스턴스(프로세스) 동시 기록 시 덮어쓰기 없음
+"""
+
+import json
+import pytest
+from datetime import datetime
+from pathlib import Path
+import sys
+
+# 04_pipeline 경로 추가
+ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(ROOT))
+
+
+# ==============================================================================
+# Fixtures
+# ==============================================================================
+
+@pytest.fixture
+def db(tmp_path):
+    from core.state_db import StateDB
+
+    db = StateDB(tmp_path / "state.db")
+    yield db
+    db.close()
+
+
+@pytest.fixture
+def project_root(tmp_path, monkeypatch):
+    """config/ · reports/ 가 저장소 대신 임시 폴더에 생기도록"""
+    from core.utils import metrics_collector, error_aggregator
+
+    monkeypatch.setattr(metrics_collector, "PROJECT_ROOT", tmp_path)
+    monkeypatch.setattr(error_aggregator, "PROJECT_ROOT", tmp_path)
+    return tmp_path
+
+
+# ==============================================================================
+# StateDB Tests
+# ==============================================================================
+
+class TestStateDB:
+    """WAL / 트랜잭션 / JSON 가져오기 테스트"""
+
+    def test_wal_mode_and_rollback(self, db):
+        """WAL 모드, 예외 시 트랜잭션 전체 롤백"""
+        assert db.query_one("PRAGMA journal_mode")[0] == "wal"
+
+        with pytest.raises(RuntimeError):
+            with db.transaction():
+                db.execute("INSERT INTO daily_metrics (date, data, updated_at) VALUES ('d', '{}', 'now')")
+                raise RuntimeError("boom")
+        assert db.query("SELECT * FROM daily_metrics") == []
+
+    def test_import_json_once(self, db, tmp_path):
+        """같은 파일은 한 번만 가져오기, 없는 파일은 무시"""
+        source = tmp_path / "legacy.json"
+        source.write_text(json.dumps({"a": 1, "b": 2}), encoding="utf-8")
+        calls = []
+
+        def importer(data):
+            calls.append(data)
+            return len(data)
+
+        assert db.import_json_once(source, "legacy", importer) == 2
+        assert db.import_json_once(source, "legacy", importer) == 0
+        assert db.import_json_once(tmp_path / "missing.json", "legacy", importer) == 0
+        assert len(calls) == 1
+
+    def test_failed_import_retried_later(self, db, tmp_path):
+        """손상 파일 / importer 실패는 기록·부분 반영 없이 다음 호출에서 재시도"""
+        source = tmp_path / "legacy.json"
+        source.write_text("{broken", encoding="utf-8")
+
+        def importer(data):
+            db.execute("INSERT INTO daily_metrics (date, data, updated_at) VALUES ('d', '{}', 'now')")
+            if data.get("fail"):
+                raise ValueError("bad row")
+            return 1
+
+        assert db.import_json_once(source, "legacy", importer) == 0
+        source.write_text(json.dumps({"fail": True}), encoding="utf-8")
+        assert db.import_json_once(source, "legacy", importer) == 0
+        assert db.query("SELECT * FROM daily_metrics") == []
+        assert db.query("SELECT * FROM json_imports") == []
+
+        source.write_text(json.dumps({"fail": False}), encoding="utf-8")
+        assert db.import_json_once(source, "legacy", importer) == 1
+        assert db.import_json_once(source, "legacy", importer) == 0
+
+
+# ==============================================================================
+# Migrated Store Tests
+# ==============================================================================
+
+class TestStateStoreBackend:
+    """StateStore SQLite 이전 테스트"""
+
+    def test_imports_legacy_json_and_shares_rows(self, tmp_path):
+        """기존 JSON 가져오기 + 인스턴스 간 기록이 서로 덮어쓰지 않음"""
+        from support.utils.state_store import StateStore
+
+        store_path = tmp_path / "states.json"
+        store_path.write_text(json.dumps({"apple": {"status": "completed"}}), encoding="utf-8")
+
+        bot, worker = StateStore(store_path=str(store_path)), StateStore(store_path=str(store_path))
+        bot.save_state("banana", {"status": "pending"})
+        worker.save_state("cherry", {"status": "failed"})
+
+        assert set(bot.states) == {"apple", "banana", "cherry"}
+        assert list(worker.get_failed_pipelines()) == ["cherry"]
+        assert json.loads(store_path.read_text(encoding="utf-8")) == {"apple": {"status": "completed"}}
+
+
+class TestMetricsAndErrors:
+    """MetricsCollector / ErrorAggregator 테스트"""
+
+    def test_counters_from_two_collectors_accumulate(self, project_root, db):
+        """두 수집기가 같은 날 기록해도 카운터 누락 없음"""
+        from core.utils.metrics_collector import MetricsCollector
+
+        night_worker, dashboard = MetricsCollector(db=db), MetricsCollector(db=db)
+        night_worker.record_publish(True)
+        dashboard.record_publish(False, retry_count=2)
+        night_worker.record_health_check(True)
+
+        today = MetricsCollector(db=db).get_or_create_daily()
+        assert (today.publish_attempts, today.publish_success, today.publish_fail) == (2, 1, 1)
+        assert today.retry_count == 2 and today.health_checks_total == 1
+
+    def test_error_records_are_appended(self, project_root, db):
+        """에러는 행 추가, 일일 요약/최근 심각 에러는 DB 조회"""
+        from core.utils.error_aggregator import ErrorAggregator, ErrorSeverity
+
+        aggregator = ErrorAggregator(db=db)
+        for _ in range(2):
+            aggregator.record_error("Connection refused", "cloudinary")
+        aggregator.record_error("disk full", "worker", severity=ErrorSeverity.CRITICAL)
+
+        summary = ErrorAggregator(db=db).get_daily_summary()
+        assert summary["total"] == 3 and summary["unique_errors"] == 2
+        assert summary["top_errors"][0]["count"] == 2
+        assert len(aggregator.get_recent_critical()) == 3
+        assert aggregator.errors["date"] == datetime.now().strftime("%Y-%m-%d")
+
+
+class TestRetryAndABTests:
+    """RetryManager / ABTestManager 테스트"""
+
+    def test_retry_failures_keep_latest_per_topic(self, tmp_path):
+        """토픽당 최신 실패 1건, publish_schedule.json 은 건드리지 않음"""
+        from core.utils.retry_manager import RetryManager
+
+        schedule_path = tmp_path / "publish_schedule.json"
+        schedule = {"scheduled": [], "failed": [{"id": 3, "topic": "kiwi", "status": "failed"}]}
+        schedule_path.write_text(json.dumps(schedule), encoding="utf-8")
+
+        manager = RetryManager(schedule_path=schedule_path)
+        manager._record_failure("apple", "사과", 1, "timeout", datetime.now())
+        manager._record_failure("apple", "사과", 3, "timeout", None)
+        manager._record_failure("pear", "배", 1, "500", datetime.now())
+
+        assert [f["topic"] for f in manager.get_pending_retries()] == ["pear"]
+        assert [f["attempt"] for f in manager.get_exhausted_items()] == [3]
+        assert manager.reset_retry_count("apple") is True
+        assert manager.clear_failure_record("pear") is True
+        assert [f["topic"] for f in RetryManager(schedule_path=schedule_path).get_pending_retries()] == ["apple"]
+        assert json.loads(schedule_path.read_text(encoding="utf-8")) == schedule
+
+    def test_unexpected_legacy_shape_does_not_block_startup(self, tmp_path):
+        """예상과 다른 구조의 기존 JSON (최상위 list, failed 항목이 dict 아님) → 생성은 되고 가져오기는 재시도"""
+        from core.utils.retry_manager import RetryManager
+        from support.utils.state_store import StateStore
+
+        store_path = tmp_path / "states.json"
+        store_path.write_text(json.dumps(["apple", "banana"]), encoding="utf-8")
+        schedule_path = tmp_path / "publish_schedule.json"
+        schedule_path.write_text(json.dumps({"scheduled": [], "failed": ["kiwi", 3]}), encoding="utf-8")
+
+        store = StateStore(store_path=str(store_path))
+        manager = RetryManager(schedule_path=schedule_path)
+        assert store.states == {} and manager.get_pending_retries() == []
+        assert store.db.query("SELECT * FROM json_imports") == []
+
+        store_path.write_text(json.dumps({"apple": {"status": "completed"}}), encoding="utf-8")
+        assert set(StateStore(store_path=str(store_path)).states) == {"apple"}
+
+    def test_ab_tests_persist_per_row(self, tmp_path):
+        """테스트별 행 저장, 새 인스턴스에서 복구"""
+        from core.utils.ab_test_manager import ABTestManager, TestVariable
+
+        data_path = tmp_path / "ab_tests.json"
+        manager = ABTestManager(data_path=str(data_path))
+        test = manager.create_test(topic_en="apple", topic_kr="사과", variable=TestVariable.CAPTION,
+                                   hypothesis="짧은 캡션이 유리")
+        manager.register_variant(test.test_id, "A", post_id="111")
+        manager.update_metrics(test.test_id, "A", likes=40, comments=5)
+
+        restored = ABTestManager(data_path=str(data_path)).get_test(test.test_id)
+        assert restored.variant_a.post_id == "111"
+        assert restored.variant_a.metrics.likes == 40
+        assert not data_path.exists()
@@ -0,0 +1,119 @@
+"""
+TraceManager JSONL 트레이스 로그 단위 테스트
+
+테스트 대상:
+- 컨텍스트 종료 시 일괄 기록 / 추가 전용 세그먼트 (core.utils.trace_manager)
+- 인덱스 기반 히스토리 / 최근 목록 조회
+- 구간별 duration_ms
+"""
+
+import json
+import pytest
+from pathlib import Path
+import sys
+
+# 04_pipeline 경로 추가
+ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(ROOT))
+
+
+# ==============================================================================
+# Fixtures
+# ==============================================================================
+
+@pytest.fixture
+def trace_module(tmp_path, monkeypatch):
+    """트레이스 로그를 임시 폴더로"""
+    from core.utils import trace_manager
+
+    monkeypatch.setattr(trace_manager, "LOG_DIR", tmp_path)
+    monkeypatch.setattr(trace_manager.TraceManager, "_buffers", {})
+    monkeypatch.setattr(trace_manager.TraceManager, "_open_contexts", {})
+    return trace_manager
+
+
+def _segment_lines(log_dir: Path):
+    return [json.loads(line) for seg in sorted((log_dir / "segments").glob("*.jsonl"))
+            for line in seg.read_text(encoding="utf-8").splitlines()]
+
+
+# ==============================================================================
+# Trace Log Tests
+# ==============================================================================
+
+class TestTraceLog:
+    """버퍼링 / 세그먼트 / 인덱스 테스트"""
+
+    def test_events_buffered_until_context_exit(self, trace_module, tmp_path):
+        """컨텍스트 안에서는 기록하지 않고 종료 시 한 번에 추가"""
+        TraceManager = trace_module.TraceManager
+
+        with TraceManager.trace_context(operation="publish") as trace_id:
+            for i in range(5):
+                trace_module.log_trace_event("STEP", {"i": i})
+            assert _segment_lines(tmp_path) == []
+
+        lines = _segment_lines(tmp_path)
+        assert [line["event"] for line in lines] == ["TRACE_START"] + ["STEP"] * 5 + ["TRACE_END"]
+        assert {line["trace_id"] for line in lines} == {trace_id}
+        assert lines[-1]["data"]["duration_ms"] >= 0
+        assert not list(tmp_path.glob("SF-*.json"))
+
+    def test_history_and_recent_from_index(self, trace_module, tmp_path):
+        """히스토리는 인덱스 오프셋부터, 최근 목록은 인덱스만으로"""
+        TraceManager = trace_module.TraceManager
+
+        with TraceManager.trace_context(operation="first") as first:
+            trace_module.log_trace_event("A")
+        with TraceManager.trace_context(operation="second") as second:
+            trace_module.log_trace_event("B")
+
+        manager = TraceManager()
+        history = manager.get_trace_history(first)
+        assert [e["event"] for e in history["events"]] == ["TRACE_START", "A", "TRACE_END"]
+        assert history["created_at"] == history["events"][0]["timestamp"]
+
+        index = json.loads((tmp_path / "trace_index.json").read_text(encoding="utf-8"))
+        assert index[second]["offset"] > index[first]["offset"]
+
+        recent = manager.get_recent_traces(limit=1)
+        assert recent == [{
+            "trace_id": second,
+            "created_at": index[second]["created_at"],
+            "updated_at": index[second]["updated_at"],
+            "event_count": 3,
+            "last_event": "TRACE_END",
+        }]
+
+    def test_traced_decorator_records_duration(self, trace_module):
+        """traced 함수는 FUNC_RETURN 에 duration_ms, 중첩 시 parent_trace_id"""
+        TraceManager = trace_module.TraceManager
+
+        @trace_module.traced("inner_op")
+        def inner():
+            return trace_module.get_trace_id()
+
+        with TraceManager.trace_context(operation="outer") as outer_id:
+            inner_id = inner()
+
+        events = TraceManager().get_trace_history(inner_id)["events"]
+        assert events[0]["data"]["parent_trace_id"] == outer_id
+        func_return = next(e for e in events if e["event"] == "FUNC_RETURN")
+        assert func_return["data"]["duration_ms"] >= 0
+
+    def test_index_is_rolling(self, trace_module, monkeypatch):
+        """인덱스는 최근 INDEX_LIMIT 개만 유지, 빠진 트레이스는 세그먼트 스캔으로 조회"""
+        monkeypatch.setattr(trace_module, "INDEX_LIMIT", 2)
+        TraceManager = trace_module.TraceManager
+
+        ids = []
+        for i in range(3):
+            with TraceManager.trace_context(operation=f"op{i}") as trace_id:
+                ids.append(trace_id)
+
+        manager = TraceManager()
+        assert [t["trace_id"] for t in manager.get_recent_traces(10)] == [ids[2], ids[1]]
+        dropped = manager.get_trace_history(ids[0])
+        assert [e["event"] for e in dropped["events"]] == ["TRACE_START", "TRACE_END"]
+        assert dropped["events"][0]["data"]["operation"] == "op0"
+        assert manager.get_trace_history("missing-trace") is None
@@ -0,0 +1,140 @@
+"""
+VisionLLM 단위 테스트
+
+테스트 대상:
+- 스레드 풀 병렬 호출 (support.utils.vision_llm)
+- (이미지 해시, 프롬프트 해시, 모델) 응답 캐시
+- StubBackend / 일괄 분석
+"""
+
+import json
+import threading
+import time
+import pytest
+from pathlib import Path
+import sys
+
+# 04_pipeline 경로 추가
+ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(ROOT))
+
+
+# ==============================================================================
+# Fixtures
+# ==============================================================================
+
+@pytest.fixture
+def images(tmp_path):
+    """서로 다른 바이트의 이미지 파일 3장"""
+    paths = []
+    for i in range(3):
+        path = tmp_path / f"apple_{i:02d}.png"
+        path.write_bytes(f"png-{i}".encode())
+        paths.append(str(path))
+    return paths
+
+
+class SlowBackend:
+    """동시 실행 수 측정용 백엔드"""
+
+    def __init__(self, delay: float = 0.05):
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def generate(self, model, prompt, images):
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        return json.dumps({"total": 21, "prompt": prompt, "images": len(images)})
+
+
+# ==============================================================================
+# VisionLLM Tests
+# ==============================================================================
+
+class TestVisionLLM:
+    """비동기 호출 / 캐시 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_batch_runs_concurrently_with_limit(self, images):
+        """analyze_batch: 병렬 실행, max_concurrency 이하, 요청 순서 유지"""
+        from support.utils.vision_llm import VisionLLM
+
+        backend = SlowBackend()
+        vlm = VisionLLM(backend=backend, max_concurrency=2, disk_cache=False)
+
+        results = await vlm.analyze_batch([(images, f"prompt-{i}") for i in range(4)])
+
+        assert backend.peak == 2
+        assert [json.loads(r["response"])["prompt"] for r in results] == [f"prompt-{i}" for i in range(4)]
+        assert all(r["image_count"] == 3 for r in results)
+
+    @pytest.mark.asyncio
+    async def test_response_cache_keyed_on_content_prompt_model(self, images, tmp_path):
+        """같은 내용/프롬프트/모델은 캐시, 하나라도 바뀌면 재호출"""
+        from support.utils.vision_llm import StubBackend, VisionLLM
+
+        backend = StubBackend()
+        vlm = VisionLLM(backend=backend, cache_dir=tmp_path / "cache", disk_cache=True)
+
+        first = await vlm.analyze_images(images, "평가")
+        second = await vlm.analyze_images(images, "평가")
+        assert (first["cached"], second["cached"], backend.calls) == (False, True, 1)
+
+        await vlm.analyze_images(images, "다른 평가")
+        Path(images[0]).write_bytes(b"edited")
+        await vlm.analyze_images(images, "평가")
+        vlm.model_name = "gemini-other"
+        await vlm.analyze_images(images[1:], "평가")
+        assert backend.calls == 4
+
+        # 디스크 캐시: 새 인스턴스에서도 재사용
+        other = VisionLLM(backend=backend, cache_dir=tmp_path / "cache", disk_cache=True)
+        assert (await other.analyze_images(images, "평가"))["cached"]
+        assert backend.calls == 4
+
+    @pytest.mark.asyncio
+    async def test_errors_are_not_cached(self, images):
+        """백엔드 예외는 vlm_used=False, 캐시하지 않음"""
+        from support.utils.vision_llm import StubBackend, VisionLLM
+
+        def flaky(prompt, imgs):
+            raise TimeoutError("429 quota")
+
+        vlm = VisionLLM(backend=StubBackend(flaky), disk_cache=False)
+        result = await vlm.analyze_image(images[0], "평가")
+
+        assert result == {"error": "429 quota", "vlm_used": False}
+        assert vlm.stats == {"calls": 0, "cache_hits": 0}
+
+    @pytest.mark.asyncio
+    async def test_memory_cache_is_bounded(self, images, monkeypatch):
+        """메모리 응답 캐시는 RESPONSE_CACHE_SIZE 이하 (오래된 항목부터 제거)"""
+        from support.utils import vision_llm
+        from support.utils.vision_llm import StubBackend, VisionLLM
+
+        monkeypatch.setattr(vision_llm, "RESPONSE_CACHE_SIZE", 2)
+        with VisionLLM(backend=StubBackend(), disk_cache=False) as vlm:
+            for prompt in ("a", "b", "c"):
+                await vlm.analyze_image(images[0], prompt)
+            assert len(vlm._responses) == 2
+
+            await vlm.analyze_image(images[0], "a")
+            assert vlm.stats == {"calls": 4, "cache_hits": 0}
+
+    def test_bad_concurrency_env_and_close(self, monkeypatch):
+        """잘못된 VISION_LLM_MAX_CONCURRENCY 는 기본값, close() 후 스레드 풀 종료"""
+        from support.utils.vision_llm import DEFAULT_MAX_CONCURRENCY, StubBackend, VisionLLM
+
+        monkeypatch.setenv("VISION_LLM_MAX_CONCURRENCY", "four")
+        vlm = VisionLLM(backend=StubBackend(), disk_cache=False)
+        assert vlm.max_concurrency == DEFAULT_MAX_CONCURRENCY
+
+        vlm.close()
+        with pytest.raises(RuntimeError):
+            vlm._executor.submit(lambda: None)
@@ -1,18 +1,21 @@
 """
 파이프라인 상태 영구 저장
-- JSON 파일 기반
+- SQLite(WAL) 기반 (core.state_db, pipeline_states 테이블)
 - 재시작 시 상태 복구
 - 히스토리 관리
+- 기존 JSON 파일은 최초 1회 가져오기
 
 Phase 3: 상태 저장소
 """
 
-import json
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, Any, Optional, List
 
+from core.state_db import dumps, get_state_db, loads
+
 ROOT = Path(__file__).parent.parent
+DEFAULT_STORE_PATH = "data/pipeline_states.json"
 
 
 class StateStore:
@@ -20,32 +23,49 @@ class StateStore:
     파이프라인 상태 영구 저장소
 
     Features:
-    - JSON 파일 기반 저장
+    - SQLite 기반 저장 (상태 1건 저장 = 행 1개 UPSERT)
     - 재시작 시 상태 복구
     - 미완료 파이프라인 조회
     - 히스토리 관리
+
+    store_path 가 기본값이 아니면 같은 위치의 .db 파일을 사용 (테스트/별도 저장소 격리)
     """
 
-    def __init__(self, store_path: str = "data/pipeline_states.json"):
+    def __init__(self, store_path: str = DEFAULT_STORE_PATH, db_path: Optional[str] = None):
         self.store_path = ROOT / store_path
         self.store_path.parent.mkdir(parents=True, exist_ok=True)
-        self._load()
-
-    def _load(self):
-        """저장된 상태 로드"""
-        if self.store_path.exists():
-            try:
-                with open(self.store_path, "r", encoding="utf-8") as f:
-                    self.states = json.load(f)
-            except json.JSONDecodeError:
-                self.states = {}
-        else:
-            self.states = {}
+        if db_path is None and store_path != DEFAULT_STORE_PATH:
+            db_path = self.store_path.with_suffix(".db")
+        self.db = get_state_db(db_path)
+        self.db.import_json_once(self.store_path, "pipeline_states", self._import_states)
+
+    def _import_states(self, data: Dict) -> int:
+        """기존 pipeline_states.json 가져오기"""
+        for food_name, state in data.items():
+            self._upsert(food_name, state)
+        return len(data)
+
+    def _upsert(self, food_name: str, state_dict: Dict) -> None:
+        self.db.execute(
+            """
+            INSERT INTO pipeline_states (food_name, status, updated_at, saved_at, data)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT (food_name) DO UPDATE SET
+                status = excluded.status, updated_at = excluded.updated_at,
+                saved_at = excluded.saved_at, data = excluded.data
+            """,
+            (food_name, _text(state_dict.get("status")), _text(state_dict.get("updated_at")),
+             state_dict.get("_saved_at") or datetime.now().isoformat(), dumps(state_dict)),
+        )
 
-    def _save(self):
-        """상태 저장"""
-        with open(self.store_path, "w", encoding="utf-8") as f:
-            json.dump(self.states, f, ensure_ascii=False, indent=2, default=str)
+    def _select(self, where: str = "", params: tuple = ()) -> Dict[str, Dict]:
+        rows = self.db.query(f"SELECT food_name, data FROM pipeline_states {where}", params)
+        return {row["food_name"]: loads(row["data"], {}) for row in rows}
+
+    @property
+    def states(self) -> Dict[str, Dict]:
+        """전체 상태 {food_name: state}"""
+        return self._select()
 
     def save_state(self, food_name: str, state: Any) -> None:
         """
@@ -67,8 +87,7 @@ class StateStore:
 
         state_dict["_saved_at"] = datetime.now().isoformat()
 
-        self.states[food_name] = state_dict
-        self._save()
+        self._upsert(food_name, state_dict)
 
     def get_state(self, food_name: str) -> Optional[Dict]:
         """
@@ -80,7 +99,8 @@ class StateStore:
         Returns:
             상태 dict 또는 None
         """
-        return self.states.get(food_name)
+        row = self.db.query_one("SELECT data FROM pipeline_states WHERE food_name = ?", (food_name,))
+        return loads(row["data"], {}) if row else None
 
     def get_pending_pipelines(self) -> Dict[str, Dict]:
         """
@@ -89,10 +109,7 @@ class StateStore:
         Returns:
             {food_name: state} 형태의 dict
         """
-        return {
-            k: v for k, v in self.states.items()
-            if v.get("status") not in ["completed", "failed"]
-        }
+        return self._select("WHERE status IS NULL OR status NOT IN ('completed', 'failed')")
 
     def get_failed_pipelines(self) -> Dict[str, Dict]:
         """
@@ -101,10 +118,7 @@ class StateStore:
         Returns:
             {food_name: state} 형태의 dict
         """
-        return {
-            k: v for k, v in self.states.items()
-            if v.get("status") == "failed"
-        }
+        return self._select("WHERE status = ?", ("failed",))
 
     def get_completed_pipelines(self) -> Dict[str, Dict]:
         """
@@ -113,14 +127,11 @@ class StateStore:
         Returns:
             {food_name: state} 형태의 dict
         """
-        return {
-            k: v for k, v in self.states.items()
-            if v.get("status") == "completed"
-        }
+        return self._select("WHERE status = ?", ("completed",))
 
     def get_all_states(self) -> Dict[str, Dict]:
         """전체 상태 조회"""
-        return self.states.copy()
+        return self.states
 
     def delete_state(self, food_name: str) -> bool:
         """
@@ -132,11 +143,8 @@ class StateStore:
         Returns:
             삭제 성공 여부
         """
-        if food_name in self.states:
-            del self.states[food_name]
-            self._save()
-            return True
-        return False
+        cursor = self.db.execute("DELETE FROM pipeline_states WHERE food_name = ?", (food_name,))
+        return cursor.rowcount > 0
 
     def get_history(self, limit: int = 10) -> List[Dict]:
         """
@@ -148,12 +156,11 @@ class StateStore:
         Returns:
             최근 상태 리스트 (최신순)
         """
-        sorted_states = sorted(
-            self.states.items(),
-            key=lambda x: x[1].get("updated_at", ""),
-            reverse=True
+        rows = self.db.query(
+            "SELECT food_name, data FROM pipeline_states ORDER BY COALESCE(updated_at, '') DESC LIMIT ?",
+            (limit,),
         )
-        return [{"food_name": k, **v} for k, v in sorted_states[:limit]]
+        return [{"food_name": row["food_name"], **loads(row["data"], {})} for row in rows]
 
     def get_statistics(self) -> Dict[str, Any]:
         """
@@ -162,16 +169,17 @@ class StateStore:
         Returns:
             통계 정보 dict
         """
-        total = len(self.states)
-        completed = len(self.get_completed_pipelines())
-        failed = len(self.get_failed_pipelines())
-        pending = len(self.get_pending_pipelines())
+        states = self.states
+        total = len(states)
+        completed = sum(1 for v in states.values() if v.get("status") == "completed")
+        failed = sum(1 for v in states.values() if v.get("status") == "failed")
+        pending = total - completed - failed
 
         # 평균 점수 계산
         tech_scores = []
         creative_scores = []
 
-        for state in self.states.values():
+        for state in states.values():
             if state.get("tech_review_score"):
                 tech_scores.append(state["tech_review_score"])
             if state.get("creative_review_score"):
@@ -189,8 +197,14 @@ class StateStore:
 
     def clear_all(self) -> None:
         """모든 상태 삭제 (주의!)"""
-        self.states = {}
-        self._save()
+        self.db.execute("DELETE FROM pipeline_states")
+
+
+def _text(value: Any) -> Optional[str]:
+    """인덱스 컬럼용 문자열 (Enum 은 value)"""
+    if value is None:
+        return None
+    return str(getattr(value, "value", value))
 
 
 # 테스트
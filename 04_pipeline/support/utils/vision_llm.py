@@ -4,31 +4,119 @@ Gemini Vision을 사용한 이미지 분석
 
 Phase 7: VLM 자동검수 시스템 (Gemini 버전)
 비용: $0 (Gemini Free Tier)
+
+비동기/캐시:
+- 모델 호출은 제한된 스레드 풀에서 실행 (이벤트 루프 비차단, asyncio.gather 시 실제 병렬)
+- 이미지 파일은 (경로, mtime, 크기) 기준 1회만 읽고 원본 바이트 그대로 전달 (재인코딩 없음)
+- 응답 캐시: (이미지 내용 해시, 프롬프트 해시, 모델) 키, 메모리 + .cache/vision_llm/
+- analyze_batch: 여러 (이미지, 프롬프트) 요청을 한 번에 병렬 실행
+- StubBackend: API 없이 테스트용 고정 응답
+
+환경 변수:
+    VISION_LLM_CACHE=off           디스크 응답 캐시 끄기
+    VISION_LLM_MAX_CONCURRENCY=4   동시 호출 수
+
+스레드 풀은 인스턴스별로 생성되므로 사용 후 close() 또는 with 문으로 종료.
 """
 
 import os
 import base64
+import hashlib
 import json
+import asyncio
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import Callable, List, Dict, Any, Optional, Sequence, Tuple
 
 ROOT = Path(__file__).parent.parent
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+CACHE_DIR = PROJECT_ROOT / ".cache" / "vision_llm"
 
 # 새로운 google-genai 패키지 임포트
 try:
     from google import genai
+    from google.genai import types as genai_types
     GEMINI_AVAILABLE = True
 except ImportError:
     GEMINI_AVAILABLE = False
     genai = None
+    genai_types = None
 
-# PIL 임포트
-try:
-    from PIL import Image
-    PIL_AVAILABLE = True
-except ImportError:
-    PIL_AVAILABLE = False
-    Image = None
+DEFAULT_MAX_CONCURRENCY = 4
+IMAGE_CACHE_SIZE = 64
+RESPONSE_CACHE_SIZE = 512
+
+MIME_TYPES = {
+    ".png": "image/png",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".webp": "image/webp",
+}
+
+
+class ImageBlob:
+    """모델 입력용 이미지 (원본 바이트 + 내용 해시)"""
+
+    __slots__ = ("path", "data", "mime_type", "sha256")
+
+    def __init__(self, path: str, data: bytes, mime_type: str):
+        self.path = path
+        self.data = data
+        self.mime_type = mime_type
+        self.sha256 = hashlib.sha256(data).hexdigest()
+
+
+# ============================================
+# 백엔드
+# ============================================
+
+class GeminiBackend:
+    """google-genai 동기 클라이언트 (스레드 풀에서 호출)"""
+
+    def __init__(self, client):
+        self.client = client
+
+    def generate(self, model: str, prompt: str, images: Sequence[ImageBlob]) -> str:
+        parts = [genai_types.Part.from_bytes(data=img.data, mime_type=img.mime_type) for img in images]
+        response = self.client.models.generate_content(model=model, contents=[prompt] + parts)
+        return response.text
+
+
+class StubBackend:
+    """
+    테스트용 로컬 백엔드 (API 호출 없음)
+
+    responder(prompt, images) -> 응답 텍스트. 없으면 항목별 4점 JSON.
+    """
+
+    def __init__(self, responder: Optional[Callable[[str, Sequence[ImageBlob]], str]] = None):
+        self.responder = responder
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def generate(self, model: str, prompt: str, images: Sequence[ImageBlob]) -> str:
+        with self._lock:
+            self.calls += 1
+        if self.responder:
+            return self.responder(prompt, images)
+        return json.dumps({
+            "scores": {}, "total": 20, "similarity_score": 80,
+            "feedback": f"stub ({len(images)} images)", "gaps": [], "strengths": [], "improvements": []
+        }, ensure_ascii=False)
+
+
+def _disk_cache_enabled() -> bool:
+    return os.getenv("VISION_LLM_CACHE", "on").lower() not in ("0", "off", "false", "no")
+
+
+def default_max_concurrency() -> int:
+    """동시 호출 수 (VISION_LLM_MAX_CONCURRENCY 환경 변수, 잘못된 값이면 4)"""
+    try:
+        return max(1, int(os.getenv("VISION_LLM_MAX_CONCURRENCY", DEFAULT_MAX_CONCURRENCY)))
+    except ValueError:
+        return DEFAULT_MAX_CONCURRENCY
 
 
 class VisionLLM:
@@ -48,38 +136,147 @@ class VisionLLM:
     비용: $0 (Gemini Free Tier - 15 RPM, 1500 RPD)
     """
 
-    def __init__(self, api_key: str = None):
+    def __init__(self, api_key: str = None, backend=None, max_concurrency: Optional[int] = None,
+                 cache_dir: Optional[Path] = None, disk_cache: Optional[bool] = None):
         """
         VisionLLM 초기화
 
         Args:
             api_key: Gemini API 키 (없으면 환경변수에서 로드)
+            backend: generate(model, prompt, images) 백엔드 (예: StubBackend)
+            max_concurrency: 동시 모델 호출 수
+            cache_dir: 디스크 응답 캐시 폴더 (기본: .cache/vision_llm)
+            disk_cache: 디스크 캐시 사용 여부 (기본: VISION_LLM_CACHE 환경 변수, 켜짐)
         """
         self.api_key = api_key or os.getenv("GEMINI_API_KEY")
         self.client = None
         self.model_name = "gemini-2.0-flash"  # 최신 모델
-        self._initialized = False
+        self.backend = backend
+        self._initialized = backend is not None
 
-        if GEMINI_AVAILABLE and self.api_key:
+        if backend is None and GEMINI_AVAILABLE and self.api_key:
             try:
                 self.client = genai.Client(api_key=self.api_key)
+                self.backend = GeminiBackend(self.client)
                 self._initialized = True
             except Exception as e:
                 print(f"[VisionLLM] Gemini 초기화 실패: {e}")
 
+        self.max_concurrency = max_concurrency or default_max_concurrency()
+        self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="vision_llm")
+        if disk_cache is None:
+            disk_cache = _disk_cache_enabled()
+        self.cache_dir = Path(cache_dir or CACHE_DIR) if disk_cache else None
+        self._responses: "OrderedDict[str, str]" = OrderedDict()
+        self._images: "OrderedDict[Tuple[str, int, int], ImageBlob]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"calls": 0, "cache_hits": 0}
+
     def is_available(self) -> bool:
         """VLM 사용 가능 여부"""
-        return self._initialized and self.client is not None
+        return self._initialized and self.backend is not None
+
+    def close(self):
+        """스레드 풀 종료 (진행 중 호출은 완료 대기)"""
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> "VisionLLM":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
 
-    def _load_image(self, image_path: str) -> Optional[Any]:
-        """이미지 로드"""
-        if not PIL_AVAILABLE:
+    def _load_blob(self, image_path: str) -> Optional[ImageBlob]:
+        """이미지 원본 바이트 로드 (경로/mtime/크기 기준 메모리 캐시)"""
+        try:
+            st = os.stat(image_path)
+        except OSError as e:
+            print(f"[VisionLLM] 이미지 로드 실패: {image_path} - {e}")
             return None
+        key = (str(image_path), st.st_mtime_ns, st.st_size)
+        with self._lock:
+            blob = self._images.get(key)
+            if blob is not None:
+                self._images.move_to_end(key)
+                return blob
         try:
-            return Image.open(image_path)
-        except Exception as e:
+            with open(image_path, "rb") as f:
+                data = f.read()
+        except OSError as e:
             print(f"[VisionLLM] 이미지 로드 실패: {image_path} - {e}")
             return None
+        mime_type = MIME_TYPES.get(Path(image_path).suffix.lower(), "image/png")
+        blob = ImageBlob(str(image_path), data, mime_type)
+        with self._lock:
+            self._images[key] = blob
+            while len(self._images) > IMAGE_CACHE_SIZE:
+                self._images.popitem(last=False)
+        return blob
+
+    # ---------- 응답 캐시 ----------
+
+    def _cache_key(self, prompt: str, images: Sequence[ImageBlob]) -> str:
+        prompt_hash = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+        material = "|".join([self.model_name, prompt_hash] + [img.sha256 for img in images])
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def _remember(self, key: str, text: str):
+        """메모리 응답 캐시 (RESPONSE_CACHE_SIZE 초과 시 오래된 항목부터 제거)"""
+        with self._lock:
+            self._responses[key] = text
+            self._responses.move_to_end(key)
+            while len(self._responses) > RESPONSE_CACHE_SIZE:
+                self._responses.popitem(last=False)
+
+    def _cache_get(self, key: str) -> Optional[str]:
+        with self._lock:
+            if key in self._responses:
+                self._responses.move_to_end(key)
+                return self._responses[key]
+        if self.cache_dir is None:
+            return None
+        try:
+            with open(self.cache_dir / f"{key}.json", "r", encoding="utf-8") as f:
+                text = json.load(f)["response"]
+        except (OSError, ValueError, KeyError):
+            return None
+        self._remember(key, text)
+        return text
+
+    def _cache_put(self, key: str, text: str):
+        self._remember(key, text)
+        if self.cache_dir is None:
+            return
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            path = self.cache_dir / f"{key}.json"
+            tmp_path = path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"model": self.model_name, "response": text}, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
+
+    async def _generate(self, prompt: str, images: Sequence[ImageBlob]) -> Dict[str, Any]:
+        """모델 호출 (캐시 확인 후 스레드 풀에서 실행)"""
+        key = self._cache_key(prompt, images)
+        cached = self._cache_get(key)
+        if cached is not None:
+            with self._lock:
+                self.stats["cache_hits"] += 1
+            return {"response": cached, "vlm_used": True, "cached": True}
+
+        loop = asyncio.get_running_loop()
+        try:
+            text = await loop.run_in_executor(
+                self._executor, self.backend.generate, self.model_name, prompt, list(images)
+            )
+        except Exception as e:
+            return {"error": str(e), "vlm_used": False}
+        with self._lock:
+            self.stats["calls"] += 1
+        self._cache_put(key, text)
+        return {"response": text, "vlm_used": True, "cached": False}
 
     def _parse_json_response(self, response_text: str) -> Dict:
         """JSON 응답 파싱"""
@@ -113,21 +310,11 @@ class VisionLLM:
         if not self.is_available():
             return {"error": "VLM 미연결", "vlm_used": False}
 
-        image = self._load_image(image_path)
+        image = self._load_blob(image_path)
         if image is None:
             return {"error": f"이미지 로드 실패: {image_path}", "vlm_used": False}
 
-        try:
-            response = self.client.models.generate_content(
-                model=self.model_name,
-                contents=[prompt, image]
-            )
-            return {
-                "response": response.text,
-                "vlm_used": True
-            }
-        except Exception as e:
-            return {"error": str(e), "vlm_used": False}
+        return await self._generate(prompt, [image])
 
     async def analyze_images(self, image_paths: List[str], prompt: str) -> Dict[str, Any]:
         """
@@ -144,29 +331,25 @@ class VisionLLM:
             return {"error": "VLM 미연결", "vlm_used": False}
 
         # 이미지 로드 (최대 5장)
-        images = []
-        for path in image_paths[:5]:
-            img = self._load_image(path)
-            if img:
-                images.append(img)
+        images = [img for img in (self._load_blob(p) for p in image_paths[:5]) if img]
 
         if not images:
             return {"error": "이미지 로드 실패", "vlm_used": False}
 
-        try:
-            # Gemini에 이미지들과 프롬프트 전달
-            contents = [prompt] + images
-            response = self.client.models.generate_content(
-                model=self.model_name,
-                contents=contents
-            )
-            return {
-                "response": response.text,
-                "vlm_used": True,
-                "image_count": len(images)
-            }
-        except Exception as e:
-            return {"error": str(e), "vlm_used": False}
+        result = await self._generate(prompt, images)
+        if result.get("vlm_used"):
+            result["image_count"] = len(images)
+        return result
+
+    async def analyze_batch(self, requests: Sequence[Tuple[List[str], str]]) -> List[Dict[str, Any]]:
+        """
+        여러 (이미지 목록, 프롬프트) 요청 병렬 분석 (요청 순서대로 결과)
+
+        동시 호출 수는 max_concurrency 로 제한돼요.
+        """
+        return list(await asyncio.gather(*(
+            self.analyze_images(paths, prompt) for paths, prompt in requests
+        )))
 
     async def analyze_aesthetic(self, image_paths: List[str]) -> Dict[str, Any]:
         """
@@ -380,10 +563,8 @@ JSON 형식으로만 응답:
             return {"similarity_score": 60, "feedback": "Gold Standard 이미지 없음", "gaps": [], "vlm_used": False}
 
         # 이미지 로드
-        content_imgs = [self._load_image(p) for p in content_images[:3]]
-        content_imgs = [img for img in content_imgs if img is not None]
-        gold_imgs = [self._load_image(p) for p in gold_images[:3]]
-        gold_imgs = [img for img in gold_imgs if img is not None]
+        content_imgs = [img for img in (self._load_blob(p) for p in content_images[:3]) if img]
+        gold_imgs = [img for img in (self._load_blob(p) for p in gold_images[:3]) if img]
 
         if not content_imgs or not gold_imgs:
             return {"similarity_score": 60, "feedback": "이미지 로드 실패", "gaps": [], "vlm_used": False}
@@ -416,18 +597,13 @@ JSON 형식으로만 응답:
     "strengths": ["잘된 점1", "잘된 점2"]
 }"""
 
-        try:
-            # Gold 이미지 먼저, 평가 대상 이미지 나중에
-            contents = [prompt] + gold_imgs + content_imgs
-            response = self.client.models.generate_content(
-                model=self.model_name,
-                contents=contents
-            )
-            parsed = self._parse_json_response(response.text)
-            parsed["vlm_used"] = True
-            return parsed
-        except Exception as e:
-            return {"similarity_score": 60, "feedback": str(e), "gaps": ["비교 실패"], "vlm_used": False}
+        # Gold 이미지 먼저, 평가 대상 이미지 나중에
+        result = await self._generate(prompt, gold_imgs + content_imgs)
+        if not result.get("vlm_used"):
+            return {"similarity_score": 60, "feedback": result.get("error"), "gaps": ["비교 실패"], "vlm_used": False}
+        parsed = self._parse_json_response(result["response"])
+        parsed["vlm_used"] = True
+        return parsed
 
     def _default_result(
         self,
@@ -23,8 +23,10 @@ from datetime import datetime
 import sys
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from pipeline.enums.safety import Safety, get_safety, SafetyError
+from caption_rules import get_caption_rules
 
 
 # =============================================================================
@@ -106,41 +108,14 @@ def validate_structure_ids(
 # §22.12 금지 키워드 정의 (강화)
 # =============================================================================
 
+# 키워드 정의: 02_config/caption_rules.json (caption_rules 엔진 1회 스캔으로 검사)
+_RULES = get_caption_rules()
+
 # FORBIDDEN에서 절대 금지
-FORBIDDEN_BLOCKED_KEYWORDS = [
-    "급여 방법",
-    "조리 방법",
-    "권장량",
-    "좋아요",
-    "맛있어요",
-    "맛있게",
-    "체중별 급여량",
-    "소형견 급여량",
-    "중형견 급여량",
-    "대형견 급여량",
-    "영양 가득",
-    "건강에 좋",
-    "건강에좋",
-    "드셔도 됩니다",
-    "먹여도 됩니다",
-    "먹여도 돼요",
-    "줘도 돼요",
-    "줘도 됩니다",
-    "영양 정보",
-    "영양정보",
-    "영양소",
-    "추천 급여량",
-    "하루 권장량",
-]
+FORBIDDEN_BLOCKED_KEYWORDS = _RULES.keywords("forbidden_blocked")
 
 # FORBIDDEN에서 금지되는 헤더 패턴
-FORBIDDEN_BLOCKED_HEADERS = [
-    "[이미지 3번: 영양 정보]",
-    "[이미지 3번: 영양정보]",
-    "[이미지 4번: 급여 방법]",
-    "[이미지 6번: 조리 방법]",
-    "[이미지 7번: 조리 방법]",
-]
+FORBIDDEN_BLOCKED_HEADERS = _RULES.keywords("forbidden_blocked_header")
 
 # FORBIDDEN 필수 헤더
 FORBIDDEN_REQUIRED_HEADERS = {
@@ -152,20 +127,15 @@ FORBIDDEN_REQUIRED_HEADERS = {
 
 # FORBIDDEN 필수 키워드 (하나 이상 포함 필요)
 FORBIDDEN_REQUIRED_KEYWORDS = {
-    "danger_warning": ["위험", "금지", "절대", "독성", "치명"],
-    "emergency": ["응급", "병원", "대처", "증상"],
-    "vet": ["수의사", "상담", "진료"],
-    "zero_amount": ["0g", "절대 금지"],
+    category: _RULES.keywords(f"forbidden_required:{category}")
+    for category in ("danger_warning", "emergency", "vet", "zero_amount")
 }
 
 # CTA 필수 문구
-CTA_REQUIRED = [
-    "같은 보호자",
-    "댓글",
-]
+CTA_REQUIRED = _RULES.keywords("post_cta")
 
 # AI 공개 필수
-AI_DISCLOSURE = "AI로 생성"
+AI_DISCLOSURE = _RULES.keywords("post_ai_disclosure")[0]
 
 
 # =============================================================================
@@ -248,17 +218,11 @@ def check_forbidden_keywords(
     if safety != Safety.FORBIDDEN:
         return True, []
 
-    violations = []
-
-    # 금지 키워드 검사
-    for keyword in FORBIDDEN_BLOCKED_KEYWORDS:
-        if keyword in caption:
-            violations.append(f"금지 키워드: '{keyword}'")
+    scan = _RULES.scan(caption)
 
-    # 금지 헤더 패턴 검사
-    for header in FORBIDDEN_BLOCKED_HEADERS:
-        if header in caption:
-            violations.append(f"금지 헤더: '{header}'")
+    # 금지 키워드 / 금지 헤더 패턴 검사
+    violations = [f"금지 키워드: '{keyword}'" for keyword in scan.matched("forbidden_blocked")]
+    violations += [f"금지 헤더: '{header}'" for header in scan.matched("forbidden_blocked_header")]
 
     return len(violations) == 0, violations
 
@@ -277,21 +241,12 @@ def check_required_headers(
         return True, []
 
     missing = []
+    scan = _RULES.scan(caption)
 
     for slide_num, header in FORBIDDEN_REQUIRED_HEADERS.items():
         if header not in caption:
             # 대안 확인 (슬라이드 번호 + 키워드)
-            alt_patterns = {
-                3: ["위험", "독성", "성분"],
-                4: ["금지", "절대"],
-                6: ["응급", "대처", "병원"],
-                7: ["수의사", "상담"],
-            }
-
-            keywords = alt_patterns.get(slide_num, [])
-            has_alt = any(kw in caption for kw in keywords)
-
-            if not has_alt:
+            if not scan.has(f"forbidden_header_alt:{slide_num}"):
                 missing.append(f"슬라이드 {slide_num}: {header} 또는 관련 키워드 필요")
 
     return len(missing) == 0, missing
@@ -311,10 +266,10 @@ def check_required_keywords(
         return True, []
 
     missing = []
+    scan = _RULES.scan(caption)
 
     for category, keywords in FORBIDDEN_REQUIRED_KEYWORDS.items():
-        has_any = any(kw in caption for kw in keywords)
-        if not has_any:
+        if not scan.has(f"forbidden_required:{category}"):
             missing.append(f"{category}: {keywords} 중 하나 필요")
 
     return len(missing) == 0, missing
@@ -328,14 +283,16 @@ def check_cta_and_disclosure(caption: str) -> Tuple[bool, List[str]]:
         (valid, missing)
     """
     missing = []
+    scan = _RULES.scan(caption)
 
     # CTA 필수 문구
+    found = scan.matched("post_cta")
     for req in CTA_REQUIRED:
-        if req not in caption:
+        if req not in found:
             missing.append(f"CTA 필수: '{req}'")
 
     # AI 공개
-    if AI_DISCLOSURE not in caption:
+    if not scan.has("post_ai_disclosure"):
         missing.append(f"AI 공개 필수: '{AI_DISCLOSURE}'")
 
     return len(missing) == 0, missing
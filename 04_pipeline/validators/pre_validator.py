@@ -10,7 +10,6 @@ v3.1: FORBIDDEN + 긍정 데이터 조합 차단
     validate_before_generation(food_id=127, safety=Safety.FORBIDDEN, food_data=data)
 """
 
-import json
 from typing import Dict, List, Tuple, Optional, Union
 from pathlib import Path
 from dataclasses import dataclass
@@ -19,15 +18,17 @@ from datetime import datetime
 import sys
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(PROJECT_ROOT / "04_pipeline"))
 
 from pipeline.enums.safety import Safety, get_safety, SafetyError
+from food_data_store import default_food_data_path, get_food_store
 
 
 # =============================================================================
 # 설정
 # =============================================================================
 
-FOOD_DATA_PATH = PROJECT_ROOT / "config" / "food_data.json"
+FOOD_DATA_PATH = default_food_data_path()
 LOGS_DIR = PROJECT_ROOT / "logs" / "validation"
 
 
@@ -308,10 +309,11 @@ def load_and_validate(food_id: int, strict: bool = True) -> PreValidationResult:
     Returns:
         PreValidationResult
     """
-    with open(FOOD_DATA_PATH, "r", encoding="utf-8") as f:
-        all_data = json.load(f)
+    store = get_food_store(FOOD_DATA_PATH)
+    if not store.exists():
+        raise FileNotFoundError(f"food_data.json 없음: {FOOD_DATA_PATH}")
 
-    food_data = all_data.get(str(food_id), {})
+    food_data = store.get(food_id, {})
     if not food_data:
         raise PreValidationError(f"Food ID {food_id} not found in food_data.json")
 
@@ -26,9 +26,14 @@ v3.1: 디자인 파라미터 (폰트, 간격, 그라데이션, 안전도 색상)
 """
 
 import os
-import re
+import sys
 from typing import Dict, Any, Optional
 
+# 숫자 폴더명 import 지원 (04_pipeline 형제 모듈)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from caption_rules import get_caption_rules
+
 # ============================================================
 # 🔴 CRITICAL: v3.0 설정값 (pasta_01 기준, 변경 금지)
 # ============================================================
@@ -593,20 +598,8 @@ def strip_emoji(text: str) -> str:
     if not text:
         return text
 
-    emoji_pattern = re.compile(
-        "["
-        "\U0001F600-\U0001F64F"
-        "\U0001F300-\U0001F5FF"
-        "\U0001F680-\U0001F6FF"
-        "\U0001F1E0-\U0001F1FF"
-        "\U00002702-\U000027B0"
-        "\U0001F900-\U0001F9FF"
-        "\U00002600-\U000026FF"
-        "\U00002700-\U000027BF"
-        "]+",
-        flags=re.UNICODE
-    )
-    cleaned = emoji_pattern.sub('', text).strip()
+    # 이모지 범위: 02_config/caption_rules.json regexes.emoji (1회 컴파일)
+    cleaned = get_caption_rules().strip_emoji(text)
 
     if cleaned != text:
         print(f"⚠️ 이모지 제거됨: '{text}' → '{cleaned}'")
@@ -136,3 +136,5 @@ class HealthResponse(BaseModel):
     version: str
     agents_loaded: int
     uptime_seconds: float
+    components: Dict[str, Dict[str, Any]] = {}  # 컴포넌트별 상태 (HealthChecker 스냅샷)
+    checked_at: Optional[str] = None
@@ -27,6 +27,7 @@ import json
 # 프로젝트 루트 추가
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "04_pipeline"))
 
 from services.api.models import (
     PipelineStartRequest, PipelineStartResponse, PipelineProgress,
@@ -35,6 +36,7 @@ from services.api.models import (
     ApprovalRequest, QualityGateResult, QualityGateType,
     HealthResponse
 )
+from core.utils.health_check import get_health_checker
 
 # ============================================================
 # 글로벌 상태 관리
@@ -60,8 +62,12 @@ async def lifespan(app: FastAPI):
     print("🌟 Project Sunshine API Server 시작")
     print(f"   버전: v5.0")
     print(f"   시간: {datetime.now().isoformat()}")
+    # 컴포넌트 헬스체크 스냅샷 백그라운드 갱신 (/health 는 스냅샷만 조회)
+    health_checker = get_health_checker()
+    health_checker.start_background_refresh()
     yield
     # Shutdown
+    await health_checker.stop_background_refresh()
     print("🌙 Project Sunshine API Server 종료")
 
 
@@ -202,11 +208,17 @@ async def serve_image(topic: str, filename: str):
 @app.get("/health", response_model=HealthResponse)
 async def health_check():
     """서버 상태 확인 (k8s/docker 헬스체크용)"""
+    checker = get_health_checker()
+    # 백그라운드 스냅샷 (첫 갱신 전이면 체크 실행, 체크별 캐시 / 타임아웃 적용)
+    health = checker.snapshot() or await checker.run_all_checks()
+    result = checker.to_dict(health)
     return HealthResponse(
-        status="healthy",
+        status=result["overall_status"],
         version="5.0.0",
         agents_loaded=8,  # 8개 에이전트
-        uptime_seconds=time.time() - SERVER_START_TIME
+        uptime_seconds=time.time() - SERVER_START_TIME,
+        components=result["components"],
+        checked_at=result["timestamp"]
     )
 
 
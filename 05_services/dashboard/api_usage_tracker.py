@@ -5,9 +5,12 @@ API 사용량 추적 및 비용 분석 모듈
 - Instagram Graph API
 - Cloudinary
 - Claude API (Anthropic)
+
+저장: core.state_db (api_usage 호출 1건 = 행 1개 INSERT, api_usage_daily 일별 합계 UPSERT)
 """
 
 import json
+import sys
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional
@@ -16,8 +19,10 @@ import os
 
 # 데이터 파일 경로
 ROOT = Path(__file__).parent.parent.parent
-USAGE_FILE = ROOT / "config" / "data" / "api_usage.json"
-USAGE_FILE.parent.mkdir(parents=True, exist_ok=True)
+USAGE_FILE = ROOT / "config" / "data" / "api_usage.json"  # 기존 JSON (최초 1회 가져오기)
+
+sys.path.insert(0, str(ROOT / "04_pipeline"))
+from core.state_db import StateDB, dumps, get_state_db, loads
 
 
 # ============================================
@@ -102,32 +107,94 @@ class APIUsageRecord:
 class APIUsageTracker:
     """API 사용량 추적 클래스"""
 
-    def __init__(self):
+    def __init__(self, db: Optional[StateDB] = None):
         self.usage_file = USAGE_FILE
-        self.data = self._load_data()
-
-    def _load_data(self) -> Dict:
-        """데이터 로드"""
-        if self.usage_file.exists():
-            try:
-                with open(self.usage_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except:
-                pass
+        self.db = db or get_state_db()
+        self.db.import_json_once(self.usage_file, "api_usage", self._import_data)
+
+    def _import_data(self, data: Dict) -> int:
+        """기존 api_usage.json 가져오기 (기록 + 일별 요약)"""
+        records = data.get("records", [])
+        self.db.executemany(
+            "INSERT INTO api_usage (timestamp, date, api_name, operation, count, tokens_input, "
+            "tokens_output, cost_usd, metadata) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [self._record_row(r) for r in records]
+        )
+        self.db.executemany(
+            "INSERT OR REPLACE INTO api_usage_daily (date, api_name, count, cost, tokens_input, tokens_output) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                (date, api_name, s.get("count", 0), s.get("cost", 0.0),
+                 s.get("tokens_input", 0), s.get("tokens_output", 0))
+                for date, apis in data.get("daily_summary", {}).items()
+                for api_name, s in apis.items()
+            ]
+        )
+        return len(records)
+
+    @staticmethod
+    def _record_row(record: Dict) -> tuple:
+        return (
+            record["timestamp"], record["timestamp"][:10], record["api_name"], record.get("operation"),
+            record.get("count", 1), record.get("tokens_input", 0), record.get("tokens_output", 0),
+            record.get("cost_usd", 0.0), dumps(record.get("metadata") or {}),
+        )
+
+    def _save_data(self, record: Dict):
+        """데이터 저장 (기록 1행 추가 + 일별 합계 갱신, 한 트랜잭션)"""
+        with self.db.transaction():
+            self.db.execute(
+                "INSERT INTO api_usage (timestamp, date, api_name, operation, count, tokens_input, "
+                "tokens_output, cost_usd, metadata) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                self._record_row(record)
+            )
+            self.db.execute(
+                """
+                INSERT INTO api_usage_daily (date, api_name, count, cost, tokens_input, tokens_output)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT (date, api_name) DO UPDATE SET
+                    count = count + excluded.count, cost = cost + excluded.cost,
+                    tokens_input = tokens_input + excluded.tokens_input,
+                    tokens_output = tokens_output + excluded.tokens_output
+                """,
+                (record["timestamp"][:10], record["api_name"], record["count"], record["cost_usd"],
+                 record["tokens_input"], record["tokens_output"])
+            )
+
+    def _summary(self, group: str, where: str = "", params: tuple = ()) -> Dict:
+        """{그룹 키: {api_name: {count, cost, tokens_input, tokens_output}}}"""
+        rows = self.db.query(
+            f"SELECT {group} AS key, api_name, SUM(count) AS count, SUM(cost) AS cost, "
+            f"SUM(tokens_input) AS tokens_input, SUM(tokens_output) AS tokens_output "
+            f"FROM api_usage_daily {where} GROUP BY key, api_name ORDER BY key",
+            params
+        )
+        summary: Dict[str, Dict] = {}
+        for row in rows:
+            summary.setdefault(row["key"], {})[row["api_name"]] = {
+                "count": row["count"],
+                "cost": row["cost"],
+                "tokens_input": row["tokens_input"],
+                "tokens_output": row["tokens_output"],
+            }
+        return summary
+
+    @property
+    def data(self) -> Dict:
+        """기존 JSON 구조 호환 뷰 (대시보드 등 읽기 전용)"""
+        rows = self.db.query(
+            "SELECT timestamp, api_name, operation, count, tokens_input, tokens_output, cost_usd, metadata "
+            "FROM api_usage ORDER BY id"
+        )
+        last = rows[-1]["timestamp"] if rows else None
         return {
-            "records": [],
-            "daily_summary": {},
-            "monthly_summary": {},
-            "total_cost": 0.0,
-            "last_updated": None
+            "records": [dict(row, metadata=loads(row["metadata"], {})) for row in rows],
+            "daily_summary": self._summary("date"),
+            "monthly_summary": self._summary("substr(date, 1, 7)"),
+            "total_cost": self.get_total_cost(),
+            "last_updated": last,
         }
 
-    def _save_data(self):
-        """데이터 저장"""
-        self.data["last_updated"] = datetime.now().isoformat()
-        with open(self.usage_file, 'w', encoding='utf-8') as f:
-            json.dump(self.data, f, ensure_ascii=False, indent=2)
-
     def log_usage(self,
                   api_name: str,
                   operation: str,
@@ -153,49 +220,8 @@ class APIUsageTracker:
             metadata=metadata or {}
         )
 
-        # 저장
-        self.data["records"].append(asdict(record))
-        self.data["total_cost"] += cost
-
-        # 일별 요약 업데이트
-        date_key = now.strftime("%Y-%m-%d")
-        if date_key not in self.data["daily_summary"]:
-            self.data["daily_summary"][date_key] = {}
-
-        if api_name not in self.data["daily_summary"][date_key]:
-            self.data["daily_summary"][date_key][api_name] = {
-                "count": 0,
-                "cost": 0.0,
-                "tokens_input": 0,
-                "tokens_output": 0
-            }
-
-        summary = self.data["daily_summary"][date_key][api_name]
-        summary["count"] += count
-        summary["cost"] += cost
-        summary["tokens_input"] += tokens_input
-        summary["tokens_output"] += tokens_output
-
-        # 월별 요약 업데이트
-        month_key = now.strftime("%Y-%m")
-        if month_key not in self.data["monthly_summary"]:
-            self.data["monthly_summary"][month_key] = {}
-
-        if api_name not in self.data["monthly_summary"][month_key]:
-            self.data["monthly_summary"][month_key][api_name] = {
-                "count": 0,
-                "cost": 0.0,
-                "tokens_input": 0,
-                "tokens_output": 0
-            }
-
-        month_summary = self.data["monthly_summary"][month_key][api_name]
-        month_summary["count"] += count
-        month_summary["cost"] += cost
-        month_summary["tokens_input"] += tokens_input
-        month_summary["tokens_output"] += tokens_output
-
-        self._save_data()
+        # 저장 (일별/월별 요약은 api_usage_daily 에서 집계)
+        self._save_data(asdict(record))
         return record
 
     def _calculate_cost(self, api_name: str, count: int,
@@ -219,30 +245,27 @@ class APIUsageTracker:
     def get_today_summary(self) -> Dict:
         """오늘 사용량 요약"""
         today = datetime.now().strftime("%Y-%m-%d")
-        return self.data["daily_summary"].get(today, {})
+        return self._summary("date", "WHERE date = ?", (today,)).get(today, {})
 
     def get_month_summary(self) -> Dict:
         """이번 달 사용량 요약"""
         month = datetime.now().strftime("%Y-%m")
-        return self.data["monthly_summary"].get(month, {})
+        return self._summary("substr(date, 1, 7)", "WHERE date LIKE ?", (f"{month}-%",)).get(month, {})
 
     def get_total_cost(self) -> float:
         """총 누적 비용"""
-        return self.data.get("total_cost", 0.0)
+        row = self.db.query_one("SELECT COALESCE(SUM(cost), 0.0) AS total FROM api_usage_daily")
+        return row["total"]
 
     def get_api_stats(self) -> Dict:
         """API별 통계"""
         stats = {}
+        month_summary = self.get_month_summary()
+        totals = self._summary("'all'").get("all", {})
         for api_name, pricing in API_PRICING.items():
-            month_data = self.get_month_summary().get(api_name, {})
-            total_count = sum(
-                d.get(api_name, {}).get("count", 0)
-                for d in self.data["daily_summary"].values()
-            )
-            total_cost = sum(
-                d.get(api_name, {}).get("cost", 0.0)
-                for d in self.data["daily_summary"].values()
-            )
+            month_data = month_summary.get(api_name, {})
+            total_count = totals.get(api_name, {}).get("count", 0)
+            total_cost = totals.get(api_name, {}).get("cost", 0.0)
 
             stats[api_name] = {
                 "name": pricing["name"],
@@ -260,10 +283,12 @@ class APIUsageTracker:
     def get_cost_projection(self, days: int = 30) -> Dict:
         """비용 예측"""
         # 최근 7일 평균 계산
+        since = (datetime.now() - timedelta(days=6)).strftime("%Y-%m-%d")
+        recent = self._summary("date", "WHERE date >= ?", (since,))
         recent_days = []
         for i in range(7):
             date = (datetime.now() - timedelta(days=i)).strftime("%Y-%m-%d")
-            daily = self.data["daily_summary"].get(date, {})
+            daily = recent.get(date, {})
             daily_cost = sum(v.get("cost", 0.0) for v in daily.values())
             recent_days.append(daily_cost)
 
@@ -279,12 +304,13 @@ class APIUsageTracker:
         """분석 리포트 생성"""
         stats = self.get_api_stats()
         projection = self.get_cost_projection()
+        period = self.db.query_one("SELECT MIN(date) AS start, MAX(date) AS end FROM api_usage_daily")
 
         return {
             "generated_at": datetime.now().isoformat(),
             "period": {
-                "start": min(self.data["daily_summary"].keys()) if self.data["daily_summary"] else None,
-                "end": max(self.data["daily_summary"].keys()) if self.data["daily_summary"] else None,
+                "start": period["start"],
+                "end": period["end"],
             },
             "summary": {
                 "total_cost_usd": self.get_total_cost(),
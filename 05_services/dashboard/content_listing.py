@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Content Manager 콘텐츠 목록 캐시
+
+Streamlit 재실행마다 폴더 수 × (history / schedule / tags JSON 파싱 + glob 2회)
+하던 get_content_folders 를 대체:
+- history / schedule / tags / metadata JSON 은 파일 mtime 이 바뀔 때만 다시 파싱
+- 이미지 폴더는 폴더 mtime 이 바뀐 것만 다시 스캔 (scandir 1회)
+- 행(ContentRow)은 가벼운 dict, 전체 이미지 경로 목록은 처음 접근할 때 생성
+- paginate() 로 그리드 페이지 단위 렌더링
+
+사용법:
+    listing = ContentListing(IMAGES_DIR, HISTORY_FILE, SCHEDULE_FILE, TAGS_FILE, METADATA_FILE)
+    rows = listing.rows()                          # 변경 없으면 캐시 재사용
+    page_rows, pages = paginate(rows, page=1, page_size=48)
+"""
+
+import json
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+IMAGE_SUFFIXES = (".png", ".jpg")
+EXCLUDED_FOLDERS = {"reference"}
+
+
+def _signature(path: Path) -> Optional[Tuple[int, int]]:
+    """파일 변경 감지용 (mtime_ns, size), 없으면 None"""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class JsonFileCache:
+    """JSON 파일 1개 - mtime/size 가 같으면 이전 파싱 결과 재사용"""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._signature = None
+        self._data: Dict = {}
+
+    def load(self) -> Tuple[Dict, bool]:
+        """(데이터, 이번 호출에서 다시 읽었는지)"""
+        signature = _signature(self.path)
+        if signature == self._signature:
+            return self._data, False
+        data = {}
+        if signature is not None:
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+            except (OSError, ValueError):
+                data = {}
+        self._signature, self._data = signature, data if isinstance(data, dict) else {}
+        return self._data, True
+
+
+class ContentRow(dict):
+    """그리드 행 1개 (images 는 처음 접근할 때 전체 경로 목록으로 채움)"""
+
+    def __init__(self, data: Dict[str, Any], image_names: Tuple[str, ...]):
+        super().__init__(data)
+        self._image_names = image_names
+
+    def __missing__(self, key):
+        if key != "images":
+            raise KeyError(key)
+        images = [str(Path(self["path"]) / name) for name in self._image_names]
+        self["images"] = images
+        return images
+
+    def get(self, key, default=None):
+        if key == "images":
+            return self["images"]
+        return super().get(key, default)
+
+
+class ContentListing:
+    """
+    콘텐츠 목록 서비스
+
+    rows() 호출 시:
+    1. 사이드 JSON 4개 mtime 확인 (바뀐 것만 파싱)
+    2. 이미지 폴더 목록 + 폴더별 mtime 확인 (바뀐 폴더만 scandir)
+    3. 아무것도 안 바뀌었으면 이전 행 목록 그대로 반환
+    """
+
+    def __init__(self, images_dir: Path, history_file: Path, schedule_file: Path,
+                 tags_file: Path, metadata_file: Optional[Path] = None):
+        self.images_dir = Path(images_dir)
+        self.history = JsonFileCache(history_file)
+        self.schedule = JsonFileCache(schedule_file)
+        self.tags = JsonFileCache(tags_file)
+        self.metadata = JsonFileCache(metadata_file) if metadata_file else None
+        self.stats = {"refreshes": 0, "rebuilds": 0, "folder_scans": 0, "json_loads": 0}
+
+        self._folders: Dict[str, Tuple[int, Tuple[str, ...]]] = {}  # name → (mtime_ns, 이미지 파일명)
+        self._rows: List[ContentRow] = []
+        self._lock = threading.Lock()
+
+    def _scan_images(self, folder: Path) -> Tuple[str, ...]:
+        self.stats["folder_scans"] += 1
+        try:
+            with os.scandir(folder) as it:
+                names = [e.name for e in it if e.name.endswith(IMAGE_SUFFIXES) and e.is_file()]
+        except OSError:
+            names = []
+        return tuple(sorted(names))
+
+    def _refresh_folders(self) -> bool:
+        """폴더 목록 / 바뀐 폴더 이미지 갱신 (변경 여부 반환)"""
+        current: Dict[str, int] = {}
+        try:
+            with os.scandir(self.images_dir) as it:
+                for entry in it:
+                    if (entry.name.startswith(".") or entry.name in EXCLUDED_FOLDERS
+                            or not entry.is_dir()):
+                        continue
+                    current[entry.name] = entry.stat().st_mtime_ns
+        except OSError:
+            pass
+
+        changed = set(self._folders) != set(current)
+        folders = {}
+        for name, mtime_ns in current.items():
+            cached = self._folders.get(name)
+            if cached and cached[0] == mtime_ns:
+                folders[name] = cached
+            else:
+                folders[name] = (mtime_ns, self._scan_images(self.images_dir / name))
+                changed = True
+        self._folders = folders
+        return changed
+
+    def _load_side_files(self) -> Tuple[Dict, Dict, Dict, Dict, bool]:
+        changed = False
+        loaded = []
+        for cache in (self.history, self.schedule, self.tags, self.metadata):
+            if cache is None:
+                loaded.append({})
+                continue
+            data, reloaded = cache.load()
+            if reloaded:
+                self.stats["json_loads"] += 1
+                changed = True
+            loaded.append(data)
+        return (*loaded, changed)
+
+    def _build_rows(self, history: Dict, schedule: Dict, tags: Dict, metadata: Dict) -> List[ContentRow]:
+        rows = []
+        for name in sorted(self._folders):
+            mtime_ns, image_names = self._folders[name]
+            if not image_names:
+                continue
+            parts = name.split('_', 1)
+            folder = self.images_dir / name
+
+            status = "draft"
+            if name in history:
+                status = "published"
+            elif name in schedule:
+                status = "scheduled"
+
+            rows.append(ContentRow({
+                "name": name,
+                "display_name": parts[1].upper() if len(parts) > 1 else name.upper(),
+                "path": str(folder),
+                "image_count": len(image_names),
+                "thumbnail": str(folder / image_names[0]),
+                "created": datetime.fromtimestamp(mtime_ns / 1e9),
+                "status": status,
+                "tags": list(tags.get(name, [])),
+                "metadata": metadata.get(name, {}),
+                "source": "local",
+            }, image_names))
+        return rows
+
+    def refresh(self) -> bool:
+        """변경분 반영 (행 목록을 다시 만들었으면 True)"""
+        with self._lock:
+            self.stats["refreshes"] += 1
+            history, schedule, tags, metadata, side_changed = self._load_side_files()
+            folders_changed = self._refresh_folders()
+            if not (side_changed or folders_changed) and self.stats["rebuilds"]:
+                return False
+            self._rows = self._build_rows(history, schedule, tags, metadata)
+            self.stats["rebuilds"] += 1
+            return True
+
+    def rows(self) -> List[ContentRow]:
+        """전체 행 (이름순, 이미지 없는 폴더 제외)"""
+        self.refresh()
+        return list(self._rows)
+
+    def images(self, name: str) -> List[str]:
+        """폴더 1개 전체 이미지 경로 (캐시된 파일명 기준)"""
+        cached = self._folders.get(name)
+        if cached is None:
+            return []
+        return [str(self.images_dir / name / image) for image in cached[1]]
+
+
+def paginate(rows: List, page: int, page_size: int) -> Tuple[List, int]:
+    """
+    페이지 단위 자르기
+
+    Returns:
+        (해당 페이지 행, 전체 페이지 수) - page 는 1 ~ 전체 페이지 수로 보정
+    """
+    pages = max(1, -(-len(rows) // page_size))
+    page = min(max(page, 1), pages)
+    start = (page - 1) * page_size
+    return rows[start:start + page_size], pages
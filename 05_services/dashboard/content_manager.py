@@ -33,6 +33,11 @@ try:
 except ImportError:
     PUBLISHER_AVAILABLE = False
 
+from content_listing import ContentListing, paginate
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "04_pipeline"))
+from core.insights_collector import InsightsCollector
+
 # .env 파일 로드 (로컬 개발용)
 load_dotenv(Path(__file__).parent.parent.parent / ".env")
 
@@ -85,6 +90,7 @@ HISTORY_FILE = DASHBOARD_DIR / "publish_history.json"
 QUEUE_FILE = DASHBOARD_DIR / "work_queue.json"
 TAGS_FILE = DASHBOARD_DIR / "content_tags.json"
 METADATA_FILE = DASHBOARD_DIR / "content_metadata.json"
+GRID_PAGE_SIZE = 48  # 6열 × 8행
 
 # Cloudinary 초기화 (get_secret 정의 후)
 CLOUDINARY_AVAILABLE = init_cloudinary()
@@ -1236,44 +1242,16 @@ st.markdown("""
 # ============================================================
 # DATA FUNCTIONS
 # ============================================================
-def get_content_folders() -> List[Dict[str, Any]]:
-    """콘텐츠 폴더 목록 조회 (로컬 우선, Cloudinary 폴백)"""
-    contents = []
+@st.cache_resource
+def get_content_listing() -> ContentListing:
+    """재실행 간 공유되는 콘텐츠 목록 캐시 (파일 mtime 기준 무효화)"""
+    return ContentListing(IMAGES_DIR, HISTORY_FILE, SCHEDULE_FILE, TAGS_FILE, METADATA_FILE)
 
-    # 1. 로컬 이미지 폴더 확인
-    if IMAGES_DIR.exists():
-        for folder in sorted(IMAGES_DIR.iterdir()):
-            if folder.is_dir() and not folder.name.startswith('.') and folder.name != 'reference':
-                images = sorted(list(folder.glob("*.png")) + list(folder.glob("*.jpg")))
-
-                if images:
-                    parts = folder.name.split('_', 1)
-                    display_name = parts[1].upper() if len(parts) > 1 else folder.name.upper()
-
-                    content_info = {
-                        "name": folder.name,
-                        "display_name": display_name,
-                        "path": str(folder),
-                        "image_count": len(images),
-                        "images": [str(img) for img in images],
-                        "thumbnail": str(images[0]),
-                        "created": datetime.fromtimestamp(folder.stat().st_mtime),
-                        "status": "draft",
-                        "tags": get_content_tags(folder.name),
-                        "source": "local"
-                    }
-
-                    # 게시 히스토리 확인
-                    history = load_history()
-                    if folder.name in history:
-                        content_info["status"] = "published"
 
-                    # 스케줄 확인
-                    schedule = load_schedule()
-                    if folder.name in schedule and content_info["status"] != "published":
-                        content_info["status"] = "scheduled"
-
-                    contents.append(content_info)
+def get_content_folders() -> List[Dict[str, Any]]:
+    """콘텐츠 폴더 목록 조회 (로컬 우선, Cloudinary 폴백)"""
+    # 1. 로컬 이미지 폴더 (history/schedule/tags 는 변경 시에만 다시 읽음, images 는 지연 생성)
+    contents = get_content_listing().rows() if IMAGES_DIR.exists() else []
 
     # 2. 로컬에 콘텐츠가 없으면 Cloudinary에서 가져오기
     if not contents and CLOUDINARY_AVAILABLE:
@@ -1982,29 +1960,31 @@ def sync_with_instagram() -> Dict[str, Any]:
 # ============================================================
 # INSTAGRAM INSIGHTS API
 # ============================================================
-INSIGHTS_CACHE_FILE = ROOT / "dashboard" / "insights_cache.json"
+INSIGHTS_CACHE_FILE = ROOT / "dashboard" / "insights_cache.json"  # 기존 JSON (최초 1회 가져오기)
 
-def load_insights_cache() -> Dict:
-    """인사이트 캐시 로드"""
-    if INSIGHTS_CACHE_FILE.exists():
-        try:
-            with open(INSIGHTS_CACHE_FILE, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except:
-            return {"posts": {}, "account": {}, "updated_at": None}
-    return {"posts": {}, "account": {}, "updated_at": None}
+
+@st.cache_resource
+def get_insights_collector() -> InsightsCollector:
+    """재실행 간 공유되는 인사이트 수집기 (게시물별 TTL 은 state.db 에 저장)"""
+    access_token, user_id = get_instagram_credentials()
+    collector = InsightsCollector(access_token=access_token, user_id=user_id)
+    collector.import_legacy_cache(INSIGHTS_CACHE_FILE)
+    return collector
 
 
-def save_insights_cache(cache: Dict):
-    """인사이트 캐시 저장"""
-    cache["updated_at"] = datetime.now().isoformat()
-    with open(INSIGHTS_CACHE_FILE, "w", encoding="utf-8") as f:
-        json.dump(cache, f, ensure_ascii=False, indent=2)
+def load_insights_cache() -> Dict:
+    """인사이트 캐시 로드 (기존 insights_cache.json 형태로 조회)"""
+    collector = get_insights_collector()
+    return {
+        "posts": {p["post_id"]: p for p in collector.cached()},
+        "account": collector.cached_account("day") or {},
+        "updated_at": collector.last_updated(),
+    }
 
 
 def fetch_post_insights(post_id: str) -> Optional[Dict]:
     """
-    개별 게시물의 Instagram Insights 가져오기
+    개별 게시물의 Instagram Insights 가져오기 (갱신 주기가 지난 필드만 batch 요청)
 
     Returns:
         - impressions: 노출 수
@@ -2022,65 +2002,8 @@ def fetch_post_insights(post_id: str) -> Optional[Dict]:
         return None
 
     try:
-        # 기본 게시물 정보 (likes, comments는 기본 필드)
-        url = f"https://graph.facebook.com/v21.0/{post_id}"
-        params = {
-            "fields": "id,like_count,comments_count,timestamp,permalink,caption,media_type",
-            "access_token": access_token
-        }
-
-        response = requests.get(url, params=params, timeout=10)
-
-        if response.status_code != 200:
-            return None
-
-        basic_data = response.json()
-
-        # Insights 데이터 (Business/Creator 계정만 가능)
-        # Note: impressions 메트릭은 v22.0부터 지원 중단, reach/saved/shares만 사용
-        insights_url = f"https://graph.facebook.com/v21.0/{post_id}/insights"
-        insights_params = {
-            "metric": "reach,saved,shares",
-            "access_token": access_token
-        }
-
-        insights_response = requests.get(insights_url, params=insights_params, timeout=10)
-
-        insights_data = {}
-        if insights_response.status_code == 200:
-            insights_raw = insights_response.json().get("data", [])
-            for item in insights_raw:
-                name = item.get("name")
-                value = item.get("values", [{}])[0].get("value", 0)
-                insights_data[name] = value
-
-        # 결과 조합
-        likes = basic_data.get("like_count", 0)
-        comments = basic_data.get("comments_count", 0)
-        saved = insights_data.get("saved", 0)
-        shares = insights_data.get("shares", 0)
-        reach = insights_data.get("reach", 0)
-        # impressions는 reach와 동일하게 처리 (v22.0+ 호환성)
-        impressions = reach
-
-        engagement = likes + comments + saved + shares
-        engagement_rate = (engagement / reach * 100) if reach > 0 else 0
-
-        return {
-            "post_id": post_id,
-            "likes": likes,
-            "comments": comments,
-            "saved": saved,
-            "shares": shares,
-            "impressions": impressions,
-            "reach": reach,
-            "engagement": engagement,
-            "engagement_rate": round(engagement_rate, 2),
-            "timestamp": basic_data.get("timestamp"),
-            "permalink": basic_data.get("permalink"),
-            "media_type": basic_data.get("media_type"),
-            "fetched_at": datetime.now().isoformat()
-        }
+        posts = get_insights_collector().refresh_posts([post_id])["posts"]
+        return posts[0] if posts else None
 
     except Exception as e:
         st.error(f"Post Insights API Error: {e}")
@@ -2089,7 +2012,7 @@ def fetch_post_insights(post_id: str) -> Optional[Dict]:
 
 def fetch_account_insights(period: str = "day") -> Optional[Dict]:
     """
-    계정 전체 Instagram Insights 가져오기
+    계정 전체 Instagram Insights 가져오기 (batch 1회, 1시간 캐시)
 
     Args:
         period: "day", "week", "days_28" (28일)
@@ -2108,78 +2031,7 @@ def fetch_account_insights(period: str = "day") -> Optional[Dict]:
         return None
 
     try:
-        # 계정 기본 정보
-        account_url = f"https://graph.facebook.com/v21.0/{user_id}"
-        account_params = {
-            "fields": "id,username,followers_count,follows_count,media_count,profile_picture_url,biography",
-            "access_token": access_token
-        }
-
-        account_response = requests.get(account_url, params=account_params, timeout=10)
-
-        account_data = {}
-        if account_response.status_code == 200:
-            account_data = account_response.json()
-
-        # 계정 인사이트 (Business/Creator만 가능)
-        # Note: Instagram API v21.0+ 에서 메트릭 분리 필요
-        insights_url = f"https://graph.facebook.com/v21.0/{user_id}/insights"
-
-        # period 매핑
-        period_map = {
-            "day": "day",
-            "week": "week",
-            "days_28": "days_28"
-        }
-        api_period = period_map.get(period, "day")
-
-        insights_data = {}
-
-        # 1. reach는 period 기반 메트릭
-        reach_params = {
-            "metric": "reach",
-            "period": api_period,
-            "access_token": access_token
-        }
-        reach_response = requests.get(insights_url, params=reach_params, timeout=10)
-        if reach_response.status_code == 200:
-            reach_raw = reach_response.json().get("data", [])
-            for item in reach_raw:
-                name = item.get("name")
-                values = item.get("values", [])
-                if values:
-                    insights_data[name] = values[-1].get("value", 0)
-
-        # 2. profile_views, accounts_engaged, total_interactions는 total_value 메트릭
-        total_params = {
-            "metric": "profile_views,accounts_engaged,total_interactions",
-            "metric_type": "total_value",
-            "period": api_period,
-            "access_token": access_token
-        }
-        total_response = requests.get(insights_url, params=total_params, timeout=10)
-        if total_response.status_code == 200:
-            total_raw = total_response.json().get("data", [])
-            for item in total_raw:
-                name = item.get("name")
-                total_value = item.get("total_value", {}).get("value", 0)
-                insights_data[name] = total_value
-
-        return {
-            "user_id": user_id,
-            "username": account_data.get("username", ""),
-            "followers_count": account_data.get("followers_count", 0),
-            "follows_count": account_data.get("follows_count", 0),
-            "media_count": account_data.get("media_count", 0),
-            "profile_picture_url": account_data.get("profile_picture_url", ""),
-            "biography": account_data.get("biography", ""),
-            "reach": insights_data.get("reach", 0),
-            "profile_views": insights_data.get("profile_views", 0),
-            "accounts_engaged": insights_data.get("accounts_engaged", 0),
-            "total_interactions": insights_data.get("total_interactions", 0),
-            "period": period,
-            "fetched_at": datetime.now().isoformat()
-        }
+        return get_insights_collector().refresh_account(period)
 
     except Exception as e:
         st.error(f"Account Insights API Error: {e}")
@@ -2190,49 +2042,25 @@ def fetch_all_posts_insights(limit: int = 20) -> List[Dict]:
     """
     모든 게시물의 인사이트 가져오기 (캐시 활용)
     """
-    cache = load_insights_cache()
+    collector = get_insights_collector()
 
     # 캐시가 1시간 이내면 캐시 사용
-    if cache.get("updated_at"):
+    updated = collector.last_updated()
+    if updated:
         try:
-            updated = datetime.fromisoformat(cache["updated_at"])
-            if (datetime.now() - updated).total_seconds() < 3600:  # 1시간
-                if cache.get("posts"):
-                    return list(cache["posts"].values())[:limit]
-        except:
+            if (datetime.now() - datetime.fromisoformat(updated)).total_seconds() < 3600:  # 1시간
+                cached = collector.cached(limit=limit)
+                if cached:
+                    return cached
+        except ValueError:
             pass
 
-    # 새로 가져오기
+    # 새로 가져오기 (게시 경과 시간별 주기가 지난 필드만 batch 요청)
     posts = fetch_instagram_posts(limit=limit)
+    if not posts:
+        return collector.cached(limit=limit)
 
-    results = []
-    for post in posts:
-        post_id = post.get("id")
-        if not post_id:
-            continue
-
-        # 캐시에 있으면 캐시 사용
-        if post_id in cache.get("posts", {}):
-            cached = cache["posts"][post_id]
-            # 24시간 이내 캐시는 유효
-            try:
-                fetched = datetime.fromisoformat(cached.get("fetched_at", ""))
-                if (datetime.now() - fetched).total_seconds() < 86400:
-                    results.append(cached)
-                    continue
-            except:
-                pass
-
-        # 새로 가져오기
-        insights = fetch_post_insights(post_id)
-        if insights:
-            cache["posts"][post_id] = insights
-            results.append(insights)
-
-    # 캐시 저장
-    save_insights_cache(cache)
-
-    return results
+    return collector.refresh_posts(posts)["posts"]
 
 
 def refresh_insights_cache(force: bool = False) -> Dict[str, Any]:
@@ -2242,11 +2070,6 @@ def refresh_insights_cache(force: bool = False) -> Dict[str, Any]:
     Args:
         force: True면 캐시 무시하고 전체 새로고침
     """
-    if force:
-        cache = {"posts": {}, "account": {}, "updated_at": None}
-    else:
-        cache = load_insights_cache()
-
     results = {
         "success": False,
         "posts_updated": 0,
@@ -2260,23 +2083,16 @@ def refresh_insights_cache(force: bool = False) -> Dict[str, Any]:
         return results
 
     try:
+        collector = get_insights_collector()
+
         # 계정 인사이트
-        account_insights = fetch_account_insights("day")
+        account_insights = collector.refresh_account("day", force=force)
         if account_insights:
-            cache["account"] = account_insights
             results["account_updated"] = True
 
         # 게시물 인사이트
         posts = fetch_instagram_posts(limit=30)
-        for post in posts:
-            post_id = post.get("id")
-            if post_id:
-                insights = fetch_post_insights(post_id)
-                if insights:
-                    cache["posts"][post_id] = insights
-                    results["posts_updated"] += 1
-
-        save_insights_cache(cache)
+        results["posts_updated"] = collector.refresh_posts(posts, force=force)["updated"]
         results["success"] = True
 
     except Exception as e:
@@ -2896,10 +2712,27 @@ def render_content_list():
 
     st.markdown("<hr style='margin: 1.5rem 0;'>", unsafe_allow_html=True)
 
+    # 페이지 단위 렌더링 (썸네일 인코딩은 현재 페이지만)
+    page_contents, total_pages = paginate(contents, st.session_state.get("grid_page", 1), GRID_PAGE_SIZE)
+    current_page = min(max(st.session_state.get("grid_page", 1), 1), total_pages)
+    if total_pages > 1:
+        pcol1, pcol2, pcol3 = st.columns([1, 2, 1])
+        with pcol1:
+            if st.button("◀ Prev", disabled=current_page <= 1, use_container_width=True):
+                st.session_state.grid_page = current_page - 1
+                st.rerun()
+        with pcol2:
+            st.markdown(f"<p style='text-align: center;'>Page {current_page} / {total_pages} "
+                        f"• {len(contents)} items</p>", unsafe_allow_html=True)
+        with pcol3:
+            if st.button("Next ▶", disabled=current_page >= total_pages, use_container_width=True):
+                st.session_state.grid_page = current_page + 1
+                st.rerun()
+
     # 6-column grid
     cols = st.columns(6)
 
-    for idx, content in enumerate(contents):
+    for idx, content in enumerate(page_contents):
         with cols[idx % 6]:
             # Thumbnail with 4:5 ratio - support both URL and local path
             thumbnail = content.get("thumbnail", "")
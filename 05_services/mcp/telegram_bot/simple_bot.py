@@ -103,41 +103,29 @@ def find_folder_by_food_id(food_id: str) -> Path | None:
     - {food_id}_{한글명}
 
     검색 순서: 2_body_ready → 3_approved → 1_cover_only
+    (콘텐츠 카탈로그 조회 - 폴더명 조각 일치, 숫자 접미사 제거 포함: blackberry2 → blackberry)
     """
-    contents_dir = PROJECT_ROOT / "contents"
-    food_id_lower = food_id.lower()
+    from core.content_catalog import get_catalog
 
     # 검색 순서 (body_ready 우선)
-    search_dirs = [
-        contents_dir / "2_body_ready",
-        contents_dir / "3_approved",
-        contents_dir / "1_cover_only",
-    ]
-
-    for search_dir in search_dirs:
-        if not search_dir.exists():
-            continue
+    entry = get_catalog(PROJECT_ROOT / "contents").find(
+        food_id, locations=["2_body_ready", "3_approved", "1_cover_only"]
+    )
+    if entry:
+        print(f"[DEBUG] find_folder_by_food_id: {food_id} → {entry.path}")
+        return entry.path
 
-        for folder in search_dir.iterdir():
-            if not folder.is_dir():
-                continue
+    print(f"[DEBUG] find_folder_by_food_id: {food_id} → None (폴더 없음)")
+    return None
 
-            folder_name = folder.name.lower()
-            parts = folder_name.split("_")
 
-            # 패턴 매칭
-            for i, part in enumerate(parts):
-                # 정확히 일치
-                if part == food_id_lower:
-                    print(f"[DEBUG] find_folder_by_food_id: {food_id} → {folder}")
-                    return folder
-                # 숫자 접미사 제거 후 매칭 (blackberry2 → blackberry)
-                if part.rstrip("0123456789") == food_id_lower:
-                    print(f"[DEBUG] find_folder_by_food_id: {food_id} → {folder} (숫자 제거)")
-                    return folder
+def invalidate_catalog(*paths: Path):
+    """폴더 이동/metadata 수정 직후 콘텐츠 카탈로그에 즉시 반영 (sync_loop 와 동일)"""
+    from core.content_catalog import get_catalog
 
-    print(f"[DEBUG] find_folder_by_food_id: {food_id} → None (폴더 없음)")
-    return None
+    catalog = get_catalog(PROJECT_ROOT / "contents")
+    for path in paths:
+        catalog.invalidate(path)
 
 
 def get_folder_status(folder_path: Path) -> str:
@@ -177,6 +165,7 @@ def create_default_metadata(food_id: str, folder_path: Path) -> dict:
         metadata_file = folder_path / "metadata.json"
         with open(metadata_file, 'w', encoding='utf-8') as f:
             json.dump(metadata, f, ensure_ascii=False, indent=2)
+        invalidate_catalog(metadata_file)
         print(f"[DEBUG] created metadata: {metadata_file}")
 
     return metadata
@@ -214,6 +203,7 @@ def update_metadata_status(food_id: str, status: str, **kwargs) -> bool:
     # 저장
     with open(metadata_file, 'w', encoding='utf-8') as f:
         json.dump(metadata, f, ensure_ascii=False, indent=2)
+    invalidate_catalog(metadata_file)
 
     print(f"[DEBUG] updated metadata status: {food_id} → {status}")
     return True
@@ -256,6 +246,7 @@ def move_to_approved(food_id: str) -> tuple[bool, str]:
 
     try:
         shutil.move(str(folder), str(dest))
+        invalidate_catalog(folder, dest)
         print(f"[DEBUG] moved to approved: {folder.name}")
         return True, f"3_approved로 이동 완료"
     except Exception as e:
@@ -678,26 +669,16 @@ def get_foods_by_status() -> dict:
     if not images_dir.exists():
         return result
 
-    # v3 구조: 상태 폴더 내 콘텐츠 스캔
-    STATUS_FOLDERS = ["1_cover_only", "2_body_ready", "3_approved"]
-
-    all_folders = []
-    for status_folder in STATUS_FOLDERS:
-        status_dir = images_dir / status_folder
-        if status_dir.exists():
-            for folder in status_dir.iterdir():
-                if folder.is_dir():
-                    all_folders.append(folder)
+    # v3 구조: 상태 폴더 내 콘텐츠 + v2 호환: contents/ 루트 폴더 (콘텐츠 카탈로그 조회)
+    from core.content_catalog import get_catalog
 
-    # v2 호환: contents/ 루트에 있는 폴더도 스캔
-    for folder in images_dir.iterdir():
-        if folder.is_dir() and folder.name not in STATUS_FOLDERS:
-            if not folder.name.startswith(("🔒", "reference", "sunshine", "test")):
-                all_folders.append(folder)
+    entries = [
+        entry for entry in get_catalog(images_dir).entries(["1_cover_only", "2_body_ready", "3_approved", ""])
+        if entry.location or not entry.name.startswith(("🔒", "reference", "sunshine", "test"))
+    ]
 
-    for folder in sorted(all_folders, key=lambda f: f.name):
-        if not folder.is_dir():
-            continue
+    for entry in entries:
+        folder = entry.path
 
         # 특수 폴더 제외
         if folder.name.startswith("000_") or "archive" in folder.name.lower():
@@ -712,11 +693,11 @@ def get_foods_by_status() -> dict:
         food_name = "_".join(parts[2:])
 
         # 파일 존재 여부 확인
-        cover = folder / f"{food_key}_00.png"
-        body1 = folder / f"{food_key}_01.png"
-        body2 = folder / f"{food_key}_02.png"
+        has_cover = entry.has_image(f"{food_key}_00.png")
+        has_body1 = entry.has_image(f"{food_key}_01.png")
+        has_body2 = entry.has_image(f"{food_key}_02.png")
 
-        if not cover.exists():
+        if not has_cover:
             continue  # 표지도 없으면 스킵
 
         # 게시 여부 확인
@@ -747,7 +728,7 @@ def get_foods_by_status() -> dict:
         pd_approved = metadata.get("pd_approved", False) if metadata else False
 
         # 상태별 분류
-        if not body1.exists() or not body2.exists():
+        if not has_body1 or not has_body2:
             # 본문 없음 → 표지만 완료
             result["cover_only"].append(food_info)
         elif status == "rejected":
@@ -2202,6 +2183,7 @@ Cloudinary 업로드 후 다시 시도하세요.
 
                     with open(metadata_path, 'w', encoding='utf-8') as f:
                         json.dump(metadata, f, ensure_ascii=False, indent=2)
+                    invalidate_catalog(metadata_path)
 
                     print(f"[DEBUG] metadata.json 업데이트: status=posted, media_id={post_id}")
 
@@ -2216,6 +2198,7 @@ Cloudinary 업로드 후 다시 시도하세요.
                     if not new_folder.exists():
                         try:
                             shutil.move(str(folder), str(new_folder))
+                            invalidate_catalog(folder, new_folder)
                             print(f"[DEBUG] 폴더 이동: {folder.name} → 4_posted/{datetime.now().strftime('%Y-%m')}/")
                         except Exception as move_err:
                             print(f"[DEBUG] 폴더 이동 실패 (무시): {move_err}")
@@ -2668,6 +2651,7 @@ def handle_upload_cloudinary(chat_id: str, food_key: str):
 
             with open(metadata_path, 'w', encoding='utf-8') as f:
                 json.dump(metadata, f, ensure_ascii=False, indent=2)
+            invalidate_catalog(metadata_path)
 
             print(f"[DEBUG] metadata.json 저장됨: image_urls={len(urls)}개, type=list")
 
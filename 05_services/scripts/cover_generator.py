@@ -14,11 +14,13 @@ Cover Generator - COVER_RULE.md v2.0 준수
 
 import os
 import sys
-import json
 from PIL import Image, ImageDraw, ImageFont, ImageFilter
 
 # 경로 설정
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.join(PROJECT_ROOT, "04_pipeline"))
+from food_data_store import get_food_store
+
 FONT_PATH = os.path.expanduser("~/Library/Fonts/BlackHanSans-Regular.ttf")
 CONTENTS_PATH = os.path.join(PROJECT_ROOT, "contents")
 
@@ -112,11 +114,8 @@ def generate_cover(clean_image_path, name_ko, name_en, output_path):
 
 def get_food_data(food_number):
     """food_data.json에서 음식 정보 조회"""
-    food_data_path = os.path.join(PROJECT_ROOT, "config", "food_data.json")
-
     try:
-        with open(food_data_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = get_food_store().require()
     except Exception as e:
         print(f"[ERROR] food_data.json 로드 실패: {e}")
         return None
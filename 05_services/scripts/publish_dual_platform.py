@@ -6,10 +6,9 @@ Instagram + Threads 통합 게시 스크립트
 1. 이미지 중복 검사
 2. 캡션 규칙 검증 (8단계)
 3. Cloudinary 업로드
-4. Instagram 게시
-5. Threads 게시
-6. 폴더 이동 (3_approved → 4_posted)
-7. Google Sheets 업데이트
+4. Instagram + Threads 동시 게시 (공용 게시 엔진)
+5. 폴더 이동 (3_approved → 4_posted)
+6. Google Sheets 업데이트
 
 사용법:
     python publish_dual_platform.py poached_egg
@@ -21,14 +20,16 @@ import sys
 import json
 import shutil
 import hashlib
-import time
+import asyncio
 import re
-import requests
 from pathlib import Path
 from datetime import datetime
 
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(PROJECT_ROOT / '04_pipeline'))
+
+from core.carousel_publisher import CarouselPublisher, instagram_platform, threads_platform
 
 from dotenv import load_dotenv
 load_dotenv(PROJECT_ROOT / '.env')
@@ -167,161 +168,80 @@ def upload_to_cloudinary(image_paths: list, topic: str) -> list:
     return urls
 
 
-def publish_to_instagram(image_urls: list, caption: str) -> dict:
-    """Instagram 캐러셀 게시"""
-    print(f"\n{Colors.CYAN}[단계 2] Instagram 게시{Colors.END}")
+INSTAGRAM_API_BASE = 'https://graph.facebook.com/v18.0'
+THREADS_API_BASE = 'https://graph.threads.net/v1.0'
 
-    ig_user_id = os.getenv('INSTAGRAM_BUSINESS_ACCOUNT_ID')
-    ig_token = os.getenv('INSTAGRAM_ACCESS_TOKEN')
 
-    if not ig_user_id or not ig_token:
-        print(f"   {Colors.RED}❌ Instagram 토큰 미설정{Colors.END}")
-        return {'success': False, 'error': 'Instagram 토큰 미설정'}
+def _print_outcome(label: str, outcome) -> dict:
+    """엔진 결과 출력 + 기존 반환 형식(dict) 변환"""
+    if outcome.success:
+        print(f"   {Colors.GREEN}✅ {label} 게시 완료!{Colors.END}")
+        print(f"   Post ID: {outcome.post_id}")
+        if outcome.post_url:
+            print(f"   URL: {outcome.post_url}")
+        print(f"   소요: {outcome.timings}")
+        result = {'success': True, 'post_id': outcome.post_id}
+        if outcome.post_url:
+            result['url'] = outcome.post_url
+        return result
+    print(f"   {Colors.RED}❌ {label} 게시 실패: {outcome.error}{Colors.END}")
+    return {'success': False, 'error': outcome.error}
 
-    base_url = 'https://graph.facebook.com/v18.0'
-
-    try:
-        # 1. 각 이미지 컨테이너 생성
-        container_ids = []
-        for i, url in enumerate(image_urls):
-            resp = requests.post(
-                f'{base_url}/{ig_user_id}/media',
-                data={
-                    'image_url': url,
-                    'is_carousel_item': 'true',
-                    'access_token': ig_token
-                }
-            )
-            data = resp.json()
-            if 'id' not in data:
-                return {'success': False, 'error': f'이미지 {i} 컨테이너 실패: {data}'}
-            container_ids.append(data['id'])
-            print(f"   ✅ 이미지 {i+1}/4 컨테이너 생성")
-            time.sleep(1)
-
-        # 2. 캐러셀 컨테이너 생성
-        resp = requests.post(
-            f'{base_url}/{ig_user_id}/media',
-            data={
-                'media_type': 'CAROUSEL',
-                'children': ','.join(container_ids),
-                'caption': caption,
-                'access_token': ig_token
-            }
-        )
-        data = resp.json()
-        if 'id' not in data:
-            return {'success': False, 'error': f'캐러셀 생성 실패: {data}'}
-        carousel_id = data['id']
-        print(f"   ✅ 캐러셀 컨테이너 생성")
-
-        time.sleep(3)
-
-        # 3. 게시
-        resp = requests.post(
-            f'{base_url}/{ig_user_id}/media_publish',
-            data={
-                'creation_id': carousel_id,
-                'access_token': ig_token
-            }
-        )
-        data = resp.json()
-        if 'id' in data:
-            post_id = data['id']
-            print(f"   {Colors.GREEN}✅ Instagram 게시 완료!{Colors.END}")
-            print(f"   Post ID: {post_id}")
-            return {'success': True, 'post_id': post_id}
-        else:
-            return {'success': False, 'error': f'게시 실패: {data}'}
 
-    except Exception as e:
-        return {'success': False, 'error': str(e)}
+async def _publish_carousels(jobs: list) -> list:
+    async with CarouselPublisher() as engine:
+        return await engine.publish_many(jobs)
 
 
-def publish_to_threads(image_urls: list, caption: str, topic: str) -> dict:
-    """Threads 캐러셀 게시"""
-    print(f"\n{Colors.CYAN}[단계 3] Threads 게시{Colors.END}")
+def publish_to_platforms(image_urls: list, ig_caption: str, th_caption: str, topic: str) -> tuple:
+    """Instagram + Threads 캐러셀 동시 게시 (컨테이너 병렬 생성, 백오프 상태 대기)"""
+    print(f"\n{Colors.CYAN}[단계 2] Instagram + Threads 동시 게시{Colors.END}")
 
+    ig_user_id = os.getenv('INSTAGRAM_BUSINESS_ACCOUNT_ID')
+    ig_token = os.getenv('INSTAGRAM_ACCESS_TOKEN')
     threads_user_id = os.getenv('THREADS_USER_ID')
     threads_token = os.getenv('THREADS_ACCESS_TOKEN')
 
-    if not threads_user_id or not threads_token:
-        print(f"   {Colors.RED}❌ Threads 토큰 미설정{Colors.END}")
-        return {'success': False, 'error': 'Threads 토큰 미설정'}
+    results = {}
+    jobs = []
+    if ig_user_id and ig_token:
+        jobs.append(('instagram', (instagram_platform(ig_user_id, ig_token, api_base=INSTAGRAM_API_BASE),
+                                   image_urls, ig_caption)))
+    else:
+        print(f"   {Colors.RED}❌ Instagram 토큰 미설정{Colors.END}")
+        results['instagram'] = {'success': False, 'error': 'Instagram 토큰 미설정'}
 
-    base_url = 'https://graph.threads.net/v1.0'
+    if threads_user_id and threads_token:
+        jobs.append(('threads', (threads_platform(threads_user_id, threads_token, api_base=THREADS_API_BASE),
+                                 image_urls, th_caption)))
+    else:
+        print(f"   {Colors.RED}❌ Threads 토큰 미설정{Colors.END}")
+        results['threads'] = {'success': False, 'error': 'Threads 토큰 미설정'}
 
-    try:
-        # 1. 각 이미지 컨테이너 생성
-        media_ids = []
-        for i, url in enumerate(image_urls):
-            resp = requests.post(
-                f'{base_url}/{threads_user_id}/threads',
-                data={
-                    'media_type': 'IMAGE',
-                    'image_url': url,
-                    'access_token': threads_token
-                }
-            )
-            data = resp.json()
-            if 'id' not in data:
-                return {'success': False, 'error': f'이미지 {i} 컨테이너 실패: {data}'}
-            media_ids.append(data['id'])
-            print(f"   ✅ 이미지 {i+1}/4 컨테이너 생성")
-            time.sleep(1)
-
-        # 2. 캐러셀 컨테이너 생성
-        resp = requests.post(
-            f'{base_url}/{threads_user_id}/threads',
-            data={
-                'media_type': 'CAROUSEL',
-                'children': ','.join(media_ids),
-                'text': caption,
-                'access_token': threads_token
-            }
-        )
-        data = resp.json()
-        if 'id' not in data:
-            return {'success': False, 'error': f'캐러셀 생성 실패: {data}'}
-        carousel_id = data['id']
-        print(f"   ✅ 캐러셀 컨테이너 생성")
-
-        time.sleep(3)
-
-        # 3. 게시
-        resp = requests.post(
-            f'{base_url}/{threads_user_id}/threads_publish',
-            data={
-                'creation_id': carousel_id,
-                'access_token': threads_token
-            }
-        )
-        data = resp.json()
-        if 'id' in data:
-            post_id = data['id']
-            threads_url = f'https://www.threads.net/@sunshinedogfood/post/{post_id}'
-            print(f"   {Colors.GREEN}✅ Threads 게시 완료!{Colors.END}")
-            print(f"   Post ID: {post_id}")
-            print(f"   URL: {threads_url}")
-
-            # Google Sheets 업데이트
-            try:
-                from services.scripts.threads_sheet_updater import update_threads_status
-                update_threads_status(topic, post_id, threads_url, 'posted')
-            except Exception as e:
-                print(f"   {Colors.YELLOW}⚠️ 시트 업데이트 실패: {e}{Colors.END}")
+    if jobs:
+        try:
+            outcomes = asyncio.run(_publish_carousels([job for _, job in jobs]))
+            for (name, _), outcome in zip(jobs, outcomes):
+                results[name] = _print_outcome(name.capitalize(), outcome)
+        except Exception as e:
+            for name, _ in jobs:
+                results[name] = {'success': False, 'error': str(e)}
 
-            return {'success': True, 'post_id': post_id, 'url': threads_url}
-        else:
-            return {'success': False, 'error': f'게시 실패: {data}'}
+    th_result = results['threads']
+    if th_result['success']:
+        # Google Sheets 업데이트
+        try:
+            from services.scripts.threads_sheet_updater import update_threads_status
+            update_threads_status(topic, th_result['post_id'], th_result['url'], 'posted')
+        except Exception as e:
+            print(f"   {Colors.YELLOW}⚠️ 시트 업데이트 실패: {e}{Colors.END}")
 
-    except Exception as e:
-        return {'success': False, 'error': str(e)}
+    return results['instagram'], th_result
 
 
 def move_to_posted(source_folder: Path, topic_en: str, topic_kr: str) -> dict:
     """폴더를 4_posted로 이동"""
-    print(f"\n{Colors.CYAN}[단계 4] 폴더 이동{Colors.END}")
+    print(f"\n{Colors.CYAN}[단계 3] 폴더 이동{Colors.END}")
 
     posted_dir = PROJECT_ROOT / 'contents' / '4_posted'
 
@@ -438,24 +358,22 @@ def publish_dual_platform(topic_en: str, dry_run: bool = False):
     with open(folder / 'cloudinary_urls.json', 'w') as f:
         json.dump({'topic': topic_en, 'urls': cloudinary_urls}, f, indent=2)
 
-    # 2. Instagram 게시
-    ig_result = publish_to_instagram(cloudinary_urls, ig_caption)
+    # 2. Instagram + Threads 동시 게시
+    ig_result, th_result = publish_to_platforms(cloudinary_urls, ig_caption, th_caption, topic_en)
+
+    if not ig_result['success'] and not th_result['success']:
+        print(f"\n{Colors.RED}❌ 두 플랫폼 모두 게시 실패{Colors.END}")
+        return {'instagram': ig_result, 'threads': th_result}
 
     if not ig_result['success']:
-        print(f"\n{Colors.RED}❌ Instagram 게시 실패 - Threads 스킵{Colors.END}")
+        print(f"\n{Colors.RED}❌ Instagram 게시 실패 (Threads는 성공){Colors.END}")
         print(f"   오류: {ig_result.get('error')}")
-        return
-
-    time.sleep(5)  # API 레이트 제한 방지
-
-    # 3. Threads 게시
-    th_result = publish_to_threads(cloudinary_urls, th_caption, topic_en)
 
     if not th_result['success']:
         print(f"\n{Colors.YELLOW}⚠️ Threads 게시 실패 (Instagram은 성공){Colors.END}")
         print(f"   오류: {th_result.get('error')}")
 
-    # 4. 폴더 이동 (둘 다 성공 시)
+    # 3. 폴더 이동 (둘 다 성공 시)
     if ig_result['success'] and th_result.get('success'):
         move_result = move_to_posted(folder, topic_en, topic_kr)
 
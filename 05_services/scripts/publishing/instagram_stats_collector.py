@@ -6,6 +6,7 @@ Instagram 성과 데이터 수집기 v1.0
 - 게시물 인게이지먼트 데이터 수집
 - 좋아요, 댓글, 저장 수 추적
 - publishing_history.json 자동 업데이트
+- 인사이트 조회는 core.insights_collector 공용 수집기 (Graph API batch, 게시물별 갱신 주기)
 
 사용법:
     python instagram_stats_collector.py
@@ -28,6 +29,7 @@ import logging
 # 프로젝트 루트 설정
 ROOT = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "04_pipeline"))
 
 # 로깅 설정
 logging.basicConfig(
@@ -47,13 +49,19 @@ try:
 except ImportError:
     pass
 
+from core.insights_collector import InsightsCollector
+
 
 class InstagramStatsCollector:
     """Instagram 성과 데이터 수집기"""
 
-    def __init__(self):
+    def __init__(self, insights: Optional[InsightsCollector] = None):
         self.access_token = os.getenv("INSTAGRAM_ACCESS_TOKEN")
         self.instagram_id = os.getenv("INSTAGRAM_BUSINESS_ID")
+        self.insights = insights or InsightsCollector(
+            access_token=self.access_token, user_id=self.instagram_id, log=logger.info
+        )
+        self.last_refresh: Dict[str, Any] = {}
         self.history = self._load_history()
         self.stats = self._load_stats()
 
@@ -90,6 +98,18 @@ class InstagramStatsCollector:
             json.dump(self.stats, f, ensure_ascii=False, indent=2)
         logger.info(f"통계 저장: {STATS_FILE}")
 
+    @staticmethod
+    def _to_stats(insights: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "likes": insights.get("likes", 0),
+            "comments": insights.get("comments", 0),
+            "saved": insights.get("saved", 0),
+            "shares": insights.get("shares", 0),
+            "reach": insights.get("reach", 0),
+            "timestamp": insights.get("timestamp") or "",
+            "permalink": insights.get("permalink") or "",
+        }
+
     def fetch_post_insights(self, post_id: str) -> Optional[Dict[str, int]]:
         """게시물 인사이트 조회 (Graph API)
 
@@ -104,78 +124,52 @@ class InstagramStatsCollector:
             return None
 
         try:
-            import requests
-
-            # 기본 메트릭 조회
-            url = f"https://graph.facebook.com/v18.0/{post_id}"
-            params = {
-                "fields": "like_count,comments_count,timestamp,permalink",
-                "access_token": self.access_token
-            }
-            response = requests.get(url, params=params, timeout=10)
-
-            if response.status_code == 200:
-                data = response.json()
-                return {
-                    "likes": data.get("like_count", 0),
-                    "comments": data.get("comments_count", 0),
-                    "timestamp": data.get("timestamp", ""),
-                    "permalink": data.get("permalink", "")
-                }
-            else:
-                logger.warning(f"API 에러: {response.status_code} - {response.text}")
-                return None
-
-        except ImportError:
-            logger.error("requests 모듈이 필요합니다: pip install requests")
-            return None
+            posts = self.insights.refresh_posts([post_id])["posts"]
         except Exception as e:
             logger.error(f"인사이트 조회 실패: {e}")
             return None
+        return self._to_stats(posts[0]) if posts else None
 
     def collect_all_stats(self) -> Dict[str, Dict]:
-        """모든 게시물 통계 수집"""
+        """모든 게시물 통계 수집 (갱신 주기가 지난 게시물만 batch 요청)"""
         collected = {}
+        published = [item for item in self.history.get("published", []) if item.get("post_id")]
+
+        insights_by_id = {}
+        if self.access_token and published:
+            logger.info(f"수집 중: {len(published)}개 게시물")
+            try:
+                # 게시일은 첫 수집 전 갱신 주기 판단용 (이후에는 API timestamp 사용)
+                self.last_refresh = self.insights.refresh_posts(
+                    [{"id": item["post_id"], "timestamp": item.get("date")} for item in published]
+                )
+                insights_by_id = {p["post_id"]: p for p in self.last_refresh["posts"]}
+            except Exception as e:
+                logger.error(f"인사이트 조회 실패: {e}")
+        elif published:
+            logger.warning("Instagram Access Token이 설정되지 않음")
 
-        for item in self.history.get("published", []):
+        for item in published:
             post_id = item.get("post_id")
             topic = item.get("topic")
+            insights = insights_by_id.get(post_id)
 
-            if not post_id:
-                continue
-
-            logger.info(f"수집 중: {item.get('topic_kr', topic)} (ID: {post_id})")
-
-            # API 호출
-            insights = self.fetch_post_insights(post_id)
-
-            if insights:
-                collected[topic] = {
-                    "post_id": post_id,
-                    "topic_kr": item.get("topic_kr", topic),
-                    "publish_date": item.get("date", ""),
-                    "instagram_url": item.get("instagram_url", ""),
-                    "stats": insights,
-                    "collected_at": datetime.now().isoformat()
-                }
-
-                # 통계 저장
-                self.stats["posts"][topic] = collected[topic]
-            else:
+            collected[topic] = {
+                "post_id": post_id,
+                "topic_kr": item.get("topic_kr", topic),
+                "publish_date": item.get("date", ""),
+                "instagram_url": item.get("instagram_url", ""),
                 # API 없을 때 더미 데이터 (실제 사용 시 제거)
-                collected[topic] = {
-                    "post_id": post_id,
-                    "topic_kr": item.get("topic_kr", topic),
-                    "publish_date": item.get("date", ""),
-                    "instagram_url": item.get("instagram_url", ""),
-                    "stats": {
-                        "likes": 0,
-                        "comments": 0,
-                        "note": "API 토큰 필요"
-                    },
-                    "collected_at": datetime.now().isoformat()
-                }
-                self.stats["posts"][topic] = collected[topic]
+                "stats": self._to_stats(insights) if insights else {
+                    "likes": 0,
+                    "comments": 0,
+                    "note": "API 토큰 필요"
+                },
+                "collected_at": datetime.now().isoformat()
+            }
+
+            # 통계 저장
+            self.stats["posts"][topic] = collected[topic]
 
         self._save_stats()
         return collected
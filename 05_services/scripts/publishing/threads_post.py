@@ -11,7 +11,7 @@ Threads 게시 스크립트 v2.0
 import os
 import sys
 import json
-import time
+import asyncio
 import requests
 from pathlib import Path
 from typing import Optional, Dict, Any, List
@@ -20,8 +20,11 @@ from dotenv import load_dotenv
 # 프로젝트 루트
 ROOT = Path(__file__).parent.parent.parent.parent
 sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "04_pipeline"))
 load_dotenv(ROOT / ".env")
 
+from core.carousel_publisher import CarouselPublisher, threads_platform
+
 # Threads API 설정
 THREADS_USER_ID = os.getenv("THREADS_USER_ID")
 THREADS_ACCESS_TOKEN = os.getenv("THREADS_ACCESS_TOKEN")
@@ -148,115 +151,17 @@ def get_or_upload_image_url(image_path: Path, folder_name: str, img_index: int)
     return upload_to_cloudinary(image_path, public_id)
 
 
-def create_image_container(image_url: str) -> Optional[str]:
-    """단일 이미지 컨테이너 생성"""
-    url = f"{THREADS_API_URL}/{THREADS_USER_ID}/threads"
-
-    params = {
-        "access_token": THREADS_ACCESS_TOKEN,
-        "media_type": "IMAGE",
-        "image_url": image_url,
-        "is_carousel_item": "true"
-    }
-
-    try:
-        resp = requests.post(url, params=params, timeout=30)
-        data = resp.json()
-
-        if "id" in data:
-            return data["id"]
-        else:
-            print(f"  ❌ 이미지 컨테이너 실패: {data}")
-            return None
-    except Exception as e:
-        print(f"  ❌ API 오류: {e}")
-        return None
-
-
-def create_carousel_container(children_ids: List[str], caption: str) -> Optional[str]:
-    """캐러셀 컨테이너 생성"""
-    url = f"{THREADS_API_URL}/{THREADS_USER_ID}/threads"
-
-    params = {
-        "access_token": THREADS_ACCESS_TOKEN,
-        "media_type": "CAROUSEL",
-        "children": ",".join(children_ids),
-        "text": caption
-    }
-
-    try:
-        resp = requests.post(url, params=params, timeout=30)
-        data = resp.json()
-
-        if "id" in data:
-            print(f"  ✅ 캐러셀 컨테이너 생성: {data['id']}")
-            return data["id"]
-        else:
-            print(f"  ❌ 캐러셀 컨테이너 실패: {data}")
-            return None
-    except Exception as e:
-        print(f"  ❌ API 오류: {e}")
-        return None
-
-
-def wait_for_container(container_id: str, max_wait: int = 30) -> bool:
-    """컨테이너 상태가 FINISHED가 될 때까지 대기"""
-    url = f"{THREADS_API_URL}/{container_id}"
-    params = {
-        "access_token": THREADS_ACCESS_TOKEN,
-        "fields": "status"
-    }
+async def publish_threads_carousel(image_urls: List[str], caption: str) -> Dict[str, Any]:
+    """게시 엔진으로 캐러셀 게시 (컨테이너 병렬 생성 + 백오프 상태 대기)"""
+    platform = threads_platform(THREADS_USER_ID, THREADS_ACCESS_TOKEN, api_base=THREADS_API_URL)
+    async with CarouselPublisher() as engine:
+        outcome = await engine.publish_carousel(platform, image_urls, caption)
 
-    for _ in range(max_wait):
-        try:
-            resp = requests.get(url, params=params, timeout=10)
-            data = resp.json()
-            status = data.get("status")
-
-            if status == "FINISHED":
-                return True
-            elif status == "ERROR":
-                print(f"  ❌ 컨테이너 오류: {data}")
-                return False
-
-            time.sleep(1)
-        except Exception as e:
-            print(f"  ⚠️ 상태 확인 오류: {e}")
-            time.sleep(1)
-
-    print("  ⚠️ 타임아웃")
-    return False
-
-
-def publish_container(container_id: str) -> Optional[Dict[str, Any]]:
-    """컨테이너 게시"""
-    url = f"{THREADS_API_URL}/{THREADS_USER_ID}/threads_publish"
-
-    params = {
-        "access_token": THREADS_ACCESS_TOKEN,
-        "creation_id": container_id
-    }
-
-    try:
-        resp = requests.post(url, params=params, timeout=30)
-        data = resp.json()
-
-        if "id" in data:
-            post_id = data["id"]
-            # Threads URL 형식
-            threads_url = f"https://www.threads.net/@sunshinedogfood/post/{post_id}"
-            print(f"  ✅ 게시 완료!")
-            return {
-                "success": True,
-                "post_id": post_id,
-                "url": threads_url
-            }
-        else:
-            print(f"  ❌ 게시 실패: {data}")
-            return {"success": False, "error": str(data)}
-    except Exception as e:
-        print(f"  ❌ 게시 오류: {e}")
-        return {"success": False, "error": str(e)}
+    if outcome.success:
+        print(f"  ✅ 게시 완료! ({outcome.timings})")
+        return {"success": True, "post_id": outcome.post_id, "url": outcome.post_url}
+    print(f"  ❌ 게시 실패: {outcome.error}")
+    return {"success": False, "error": outcome.error}
 
 
 def post_carousel_to_threads(
@@ -314,41 +219,9 @@ def post_carousel_to_threads(
             print(f"  ❌ {i+1}번 실패")
             return None
 
-    # 이미지 컨테이너 생성
-    print(f"\n🔧 이미지 컨테이너 생성:")
-    children_ids = []
-    for i, url in enumerate(image_urls):
-        container_id = create_image_container(url)
-        if container_id:
-            children_ids.append(container_id)
-            print(f"  ✅ {i+1}번: {container_id}")
-            time.sleep(1)  # Rate limit
-        else:
-            print(f"  ❌ {i+1}번 실패")
-            return None
-
-    # 컨테이너 상태 대기
-    print(f"\n⏳ 컨테이너 처리 대기...")
-    for cid in children_ids:
-        if not wait_for_container(cid):
-            print(f"  ❌ 컨테이너 준비 실패: {cid}")
-            return None
-    print("  ✅ 모든 컨테이너 준비 완료")
-
-    # 캐러셀 컨테이너 생성
-    print(f"\n🎠 캐러셀 컨테이너 생성:")
-    carousel_id = create_carousel_container(children_ids, caption)
-    if not carousel_id:
-        return None
-
-    # 캐러셀 상태 대기
-    if not wait_for_container(carousel_id):
-        print("  ❌ 캐러셀 준비 실패")
-        return None
-
-    # 게시
-    print(f"\n🚀 게시 중...")
-    result = publish_container(carousel_id)
+    # 컨테이너 생성 → 상태 대기 → 캐러셀 → 게시
+    print(f"\n🚀 Threads 게시 (컨테이너 병렬 생성):")
+    result = asyncio.run(publish_threads_carousel(image_urls, caption))
 
     return result
 
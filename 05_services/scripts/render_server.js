@@ -0,0 +1,184 @@
+/**
+ * 상주 렌더 워커 (Puppeteer 브라우저 재사용)
+ * - 브라우저 1개를 띄워 두고 요청마다 HTML → PNG 렌더링 (Chromium 콜드 스타트 1회)
+ * - 요청 1건에 여러 슬라이드, 페이지 풀(RENDER_WORKER_PAGES)로 병렬 렌더링
+ * - 슬라이드별 소요 시간(ms) 보고
+ * - 브라우저가 죽으면 다음 슬라이드에서 자동 재실행
+ *
+ * 프로토콜: stdin/stdout 줄 단위 JSON (로그는 stderr)
+ *   시작 시  ← {"ready": true, "pages": 4}
+ *   → {"id": 1, "op": "render", "slides": [{"html": "...", "output": "/abs/out.png", "width": 1080, "height": 1080}]}
+ *   ← {"id": 1, "ok": true, "ms": 812, "results": [{"output": "/abs/out.png", "ok": true, "ms": 403}]}
+ *   → {"id": 2, "op": "ping"}      ← {"id": 2, "ok": true, "rendered": 120, "launches": 1}
+ *   → {"id": 3, "op": "shutdown"}  ← {"id": 3, "ok": true} 후 종료
+ *
+ * 슬라이드는 html (문자열) 또는 html_path (파일 경로) 중 하나.
+ *
+ * 사용법:
+ *   node render_server.js   (04_pipeline/core/render_worker.py 가 실행/관리)
+ *
+ * 환경 변수:
+ *   RENDER_WORKER_PAGES=4          동시 렌더링 페이지 수
+ *   RENDER_SLIDE_TIMEOUT_MS=30000  슬라이드당 로딩 타임아웃
+ */
+
+import puppeteer from 'puppeteer';
+import fs from 'fs';
+import path from 'path';
+import readline from 'readline';
+import { pathToFileURL } from 'url';
+
+const PAGES = Math.max(1, parseInt(process.env.RENDER_WORKER_PAGES || '4', 10));
+const SLIDE_TIMEOUT_MS = parseInt(process.env.RENDER_SLIDE_TIMEOUT_MS || '30000', 10);
+
+let browser = null;
+let launching = null;
+let idlePages = [];
+let launches = 0;
+let rendered = 0;
+
+function send(message) {
+  process.stdout.write(JSON.stringify(message) + '\n');
+}
+
+function log(message) {
+  console.error(`[render_server] ${message}`);
+}
+
+// 브라우저 (연결 끊기면 다음 호출 시 재실행)
+async function getBrowser() {
+  if (browser && browser.isConnected()) return browser;
+  if (!launching) {
+    launching = puppeteer.launch({
+      headless: 'new',
+      args: ['--no-sandbox', '--disable-setuid-sandbox', '--disable-dev-shm-usage'],
+    }).then((b) => {
+      launches += 1;
+      browser = b;
+      idlePages = [];
+      b.on('disconnected', () => {
+        log('브라우저 연결 끊김 → 다음 요청에서 재실행');
+        browser = null;
+        idlePages = [];
+      });
+      return b;
+    }).finally(() => {
+      launching = null;
+    });
+  }
+  return launching;
+}
+
+async function acquirePage() {
+  const b = await getBrowser();
+  while (idlePages.length) {
+    const page = idlePages.pop();
+    if (!page.isClosed() && page.browser() === b) return page;
+  }
+  return b.newPage();
+}
+
+function releasePage(page, broken) {
+  if (broken || page.isClosed() || !browser || page.browser() !== browser) {
+    page.close().catch(() => {});
+    return;
+  }
+  idlePages.push(page);
+}
+
+async function renderSlide(slide) {
+  const started = Date.now();
+  let page = null;
+  let broken = false;
+  try {
+    page = await acquirePage();
+    await page.setViewport({ width: slide.width || 1080, height: slide.height || 1080 });
+    if (slide.html_path) {
+      await page.goto(pathToFileURL(slide.html_path).href, { waitUntil: 'networkidle0', timeout: SLIDE_TIMEOUT_MS });
+    } else {
+      await page.setContent(slide.html, { waitUntil: 'networkidle0', timeout: SLIDE_TIMEOUT_MS });
+    }
+    await page.evaluateHandle('document.fonts.ready');
+    fs.mkdirSync(path.dirname(slide.output), { recursive: true });
+    await page.screenshot({ path: slide.output, type: 'png' });
+    rendered += 1;
+    return { output: slide.output, ok: true, ms: Date.now() - started };
+  } catch (e) {
+    broken = true;
+    return { output: slide.output, ok: false, ms: Date.now() - started, error: String(e.message || e) };
+  } finally {
+    if (page) releasePage(page, broken);
+  }
+}
+
+// 슬라이드 병렬 렌더링 (PAGES 개 레인, 결과는 입력 순서)
+async function renderAll(slides) {
+  const results = new Array(slides.length);
+  let next = 0;
+  const lanes = Array.from({ length: Math.min(PAGES, slides.length) }, async () => {
+    while (next < slides.length) {
+      const index = next++;
+      results[index] = await renderSlide(slides[index]);
+    }
+  });
+  await Promise.all(lanes);
+  return results;
+}
+
+async function handle(line) {
+  let request;
+  try {
+    request = JSON.parse(line);
+  } catch (e) {
+    send({ id: null, ok: false, error: `JSON 파싱 실패: ${e.message}` });
+    return;
+  }
+  const { id, op } = request;
+  try {
+    if (op === 'render') {
+      const started = Date.now();
+      const results = await renderAll(request.slides || []);
+      send({ id, ok: results.every((r) => r.ok), ms: Date.now() - started, results });
+    } else if (op === 'ping') {
+      send({ id, ok: true, rendered, launches, connected: Boolean(browser && browser.isConnected()) });
+    } else if (op === 'shutdown') {
+      send({ id, ok: true });
+      await shutdown();
+    } else {
+      send({ id, ok: false, error: `알 수 없는 op: ${op}` });
+    }
+  } catch (e) {
+    send({ id, ok: false, error: String(e.message || e) });
+  }
+}
+
+async function shutdown() {
+  try {
+    if (browser) await browser.close();
+  } finally {
+    process.exit(0);
+  }
+}
+
+async function main() {
+  try {
+    await getBrowser();
+  } catch (e) {
+    send({ ready: false, error: `브라우저 실행 실패: ${e.message}` });
+    process.exit(1);
+  }
+  send({ ready: true, pages: PAGES });
+
+  // 요청은 순서대로 처리 (요청 내부 슬라이드는 병렬)
+  let queue = Promise.resolve();
+  const rl = readline.createInterface({ input: process.stdin });
+  rl.on('line', (line) => {
+    if (!line.trim()) return;
+    queue = queue.then(() => handle(line));
+  });
+  rl.on('close', () => {
+    queue.then(shutdown);
+  });
+}
+
+main();
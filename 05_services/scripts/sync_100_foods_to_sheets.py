@@ -54,7 +54,7 @@ def load_topics_expanded() -> list:
 
 
 def get_existing_topics(manager: ContentSheetManager) -> set:
-    """기존 시트에서 영문명 목록 추출 (소문자)"""
+    """기존 시트에서 영문명 목록 추출 (소문자, 시트 스냅샷 재사용)"""
     contents = manager.get_all_contents()
     existing = set()
 
@@ -135,9 +135,10 @@ def main():
     next_num = get_next_number(manager)
     added_count = 0
     failed_count = 0
+    staged = []
 
     for food in new_foods:
-        num = next_num + added_count
+        num = next_num + len(staged)
         num_str = f"{num:03d}"
 
         folder_name = f"{num_str}_{food['id']}_{food['ko']}"
@@ -153,13 +154,19 @@ def main():
             ''                    # 인스타URL (비움)
         ]
 
-        try:
-            manager._worksheet.append_row(row)
-            added_count += 1
+        manager.gateway.stage_append(row)
+        staged.append((num_str, food))
+
+    # 신규 행 전체를 append_rows 1회로 전송 (쿼터 초과 시 백오프 재시도)
+    try:
+        manager.gateway.flush()
+        added_count = len(staged)
+        for num_str, food in staged:
             print(f"  ✅ [{num_str}] {food['ko']} ({food['id']}) - {food['safety']}")
-        except Exception as e:
-            failed_count += 1
-            print(f"  ❌ [{num_str}] {food['ko']} 실패: {e}")
+    except Exception as e:
+        manager.gateway.discard()
+        failed_count = len(staged)
+        print(f"  ❌ 신규 {len(staged)}건 추가 실패: {e}")
 
     # 결과 보고
     print("\n" + "=" * 60)
@@ -20,16 +20,25 @@ load_dotenv(Path('/Users/al02399300/Desktop/Jun_AI/Dog_Contents/project_sunshine
 import gspread
 from google.oauth2.service_account import Credentials
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "04_pipeline"))
+from core.instagram_media_sync import MediaSync
+
 # 경로
 PROJECT_ROOT = Path('/Users/al02399300/Desktop/Jun_AI/Dog_Contents/project_sunshine')
 CONTENTS_DIR = PROJECT_ROOT / 'contents'
-INSTAGRAM_DATA = PROJECT_ROOT / 'config/data/instagram_posts.json'
+INSTAGRAM_DATA = PROJECT_ROOT / 'config/data/instagram_posts.json'  # 인덱스가 비었을 때만 사용
 
 MAX_LOOP = 5
 
 
 def load_instagram_posts():
-    """Instagram 게시물 데이터 로드"""
+    """Instagram 게시물 데이터 로드 (공용 미디어 인덱스 증분 동기화 → 게시 레코드)"""
+    media_sync = MediaSync()
+    media_sync.sync_safe()
+    posts = media_sync.posted_records()
+    if posts:
+        return posts
+
     with open(INSTAGRAM_DATA, 'r', encoding='utf-8') as f:
         data = json.load(f)
     return data['posts']